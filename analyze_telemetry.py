@@ -1,104 +1,106 @@
-import json
+"""Event telemetry report.
+
+Streams the latest ``events`` telemetry file (columnar ``.tcol`` or legacy
+``.jsonl``) through :mod:`evolution.systems.telemetry_query`, so memory use
+does not grow with the length of the run.
+"""
+from __future__ import annotations
+
+import argparse
 import sys
-from collections import Counter
 from pathlib import Path
 
-# Find latest event log
-log_dir = Path("logs/telemetry")
-event_logs = sorted(log_dir.glob("events_*.jsonl"))
-
-if not event_logs:
-    sys.stdout.write("No event logs found\n")
-    sys.exit(0)
-
-latest_log = event_logs[-1]
-sys.stdout.write(f"Analyzing: {latest_log.name}\n")
-sys.stdout.write("=" * 80 + "\n\n")
-
-# Parse events
-events = []
-with open(latest_log, 'r', encoding='utf-8') as f:
-    for line in f:
-        line = line.strip()
-        if line:
-            try:
-                events.append(json.loads(line))
-            except:
-                pass
-
-if not events:
-    sys.stdout.write("No valid events found\n")
-    sys.exit(0)
-
-sys.stdout.write(f"TOTAL EVENTS: {len(events)}\n")
-sys.stdout.write(f"Time range: tick {events[0]['tick']} to {events[-1]['tick']}\n")
-duration = events[-1]['tick'] - events[0]['tick']
-sys.stdout.write(f"Duration: {duration} ticks (~{duration/1000:.1f}s)\n\n")
-
-# Categories
-categories = Counter(e['category'] for e in events)
-sys.stdout.write("EVENT CATEGORIES:\n")
-for cat, count in sorted(categories.items()):
-    pct = (count / len(events)) * 100
-    sys.stdout.write(f"  {cat:15s}: {count:5d} ({pct:5.1f}%)\n")
-
-# AI events
-ai_events = [e for e in events if e['category'] == 'AI']
-if ai_events:
-    sys.stdout.write(f"\n{'='*80}\n")
-    sys.stdout.write(f"AI BEHAVIOR ANALYSIS ({len(ai_events)} events)\n")
-    sys.stdout.write(f"{'='*80}\n\n")
-    
-    threats = [e for e in ai_events if e['event_type'] == 'THREAT_DETECTED']
-    prey = [e for e in ai_events if e['event_type'] == 'PREY_ACQUIRED']
-    
-    sys.stdout.write(f"Threats detected: {len(threats)}\n")
-    if threats:
-        dists = [e['details']['dist'] for e in threats if 'dist' in e['details']]
-        if dists:
-            sys.stdout.write(f"  Avg distance: {sum(dists)/len(dists):.1f}\n")
-            sys.stdout.write(f"  Range: {min(dists):.1f} - {max(dists):.1f}\n")
-        
-        entities = Counter(e['entity_id'] for e in threats)
-        sys.stdout.write(f"  Most threatened (top 5):\n")
-        for eid, cnt in entities.most_common(5):
-            sys.stdout.write(f"    {eid}: {cnt}\n")
-    
-    sys.stdout.write(f"\nPrey spotted: {len(prey)}\n")
-    if prey:
-        dists = [e['details']['dist'] for e in prey if 'dist' in e['details']]
-        if dists:
-            sys.stdout.write(f"  Avg distance: {sum(dists)/len(dists):.1f}\n")
-            sys.stdout.write(f"  Range: {min(dists):.1f} - {max(dists):.1f}\n")
-        
-        entities = Counter(e['entity_id'] for e in prey)
-        sys.stdout.write(f"  Most active hunters (top 5):\n")
-        for eid, cnt in entities.most_common(5):
-            sys.stdout.write(f"    {eid}: {cnt}\n")
-
-# Behavior
-behavior = [e for e in events if e['category'] == 'BEHAVIOR']
-if behavior:
-    sys.stdout.write(f"\n{'='*80}\n")
-    sys.stdout.write(f"BEHAVIOR ACTIVITIES ({len(behavior)} events)\n")
-    sys.stdout.write(f"{'='*80}\n\n")
-    
-    activities = Counter(e['details']['name'] for e in behavior)
-    for activity, count in activities.most_common():
-        pct = (count / len(behavior)) * 100
-        sys.stdout.write(f"  {activity:25s}: {count:5d} ({pct:5.1f}%)\n")
-
-# Carcass
-carcass = [e for e in events if e['category'] == 'CARCASS']
-if carcass:
+from evolution.systems.telemetry_query import TelemetryQuery, event_report, latest_file, parse_tick_range
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Summarise event telemetry")
+    parser.add_argument("telemetry", nargs="?", type=Path, help="Path to an events_* telemetry file")
+    parser.add_argument("--ticks", help="Only events in this tick range, e.g. 1000:5000")
+    parser.add_argument("--category", action="append", help="Only these categories (repeatable)")
+    args = parser.parse_args()
+
+    try:
+        path = args.telemetry or latest_file("events")
+    except FileNotFoundError:
+        sys.stdout.write("No event logs found\n")
+        sys.exit(0)
+
+    where = {"category": set(args.category)} if args.category else None
+    report = event_report(TelemetryQuery(path, ticks=parse_tick_range(args.ticks), where=where))
+
+    sys.stdout.write(f"Analyzing: {path.name}\n")
+    sys.stdout.write("=" * 80 + "\n\n")
+
+    if not report.total:
+        sys.stdout.write("No valid events found\n")
+        sys.exit(0)
+
+    sys.stdout.write(f"TOTAL EVENTS: {report.total}\n")
+    sys.stdout.write(f"Time range: tick {report.first_tick} to {report.last_tick}\n")
+    duration = report.last_tick - report.first_tick
+    sys.stdout.write(f"Duration: {duration} ticks (~{duration/1000:.1f}s)\n\n")
+
+    # Categories
+    sys.stdout.write("EVENT CATEGORIES:\n")
+    for cat, count in sorted(report.categories.items()):
+        pct = (count / report.total) * 100
+        sys.stdout.write(f"  {cat:15s}: {count:5d} ({pct:5.1f}%)\n")
+
+    # AI events
+    ai_total = report.categories.get("AI", 0)
+    if ai_total:
+        sys.stdout.write(f"\n{'='*80}\n")
+        sys.stdout.write(f"AI BEHAVIOR ANALYSIS ({ai_total} events)\n")
+        sys.stdout.write(f"{'='*80}\n\n")
+
+        threats = sum(report.threats.values())
+        sys.stdout.write(f"Threats detected: {threats}\n")
+        if threats:
+            dists = report.threat_distance
+            if dists.count:
+                sys.stdout.write(f"  Avg distance: {dists.mean:.1f}\n")
+                sys.stdout.write(f"  Range: {dists.minimum:.1f} - {dists.maximum:.1f}\n")
+            sys.stdout.write(f"  Most threatened (top 5):\n")
+            for eid, cnt in report.threats.most_common(5):
+                sys.stdout.write(f"    {eid}: {cnt}\n")
+
+        prey = sum(report.prey.values())
+        sys.stdout.write(f"\nPrey spotted: {prey}\n")
+        if prey:
+            dists = report.prey_distance
+            if dists.count:
+                sys.stdout.write(f"  Avg distance: {dists.mean:.1f}\n")
+                sys.stdout.write(f"  Range: {dists.minimum:.1f} - {dists.maximum:.1f}\n")
+            sys.stdout.write(f"  Most active hunters (top 5):\n")
+            for eid, cnt in report.prey.most_common(5):
+                sys.stdout.write(f"    {eid}: {cnt}\n")
+
+    # Behavior
+    behavior_total = sum(report.activities.values())
+    if behavior_total:
+        sys.stdout.write(f"\n{'='*80}\n")
+        sys.stdout.write(f"BEHAVIOR ACTIVITIES ({behavior_total} events)\n")
+        sys.stdout.write(f"{'='*80}\n\n")
+
+        for activity, count in report.activities.most_common():
+            pct = (count / behavior_total) * 100
+            sys.stdout.write(f"  {str(activity):25s}: {count:5d} ({pct:5.1f}%)\n")
+
+    # Carcass
+    carcass_total = sum(report.carcass_transitions.values())
+    if carcass_total:
+        sys.stdout.write(f"\n{'='*80}\n")
+        sys.stdout.write(f"CARCASS DECOMPOSITION ({carcass_total} events)\n")
+        sys.stdout.write(f"{'='*80}\n\n")
+
+        for (f, t), cnt in report.carcass_transitions.most_common():
+            sys.stdout.write(f"  {str(f):15s} -> {str(t):15s}: {cnt}\n")
+
     sys.stdout.write(f"\n{'='*80}\n")
-    sys.stdout.write(f"CARCASS DECOMPOSITION ({len(carcass)} events)\n")
-    sys.stdout.write(f"{'='*80}\n\n")
-    
-    transitions = [(e['details']['from'], e['details']['to']) for e in carcass]
-    for (f, t), cnt in Counter(transitions).most_common():
-        sys.stdout.write(f"  {f:15s} -> {t:15s}: {cnt}\n")
-
-sys.stdout.write(f"\n{'='*80}\n")
-sys.stdout.write("ANALYSIS COMPLETE\n")
-sys.stdout.write(f"{'='*80}\n")
+    sys.stdout.write("ANALYSIS COMPLETE\n")
+    sys.stdout.write(f"{'='*80}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+"""Headless performance benchmarks over reproducible canned worlds.
+
+Run ``python -m benchmarks.run --help`` for usage.
+"""
@@ -0,0 +1,242 @@
+"""Run the canned benchmark worlds and compare them against a baseline.
+
+Usage::
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --scenario sparse_ocean --baseline benchmarks/baseline.json
+    python -m benchmarks.run --output benchmarks/baseline.json  # refresh the baseline
+
+Each scenario reports ticks per second, tick percentiles, the mean time per
+engine phase (from :attr:`SimulationEngine.timers`, measured in a separate
+pass with per-creature phases switched on so they do not skew ticks per
+second), memory allocated per tick (traced with :mod:`tracemalloc` over a short extra run) and the peak
+resident set size of the process. With ``--baseline`` the exit code is 1
+when any metric is worse than the baseline by more than ``--tolerance``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Mapping, Optional, Sequence
+
+try:  # pragma: no cover - unavailable on Windows
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+from .scenarios import DEFAULT_SEED, SCENARIOS, scenario_engine
+
+DEFAULT_TOLERANCE = 0.15
+DEFAULT_WARMUP = 10
+DEFAULT_ALLOC_TICKS = 5
+DEFAULT_PHASE_TICKS = 10
+TICK_SECONDS = 1.0 / 30.0
+
+# Metric -> True when higher is better
+COMPARED_METRICS: Dict[str, bool] = {
+    "ticks_per_second": True,
+    "tick_p95_ms": False,
+    "alloc_kb_per_tick": False,
+    "peak_rss_mb": False,
+}
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MiB, if the OS reports it."""
+
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    divisor = 1024.0 * 1024.0 if sys.platform == "darwin" else 1024.0
+    return round(peak / divisor, 1)
+
+
+def _allocated_kb_per_tick(engine, ticks: int) -> float:
+    if ticks <= 0:
+        return 0.0
+    tracemalloc.start()
+    try:
+        total = 0
+        for _ in range(ticks):
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            engine.step(TICK_SECONDS)
+            total += tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+    return round(total / ticks / 1024.0, 1)
+
+
+def run_scenario(
+    name: str,
+    *,
+    ticks: Optional[int] = None,
+    seed: int = DEFAULT_SEED,
+    warmup: int = DEFAULT_WARMUP,
+    alloc_ticks: int = DEFAULT_ALLOC_TICKS,
+    phase_ticks: int = DEFAULT_PHASE_TICKS,
+    lifeforms: Optional[int] = None,
+) -> Dict[str, object]:
+    """Build and tick one scenario, returning its measurements.
+
+    ``phase_ticks`` extra ticks run with :attr:`SimulationEngine.profile_phases`
+    on to break the tick down per creature phase (movement, feeding, ...);
+    with 0 the breakdown only covers the whole-tick phases of the timed run.
+    """
+
+    scenario = SCENARIOS[name]
+    measured = scenario.ticks if ticks is None else ticks
+    with scenario_engine(name, seed=seed, lifeforms=lifeforms) as engine:
+        population = len(engine.state.lifeforms)
+        for _ in range(warmup):
+            engine.step(TICK_SECONDS)
+        engine.timers.reset()
+
+        started = time.perf_counter()
+        for _ in range(measured):
+            engine.step(TICK_SECONDS)
+        elapsed = time.perf_counter() - started
+        phases = engine.timers.summary()
+        tick = phases.pop("tick", {})
+
+        if phase_ticks > 0:
+            engine.timers.reset()
+            engine.profile_phases = True
+            for _ in range(phase_ticks):
+                engine.step(TICK_SECONDS)
+            engine.profile_phases = False
+            phases = engine.timers.summary()
+            phases.pop("tick", None)
+
+        alloc_kb = _allocated_kb_per_tick(engine, alloc_ticks)
+
+    return {
+        "scenario": name,
+        "seed": seed,
+        "ticks": measured,
+        "lifeforms": population,
+        "ticks_per_second": round(measured / elapsed, 2) if elapsed > 0 else None,
+        "tick_p50_ms": round(tick.get("p50_ms", 0.0), 3),
+        "tick_p95_ms": round(tick.get("p95_ms", 0.0), 3),
+        "phases_ms": {
+            phase: round(stats["mean_ms"], 4)
+            for phase, stats in sorted(phases.items(), key=lambda item: item[1]["mean_ms"], reverse=True)
+        },
+        "alloc_kb_per_tick": alloc_kb,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def compare(
+    results: Mapping[str, Mapping[str, object]],
+    baseline: Mapping[str, Mapping[str, object]],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[str]:
+    """Describe every metric that regressed by more than ``tolerance``.
+
+    Scenarios or metrics missing from either side are skipped.
+    """
+
+    regressions: List[str] = []
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            now = current.get(metric)
+            before = reference.get(metric)
+            if not now or not before:
+                continue
+            now = float(now)
+            before = float(before)
+            if higher_is_better:
+                regressed = now < before * (1.0 - tolerance)
+            else:
+                regressed = now > before * (1.0 + tolerance)
+            if regressed:
+                change = (now - before) / before * 100.0
+                regressions.append(f"{name}.{metric}: {before:g} -> {now:g} ({change:+.1f}%)")
+    return regressions
+
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run the headless simulation benchmarks")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="Scenario to run (repeatable, defaults to all)",
+    )
+    parser.add_argument("--ticks", type=int, help="Measured ticks per scenario (defaults per scenario)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Run seed")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="Unmeasured ticks first")
+    parser.add_argument(
+        "--alloc-ticks",
+        type=int,
+        default=DEFAULT_ALLOC_TICKS,
+        help="Extra ticks traced with tracemalloc (0 disables)",
+    )
+    parser.add_argument(
+        "--phase-ticks",
+        type=int,
+        default=DEFAULT_PHASE_TICKS,
+        help="Extra ticks timed per creature phase for the breakdown (0 disables)",
+    )
+    parser.add_argument("--output", help="Write results JSON to this path")
+    parser.add_argument("--baseline", help="Compare against this results JSON")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Allowed relative regression before failing (0.15 = 15%%)",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _build_arg_parser().parse_args(argv)
+    # Per-lifeform info logging would dominate the measurement
+    logging.getLogger("evolution").setLevel(logging.WARNING)
+
+    results: Dict[str, Dict[str, object]] = {}
+    for name in args.scenario or list(SCENARIOS):
+        result = run_scenario(
+            name,
+            ticks=args.ticks,
+            seed=args.seed,
+            warmup=args.warmup,
+            alloc_ticks=args.alloc_ticks,
+            phase_ticks=args.phase_ticks,
+        )
+        results[name] = result
+        print(
+            f"{name:>16}: {result['ticks_per_second']} ticks/s, "
+            f"p95 {result['tick_p95_ms']} ms, {result['alloc_kb_per_tick']} KiB/tick, "
+            f"peak RSS {result['peak_rss_mb']} MiB"
+        )
+
+    if args.output:
+        payload = {"python": platform.python_version(), "machine": platform.machine(), "results": results}
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as handle:
+            baseline = json.load(handle).get("results", {})
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
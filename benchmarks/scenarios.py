@@ -0,0 +1,155 @@
+"""Canned worlds for the benchmark suite.
+
+Every scenario starts from :func:`evolution.headless.build_engine`, which
+runs ``bootstrap.reset_simulation`` with all random streams seeded, and then
+reshapes the world into the situation it wants to measure. The same name and
+seed therefore always produce the same starting state.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, Optional
+
+from evolution.config import settings
+from evolution.creator import CreatureDraft, spawn_template
+from evolution.headless import build_engine
+from evolution.simulation import bootstrap, environment
+from evolution.simulation.engine import SimulationEngine
+from evolution.systems import rng as random_streams
+
+DEFAULT_SEED = 1234
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A reproducible starting world.
+
+    Attributes:
+        name: Key used on the command line and in result files.
+        description: One line for reports.
+        lifeforms: ``N_LIFEFORMS`` spawned by bootstrap.
+        ticks: Default number of measured ticks.
+        overrides: Extra runtime settings applied while building.
+        prepare: Hook reshaping the freshly bootstrapped engine.
+    """
+
+    name: str
+    description: str
+    lifeforms: int
+    ticks: int
+    overrides: Dict[str, object] = field(default_factory=dict)
+    prepare: Optional[Callable[[SimulationEngine], None]] = None
+
+
+@contextmanager
+def _runtime(overrides: Dict[str, object]) -> Iterator[settings.SimulationSettings]:
+    previous = settings.current_settings()
+    runtime = previous.with_updates(overrides)
+    settings.apply_runtime_settings(runtime)
+    try:
+        yield runtime
+    finally:
+        settings.apply_runtime_settings(previous)
+
+
+def _saturate_moss(engine: SimulationEngine) -> None:
+    state = engine.state
+    bootstrap.seed_vegetation(
+        state,
+        state.world,
+        random_streams.stream("bootstrap"),
+        moss_clusters=160,
+        seaweed_strands=60,
+    )
+    environment.sync_food_abundance(state)
+    environment.sync_moss_growth_speed(state)
+
+
+def _die_off(engine: SimulationEngine) -> None:
+    # Two thirds of the population dies at once and leaves a carcass behind
+    for lifeform in list(engine.state.lifeforms)[::3] + list(engine.state.lifeforms)[1::3]:
+        lifeform.health_now = 0
+        lifeform.handle_death()
+
+
+def _creator_swarm(engine: SimulationEngine) -> None:
+    draft = CreatureDraft.new("benchmark_swarm")
+    draft.attach_module("head", "core")
+    draft.attach_module("thruster", "core")
+    state = engine.state
+    for _ in range(150):
+        spawn_template(state, draft.template, state.world)
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario(
+            "sparse_ocean",
+            "200 creatures in the default ocean",
+            200,
+            200,
+            overrides={"MAX_LIFEFORMS": 300},
+        ),
+        Scenario(
+            "dense_reef",
+            "2,000 creatures packed into a small world",
+            2000,
+            20,
+            overrides={"MAX_LIFEFORMS": 2500, "WORLD_WIDTH": 2400, "WORLD_HEIGHT": 1800},
+        ),
+        Scenario(
+            "moss_saturated",
+            "100 creatures in a world overgrown with moss and seaweed",
+            100,
+            200,
+            prepare=_saturate_moss,
+        ),
+        Scenario(
+            "carcass_die_off",
+            "400 creatures of which two thirds just died",
+            400,
+            100,
+            overrides={"MAX_LIFEFORMS": 500},
+            prepare=_die_off,
+        ),
+        Scenario(
+            "creator_swarm",
+            "150 creator-template creatures spawned around the centre",
+            50,
+            150,
+            overrides={"MAX_LIFEFORMS": 250},
+            prepare=_creator_swarm,
+        ),
+    )
+}
+
+
+@contextmanager
+def scenario_engine(
+    name: str, *, seed: int = DEFAULT_SEED, lifeforms: Optional[int] = None
+) -> Iterator[SimulationEngine]:
+    """Build the engine for scenario ``name`` with its runtime settings active.
+
+    The settings stay applied until the block exits, so limits such as
+    ``MAX_LIFEFORMS`` also hold while the scenario is being ticked.
+
+    Args:
+        name: Key in :data:`SCENARIOS`.
+        seed: Run seed for every random stream.
+        lifeforms: Override the scenario's population, e.g. for smoke tests.
+    """
+
+    scenario = SCENARIOS[name]
+    overrides = dict(scenario.overrides)
+    overrides["N_LIFEFORMS"] = lifeforms if lifeforms is not None else scenario.lifeforms
+    with _runtime(overrides) as runtime:
+        engine = build_engine(runtime, seed=seed)
+        if scenario.prepare is not None:
+            scenario.prepare(engine)
+        yield engine
+
+
+__all__ = ["DEFAULT_SEED", "SCENARIOS", "Scenario", "scenario_engine"]
@@ -24,6 +24,7 @@ _FLOAT_FIELDS = {
     "THRUST_SCALE_EXPONENT",
     "THRUST_BASE_MULTIPLIER",
     "DRAG_COEFFICIENT_MULTIPLIER",
+    "MAX_SPEED_BUDGET",
 }
 
 WORLD_WIDTH = DEFAULTS["WORLD_WIDTH"]
@@ -77,6 +78,18 @@ MODULE_SPRITE_SCALE = float(os.getenv("EVOLUTION_MODULE_SPRITE_SCALE", "0.22"))
 MODULE_SPRITE_MIN_PX = float(os.getenv("EVOLUTION_MODULE_SPRITE_MIN_PX", "6.0"))
 MODULE_SPRITE_MIN_LENGTH = float(os.getenv("EVOLUTION_MODULE_SPRITE_MIN_LENGTH", "4.0"))
 MODULE_SPRITE_MIN_HEIGHT = float(os.getenv("EVOLUTION_MODULE_SPRITE_MIN_HEIGHT", "4.0"))
+SPRITE_ANGLE_BIN_DEG = float(os.getenv("EVOLUTION_SPRITE_ANGLE_BIN_DEG", "5.0"))
+# Pre-rendered modular creature poses: swim-phase frames per cycle and memory cap
+POSE_ATLAS_PHASES = max(1, int(os.getenv("EVOLUTION_POSE_ATLAS_PHASES", "8")))
+POSE_ATLAS_BUDGET_MB = float(os.getenv("EVOLUTION_POSE_ATLAS_BUDGET_MB", "128"))
+# Memory cap for the per-DNA sprite cache (bases and rotations)
+SPRITE_CACHE_BUDGET_MB = float(os.getenv("EVOLUTION_SPRITE_CACHE_BUDGET_MB", "128"))
+# Depth darkening is quantised into this many cached brightness bands
+DEPTH_SHADE_BANDS = max(1, int(os.getenv("EVOLUTION_DEPTH_SHADE_BANDS", "12")))
+# Draw the world straight at window resolution instead of resampling a world-sized view
+RENDER_SCREEN_SPACE = os.getenv("EVOLUTION_RENDER_SCREEN_SPACE", "1") not in {"0", "false", "False"}
+# Zoomed out below this scale, cached world layers are resampled nearest-neighbour (0 disables)
+RENDER_NEAREST_BELOW_ZOOM = float(os.getenv("EVOLUTION_RENDER_NEAREST_BELOW_ZOOM", "0"))
 THRUST_SCALE_EXPONENT = float(os.getenv("EVOLUTION_THRUST_SCALE_EXPONENT", "0.5"))
 THRUST_BASE_MULTIPLIER = float(os.getenv("EVOLUTION_THRUST_BASE_MULTIPLIER", "2.0"))
 DRAG_COEFFICIENT_MULTIPLIER = float(os.getenv("EVOLUTION_DRAG_COEFFICIENT_MULTIPLIER", "0.15"))
@@ -122,6 +135,12 @@ BOUNDARY_REPULSION_MARGIN = 80
 BOUNDARY_REPULSION_WEIGHT = 1.25
 
 FPS = 30
+# Ticks between population-stat snapshots (stats panel and event triggers)
+STATS_PUBLISH_INTERVAL = max(1, int(os.getenv("EVOLUTION_STATS_INTERVAL", "5")))
+# Ticks run per frame to catch up after a slow frame
+MAX_SUBSTEPS = 4
+# Wall-clock seconds spent ticking per presented frame in max speed mode (F6)
+MAX_SPEED_BUDGET = 0.025
 
 AGE_RATE_PER_SECOND = 5.0
 HUNGER_RATE_PER_SECOND = 3.5
@@ -156,6 +175,8 @@ class SimulationSettings:
     MAX_LIFEFORMS: int = MAX_LIFEFORMS
     MUTATION_CHANCE: int = MUTATION_CHANCE
     FPS: int = FPS
+    MAX_SUBSTEPS: int = MAX_SUBSTEPS
+    MAX_SPEED_BUDGET: float = MAX_SPEED_BUDGET
     LOG_DIRECTORY: Path = LOG_DIRECTORY
     DEBUG_LOG_FILE: str = DEBUG_LOG_FILE
     DEBUG_LOG_LEVEL: str = DEBUG_LOG_LEVEL
@@ -194,6 +215,8 @@ _ENV_VARS: Dict[str, str] = {
     "MAX_LIFEFORMS": "EVOLUTION_MAX_LIFEFORMS",
     "MUTATION_CHANCE": "EVOLUTION_MUTATION_CHANCE",
     "FPS": "EVOLUTION_FPS",
+    "MAX_SUBSTEPS": "EVOLUTION_MAX_SUBSTEPS",
+    "MAX_SPEED_BUDGET": "EVOLUTION_MAX_SPEED_BUDGET",
     "TELEMETRY_ENABLED": "EVOLUTION_TELEMETRY",
     "BODY_PIXEL_SCALE": "EVOLUTION_BODY_PIXEL_SCALE",
     "USE_BODYGRAPH_SIZE": "EVOLUTION_USE_BODYGRAPH_SIZE",
@@ -228,6 +251,7 @@ def _coerce(value: str, field: str) -> Any:
         "THRUST_SCALE_EXPONENT",
         "THRUST_BASE_MULTIPLIER",
         "DRAG_COEFFICIENT_MULTIPLIER",
+        "MAX_SPEED_BUDGET",
     }:
         return float(value)
     return int(value)
@@ -288,6 +312,8 @@ _NUMERIC_BOUNDS: Dict[str, tuple[float, float]] = {
     "INITIAL_BASEFORM_COUNT": (1, 10),
     "MUTATION_CHANCE": (0, 100),
     "FPS": (1, 360),
+    "MAX_SUBSTEPS": (1, 64),
+    "MAX_SPEED_BUDGET": (0.001, 1.0),
     "BODY_PIXEL_SCALE": (1.0, 50.0),
     "MODULE_SPRITE_SCALE": (0.05, 2.0),
     "MODULE_SPRITE_MIN_PX": (1.0, 64.0),
@@ -392,6 +418,12 @@ def _build_arg_parser() -> argparse.ArgumentParser:
     parser.add_argument("--initial-baseforms", type=int, help="Seed baseform templates")
     parser.add_argument("--mutation-chance", type=int, help="Mutation percentage")
     parser.add_argument("--fps", type=int, help="Target frames per second")
+    parser.add_argument("--max-substeps", type=int, help="Simulation ticks allowed per frame to catch up")
+    parser.add_argument(
+        "--max-speed-budget",
+        type=float,
+        help="Seconds of ticking per frame in max speed mode",
+    )
     parser.add_argument("--telemetry-enabled", type=int, help="Enable telemetry (1 or 0)")
     parser.add_argument("--body-pixel-scale", type=float, help="Pixels per simulated meter for body geometry")
     parser.add_argument("--module-sprite-scale", type=float, help="Multiplier for modular sprite size")
@@ -442,6 +474,8 @@ def load_runtime_settings(args: Sequence[str] | None = None, env: Mapping[str, s
         "INITIAL_BASEFORM_COUNT": parsed.initial_baseforms,
         "MUTATION_CHANCE": parsed.mutation_chance,
         "FPS": parsed.fps,
+        "MAX_SUBSTEPS": parsed.max_substeps,
+        "MAX_SPEED_BUDGET": parsed.max_speed_budget,
         "TELEMETRY_ENABLED": None if parsed.telemetry_enabled is None else bool(parsed.telemetry_enabled),
         "BODY_PIXEL_SCALE": parsed.body_pixel_scale,
         "USE_BODYGRAPH_SIZE": parsed.use_bodygraph_size,
@@ -462,6 +496,7 @@ def apply_runtime_settings(new_settings: SimulationSettings) -> SimulationSettin
     global _ACTIVE_SETTINGS
     global WORLD_WIDTH, WORLD_HEIGHT, WINDOW_WIDTH, WINDOW_HEIGHT
     global N_LIFEFORMS, MAX_LIFEFORMS, INITIAL_BASEFORM_COUNT, MUTATION_CHANCE, FPS
+    global MAX_SUBSTEPS, MAX_SPEED_BUDGET
     global LOG_DIRECTORY, DEBUG_LOG_FILE, DEBUG_LOG_LEVEL, TELEMETRY_ENABLED
     global BODY_PIXEL_SCALE, USE_BODYGRAPH_SIZE
     global MODULE_SPRITE_SCALE, MODULE_SPRITE_MIN_PX, MODULE_SPRITE_MIN_LENGTH, MODULE_SPRITE_MIN_HEIGHT
@@ -479,6 +514,8 @@ def apply_runtime_settings(new_settings: SimulationSettings) -> SimulationSettin
     INITIAL_BASEFORM_COUNT = new_settings.INITIAL_BASEFORM_COUNT
     MUTATION_CHANCE = new_settings.MUTATION_CHANCE
     FPS = new_settings.FPS
+    MAX_SUBSTEPS = new_settings.MAX_SUBSTEPS
+    MAX_SPEED_BUDGET = new_settings.MAX_SPEED_BUDGET
     LOG_DIRECTORY = new_settings.LOG_DIRECTORY
     DEBUG_LOG_FILE = new_settings.DEBUG_LOG_FILE
     DEBUG_LOG_LEVEL = new_settings.DEBUG_LOG_LEVEL
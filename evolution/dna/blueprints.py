@@ -6,6 +6,7 @@ import math
 import random
 from typing import Dict, Iterable, Mapping, Optional, Sequence
 
+from ..systems import rng as random_streams
 from .genes import Genome, GenomeConstraints, ModuleGene
 
 __all__ = ["generate_modular_blueprint"]
@@ -134,7 +135,7 @@ def generate_modular_blueprint(
 ) -> Dict[str, object]:
     """Build a modular blueprint tailored to ``diet`` and ``base_form``."""
 
-    rng = rng or random.Random()
+    rng = rng or random_streams.stream("blueprint")
     genes: Dict[str, ModuleGene] = {}
 
     # Default to a random base form if none provided
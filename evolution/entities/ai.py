@@ -9,15 +9,16 @@ from __future__ import annotations
 
 import logging
 import math
-import random
-from typing import Iterable, List, Optional, Tuple, TYPE_CHECKING
+from typing import Iterable, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 from pygame.math import Vector2
 
+from ..systems import rng as random_streams
 from .neural_controller import (
     INPUT_KEYS,
     OUTPUT_KEYS,
     NeuralController,
+    PopulationBrain,
     expected_weight_count,
     initialize_brain_weights,
 )
@@ -27,23 +28,50 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("evolution.ai")
 
+NEIGHBOR_DENSITY_RADIUS = 64.0
+# Noise input of the neural controllers
+_NOISE_RNG = random_streams.stream("ai")
+
+
+def sensing_radius(lifeform: "Lifeform") -> float:
+    """Largest radius any per-tick sensing query of ``lifeform`` uses.
+
+    The simulation engine prefetches neighbourhoods with this radius so the
+    vision, food-density and crowding queries share one batched lookup.
+    """
+
+    vision = float(getattr(lifeform, "vision", 0.0))
+    return max(vision, 12.0, NEIGHBOR_DENSITY_RADIUS)
+
 
 # ---------------------------------------------------------------------------
 # Public entry point
 # ---------------------------------------------------------------------------
 
-def update_brain(lifeform: "Lifeform", state: "SimulationState", dt: float) -> None:
+def update_brain(
+    lifeform: "Lifeform",
+    state: "SimulationState",
+    dt: float,
+    outputs: Optional[Sequence[float]] = None,
+) -> None:
     """Update the neural controller and translate outputs into actions.
 
     The controller only emits actuator commands: thrust intents, bite
     probability and luminescence tweaks. It does *not* set absolute
     positions or choose global targets; movement still flows through the
     physics layer.
+
+    Args:
+        lifeform: Creature to steer.
+        state: Shared simulation state used for sensing.
+        dt: Tick duration in seconds.
+        outputs: This creature's row from :func:`evaluate_brains`. When
+            omitted the controller is evaluated for this creature alone.
     """
 
-    controller = _ensure_controller(lifeform)
-    inputs = _gather_inputs(lifeform, state)
-    outputs = controller.forward(inputs)
+    if outputs is None:
+        controller = _ensure_controller(lifeform)
+        outputs = controller.forward(_gather_inputs(lifeform, state))
     commands = _interpret_outputs(outputs)
 
     lifeform.neural_commands = commands
@@ -74,6 +102,28 @@ def update_brain(lifeform: "Lifeform", state: "SimulationState", dt: float) -> N
     lifeform.current_behavior_mode = "neural"
 
 
+def evaluate_brains(
+    lifeforms: Sequence["Lifeform"],
+    state: "SimulationState",
+    population: Optional[PopulationBrain] = None,
+) -> List[List[float]]:
+    """Sense and run every controller in one batch.
+
+    All inputs are gathered before any creature acts, so the whole population
+    reacts to the same start-of-tick world. Pass ``population`` to keep the
+    stacked weight tensors alive between ticks.
+
+    Returns:
+        Raw network outputs aligned with ``lifeforms``, ready to hand to
+        :func:`update_brain`.
+    """
+
+    population = population or PopulationBrain()
+    controllers = [_ensure_controller(lifeform) for lifeform in lifeforms]
+    inputs = [_gather_inputs(lifeform, state) for lifeform in lifeforms]
+    return population.forward(controllers, inputs)
+
+
 # ---------------------------------------------------------------------------
 # Threat hooks
 # ---------------------------------------------------------------------------
@@ -101,8 +151,8 @@ def _ensure_controller(lifeform: "Lifeform") -> NeuralController:
     if controller is None:
         controller = NeuralController(weights)
         lifeform._neural_controller = controller
-    else:
-        controller.weights = list(weights)
+    elif controller.source is not weights:
+        controller.set_weights(weights)
     return controller
 
 
@@ -133,7 +183,7 @@ def _gather_inputs(lifeform: "Lifeform", state: "SimulationState") -> List[float
         neighbor_density,
         vertical_velocity,
         speed,
-        random.uniform(-1.0, 1.0),
+        _NOISE_RNG.uniform(-1.0, 1.0),
         buoyancy_bias,
         reproductive_urge,
         lifeform.risk_tolerance,
@@ -216,17 +266,17 @@ def _sense_food_density(
     if grid:
         # Use spatial grid
         if digest_plants > 0.1:
-            for plant in grid.query_plants(lifeform.x, lifeform.y, radius):
+            for plant in grid.nearby_plants(lifeform, radius):
                 target_pos = Vector2(plant.x + plant.width / 2, plant.y + plant.height / 2)
                 base_score = _score(target_pos)
                 targets.append(tuple(v * digest_plants for v in base_score))
                 
         if digest_meat > 0.1:
-            for carcass in grid.query_carcasses(lifeform.x, lifeform.y, radius):
+            for carcass in grid.nearby_carcasses(lifeform, radius):
                 target_pos = Vector2(carcass.rect.centerx, carcass.rect.centery)
                 base_score = _score(target_pos)
                 targets.append(tuple(v * digest_meat for v in base_score))
-            for other in grid.query_lifeforms(lifeform.x, lifeform.y, radius):
+            for other in grid.nearby_lifeforms(lifeform, radius):
                 if other is lifeform or other.health_now <= 0:
                     continue
                 target_pos = Vector2(other.rect.centerx, other.rect.centery)
@@ -265,16 +315,16 @@ def _sense_food_density(
 
 
 def _neighbor_density(lifeform: "Lifeform", state: "SimulationState") -> float:
-    radius = 64.0
+    radius = NEIGHBOR_DENSITY_RADIUS
     grid = getattr(state, "spatial_grid", None)
     count = 0
     
     if grid:
         # Use spatial grid
-        # Note: query_lifeforms returns candidates, we still check distance/identity
+        # Note: nearby_lifeforms measures from x/y, we still check rect centres
         radius_sq = radius * radius
         pos = Vector2(lifeform.x, lifeform.y)
-        for other in grid.query_lifeforms(lifeform.x, lifeform.y, radius):
+        for other in grid.nearby_lifeforms(lifeform, radius):
             if other is lifeform or other.health_now <= 0:
                 continue
             if (Vector2(other.rect.center) - pos).length_squared() <= radius_sq:
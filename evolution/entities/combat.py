@@ -5,16 +5,28 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from ..config import settings
+from ..systems.timers import NULL_TIMERS
 from . import feeding
 
 if TYPE_CHECKING:
     from .lifeform import Lifeform
 
 
-def resolve_close_interactions(lifeform: "Lifeform") -> None:
-    """Handle biomass biting and reproduction."""
+def resolve_close_interactions(lifeform: "Lifeform", timers=NULL_TIMERS) -> None:
+    """Handle biomass biting and reproduction.
 
-    feeding.resolve_biomass_bites(lifeform)
+    ``timers`` receives the ``feeding`` and ``reproduction`` phase timings
+    when the engine profiles the tick.
+    """
+
+    with timers.time("feeding"):
+        feeding.resolve_biomass_bites(lifeform)
+
+    with timers.time("reproduction"):
+        _resolve_reproduction(lifeform)
+
+
+def _resolve_reproduction(lifeform: "Lifeform") -> None:
 
     effects = lifeform.effects_manager
 
@@ -9,14 +9,21 @@ to the target type.
 
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
 from typing import Iterable, List, Optional, Tuple
 
 import pygame
 
 from ..config import settings
+from ..systems import rng as random_streams
 from . import ai
 
+# Closest reachable targets kept per category (plant, carcass, creature)
+BITE_TARGETS_PER_KIND = 3
+
+_RNG = random_streams.stream("feeding")
+
 
 @dataclass(slots=True)
 class BiomassTarget:
@@ -33,71 +40,138 @@ def _lifeform_anchor(entity) -> tuple[float, float]:
     return (entity.x + entity.width / 2, entity.y - 10)
 
 
+def _bite_reach(lifeform) -> Tuple[float, float, float]:
+    """Return (plant allowance, carcass reach, creature reach) for ``lifeform``.
+
+    The plant allowance excludes the plant's own radius; the exact per-plant
+    radius comes from :meth:`Lifeform._plant_feeding_radius`.
+    """
+
+    body = max(float(lifeform.width), float(lifeform.height))
+    reach = float(getattr(lifeform, "reach", 0.0))
+    plant_allowance = body * 0.5 + max(8.0, reach * 0.5)
+    carcass_reach = max(5.0, reach * 0.8 + body * 0.4)
+    creature_reach = max(4.0, reach + body * 0.25)
+    return plant_allowance, carcass_reach, creature_reach
+
+
+def _nearest(
+    candidates: Iterable[object],
+    center_of,
+    reach_of,
+    x: float,
+    y: float,
+    limit: float,
+) -> List[Tuple[float, object, Tuple[float, float]]]:
+    """Keep the ``BITE_TARGETS_PER_KIND`` closest candidates within reach."""
+
+    in_reach = []
+    for candidate in candidates:
+        cx, cy = center_of(candidate)
+        dx = cx - x
+        dy = cy - y
+        reach = min(limit, reach_of(candidate))
+        distance_sq = dx * dx + dy * dy
+        if distance_sq > reach * reach:
+            continue
+        in_reach.append((distance_sq, candidate, (cx, cy)))
+    if len(in_reach) > BITE_TARGETS_PER_KIND:
+        return heapq.nsmallest(BITE_TARGETS_PER_KIND, in_reach, key=lambda item: item[0])
+    return in_reach
+
+
 def _reachable_targets(lifeform) -> List[BiomassTarget]:
+    """Return the biteable biomass around ``lifeform``, nearest first.
+
+    Only targets within both vision and the bite reach of their category are
+    considered, and at most ``BITE_TARGETS_PER_KIND`` of each category are
+    kept. With a spatial grid the candidates come from a reach-sized query
+    instead of the full plant, carcass and lifeform lists.
+    """
+
     candidates: List[BiomassTarget] = []
     state = getattr(lifeform, "state", None)
     if state is None:
         return candidates
 
-    position = pygame.math.Vector2(lifeform.x, lifeform.y)
-    vision_sq = float(lifeform.vision) * float(lifeform.vision)
+    x = float(lifeform.x)
+    y = float(lifeform.y)
+    vision = float(lifeform.vision)
+    plant_allowance, carcass_reach, creature_reach = _bite_reach(lifeform)
+
+    plants = getattr(state, "plants", [])
+    carcasses = getattr(state, "carcasses", [])
+    creatures = getattr(state, "lifeforms", [])
+    grid = getattr(state, "spatial_grid", None)
+    if grid is not None:
+        plants = grid.nearby_plants(
+            lifeform, min(vision, max(6.0, plant_allowance + grid.max_plant_extent))
+        )
+        carcasses = grid.nearby_carcasses(lifeform, min(vision, carcass_reach))
+        creatures = grid.nearby_lifeforms(
+            lifeform, min(vision, creature_reach + grid.max_lifeform_extent)
+        )
 
-    for plant in getattr(state, "plants", []):
-        if getattr(plant, "resource", 0) <= 0:
-            continue
-        center = pygame.math.Vector2(plant.rect.center)
-        distance_sq = (center - position).length_squared()
-        if distance_sq > vision_sq:
-            continue
-        distance = distance_sq ** 0.5
-        hardness = max(0.1, getattr(plant, "density", 0.2))
+    nearest_plants = _nearest(
+        (plant for plant in plants if getattr(plant, "resource", 0) > 0),
+        lambda plant: plant.rect.center,
+        lifeform._plant_feeding_radius,
+        x,
+        y,
+        vision,
+    )
+    for distance_sq, plant, center in nearest_plants:
         candidates.append(
             BiomassTarget(
                 target=plant,
                 tag="plant",
-                position=(center.x, center.y),
-                distance=distance,
-                hardness=hardness,
+                position=center,
+                distance=distance_sq ** 0.5,
+                hardness=max(0.1, getattr(plant, "density", 0.2)),
                 is_dead=False,
             )
         )
 
-    for carcass in getattr(state, "carcasses", []):
-        if getattr(carcass, "resource", 0) <= 0:
-            continue
-        center = pygame.math.Vector2(carcass.rect.center)
-        distance_sq = (center - position).length_squared()
-        if distance_sq > vision_sq:
-            continue
-        distance = distance_sq ** 0.5
-        hardness = max(0.05, getattr(carcass, "body_density", 0.2))
+    nearest_carcasses = _nearest(
+        (carcass for carcass in carcasses if getattr(carcass, "resource", 0) > 0),
+        lambda carcass: carcass.rect.center,
+        lambda _: carcass_reach,
+        x,
+        y,
+        vision,
+    )
+    for distance_sq, carcass, center in nearest_carcasses:
         candidates.append(
             BiomassTarget(
                 target=carcass,
                 tag="meat",
-                position=(center.x, center.y),
-                distance=distance,
-                hardness=hardness,
+                position=center,
+                distance=distance_sq ** 0.5,
+                hardness=max(0.05, getattr(carcass, "body_density", 0.2)),
                 is_dead=True,
             )
         )
 
-    for creature in getattr(state, "lifeforms", []):
-        if creature is lifeform or creature.health_now <= 0:
-            continue
-        center = pygame.math.Vector2(creature.rect.center)
-        distance_sq = (center - position).length_squared()
-        if distance_sq > vision_sq:
-            continue
-        distance = distance_sq ** 0.5
-        hardness = float(getattr(creature, "tissue_hardness", 0.6))
+    nearest_creatures = _nearest(
+        (
+            creature
+            for creature in creatures
+            if creature is not lifeform and creature.health_now > 0
+        ),
+        lambda creature: creature.rect.center,
+        lambda _: creature_reach,
+        x,
+        y,
+        vision,
+    )
+    for distance_sq, creature, center in nearest_creatures:
         candidates.append(
             BiomassTarget(
                 target=creature,
                 tag="meat",
-                position=(center.x, center.y),
-                distance=distance,
-                hardness=hardness,
+                position=center,
+                distance=distance_sq ** 0.5,
+                hardness=float(getattr(creature, "tissue_hardness", 0.6)),
                 is_lifeform=True,
                 is_dead=False,
             )
@@ -130,20 +204,13 @@ def _apply_plant_bite(lifeform, target: BiomassTarget, bite_strength: float) ->
         anchor = _lifeform_anchor(lifeform)
         effects.spawn_bite_label(anchor, "Munch!", color=(120, 220, 160))
     lifeform.record_activity("Bite biomass", doel="plant", voeding=total_nutrition)
-    
-    # DEBUG: Log successful plant bite
-    try:
-        with open("feeding_events.csv", "a") as f:
-            f.write(f"{pygame.time.get_ticks()},{getattr(lifeform, 'id', 'unknown')},plant,{total_nutrition:.2f},{bite_strength:.2f}\n")
-    except Exception:
-        pass
 
     return True
 
 
 def _apply_carcass_bite(lifeform, target: BiomassTarget, bite_strength: float) -> bool:
     carcass = target.target
-    reach = max(5.0, lifeform.reach * 0.8 + max(lifeform.width, lifeform.height) * 0.4)
+    _, reach, _ = _bite_reach(lifeform)
     if target.distance > reach:
         return False
 
@@ -160,8 +227,7 @@ def _apply_carcass_bite(lifeform, target: BiomassTarget, bite_strength: float) -
         
         if available_modules:
             # Pick a random module to simulate "biting a chunk"
-            import random
-            target_module = random.choice(available_modules)
+            target_module = _RNG.choice(available_modules)
             nutrition = carcass.consume_module(target_module)
         else:
             # No modules left? Fallback to generic consume if implemented, or 0
@@ -179,16 +245,12 @@ def _apply_carcass_bite(lifeform, target: BiomassTarget, bite_strength: float) -
     
     lifeform.record_activity("Bite biomass", doel="carrion", voeding=nutrition)
 
-    # DEBUG: Log successful carcass bite
-    try:
-        with open("feeding_events.csv", "a") as f:
-            f.write(f"{pygame.time.get_ticks()},{getattr(lifeform, 'id', 'unknown')},carcass,{nutrition:.2f},{bite_strength:.2f}\n")
-    except Exception:
-        pass
-
     if getattr(carcass, "is_depleted", lambda: False)():
         if carcass in getattr(lifeform.state, "carcasses", []):
             lifeform.state.carcasses.remove(carcass)
+        grid = getattr(lifeform.state, "spatial_grid", None)
+        if grid is not None:
+            grid.remove_carcass(carcass)
 
     effects = lifeform.effects_manager
     if effects:
@@ -199,7 +261,7 @@ def _apply_carcass_bite(lifeform, target: BiomassTarget, bite_strength: float) -
 
 def _apply_creature_bite(lifeform, target: BiomassTarget, bite_strength: float) -> bool:
     other = target.target
-    reach = max(4.0, lifeform.reach + max(lifeform.width, lifeform.height) * 0.25)
+    _, _, reach = _bite_reach(lifeform)
     if target.distance > reach:
         return False
 
@@ -258,21 +320,10 @@ def _apply_creature_bite(lifeform, target: BiomassTarget, bite_strength: float)
 def resolve_biomass_bites(lifeform) -> None:
     bite_intent = max(0.0, min(1.0, getattr(lifeform, "bite_intent", 0.0)))
     bite_force = float(getattr(lifeform, "bite_force", 0.0))
-    bite_force = float(getattr(lifeform, "bite_force", 0.0))
     bite_damage = float(getattr(lifeform, "bite_damage", 0.0))
-    
-    # Must have either innate bite force or a mouth (bite_damage) to eat
-    
+
     # Must have a mouth (bite_damage > 0) to eat.
     # Innate bite_force alone is not enough - you need a mouth module.
-    
-    # DEBUG: Log feeding attempts
-    if bite_intent > 0.1:
-        try:
-            with open("feeding_debug.csv", "a") as f:
-                f.write(f"{pygame.time.get_ticks()},{getattr(lifeform, 'id', 'unknown')},{bite_intent:.2f},{bite_force:.2f},{bite_damage:.2f}\n")
-        except Exception:
-            pass
 
     if bite_intent <= 0 or bite_damage <= 0:
         return
@@ -14,7 +14,6 @@ from __future__ import annotations
 
 import logging
 import math
-import random
 from collections import deque
 from typing import Any, Deque, Dict, List, Optional, Tuple, TYPE_CHECKING
 
@@ -33,6 +32,7 @@ from ..world.advanced_carcass import DecomposingCarcass
 from ..world.world import BiomeRegion
 from . import reproduction
 from .locomotion import LocomotionProfile, derive_locomotion_profile
+from ..systems import rng as random_streams
 from ..systems.telemetry import log_event
 
 if TYPE_CHECKING:
@@ -41,6 +41,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger("evolution.simulation")
 
 _GRAVITY = 9.81  # m/s² - used for buoyancy diagnostics
+_RNG = random_streams.stream("lifeform")
 
 
 class BehaviorMode:
@@ -67,7 +68,7 @@ class Lifeform:
         self.velocity = Vector2()
 
         # Movement / Physics state
-        self.thrust_phase = random.uniform(0, 6.28)  # Random start phase for oscillation
+        self.thrust_phase = _RNG.uniform(0, 6.28)  # Random start phase for oscillation
         self.adrenaline_factor = 0.0
         # Legacy behaviour modes are deprecated in favour of neural control.
         self.current_behavior_mode = BehaviorMode.NEURAL
@@ -234,7 +235,7 @@ class Lifeform:
         self.initial_width = self.width
 
         counter = getattr(self.state, "lifeform_id_counter", 0)
-        self.id = f"{self.dna_id}_{counter}"
+        self.id = f"{self.dna_id}_{getattr(self.state, 'id_namespace', '')}{counter}"
         self.state.lifeform_id_counter = counter + 1
 
         # Derived / dynamic state
@@ -319,7 +320,7 @@ class Lifeform:
         }
 
         # Wander / escape state
-        initial_wander = Vector2(random.uniform(-1, 1), random.uniform(-1, 1))
+        initial_wander = Vector2(_RNG.uniform(-1, 1), _RNG.uniform(-1, 1))
         if initial_wander.length_squared() == 0:
             initial_wander = Vector2(1, 0)
         self.wander_direction = initial_wander.normalize()
@@ -337,6 +338,13 @@ class Lifeform:
         self._refresh_inertial_properties()
         self._compute_buoyancy_debug()
 
+        grid = getattr(state, "spatial_grid", None)
+        if grid is not None:
+            grid.add_lifeform(self)
+        population_stats = getattr(state, "population_stats", None)
+        if population_stats is not None:
+            population_stats.add(self)
+
     # ------------------------------------------------------------------
     # Convenience: access to global notification context via state
     # ------------------------------------------------------------------
@@ -374,7 +382,7 @@ class Lifeform:
         return tinted
 
     def _trigger_escape_manoeuvre(self, reason: str) -> None:
-        escape = Vector2(random.uniform(-1, 1), random.uniform(-1, 1))
+        escape = Vector2(_RNG.uniform(-1, 1), _RNG.uniform(-1, 1))
         if escape.length_squared() == 0:
             escape = Vector2(1, 0)
         escape = escape.normalize()
@@ -626,10 +634,11 @@ class Lifeform:
         if not self.state or not self.state.spatial_grid:
             return
 
-        # Query Grid
-        nearby_lifeforms = self.state.spatial_grid.query_lifeforms(self.x, self.y, vision_range)
-        nearby_plants = self.state.spatial_grid.query_plants(self.x, self.y, vision_range)
-        nearby_carcasses = self.state.spatial_grid.query_carcasses(self.x, self.y, vision_range)
+        # Query Grid (served from the per-tick prefetch when available)
+        grid = self.state.spatial_grid
+        nearby_lifeforms = grid.nearby_lifeforms(self, vision_range)
+        nearby_plants = grid.nearby_plants(self, vision_range)
+        nearby_carcasses = grid.nearby_carcasses(self, vision_range)
         
         # Filter and find closest
         closest_dist_sq = {
@@ -700,24 +709,19 @@ class Lifeform:
                 self.closest_carcass = carcass
     def _initialise_body(self, dna_profile: dict) -> None:
         diet = dna_profile.get("diet", "omnivore")
-        genome_data = dna_profile.get("genome") or generate_modular_blueprint(diet)
+        genome_data = dna_profile.get("genome") or generate_modular_blueprint(diet, rng=_RNG)
         try:
             genome = ensure_genome(genome_data)
             graph, geometry = build_body_graph(genome, include_geometry=True)
         except Exception as exc:  # pragma: no cover - defensive fallback
             import sys
-            with open("c:/Users/Jasper/PycharmProjects/OpenAIcoop2/error_log.txt", "w") as f:
-                f.write(f"ERROR: Failed to build body graph for dna {dna_profile.get('dna_id')}: {exc}\n")
-                import traceback
-                traceback.print_exc(file=f)
-            
             print(f"ERROR: Failed to build body graph for dna {dna_profile.get('dna_id')}: {exc}", file=sys.stderr)
             import traceback
             traceback.print_exc(file=sys.stderr)
             logger.exception(
                 "Failed to build body graph for dna %s: %s", dna_profile.get("dna_id"), exc
             )
-            fallback = generate_modular_blueprint(diet)
+            fallback = generate_modular_blueprint(diet, rng=_RNG)
             genome = ensure_genome(fallback)
             graph, geometry = build_body_graph(genome, include_geometry=True)
         self.genome: Genome = genome
@@ -1152,7 +1156,15 @@ class Lifeform:
 
         if self in self.state.lifeforms:
             self.state.lifeforms.remove(self)
+        grid = getattr(self.state, "spatial_grid", None)
+        if grid is not None:
+            grid.remove_lifeform(self)
+            grid.add_carcass(carcass)
         self.state.death_ages.append(self.age)
+        population_stats = getattr(self.state, "population_stats", None)
+        if population_stats is not None:
+            population_stats.remove(self)
+            population_stats.record_death(self.age)
         return True
 
     def update_angle(self) -> None:
@@ -1251,7 +1263,7 @@ class Lifeform:
             self.generation + 1,
             parents=child_parents,
         )
-        if random.randint(0, 100) < 10:
+        if _RNG.randint(0, 100) < 10:
             child.is_leader = True
         self.state.lifeforms.append(child)
 
@@ -1322,7 +1334,7 @@ class Lifeform:
             self.generation + 1,
             parents=child_parents,
         )
-        if random.randint(0, 100) < 10:
+        if _RNG.randint(0, 100) < 10:
             child.is_leader = True
         self.state.lifeforms.append(child)
 
@@ -1397,6 +1409,9 @@ class Lifeform:
                  self.height = max(1, scaled_height)
                  # Update mass
                  self.mass = self._scaled_mass(self.body_mass * current_growth)
+                 population_stats = getattr(self.state, "population_stats", None)
+                 if population_stats is not None:
+                     population_stats.refresh(self)
 
         self.energy_now += (
             settings.ENERGY_RECOVERY_PER_SECOND
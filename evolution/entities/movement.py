@@ -15,7 +15,8 @@ from __future__ import annotations
 
 import logging
 import math
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
 
 from evolution.config import settings
 
@@ -25,6 +26,7 @@ from pygame.math import Vector2
 from ..config import settings
 from ..physics.physics_body import PhysicsBody
 from ..systems import telemetry
+from ..systems.timers import NULL_TIMERS
 
 from . import ai, combat  # Gebruik aparte modules voor gedrag en interacties
 
@@ -162,7 +164,21 @@ def _blend_desired_with_velocity(lifeform: "Lifeform", desired: Vector2) -> Vect
     return blended
 
 
-def update_movement(lifeform: "Lifeform", state: "SimulationState", dt: float) -> None:
+@dataclass(slots=True)
+class MovementPlan:
+    """Thrust phase result handed to the fluid integration and resolution."""
+
+    previous_position: Tuple[float, float]
+    max_swim_speed: float
+    energy_cost: float
+
+
+def update_movement(
+    lifeform: "Lifeform",
+    state: "SimulationState",
+    dt: float,
+    brain_outputs: Optional[Sequence[float]] = None,
+) -> None:
     """Hoofdfunctie voor movement.
 
     Stappen:
@@ -172,12 +188,88 @@ def update_movement(lifeform: "Lifeform", state: "SimulationState", dt: float) -
     4. Positie & rect bijwerken
     5. Stuck-detectie
     6. Debug-notificaties + short-range interacties
+
+    ``brain_outputs`` is de rij van deze lifeform uit ``ai.evaluate_brains``
+    wanneer de engine alle breinen in één batch heeft doorgerekend.
+    De engine roept de fases los aan (``plan_movement``,
+    ``integrate_planned`` en ``finish_movement``) zodat de vloeistof-
+    integratie voor de hele populatie tegelijk kan draaien.
+    """
+
+    plan = plan_movement(lifeform, state, dt, brain_outputs)
+    if plan is None:
+        return
+
+    # Fluid dynamics interaction (simplified)
+    attempted_position, fluid = state.world.apply_fluid_dynamics(
+        lifeform,
+        Vector2(0,0), # Thrust already applied to velocity
+        dt,
+        max_speed=plan.max_swim_speed,
+    )
+
+    current = None
+    if fluid is not None:
+        lifeform.last_fluid_properties = fluid
+        current = (fluid.current.x, fluid.current.y)
+    finish_movement(
+        lifeform, state, dt, plan, (attempted_position.x, attempted_position.y), current
+    )
+
+
+def integrate_planned(
+    lifeforms: Sequence["Lifeform"],
+    plans: Sequence[Optional[MovementPlan]],
+    state: "SimulationState",
+    dt: float,
+) -> List[Optional[Tuple[Tuple[float, float], Optional[Tuple[float, float]]]]]:
+    """Run the fluid integration for every planned lifeform in one batch.
+
+    Returns:
+        Per lifeform ``(attempted_position, current)`` for ``finish_movement``,
+        or ``None`` where no plan was made.
+    """
+
+    planned = [(lifeform, plan) for lifeform, plan in zip(lifeforms, plans) if plan is not None]
+    positions, currents = state.world.apply_fluid_dynamics_batch(
+        [lifeform for lifeform, _ in planned],
+        dt,
+        max_speeds=[plan.max_swim_speed for _, plan in planned],
+    )
+    results = iter(
+        zip(positions, currents if currents is not None else [None] * len(positions))
+    )
+    return [next(results) if plan is not None else None for plan in plans]
+
+
+def plan_movement(
+    lifeform: "Lifeform",
+    state: "SimulationState",
+    dt: float,
+    brain_outputs: Optional[Sequence[float]] = None,
+    timers=NULL_TIMERS,
+) -> Optional[MovementPlan]:
+    """Brein bijwerken en stuwkracht op de snelheid toepassen (stap 1).
+
+    Args:
+        timers: Optionele :class:`TimerAggregator` voor de tick-profiler.
+
+    Returns:
+        Het plan voor de vloeistof-integratie, of ``None`` zonder physics body.
     """
 
     # --------------------------------------------------
     # 1. Gedrag / AI update (FASE 6)
     # --------------------------------------------------
-    ai.update_brain(lifeform, state, dt)
+    with timers.time("update_brain"):
+        ai.update_brain(lifeform, state, dt, brain_outputs)
+
+    with timers.time("thrust_mixer"):
+        return _mix_thrust(lifeform, dt)
+
+
+def _mix_thrust(lifeform: "Lifeform", dt: float) -> Optional[MovementPlan]:
+    """Stuwkracht over de thrusters verdelen en snelheid/hoek integreren."""
 
     previous_position = (lifeform.x, lifeform.y)
     now_ms = pygame.time.get_ticks()
@@ -193,7 +285,7 @@ def update_movement(lifeform: "Lifeform", state: "SimulationState", dt: float) -
     physics_body: PhysicsBody | None = getattr(lifeform, "physics_body", None)
     if physics_body is None:
         logger.warning("Lifeform %s missing physics_body; skipping movement", lifeform.id)
-        return
+        return None
 
     max_swim_speed = max(1.0, getattr(lifeform, "max_swim_speed", 120.0))
 
@@ -428,23 +520,36 @@ def update_movement(lifeform: "Lifeform", state: "SimulationState", dt: float) -
         effort=avg_effort,
     )
     
-    # Fluid dynamics interaction (simplified)
-    attempted_position, fluid = state.world.apply_fluid_dynamics(
-        lifeform,
-        Vector2(0,0), # Thrust already applied to velocity
-        dt,
-        max_speed=max_swim_speed,
-    )
-    
-    if fluid is not None:
-        lifeform.last_fluid_properties = fluid
+    return MovementPlan(previous_position, max_swim_speed, total_energy_cost)
+
+
+def finish_movement(
+    lifeform: "Lifeform",
+    state: "SimulationState",
+    dt: float,
+    plan: MovementPlan,
+    attempted_position: Tuple[float, float],
+    current: Optional[Tuple[float, float]],
+    timers=NULL_TIMERS,
+) -> None:
+    """Geïntegreerde positie oplossen tegen de wereld (stappen 2 t/m 6).
+
+    Args:
+        plan: Resultaat van ``plan_movement``.
+        attempted_position: Positie na de vloeistof-integratie.
+        current: Oceaanstroming op de lifeform, indien er een oceaan is.
+        timers: Optionele :class:`TimerAggregator` voor de tick-profiler.
+    """
+
+    previous_position = plan.previous_position
+    if current is not None:
         if getattr(lifeform, "locomotion_strategy", "") == "tentacle_walker":
             stick = min(0.9, getattr(lifeform, "grip_strength", 1.0) * 0.4)
-            lifeform.velocity -= fluid.current * stick * 0.015
+            lifeform.velocity -= Vector2(current) * stick * 0.015
 
-    lifeform.energy_now = max(0.0, lifeform.energy_now - total_energy_cost * dt)
-    attempted_x = float(attempted_position.x)
-    attempted_y = float(attempted_position.y)
+    lifeform.energy_now = max(0.0, lifeform.energy_now - plan.energy_cost * dt)
+    attempted_x = float(attempted_position[0])
+    attempted_y = float(attempted_position[1])
 
     candidate_rect = lifeform.rect.copy()
     candidate_rect.update(
@@ -457,17 +562,18 @@ def update_movement(lifeform: "Lifeform", state: "SimulationState", dt: float) -
     # --------------------------------------------------
     # 2. Movement-resolutie via de wereld
     # --------------------------------------------------
-    (
-        resolved_x,
-        resolved_y,
-        hit_boundary_x,
-        hit_boundary_y,
-        collided,
-    ) = state.world.resolve_entity_movement(
-        candidate_rect,
-        previous_position,
-        (attempted_x, attempted_y),
-    )
+    with timers.time("resolve_entity_movement"):
+        (
+            resolved_x,
+            resolved_y,
+            hit_boundary_x,
+            hit_boundary_y,
+            collided,
+        ) = state.world.resolve_entity_movement(
+            candidate_rect,
+            previous_position,
+            (attempted_x, attempted_y),
+        )
 
     # --------------------------------------------------
     # 3. Collisions / boundaries / escape-logica
@@ -563,7 +669,7 @@ def update_movement(lifeform: "Lifeform", state: "SimulationState", dt: float) -
             context.debug(f"{lifeform.id} heeft partner {lifeform.closest_partner.id}")
 
     # FASE 7: korte-afstand interacties
-    combat.resolve_close_interactions(lifeform)
+    combat.resolve_close_interactions(lifeform, timers)
 
 
 def _anchor_benthic_crawler(
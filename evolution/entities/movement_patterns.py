@@ -2,7 +2,11 @@
 
 import math
 from pygame.math import Vector2
-import random
+
+from ..systems import rng as random_streams
+
+_RNG = random_streams.stream("movement")
+
 
 def get_wander_vector(
     current_velocity: Vector2,
@@ -26,7 +30,7 @@ def get_wander_vector(
         
     # 2. Calculate displacement on the circle based on angle
     # Add small random jitter to the angle
-    jitter = (random.random() - 0.5) * wander_strength
+    jitter = (_RNG.random() - 0.5) * wander_strength
     new_angle = current_wander_angle + jitter
     
     # Constrain angle to avoid spinning? No, wandering can loop.
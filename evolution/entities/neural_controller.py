@@ -7,8 +7,17 @@ from __future__ import annotations
 
 import math
 import random
-from typing import Iterable, List, Sequence
+from typing import Dict, Iterable, List, Sequence, Tuple
 
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - fallback when numpy is missing
+    np = None
+    NUMPY_AVAILABLE = False
+
+from ..systems import rng as random_streams
 
 INPUT_KEYS: Sequence[str] = (
     "food_density_forward",
@@ -40,6 +49,9 @@ OUTPUT_KEYS: Sequence[str] = (
 # Small fixed network: Input -> Hidden(12) -> Output
 HIDDEN_SIZES: Sequence[int] = (12,)
 
+# Layer widths from input to output; controllers are batched per topology.
+TOPOLOGY: Tuple[int, ...] = (len(INPUT_KEYS), *HIDDEN_SIZES, len(OUTPUT_KEYS))
+
 
 def expected_weight_count() -> int:
     """Return the flattened parameter count for the fixed topology."""
@@ -54,7 +66,7 @@ def expected_weight_count() -> int:
 
 
 def initialize_brain_weights(rng: random.Random | None = None) -> List[float]:
-    rng = rng or random
+    rng = rng or random_streams.stream("brain")
     scale = 0.25
     return [rng.gauss(0.0, scale) for _ in range(expected_weight_count())]
 
@@ -66,7 +78,7 @@ def mutate_brain_weights(
     sigma: float = 0.1,
     mutation_rate: float = 0.1,
 ) -> List[float]:
-    rng = rng or random
+    rng = rng or random_streams.stream("brain")
     mutated = list(weights)
     for i, value in enumerate(mutated):
         if rng.random() < mutation_rate:
@@ -80,10 +92,41 @@ class NeuralController:
     def __init__(self, weights: Sequence[float] | None = None) -> None:
         if weights is None:
             weights = initialize_brain_weights()
+        self.topology: Tuple[int, ...] = TOPOLOGY
+        self.set_weights(weights)
+
+    def set_weights(self, weights: Sequence[float]) -> None:
+        """Replace the parameters and drop the cached layer matrices.
+
+        ``source`` keeps a reference to the sequence the weights were copied
+        from, so callers can skip the copy while a lifeform keeps the same
+        ``brain_weights`` list.
+        """
+
         expected = expected_weight_count()
         if len(weights) != expected:
             raise ValueError(f"Expected {expected} weights, got {len(weights)}")
         self.weights = list(weights)
+        self.source = weights
+        self._layers = None
+
+    def layer_matrices(self) -> List["np.ndarray"]:
+        """Return one ``(outputs, inputs + 1)`` matrix per layer, bias last.
+
+        The matrices are built once per weight set and reused by
+        :class:`PopulationBrain` when it restacks the population.
+        """
+
+        if self._layers is None:
+            flat = np.asarray(self.weights, dtype=np.float64)
+            layers = []
+            offset = 0
+            for prev_size, size in zip(self.topology, self.topology[1:]):
+                span = (prev_size + 1) * size
+                layers.append(flat[offset : offset + span].reshape(size, prev_size + 1))
+                offset += span
+            self._layers = layers
+        return self._layers
 
     def forward(self, inputs: Iterable[float]) -> List[float]:
         x = list(inputs)
@@ -116,3 +159,89 @@ class NeuralController:
                 acc += value * weights[neuron_idx + i]
             outputs.append(math.tanh(acc))
         return outputs
+
+
+class PopulationBrain:
+    """Evaluate many :class:`NeuralController` instances in one pass.
+
+    Controllers are grouped by topology and each group's layer matrices are
+    stacked into ``(n, outputs, inputs + 1)`` tensors, so a layer becomes one
+    batched matmul plus ``tanh`` for the whole group. The stacks are kept
+    until the group's members or their weights change, which in a running
+    simulation only happens on births and deaths.
+
+    Without NumPy every controller simply runs :meth:`NeuralController.forward`.
+    """
+
+    def __init__(self) -> None:
+        self._layers: Dict[Tuple[int, ...], List[object]] = {}
+        self._stacks: Dict[Tuple[int, ...], List["np.ndarray"]] = {}
+
+    def forward(
+        self,
+        controllers: Sequence[NeuralController],
+        inputs: Sequence[Sequence[float]],
+    ) -> List[List[float]]:
+        """Return the outputs of ``controllers[i]`` for ``inputs[i]``."""
+
+        if len(controllers) != len(inputs):
+            raise ValueError("Every controller needs exactly one input vector")
+        if not NUMPY_AVAILABLE:
+            return [c.forward(x) for c, x in zip(controllers, inputs)]
+
+        groups: Dict[Tuple[int, ...], List[int]] = {}
+        for index, controller in enumerate(controllers):
+            groups.setdefault(controller.topology, []).append(index)
+
+        results: List[List[float]] = [[] for _ in controllers]
+        for topology, indices in groups.items():
+            members = [controllers[i] for i in indices]
+            matrix = np.asarray([inputs[i] for i in indices], dtype=np.float64)
+            if matrix.shape[1] != topology[0]:
+                raise ValueError(f"Expected {topology[0]} inputs, received {matrix.shape[1]}")
+            outputs = self._forward_group(topology, members, matrix)
+            for i, row in zip(indices, outputs.tolist()):
+                results[i] = row
+        # Groups that vanished this call free their stacked tensors
+        for topology in list(self._stacks):
+            if topology not in groups:
+                self._forget(topology)
+        return results
+
+    def _forward_group(
+        self,
+        topology: Tuple[int, ...],
+        members: List[NeuralController],
+        values: "np.ndarray",
+    ) -> "np.ndarray":
+        stacks = self._stacked(topology, members)
+        ones = np.ones((values.shape[0], 1), dtype=np.float64)
+        for weights in stacks:
+            augmented = np.concatenate((values, ones), axis=1)
+            values = np.tanh(np.matmul(weights, augmented[:, :, None])[:, :, 0])
+        return values
+
+    def _stacked(
+        self,
+        topology: Tuple[int, ...],
+        members: List[NeuralController],
+    ) -> List["np.ndarray"]:
+        layers = [c.layer_matrices() for c in members]
+        cached_layers = self._layers.get(topology)
+        if (
+            cached_layers is not None
+            and len(cached_layers) == len(layers)
+            and all(a is b for a, b in zip(cached_layers, layers))
+        ):
+            return self._stacks[topology]
+
+        stacks = [np.stack([member[l] for member in layers]) for l in range(len(topology) - 1)]
+        # Cached by identity: holding the layer lists keeps them from being
+        # recycled, so a matching list really is the same weight set.
+        self._layers[topology] = layers
+        self._stacks[topology] = stacks
+        return stacks
+
+    def _forget(self, topology: Tuple[int, ...]) -> None:
+        self._layers.pop(topology, None)
+        self._stacks.pop(topology, None)
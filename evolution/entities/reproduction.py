@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import random
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Mapping, Optional, Tuple, TYPE_CHECKING
 
@@ -13,6 +12,7 @@ from ..dna.factory import build_body_graph
 from ..dna.genes import Genome
 from ..dna.mutation import MutationError, mutate_genome
 from ..morphology.genotype import MorphologyGenotype, mutate_profile_morphology
+from ..systems import rng as random_streams
 from .neural_controller import (
     expected_weight_count,
     initialize_brain_weights,
@@ -23,6 +23,9 @@ if TYPE_CHECKING:
     from ..simulation.state import SimulationState
     from .lifeform import Lifeform
 
+# Mutation and inheritance draws
+_RNG = random_streams.stream("mutation")
+
 
 @dataclass(frozen=True)
 class OffspringMetadata:
@@ -229,10 +232,11 @@ def _mutate_offspring(profile: Dict[str, object]) -> List[str]:
     # but for now we rely on the upstream structural mutations.
     
     # 2. Brain Mutation
-    if "brain_weights" in profile and random.randint(0, 100) < settings.MUTATION_CHANCE:
+    if "brain_weights" in profile and _RNG.randint(0, 100) < settings.MUTATION_CHANCE:
         weights = list(profile["brain_weights"]) # type: ignore
         profile["brain_weights"] = mutate_brain_weights(
             weights,
+            rng=_RNG,
             mutation_rate=0.1, # 10% of weights change
             sigma=0.1
         )
@@ -251,21 +255,21 @@ def _mutate_offspring(profile: Dict[str, object]) -> List[str]:
     ]
     
     for trait in traits:
-        if trait in profile and random.randint(0, 100) < settings.MUTATION_CHANCE:
+        if trait in profile and _RNG.randint(0, 100) < settings.MUTATION_CHANCE:
             current = float(profile[trait]) # type: ignore
             # +/- 10% variation
-            delta = random.uniform(-0.1, 0.1)
+            delta = _RNG.uniform(-0.1, 0.1)
             new_val = current + delta
             # Clamp logic will handle limits later
             profile[trait] = new_val
             mutations.append(trait)
 
     # Color mutation
-    if random.randint(0, 100) < settings.MUTATION_CHANCE:
+    if _RNG.randint(0, 100) < settings.MUTATION_CHANCE:
         r, g, b = profile["color"] # type: ignore
-        dr = random.randint(-20, 20)
-        dg = random.randint(-20, 20)
-        db = random.randint(-20, 20)
+        dr = _RNG.randint(-20, 20)
+        dg = _RNG.randint(-20, 20)
+        db = _RNG.randint(-20, 20)
         profile["color"] = (r + dr, g + dg, b + db)
         mutations.append(f"color: {profile['color']}")
 
@@ -281,11 +285,11 @@ def _mix_parent_traits(parent: "Lifeform", partner: "Lifeform") -> Tuple[Dict[st
     risk = (parent.risk_tolerance + partner.risk_tolerance) / 2
     restlessness = (parent.restlessness + partner.restlessness) / 2
 
-    diet = parent.diet if parent.diet == partner.diet else random.choice(
+    diet = parent.diet if parent.diet == partner.diet else _RNG.choice(
         [parent.diet, partner.diet]
     )
 
-    morphology = MorphologyGenotype.mix(parent.morphology, partner.morphology)
+    morphology = MorphologyGenotype.mix(parent.morphology, partner.morphology, rng=_RNG)
     development = mix_development_plans(diet, parent.development, partner.development)
 
     genome_blueprint, genome_mutations = _mix_parent_genome(parent, partner)
@@ -344,8 +348,8 @@ def _clone_parent_traits(parent: "Lifeform") -> Tuple[Dict[str, object], List[st
             current_genome = parent.genome
             
             # Apply mutation chance
-            if random.randint(0, 100) < settings.MUTATION_CHANCE:
-                new_genome, desc = mutate_genome(current_genome)
+            if _RNG.randint(0, 100) < settings.MUTATION_CHANCE:
+                new_genome, desc = mutate_genome(current_genome, rng=_RNG)
                 genome_blueprint = new_genome.to_dict()
                 mutations.append(desc)
             else:
@@ -357,7 +361,7 @@ def _clone_parent_traits(parent: "Lifeform") -> Tuple[Dict[str, object], List[st
     else:
         genome_blueprint = parent.genome_blueprint.copy() if parent.genome_blueprint else {}
 
-    brain_weights = list(parent.brain_weights) if parent.brain_weights else initialize_brain_weights()
+    brain_weights = list(parent.brain_weights) if parent.brain_weights else initialize_brain_weights(_RNG)
 
     return {
         "dna_id": parent.dna_id,
@@ -384,14 +388,14 @@ def _mix_parent_genome(parent: "Lifeform", partner: "Lifeform") -> Tuple[Dict[st
         if isinstance(candidate, Genome):
             genomes.append(candidate)
     if not genomes:
-        return generate_modular_blueprint(getattr(parent, "diet", "omnivore")), []
+        return generate_modular_blueprint(getattr(parent, "diet", "omnivore"), rng=_RNG), []
 
-    base = random.choice(genomes)
+    base = _RNG.choice(genomes)
     genome = base
     mutations = []
     try:
-        if random.randint(0, 100) < settings.MUTATION_CHANCE:
-            genome, desc = mutate_genome(genome)
+        if _RNG.randint(0, 100) < settings.MUTATION_CHANCE:
+            genome, desc = mutate_genome(genome, rng=_RNG)
             mutations.append(desc)
     except MutationError:
         genome = base
@@ -570,7 +574,7 @@ def _register_new_profile(
     parent_id = str(parent.dna_id)
     counts = state.dna_id_counts
     counts[parent_id] = counts.get(parent_id, 0) + 1
-    new_id = f"{parent_id}-{counts[parent_id]}"
+    new_id = f"{parent_id}-{getattr(state, 'id_namespace', '')}{counts[parent_id]}"
 
     new_profile = candidate.copy()
     new_profile["dna_id"] = new_id
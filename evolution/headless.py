@@ -0,0 +1,247 @@
+"""Run the simulation without a window.
+
+Usage::
+
+    python -m evolution.headless --ticks 2000 --seed 42
+    python -m evolution.headless --ticks 2000 --profile-json profile.json --profile-slowest 3
+    python -m evolution.headless --ticks 2000 --seed 42 --shards 4
+
+Any remaining arguments are forwarded to the regular runtime settings parser,
+so ``--n-lifeforms`` or ``--config`` work exactly as they do for ``main.py``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import time
+from typing import Dict, Optional, Sequence
+
+from .config import settings
+from .config.settings import SimulationSettings
+from .rendering.camera import Camera
+from .rendering.effects import EffectManager
+from .simulation import bootstrap, environment
+from .simulation.engine import SimulationEngine
+from .simulation.state import SimulationState
+from .systems import rng as random_streams
+from .systems.events import EventManager
+from .systems.notifications import NotificationManager
+from .systems.player import PlayerController
+from .world.world import World
+
+logger = logging.getLogger(__name__)
+
+
+def build_engine(
+    runtime: Optional[SimulationSettings] = None,
+    *,
+    seed: Optional[int] = None,
+    stats_interval: Optional[int] = None,
+) -> SimulationEngine:
+    """Create a freshly populated world wrapped in a :class:`SimulationEngine`.
+
+    Args:
+        runtime: Settings to simulate with. Defaults to the active settings.
+        seed: Optional seed for every named random stream (and the shared
+            ``random`` module) so runs are bit-reproducible.
+        stats_interval: Ticks between population-stat snapshots. Defaults to
+            ``settings.STATS_PUBLISH_INTERVAL``.
+
+    Returns:
+        An engine whose state is ready for :meth:`SimulationEngine.step`.
+    """
+
+    runtime = runtime or settings.current_settings()
+    random_streams.seed_all(seed)
+    rng = random_streams.stream("bootstrap")
+
+    state = SimulationState()
+    world = World(
+        runtime.WORLD_WIDTH,
+        runtime.WORLD_HEIGHT,
+        world_type=state.world_type,
+        environment_modifiers=state.environment_modifiers,
+    )
+    camera = Camera(
+        runtime.WINDOW_WIDTH,
+        runtime.WINDOW_HEIGHT,
+        runtime.WORLD_WIDTH,
+        runtime.WORLD_HEIGHT,
+    )
+    notification_manager = NotificationManager()
+    event_manager = EventManager(notification_manager, state.environment_modifiers)
+    player_controller = PlayerController(notification_manager, state.dna_profiles, state.lifeforms)
+    effects_manager = EffectManager()
+
+    bootstrap.reset_simulation(
+        state,
+        world,
+        camera,
+        event_manager,
+        player_controller,
+        notification_manager,
+        effects_manager,
+    )
+    bootstrap.generate_dna_profiles(state, world, rng)
+    bootstrap.seed_vegetation(state, world, rng)
+    bootstrap.spawn_lifeforms(state, world, rng)
+    environment.sync_food_abundance(state)
+    environment.sync_moss_growth_speed(state)
+
+    return SimulationEngine(
+        state,
+        event_manager=event_manager,
+        player_controller=player_controller,
+        notification_manager=notification_manager,
+        effects_manager=effects_manager,
+        stats_interval=stats_interval,
+    )
+
+
+def profile_report(engine: SimulationEngine, *, lines: int = 15) -> Dict[str, object]:
+    """Per-phase tick timings plus any captured slow-tick profiles."""
+
+    phases = engine.timers.summary()
+    report: Dict[str, object] = {
+        "ticks": engine.tick_count,
+        "phases": dict(sorted(phases.items(), key=lambda item: item[1]["mean_ms"], reverse=True)),
+        "slowest_ticks": [],
+    }
+    capture = engine.slow_ticks
+    if capture is not None:
+        report["slowest_ticks"] = [
+            {"tick": tick, "ms": round(duration_ms, 3), "profile": capture.report(stats, lines)}
+            for duration_ms, tick, stats in capture.slowest()
+        ]
+    return report
+
+
+def run_headless(
+    ticks: int,
+    *,
+    seed: Optional[int] = None,
+    dt: Optional[float] = None,
+    runtime: Optional[SimulationSettings] = None,
+    profile_path: Optional[str] = None,
+    profile_slowest: int = 0,
+    stats_interval: Optional[int] = None,
+) -> Dict[str, object]:
+    """Simulate ``ticks`` fixed steps and return a short run summary.
+
+    Args:
+        profile_path: When set, write :func:`profile_report` as JSON there.
+        profile_slowest: Run every tick under cProfile and keep this many of
+            the slowest profiles for the report.
+        stats_interval: Ticks between population-stat snapshots.
+    """
+
+    runtime = runtime or settings.current_settings()
+    step_dt = dt if dt is not None else 1.0 / max(1, runtime.FPS)
+    engine = build_engine(runtime, seed=seed, stats_interval=stats_interval)
+    engine.enable_slow_tick_capture(profile_slowest)
+    engine.profile_phases = bool(profile_path)
+
+    started = time.perf_counter()
+    for _ in range(max(0, ticks)):
+        engine.step(step_dt)
+    elapsed = time.perf_counter() - started
+
+    if profile_path:
+        with open(profile_path, "w", encoding="utf-8") as handle:
+            json.dump(profile_report(engine), handle, indent=2)
+
+    stats = engine.publish_stats() if engine.tick_count else {}
+    return {
+        "ticks": engine.tick_count,
+        "seed": seed,
+        "dt": step_dt,
+        "wall_seconds": round(elapsed, 4),
+        "ticks_per_second": round(engine.tick_count / elapsed, 2) if elapsed > 0 else None,
+        "lifeforms": stats.get("lifeform_count", len(engine.state.lifeforms)),
+        "plants": len(engine.state.plants),
+        "carcasses": len(engine.state.carcasses),
+        "deaths": len(engine.state.death_ages),
+    }
+
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Run the evolution simulation without a display",
+    )
+    parser.add_argument("--ticks", type=int, default=1000, help="Number of simulation ticks to run")
+    parser.add_argument("--seed", type=int, help="Seed for reproducible runs")
+    parser.add_argument("--dt", type=float, help="Tick length in seconds (defaults to 1 / FPS)")
+    parser.add_argument("--profile-json", help="Write per-phase tick timings to this JSON file")
+    parser.add_argument(
+        "--profile-slowest",
+        type=int,
+        default=0,
+        help="Capture cProfile output for the N slowest ticks (slows the run down)",
+    )
+    parser.add_argument(
+        "--stats-interval",
+        type=int,
+        help="Ticks between population-stat snapshots (defaults to EVOLUTION_STATS_INTERVAL or 5)",
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Split the world into this many strips, each simulated by its own process",
+    )
+    parser.add_argument(
+        "--shard-axis",
+        choices=("x", "y"),
+        default="x",
+        help="Strip direction: x for side-by-side strips, y for strips stacked by depth",
+    )
+    parser.add_argument(
+        "--shard-halo",
+        type=float,
+        help="Pixels of neighbouring strips each shard sees (defaults to VISION_MAX)",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = _build_arg_parser()
+    args, remaining = parser.parse_known_args(argv)
+    runtime = settings.load_runtime_settings(remaining)
+    settings.apply_runtime_settings(runtime)
+
+    if args.shards > 1:
+        if args.profile_json or args.profile_slowest:
+            parser.error("--profile-json and --profile-slowest need an unsharded run")
+        from .simulation.sharded import run_sharded
+
+        summary = run_sharded(
+            args.ticks,
+            args.shards,
+            seed=args.seed,
+            dt=args.dt,
+            runtime=runtime,
+            axis=args.shard_axis,
+            halo=args.shard_halo,
+            stats_interval=args.stats_interval,
+        )
+        print(json.dumps(summary, indent=2))
+        return 0
+
+    summary = run_headless(
+        args.ticks,
+        seed=args.seed,
+        dt=args.dt,
+        runtime=runtime,
+        profile_path=args.profile_json,
+        profile_slowest=args.profile_slowest,
+        stats_interval=args.stats_interval,
+    )
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
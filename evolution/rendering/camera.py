@@ -120,3 +120,19 @@ class Camera:
 
     def view_rect(self) -> pygame.Rect:
         return self.viewport.copy()
+
+    def render_scale(self, tolerance: float = 0.01) -> Optional[float]:
+        """Uniform world-to-screen scale, or ``None`` when the axes disagree.
+
+        The viewport size is truncated to whole world pixels, so the two axes
+        differ slightly; beyond ``tolerance`` (e.g. a window larger than the
+        world) only a non-uniform resample of the view fills the window.
+        """
+
+        scale_x = self.window_width / self.viewport.width
+        scale_y = self.window_height / self.viewport.height
+        scale = max(scale_x, scale_y)
+        if abs(scale_x - scale_y) > tolerance * scale:
+            return None
+        # Rounded so cached scaled surfaces are shared per zoom level
+        return round(scale, 3)
@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+import math
+
 import pygame
 
 from ..config import settings
 from .camera import Camera
 from .conditions import RenderBounds
 from .sprite_cache import lifeform_sprite_cache
-from .modular_lifeform_renderer import modular_lifeform_renderer
+from .pose_atlas import pose_atlas
 
 
 # Threshold below which no darkening is applied (effectively full brightness)
 _MIN_DARKNESS_THRESHOLD = 0.99
 
+# cos/sin per whole degree, so outline corners need no trig per creature
+_UNIT_ROTATIONS = [(math.cos(math.radians(degree)), math.sin(math.radians(degree))) for degree in range(360)]
+
 def _render_dimensions(lifeform) -> tuple[int, int]:
     if settings.USE_BODYGRAPH_SIZE:
         geometry = getattr(lifeform, "profile_geometry", {}) or getattr(lifeform, "body_geometry", {})
@@ -33,18 +38,22 @@ def _render_dimensions(lifeform) -> tuple[int, int]:
 
 
 def _centered_position(
-    lifeform, sprite: pygame.Surface, reference: tuple[int, int], offset: tuple[int, int]
+    lifeform,
+    sprite: pygame.Surface,
+    reference: tuple[int, int],
+    offset: tuple[int, int],
+    scale: float = 1.0,
 ) -> tuple[int, int]:
     # Align the center of the sprite with the center of the lifeform
     # lifeform.x/y is top-left of the collision rect
-    center_x = lifeform.x + lifeform.width / 2
-    center_y = lifeform.y + lifeform.height / 2
-    
-    # Sprite coordinates
+    center_x = (lifeform.x + lifeform.width / 2 - offset[0]) * scale
+    center_y = (lifeform.y + lifeform.height / 2 - offset[1]) * scale
+
+    # Sprite coordinates (the sprite is already drawn at ``scale``)
     sprite_x = center_x - sprite.get_width() / 2
     sprite_y = center_y - sprite.get_height() / 2
-    
-    return int(sprite_x - offset[0]), int(sprite_y - offset[1])
+
+    return int(sprite_x), int(sprite_y)
 
 
 def _calculate_depth_darkness(y_position: float, world_height: float) -> float:
@@ -73,33 +82,15 @@ def _calculate_depth_darkness(y_position: float, world_height: float) -> float:
     return brightness
 
 
-def _apply_depth_shading(sprite: pygame.Surface, darkness_factor: float) -> pygame.Surface:
-    """Apply depth-based darkening to a sprite.
-
-    Args:
-        sprite: The original sprite surface
-        darkness_factor: Brightness multiplier (0.0 = black, 1.0 = unchanged)
+def _depth_band(darkness_factor: float) -> float:
+    """Quantise a brightness multiplier to one of ``DEPTH_SHADE_BANDS`` levels.
 
-    Returns:
-        A new surface with depth shading applied
+    Shaded sprites are cached per band, so creatures at similar depths share
+    one darkened variant instead of copying their sprite every frame.
     """
-    if darkness_factor >= _MIN_DARKNESS_THRESHOLD:
-        # No darkening needed
-        return sprite
-
-    # Create a copy to avoid modifying the cached sprite
-    # Ensure it has SRCALPHA for proper blending
-    darkened = sprite.copy()
-    if not darkened.get_flags() & pygame.SRCALPHA:
-        darkened = darkened.convert_alpha()
-
-    # Multiply RGB channels to darken while preserving the original alpha mask.
-    # Using RGBA_MULT avoids drawing over transparent regions, preventing black
-    # squares from appearing around sprites with per-pixel transparency.
-    multiplier = int(255 * darkness_factor)
-    darkened.fill((multiplier, multiplier, multiplier, 255), special_flags=pygame.BLEND_RGBA_MULT)
-
-    return darkened
+    bands = max(1, settings.DEPTH_SHADE_BANDS)
+    level = round(max(0.0, min(1.0, darkness_factor)) * bands) / bands
+    return 1.0 if level >= _MIN_DARKNESS_THRESHOLD else level
 
 
 def draw_lifeform(
@@ -111,51 +102,92 @@ def draw_lifeform(
     render_bounds: RenderBounds | None = None,
     world_height: float | None = None,
     offset: tuple[int, int] = (0, 0),
-):
-    """Draw a lifeform body and status outline onto ``surface``."""
+    outline: bool = True,
+    scale: float = 1.0,
+    smooth: bool = True,
+) -> bool:
+    """Draw a lifeform body and status outline onto ``surface``.
+
+    Returns ``True`` when the lifeform was drawn. Pass ``outline=False`` to
+    leave the outline to a later overlay pass (see :func:`draw_lifeform_outline`).
+    ``scale`` maps world pixels to ``surface`` pixels; the body comes from
+    the sprite caches already resized (nearest-neighbour unless ``smooth``).
+    """
     if lifeform.health_now <= 0:
-        return
+        return False
 
     render_width, render_height = _render_dimensions(lifeform)
     if camera is not None:
         bounds = render_bounds or camera.render_bounds()
         if not bounds.contains((lifeform.x - render_width / 2, lifeform.y - render_height / 2), render_width, render_height):
-            return
+            return False
+
+    brightness = 1.0
+    if world_height is not None:
+        brightness = _depth_band(_calculate_depth_darkness(lifeform.y, world_height))
 
     body_graph = getattr(lifeform, "body_graph", None)
     if body_graph is not None:
-        body, reference = modular_lifeform_renderer.render_surface(lifeform)
-        # Rotate the body to match the lifeform's orientation
-        # Note: We rotate the surface itself because the modular renderer draws in local space (mostly)
-        # or at least the surface is generated axis-aligned to the body's base dimensions.
-        body = pygame.transform.rotate(body, lifeform.angle)
+        # Pre-rendered pose for the current swim phase, already rotated to the
+        # nearest angle bin and shaded for the depth band
+        body = pose_atlas.frame(lifeform, brightness=brightness, scale=scale, smooth=smooth)
     else:
-        body = lifeform_sprite_cache.get_body(lifeform)
-        reference = (render_width, render_height)
+        body = lifeform_sprite_cache.get_body(lifeform, brightness=brightness, scale=scale, smooth=smooth)
+    reference = (render_width, render_height)
 
-    if world_height is not None:
-        darkness_factor = _calculate_depth_darkness(lifeform.y, world_height)
-        body = _apply_depth_shading(body, darkness_factor)
+    surface.blit(body, _centered_position(lifeform, body, reference, offset, scale))
 
-    surface.blit(body, _centered_position(lifeform, body, reference, offset))
+    if outline:
+        draw_lifeform_outline(surface, lifeform, offset=offset, size=reference, scale=scale)
+    return True
 
-    # Outline matches the collision rect (render_width/height)
-    # We need to rotate it and center it just like the body
-    outline = pygame.Surface((render_width, render_height))
-    outline.set_colorkey(settings.BLACK)
+
+def outline_corners(
+    lifeform, size: tuple[int, int], offset: tuple[int, int] = (0, 0), scale: float = 1.0
+) -> list[tuple[float, float]]:
+    """Corners of the ``size`` rect centred on ``lifeform`` and rotated by its angle.
+
+    Rotation follows ``pygame.transform.rotate``: positive angles turn
+    counter-clockwise on screen. Corners are in ``surface`` pixels, i.e.
+    world offsets multiplied by ``scale``.
+    """
+    half_width = size[0] * scale / 2
+    half_height = size[1] * scale / 2
+    cos_a, sin_a = _UNIT_ROTATIONS[int(round(lifeform.angle)) % 360]
+    center_x = (lifeform.x + lifeform.width / 2 - offset[0]) * scale
+    center_y = (lifeform.y + lifeform.height / 2 - offset[1]) * scale
+    return [
+        (center_x + dx * cos_a + dy * sin_a, center_y - dx * sin_a + dy * cos_a)
+        for dx, dy in (
+            (-half_width, -half_height),
+            (half_width, -half_height),
+            (half_width, half_height),
+            (-half_width, half_height),
+        )
+    ]
+
+
+def draw_lifeform_outline(
+    surface,
+    lifeform,
+    *,
+    offset: tuple[int, int] = (0, 0),
+    size: tuple[int, int] | None = None,
+    scale: float = 1.0,
+) -> None:
+    """Draw the attack/defence outline straight onto ``surface``.
+
+    The outline matches the collision rect (render width/height), rotated
+    and centred like the body, and is drawn as a polygon so no temporary
+    surface is allocated per creature.
+    """
     red_value = int(max(0, min(255, lifeform.attack_power_now * 2.55)))
     blue_value = int(max(0, min(255, lifeform.defence_power_now * 2.55)))
-    color = pygame.Color(red_value, 0, blue_value)
-    
-    # Draw rect on the outline surface
-    pygame.draw.rect(outline, color, (0, 0, render_width, render_height), 2)
-    
-    outline = pygame.transform.rotate(outline, lifeform.angle)
-    
-    surface.blit(
-        outline,
-        _centered_position(lifeform, outline, (render_width, render_height), offset),
-    )
+    if not red_value and not blue_value:
+        # Black was the colorkey of the old outline surface: nothing to draw
+        return
+    corners = outline_corners(lifeform, size or _render_dimensions(lifeform), offset, scale)
+    pygame.draw.polygon(surface, (red_value, 0, blue_value), corners, 2)
 
 
 def draw_lifeform_vision(
@@ -166,6 +198,7 @@ def draw_lifeform_vision(
     camera: Camera | None = None,
     render_bounds: RenderBounds | None = None,
     offset: tuple[int, int] = (0, 0),
+    scale: float = 1.0,
 ):
     """Draw the vision radius indicator for a lifeform."""
     if lifeform.health_now <= 0:
@@ -180,9 +213,9 @@ def draw_lifeform_vision(
         surface,
         settings.GREEN,
         (
-            int(lifeform.rect.centerx) - offset[0],
-            int(lifeform.rect.centery) - offset[1],
+            int((lifeform.rect.centerx - offset[0]) * scale),
+            int((lifeform.rect.centery - offset[1]) * scale),
         ),
-        int(getattr(lifeform, "sensory_range", lifeform.vision)),
+        int(getattr(lifeform, "sensory_range", lifeform.vision) * scale),
         1,
     )
@@ -81,7 +81,8 @@ class EffectManager:
     def __init__(self, font: Optional[pygame.font.Font] = None) -> None:
         self.labels: List[FloatingLabel] = []
         self.confetti: List[ConfettiParticle] = []
-        self._font = font or pygame.font.Font(None, 20)
+        # Resolved lazily in draw() so headless runs never initialise fonts.
+        self._font = font
         self._confetti_cache: Dict[Tuple[int, Color], pygame.Surface] = {}
 
     # ------------------------------------------------------------------
@@ -271,18 +272,25 @@ class EffectManager:
                 alive_particles.append(particle)
         self.confetti = alive_particles
 
-    def draw(self, surface: pygame.Surface, *, offset: Tuple[int, int] = (0, 0)) -> None:
+    def draw(
+        self, surface: pygame.Surface, *, offset: Tuple[int, int] = (0, 0), scale: float = 1.0
+    ) -> None:
+        """Draw floating labels and confetti; ``scale`` maps world to ``surface`` pixels."""
+
         if not (self.labels or self.confetti):
             return
 
+        if self.labels and self._font is None:
+            self._font = pygame.font.Font(None, 20)
+
         for label in self.labels:
             text_surface = self._font.render(label.text, True, label.color)
             text_surface.set_alpha(label.alpha)
             surface.blit(
                 text_surface,
                 (
-                    label.position.x - text_surface.get_width() / 2 - offset[0],
-                    label.position.y - offset[1],
+                    (label.position.x - offset[0]) * scale - text_surface.get_width() / 2,
+                    (label.position.y - offset[1]) * scale,
                 ),
             )
 
@@ -290,13 +298,14 @@ class EffectManager:
             alpha = particle.alpha
             if alpha <= 0:
                 continue
-            sprite = self._get_confetti_sprite(particle.size, particle.color)
+            size = particle.size if scale == 1.0 else max(1, int(particle.size * scale))
+            sprite = self._get_confetti_sprite(size, particle.color)
             sprite.set_alpha(alpha)
             surface.blit(
                 sprite,
                 (
-                    particle.position.x - particle.size - offset[0],
-                    particle.position.y - particle.size - offset[1],
+                    (particle.position.x - offset[0]) * scale - size,
+                    (particle.position.y - offset[1]) * scale - size,
                 ),
             )
 
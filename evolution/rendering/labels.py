@@ -0,0 +1,72 @@
+"""Cached text surfaces for world overlays."""
+
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+import pygame
+
+from .surface_cache import SurfaceLRU
+
+# Overlay text is small; a few megabytes hold thousands of labels
+LABEL_BUDGET_BYTES = 8 * 1024 * 1024
+# Debug readouts that change every tick are rounded down to this step so
+# their text repeats across frames and creatures
+DEBUG_VALUE_STEP = 10
+
+
+class LabelCache:
+    """Rendered text for one font and colour, keyed by the string itself.
+
+    A label is rasterised the first time its text is seen and reused until
+    the text changes, so overlays that repeat (DNA ids, leader marks, stable
+    debug values) cost a blit instead of a ``font.render`` per frame.
+    """
+
+    def __init__(
+        self,
+        font: pygame.font.Font,
+        color: Tuple[int, int, int] = (0, 0, 0),
+        *,
+        budget_bytes: int = LABEL_BUDGET_BYTES,
+    ) -> None:
+        self.font = font
+        self.color = color
+        self.labels = SurfaceLRU(budget_bytes)
+
+    def render(self, text: str) -> pygame.Surface:
+        label = self.labels.get(text)
+        if label is None:
+            label = self.labels.put(text, self.font.render(text, True, self.color))
+        return label
+
+    def clear(self) -> None:
+        self.labels.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self.labels.stats()
+
+
+def _coarse(value: float) -> int:
+    return int(value // DEBUG_VALUE_STEP * DEBUG_VALUE_STEP)
+
+
+def debug_label_texts(lifeform) -> Tuple[str, str]:
+    """Identity and vitals text for the debug overlay of ``lifeform``.
+
+    The identity part (id, generation, DNA id) is fixed for the creature's
+    life; the vitals are rounded to :data:`DEBUG_VALUE_STEP`, so both
+    strings stay cache hits in a :class:`LabelCache` for many frames.
+    """
+
+    identity = f"ID: {lifeform.id} gen: {lifeform.generation} dna_id {lifeform.dna_id} "
+    vitals = (
+        f"health: {_coarse(lifeform.health_now)} "
+        f"hunger: {_coarse(lifeform.hunger)} "
+        f"age: {_coarse(lifeform.age)} "
+        f"cooldown {_coarse(lifeform.reproduced_cooldown)}"
+    )
+    return identity, vitals
+
+
+__all__ = ["DEBUG_VALUE_STEP", "LabelCache", "debug_label_texts"]
@@ -62,47 +62,79 @@ class ModularLifeformRenderer:
             lum_intensity=lum_intensity,
             bite_intent=bite_intent,
         )
+        surf_width, surf_height = self.surface_size(lifeform)
+
+        surface = state.cached_surface
+        if surface is None or surface.get_width() != surf_width or surface.get_height() != surf_height:
+            surface = pygame.Surface(
+                (surf_width, surf_height), flags=pygame.SRCALPHA, depth=32
+            ).convert_alpha()
+            state.cached_surface = surface
+
+        surface.fill((0, 0, 0, 0))
+        self.draw_posed(lifeform, surface)
+        return surface, (surf_width, surf_height)
+
+    def surface_size(self, lifeform: Lifeform) -> tuple[int, int]:
+        """Size of the unrotated surface ``lifeform`` is drawn on."""
+
+        state = self._ensure_state(lifeform)
         base_width = max(1, getattr(lifeform, "base_width", lifeform.width))
         base_height = max(1, getattr(lifeform, "base_height", lifeform.height))
-        
+        margin = int(self.pixel_scale * self._margin_factor(state))
+        return base_width + margin * 2, base_height + margin * 2
+
+    def _margin_factor(self, state: ModularRendererState) -> float:
+        if state.margin_factor is not None:
+            return state.margin_factor
         # Calculate dynamic margin based on morphology
         # Default small margin for standard creatures
         margin_factor = 1.5
-        
+
         # Check for tentacles or long limbs in the graph
-        has_long_limbs = False
         if state.graph:
             for module in state.graph.iter_modules():
                 m_type = getattr(module, "module_type", "")
                 if m_type in ("tentacle", "tail", "propulsion"):
-                    has_long_limbs = True
                     # Tentacles can be very long, check size if possible, otherwise assume large
                     margin_factor = max(margin_factor, 8.0)
                     break
                 elif m_type == "limb":
                     margin_factor = max(margin_factor, 3.0)
-        
-        margin = int(self.pixel_scale * margin_factor)
-        surf_width = base_width + margin * 2
-        surf_height = base_height + margin * 2
-        
-        surface = state.cached_surface
-        if surface is None or surface.get_width() != surf_width or surface.get_height() != surf_height:
-            surface = pygame.Surface(
-                (surf_width, surf_height), flags=pygame.SRCALPHA, depth=32
-            ).convert_alpha()
-            state.cached_surface = surface
-            
-        surface.fill((0, 0, 0, 0))
-        renderer = _get_renderer(surface, lifeform.body_color)
+        state.margin_factor = margin_factor
+        return margin_factor
+
+    def draw_posed(
+        self,
+        lifeform: Lifeform,
+        surface: Surface,
+        *,
+        growth: float | None = None,
+        color=None,
+    ) -> None:
+        """Draw the already posed body of ``lifeform`` centred on ``surface``.
+
+        ``growth`` and ``color`` override the lifeform's current growth factor
+        and body colour.
+        """
+
+        state = self._ensure_state(lifeform)
+        renderer = _get_renderer(surface, color if color is not None else lifeform.body_color)
         renderer.set_debug_overlays(False)
-        
+
         # Apply growth scaling
-        growth = getattr(lifeform, "growth_factor", 1.0)
+        if growth is None:
+            growth = getattr(lifeform, "growth_factor", 1.0)
         renderer.position_scale = settings.BODY_PIXEL_SCALE * growth
-        
-        renderer.draw(state, Vector2(surf_width / 2, surf_height / 2))
-        return surface, (surf_width, surf_height)
+
+        renderer.draw(state, Vector2(surface.get_width() / 2, surface.get_height() / 2))
+
+    def state_for(self, lifeform: Lifeform) -> ModularRendererState:
+        """Return the (refreshed) render state attached to ``lifeform``."""
+
+        state = self._ensure_state(lifeform)
+        state.refresh()
+        return state
 
 
 modular_lifeform_renderer = ModularLifeformRenderer(settings.BODY_PIXEL_SCALE)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import pygame
 from pygame.math import Vector2
@@ -35,6 +35,12 @@ def _module_radius(module: BodyModule) -> float:
     return length / 2.0
 
 
+def wave_frequency(thrust_factor: float) -> float:
+    """Angular frequency (radians per ms) of the swim wave at ``thrust_factor``."""
+
+    return 0.0018 + (0.011 * thrust_factor)
+
+
 def _unit(angle_degrees: float) -> Vector2:
     radians = math.radians(angle_degrees)
     return Vector2(math.cos(radians), math.sin(radians))
@@ -101,6 +107,11 @@ class ModularRendererState:
     cached_surface: Optional[Surface] = None
     lum_intensity: float = 0.0
     bite_intent: float = 0.0
+    # Animation clock of the last rebuild_world_poses call
+    time_ms: int = 0
+    # Cached by the pose atlas: body plan (``pose_atlas.BodyPlan``) and draw margin
+    atlas_plan: Optional[Any] = None
+    margin_factor: Optional[float] = None
 
     def refresh(self) -> None:
         if not self.dirty:
@@ -253,10 +264,17 @@ class ModularRendererState:
         surface_thrust: dict[str, float] | None = None,
         lum_intensity: float = 0.0,
         bite_intent: float = 0.0,
+        time_ms: Optional[int] = None,
     ) -> None:
+        """Pose every module for the given animation inputs.
+
+        ``time_ms`` drives the procedural animation; it defaults to the pygame
+        clock, while the pose atlas passes a time derived from the swim phase.
+        """
         if self.dirty:
             self.refresh()
-        
+
+        self.time_ms = pygame.time.get_ticks() if time_ms is None else int(time_ms)
         self.lum_intensity = lum_intensity
         self.bite_intent = bite_intent
 
@@ -280,7 +298,7 @@ class ModularRendererState:
     def _update_animation(
         self, angular_velocity: float, thrust_output: float, surface_thrust: dict[str, float]
     ) -> None:
-        time_ms = pygame.time.get_ticks()
+        time_ms = self.time_ms
 
         # Base animation parameters
         # Idle movement: slow, low amplitude
@@ -290,7 +308,7 @@ class ModularRendererState:
         # Let's just use a sigmoid or clamp.
         thrust_factor = max(surface_thrust.values(), default=min(1.0, abs(thrust_output) / 20.0))
 
-        base_freq = 0.0018 + (0.011 * thrust_factor)
+        base_freq = wave_frequency(thrust_factor)
         base_amp = 2.0 + (20.0 * thrust_factor)
         
         visited = set()
@@ -449,11 +467,13 @@ class BodyGraphRenderer:
         self.torso_color = torso_color
         self.position_scale = position_scale
         self.show_debug = True
+        self._time_ms = 0
 
     def set_debug_overlays(self, enabled: bool) -> None:
         self.show_debug = enabled
 
     def draw(self, state: ModularRendererState, offset: Vector2) -> None:
+        self._time_ms = state.time_ms
         skin_points = self._collect_outline_points(state, offset)
         if len(skin_points) >= 3:
             hull = self._convex_hull(skin_points)
@@ -632,7 +652,7 @@ class BodyGraphRenderer:
         base_width = max(module.size[0], module.size[1]) * self.position_scale * 0.5
         
         # Animation parameters
-        time_ms = pygame.time.get_ticks()
+        time_ms = self._time_ms
         phase_offset = (id(animated) % 100) * 0.1
         
         # Movement characteristics
@@ -803,7 +823,7 @@ class BodyGraphRenderer:
                  int(100 - 100 * intensity)
              )
              # Flash effect
-             if (pygame.time.get_ticks() // 100) % 2 == 0:
+             if (self._time_ms // 100) % 2 == 0:
                  color = (255, 50, 50)
 
         pygame.draw.polygon(self.surface, color, int_points)
@@ -218,8 +218,13 @@ class OceanRenderer:
         time_s: float,
         viewport: pygame.Rect,
         offset: tuple[int, int],
+        scale: float = 1.0,
     ) -> None:
-        """Render surface waves limited to the current viewport."""
+        """Render surface waves limited to the current viewport.
+
+        With ``scale`` the crest is sampled once per output column (zoomed
+        out) or drawn with wider lines (zoomed in).
+        """
 
         base_y = settings.OCEAN_SURFACE_Y
         amp1 = 10
@@ -230,21 +235,26 @@ class OceanRenderer:
         if start_x >= end_x:
             return
 
-        for world_x in range(start_x, end_x):
+        step = max(1, int(round(1.0 / scale)))
+        width = max(1, int(math.ceil(scale)))
+        foam = max(1, int(3 * scale))
+        spray = max(1, int(7 * scale))
+        for world_x in range(start_x, end_x, step):
             y1 = base_y + math.sin(world_x * 0.02 + time_s * 1.8) * amp1
             y2 = base_y + math.sin(world_x * 0.037 + time_s * 2.3 + 1.7) * amp2
             y = int((y1 + y2) * 0.5)
 
-            screen_x = world_x - offset[0]
-            screen_y = y - offset[1]
+            screen_x = int((world_x - offset[0]) * scale)
+            screen_y = int((y - offset[1]) * scale)
             pygame.draw.line(
-                surface, (255, 255, 255, 170), (screen_x, screen_y), (screen_x, screen_y + 3)
+                surface, (255, 255, 255, 170), (screen_x, screen_y), (screen_x, screen_y + foam), width
             )
             pygame.draw.line(
                 surface,
                 (215, 250, 255, 110),
                 (screen_x, screen_y),
-                (screen_x, screen_y + 7),
+                (screen_x, screen_y + spray),
+                width,
             )
 
     def draw_rad_vent(
@@ -256,6 +266,7 @@ class OceanRenderer:
         intensity: float,
         *,
         offset: Tuple[int, int] = (0, 0),
+        scale: float = 1.0,
     ) -> None:
         """
         Tekent een pulserende rad-vent glow op world-coördinaten.
@@ -266,7 +277,7 @@ class OceanRenderer:
         color   = vent kleur
         intensity = 0..1
         """
-        radius = max(18, radius)
+        radius = max(1, int(max(18, radius) * scale))
         size = radius * 2
 
         glow = pygame.transform.smoothscale(self._base_glow, (size, size))
@@ -279,8 +290,8 @@ class OceanRenderer:
             glow.blit(alpha_mod, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
 
         x, y = center
-        x -= offset[0]
-        y -= offset[1]
+        x = int((x - offset[0]) * scale)
+        y = int((y - offset[1]) * scale)
         surface.blit(
             glow,
             (x - radius, y - radius),
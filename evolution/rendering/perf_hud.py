@@ -9,6 +9,8 @@ import pygame
 WARNING_COLOR = (240, 120, 120)
 INFO_COLOR = (235, 245, 255)
 BACKGROUND_COLOR = (12, 20, 32, 170)
+# Slowest simulation phases listed in the HUD
+SIM_PHASE_LINES = 5
 
 
 class PerfHUD:
@@ -62,9 +64,17 @@ class PerfHUD:
         render_ms = float(self._metrics.get("render_ms", 0.0))
         streaming = bool(self._metrics.get("streaming", False))
         rebuild_queue = int(self._metrics.get("rebuild_queue", 0))
+        sim_steps = int(self._metrics.get("sim_steps", 0))
+        max_speed = bool(self._metrics.get("max_speed", False))
+        sim_phases = self._metrics.get("sim_phases") or {}
+        sprite_caches = self._metrics.get("sprite_caches") or {}
+        render_scale = self._metrics.get("render_scale")
+        render_path = f"screen x{render_scale:.2f}" if render_scale is not None else "resample"
 
         lines = [
-            (f"FPS: {fps:5.1f} | Render: {render_ms:4.1f} ms", INFO_COLOR),
+            (f"FPS: {fps:5.1f} | Render: {render_ms:4.1f} ms ({render_path})", INFO_COLOR),
+            (f"Sim ticks/frame: {sim_steps} | max speed: {'on' if max_speed else 'off'}", INFO_COLOR),
+            *self._phase_lines(sim_phases),
             (
                 f"Chunks vis: {visible_chunks} @ {chunk_size}px | streaming: {'on' if streaming else 'off'}",
                 INFO_COLOR,
@@ -77,6 +87,45 @@ class PerfHUD:
                 f"Entity blits: {entity_blits}",
                 WARNING_COLOR if self._warn_entity_blits else INFO_COLOR,
             ),
-            ("Toggles: [F3] HUD [F5] streaming [ [ ] chunk [ ; ' ] margin", INFO_COLOR),
+            *self._cache_lines(sprite_caches),
+            ("Toggles: [F3] HUD [F5] streaming [F6] max speed [ [ ] chunk [ ; ' ] margin", INFO_COLOR),
         ]
         return tuple(lines)
+
+    def _cache_lines(self, caches: Dict[str, Dict[str, int]]) -> Tuple[Tuple[str, Tuple[int, int, int]], ...]:
+        lines = []
+        for name, stats in caches.items():
+            lookups = stats["hits"] + stats["misses"]
+            hit_rate = 100.0 * stats["hits"] / lookups if lookups else 0.0
+            lines.append(
+                (
+                    f"Cache {name}: {stats['bytes'] / 1048576:.0f}/{stats['budget_bytes'] / 1048576:.0f} MB"
+                    f" ({stats['entries']}) | hit {hit_rate:.0f}% | evict {stats['evictions']}",
+                    INFO_COLOR,
+                )
+            )
+        return tuple(lines)
+
+    def _phase_lines(self, phases: Dict[str, Dict[str, float]]) -> Tuple[Tuple[str, Tuple[int, int, int]], ...]:
+        tick = phases.get("tick")
+        if not tick:
+            return ()
+        lines = [
+            (
+                f"Tick p50 {tick['p50_ms']:.1f} / p95 {tick['p95_ms']:.1f} / max {tick['max_ms']:.1f} ms",
+                INFO_COLOR,
+            )
+        ]
+        ranked = sorted(
+            ((name, stats) for name, stats in phases.items() if name != "tick"),
+            key=lambda item: item[1]["p95_ms"],
+            reverse=True,
+        )
+        for name, stats in ranked[:SIM_PHASE_LINES]:
+            lines.append(
+                (
+                    f"  {name}: {stats['p50_ms']:.2f} / {stats['p95_ms']:.2f} ms",
+                    INFO_COLOR,
+                )
+            )
+        return tuple(lines)
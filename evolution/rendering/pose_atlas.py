@@ -0,0 +1,282 @@
+"""Pre-rendered, rotated poses of modular creatures.
+
+Drawing a BodyGraph creature means solving every module pose, drawing every
+module and rotating the result. Creatures that share a body plan look the
+same at the same point of their swim cycle, so :class:`PoseAtlas` renders
+each body plan once per quantised animation state (swim phase taken from
+``thrust_phase``, thrust, turn, glow and bite) and angle bin, then serves
+later frames from a byte-bounded LRU. A cache hit is a dict lookup.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import weakref
+from typing import Dict, Tuple
+
+import pygame
+
+from ..config import settings
+from .modular_lifeform_renderer import ModularLifeformRenderer, modular_lifeform_renderer
+from .modular_renderer import ModularRendererState, wave_frequency
+from .surface_cache import SurfaceLRU, scale_surface, shade_surface
+
+TAU = 2.0 * math.pi
+THRUST_LEVELS = 4
+GLOW_LEVELS = 4
+TURN_STEP = 2.0  # rad/s per turn bin
+GROWTH_STEP = 0.05
+# Skin tints vary per individual; nearby colours share frames
+COLOR_STEP = 8
+
+PoseKey = Tuple[object, ...]
+
+
+def _quantize(value: float, levels: int) -> float:
+    steps = levels - 1
+    return round(max(0.0, min(1.0, value)) * steps) / steps
+
+
+class BodyPlan:
+    """Small id for one body plan, so frame keys stay cheap to hash.
+
+    Render states hold their plan; the registry below only references plans
+    weakly, so plans of extinct creatures drop out with their last state.
+    Ids are never reused, which keeps frames of a dropped plan from being
+    served to a new one before the LRU evicts them.
+    """
+
+    __slots__ = ("id", "has_mouth", "__weakref__")
+
+    def __init__(self, plan_id: int, has_mouth: bool) -> None:
+        self.id = plan_id
+        self.has_mouth = has_mouth
+
+
+# Body plan signature -> plan of the live creatures sharing it
+_PLANS: "weakref.WeakValueDictionary[tuple, BodyPlan]" = weakref.WeakValueDictionary()
+_PLAN_COUNTER = itertools.count()
+
+
+def body_plan_id(state: ModularRendererState) -> int:
+    """Id shared by every body graph with the same modules and layout."""
+
+    return body_plan(state).id
+
+
+def body_plan(state: ModularRendererState) -> BodyPlan:
+    """The :class:`BodyPlan` of ``state``, registered on first use."""
+
+    if state.atlas_plan is not None:
+        return state.atlas_plan
+    graph = state.graph
+    parts = []
+    has_mouth = False
+    for node_id in sorted(graph.nodes):
+        node = graph.nodes[node_id]
+        module = node.module
+        module_type = getattr(module, "module_type", "")
+        has_mouth = has_mouth or module_type == "mouth"
+        parts.append(
+            (
+                node_id,
+                node.parent,
+                node.attachment_point,
+                module_type,
+                tuple(module.size),
+                float(getattr(module, "natural_orientation", 0.0)),
+                getattr(module, "light_color", None),
+                getattr(module, "light_pattern", None),
+                float(getattr(module, "light_frequency", 0.0)),
+                float(getattr(module, "light_phase", 0.0)),
+                float(getattr(module, "light_intensity", 0.0)),
+                getattr(module, "jaw_type", None),
+            )
+        )
+    signature = tuple(parts)
+    plan = _PLANS.get(signature)
+    if plan is None:
+        plan = _PLANS[signature] = BodyPlan(next(_PLAN_COUNTER), has_mouth)
+    state.atlas_plan = plan
+    return plan
+
+
+def _crop_centered(surface: pygame.Surface) -> pygame.Surface:
+    """Trim transparent margins while keeping the body centred on the surface."""
+
+    bounds = surface.get_bounding_rect()
+    if not bounds.width or not bounds.height:
+        return surface
+    center_x = surface.get_width() // 2
+    center_y = surface.get_height() // 2
+    half_width = max(center_x - bounds.left, bounds.right - center_x)
+    half_height = max(center_y - bounds.top, bounds.bottom - center_y)
+    crop = pygame.Rect(center_x - half_width, center_y - half_height, half_width * 2, half_height * 2)
+    crop = crop.clip(surface.get_rect())
+    if crop.size == surface.get_size():
+        return surface
+    return surface.subsurface(crop).copy()
+
+
+class PoseAtlas:
+    """Lazily built frames per body plan, animation state and angle bin.
+
+    Args:
+        renderer: Renderer used to pose and draw missing frames.
+        budget_bytes: Pixel memory for all frames; least recently used
+            frames are evicted beyond it.
+        phases: Frames per swim cycle.
+        angle_bin_deg: Width of one rotation bin in degrees.
+    """
+
+    def __init__(
+        self,
+        renderer: ModularLifeformRenderer,
+        *,
+        budget_bytes: int,
+        phases: int,
+        angle_bin_deg: float,
+    ) -> None:
+        self.renderer = renderer
+        self.phases = max(1, int(phases))
+        self.angle_bin_deg = angle_bin_deg if angle_bin_deg > 0 else 5.0
+        self._angle_bins = max(1, int(math.ceil(360.0 / self.angle_bin_deg)))
+        self.frames = SurfaceLRU(budget_bytes)
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+    def pose_key(self, lifeform) -> PoseKey:
+        """Quantised animation state of ``lifeform``."""
+
+        state = self.renderer.state_for(lifeform)
+        plan = body_plan(state)
+
+        thrust = (
+            getattr(lifeform, "physics", None)
+            and getattr(lifeform.physics, "thrust_output", 0.0)
+            or getattr(lifeform, "thrust_output", 0.0)
+        )
+        thrust_level = _quantize(abs(thrust) / 20.0, THRUST_LEVELS)
+        thrust_map = getattr(lifeform, "active_thrust_map", None) or {}
+        module_thrust = tuple(
+            sorted((node_id, _quantize(value, THRUST_LEVELS)) for node_id, value in thrust_map.items())
+        )
+
+        phase = float(getattr(lifeform, "thrust_phase", 0.0)) % TAU
+        phase_bin = int(phase / TAU * self.phases) % self.phases
+        turn = max(-6.0, min(6.0, float(getattr(lifeform, "angular_velocity", 0.0))))
+        turn_bin = round(turn / TURN_STEP) * TURN_STEP
+        glow = _quantize(float(getattr(lifeform, "lum_intensity", 0.0)), GLOW_LEVELS)
+        bite = 0.0
+        if plan.has_mouth:
+            bite_intent = float(getattr(lifeform, "bite_intent", 0.0))
+            bite = 0.0 if bite_intent <= 0.1 else _quantize(bite_intent, 3)
+        growth = round(float(getattr(lifeform, "growth_factor", 1.0)) / GROWTH_STEP) * GROWTH_STEP
+
+        return (
+            plan.id,
+            tuple(int(channel) // COLOR_STEP * COLOR_STEP for channel in lifeform.body_color),
+            int(getattr(lifeform, "base_width", lifeform.width)),
+            int(getattr(lifeform, "base_height", lifeform.height)),
+            settings.BODY_PIXEL_SCALE,
+            growth,
+            phase_bin,
+            thrust_level,
+            module_thrust,
+            turn_bin,
+            glow,
+            bite,
+        )
+
+    def angle_bin(self, angle: float) -> int:
+        return int(round((angle % 360.0) / self.angle_bin_deg)) % self._angle_bins
+
+    # ------------------------------------------------------------------
+    # Frames
+    # ------------------------------------------------------------------
+    def frame(
+        self, lifeform, *, brightness: float = 1.0, scale: float = 1.0, smooth: bool = True
+    ) -> pygame.Surface:
+        """Return the rotated body of ``lifeform`` for its current pose.
+
+        ``brightness`` below 1.0 returns a cached darkened variant and
+        ``scale`` a cached resized one for drawing at screen resolution;
+        callers should quantise both so variants are shared.
+        """
+
+        key = self.pose_key(lifeform)
+        angle_bin = self.angle_bin(getattr(lifeform, "angle", 0.0))
+        rotated_key = key + (angle_bin,)
+        if scale != 1.0:
+            scaled_key = rotated_key + (brightness, scale, smooth)
+            scaled = self.frames.get(scaled_key)
+            if scaled is None:
+                unscaled = self._shaded(lifeform, key, rotated_key, angle_bin, brightness)
+                scaled = self.frames.put(scaled_key, scale_surface(unscaled, scale, smooth=smooth))
+            return scaled
+        return self._shaded(lifeform, key, rotated_key, angle_bin, brightness)
+
+    def _shaded(
+        self, lifeform, key: PoseKey, rotated_key: PoseKey, angle_bin: int, brightness: float
+    ) -> pygame.Surface:
+        if brightness < 1.0:
+            shaded_key = rotated_key + (brightness,)
+            shaded = self.frames.get(shaded_key)
+            if shaded is None:
+                shaded = self.frames.put(
+                    shaded_key, shade_surface(self._rotated(lifeform, key, rotated_key, angle_bin), brightness)
+                )
+            return shaded
+        return self._rotated(lifeform, key, rotated_key, angle_bin)
+
+    def _rotated(self, lifeform, key: PoseKey, rotated_key: PoseKey, angle_bin: int) -> pygame.Surface:
+        rotated = self.frames.get(rotated_key)
+        if rotated is not None:
+            return rotated
+
+        upright = self.frames.get(key)
+        if upright is None:
+            upright = self.frames.put(key, self._render_pose(lifeform, key))
+        rotated = pygame.transform.rotate(upright, angle_bin * self.angle_bin_deg)
+        return self.frames.put(rotated_key, rotated)
+
+    def _render_pose(self, lifeform, key: PoseKey) -> pygame.Surface:
+        growth, phase_bin, thrust_level, module_thrust, turn, glow, bite = key[5:]
+        factor = max((value for _, value in module_thrust), default=thrust_level)
+        state = self.renderer.state_for(lifeform)
+        state.rebuild_world_poses(
+            angular_velocity=turn,
+            thrust_output=thrust_level * 20.0,
+            surface_thrust=dict(module_thrust),
+            lum_intensity=glow,
+            bite_intent=bite,
+            # Spread the phase bins over one full cycle of the swim wave
+            time_ms=int(phase_bin / self.phases * TAU / wave_frequency(factor)),
+        )
+        surface = pygame.Surface(
+            self.renderer.surface_size(lifeform), flags=pygame.SRCALPHA, depth=32
+        ).convert_alpha()
+        self.renderer.draw_posed(lifeform, surface, growth=growth, color=key[1])
+        return _crop_centered(surface)
+
+    def clear(self) -> None:
+        self.frames.clear()
+
+    def stats(self) -> Dict[str, int]:
+        stats = self.frames.stats()
+        # Plans of creatures still alive, not every plan ever seen
+        stats["body_plans"] = len(_PLANS)
+        return stats
+
+
+pose_atlas = PoseAtlas(
+    modular_lifeform_renderer,
+    budget_bytes=int(settings.POSE_ATLAS_BUDGET_MB * 1024 * 1024),
+    phases=settings.POSE_ATLAS_PHASES,
+    angle_bin_deg=settings.SPRITE_ANGLE_BIN_DEG,
+)
+
+
+__all__ = ["BodyPlan", "PoseAtlas", "body_plan", "body_plan_id", "pose_atlas"]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import math
-from typing import Dict, Iterable, Sequence, Tuple
+from typing import Dict, Iterable, Optional, Sequence, Tuple
 
 import pygame
 from pygame.math import Vector2
@@ -11,12 +11,12 @@ from pygame.math import Vector2
 from ..body.body_graph import BodyGraph
 from ..config import settings
 from .modular_palette import BASE_MODULE_ALPHA, MODULE_RENDER_STYLES, tint_color
+from .surface_cache import SurfaceLRU, scale_surface, shade_surface
 
 Color = Tuple[int, int, int]
 MorphSignature = Tuple[int, int, int, int, int, int, int]
 ModuleSignature = Tuple[str, ...]
 BaseKey = Tuple[str, int, int, Color, MorphSignature, ModuleSignature]
-RotationKey = Tuple[str, int, int, Color, MorphSignature, ModuleSignature, int]
 
 CONNECTION_COLOR = (18, 42, 68)
 
@@ -48,37 +48,90 @@ def _evenly_spaced_positions(count: int, start: float, end: float) -> Iterable[f
 
 
 class LifeformSpriteCache:
-    """Cache rotated sprites per DNA profile and angle bin."""
-
-    def __init__(self) -> None:
-        self._lifeform_cache: Dict[str, pygame.Surface] = {}
-        self._faction_cache: Dict[str, pygame.Surface] = {}
-        self._rotations: Dict[RotationKey, pygame.Surface] = {}
-        self._base: Dict[BaseKey, pygame.Surface] = {}
+    """Cache rotated sprites per DNA profile and angle bin.
+
+    Every tier (per-DNA sprites, unrotated bases, rotations and their
+    depth-shaded variants) shares one byte-budgeted LRU, keyed as
+    ``(tier, dna_id, ...)`` so sprites of extinct DNA profiles can be dropped
+    with :meth:`retain_dna`.
+
+    Args:
+        budget_bytes: Pixel memory for all tiers. Defaults to
+            ``settings.SPRITE_CACHE_BUDGET_MB``.
+    """
+
+    def __init__(self, budget_bytes: Optional[int] = None) -> None:
+        if budget_bytes is None:
+            budget_bytes = int(settings.SPRITE_CACHE_BUDGET_MB * 1024 * 1024)
+        self.sprites = SurfaceLRU(budget_bytes)
         self._angle_bin_size = float(getattr(settings, "SPRITE_ANGLE_BIN_DEG", 5.0))
         if self._angle_bin_size <= 0:
             self._angle_bin_size = 5.0
 
-    def get_body(self, lifeform) -> pygame.Surface:
-        """Return the rotated body sprite for ``lifeform``."""
+    def get_body(
+        self, lifeform, *, brightness: float = 1.0, scale: float = 1.0, smooth: bool = True
+    ) -> pygame.Surface:
+        """Return the rotated body sprite for ``lifeform``.
+
+        ``brightness`` below 1.0 returns a cached darkened variant and
+        ``scale`` a cached resized one; callers should quantise both so
+        variants are shared.
+        """
+
+        if scale != 1.0:
+            scaled_key = self._body_key(lifeform) + (brightness, scale, smooth)
+            scaled = self.sprites.get(scaled_key)
+            if scaled is None:
+                unscaled = self.get_body(lifeform, brightness=brightness)
+                scaled = self.sprites.put(scaled_key, scale_surface(unscaled, scale, smooth=smooth))
+            return scaled
+        if brightness >= 1.0:
+            return self._unshaded_body(lifeform)
+        # Same key as the unshaded sprite plus the band, so the variant is
+        # evicted together with its DNA profile
+        shaded_key = self._body_key(lifeform) + (brightness,)
+        shaded = self.sprites.get(shaded_key)
+        if shaded is None:
+            shaded = self.sprites.put(shaded_key, shade_surface(self._unshaded_body(lifeform), brightness))
+        return shaded
+
+    def _body_key(self, lifeform) -> tuple:
+        if settings.USE_BODYGRAPH_SIZE:
+            return ("dna", str(lifeform.dna_id))
+        angle_bin = self._angle_bin(getattr(lifeform, "angle", 0.0))
+        return ("rotation",) + self._base_key(lifeform) + (angle_bin,)
 
+    def _unshaded_body(self, lifeform) -> pygame.Surface:
         if settings.USE_BODYGRAPH_SIZE:
             # Legacy path: still cache sprites for non-modular creatures.
-            cache_key = lifeform.dna_id
-            if cache_key not in self._lifeform_cache:
-                sprite = self._render_lifeform(lifeform)
-                self._lifeform_cache[cache_key] = sprite
-            return self._lifeform_cache[cache_key]
+            cache_key = ("dna", str(lifeform.dna_id))
+            sprite = self.sprites.get(cache_key)
+            if sprite is None:
+                sprite = self.sprites.put(cache_key, self._render_lifeform(lifeform))
+            return sprite
         return self._render_lifeform(lifeform)
 
+    def retain_dna(self, living_dna_ids: Iterable[object]) -> int:
+        """Evict sprites of DNA profiles without living members; returns the count."""
+
+        living = {str(dna_id) for dna_id in living_dna_ids}
+        return self.sprites.discard_where(lambda key: key[1] not in living)
+
+    def stats(self) -> Dict[str, int]:
+        return self.sprites.stats()
+
+    def clear(self) -> None:
+        self.sprites.clear()
+
     def _render_lifeform(self, lifeform) -> pygame.Surface:
         angle_bin = self._angle_bin(getattr(lifeform, "angle", 0.0))
-        rotation_key = self._rotation_key(lifeform, angle_bin)
-        if rotation_key in self._rotations:
-            return self._rotations[rotation_key]
-
         base_key = self._base_key(lifeform)
-        surface = self._base.get(base_key)
+        rotation_key = ("rotation",) + base_key + (angle_bin,)
+        rotated = self.sprites.get(rotation_key)
+        if rotated is not None:
+            return rotated
+
+        surface = self.sprites.get(("base",) + base_key)
         if surface is None:
             width = int(round(max(1.0, lifeform.width)))
             height = int(round(max(1.0, lifeform.height)))
@@ -87,13 +140,11 @@ class LifeformSpriteCache:
                 height = int(round(max(1.0, self._sprite_height(lifeform))))
             color = base_key[3]
             surface = self._create_body_surface(lifeform, width, height, color)
-            surface = surface.convert_alpha()
-            self._base[base_key] = surface
+            surface = self.sprites.put(("base",) + base_key, surface.convert_alpha())
 
         target_angle = angle_bin * self._angle_bin_size
         rotated = pygame.transform.rotate(surface, target_angle).convert_alpha()
-        self._rotations[rotation_key] = rotated
-        return rotated
+        return self.sprites.put(rotation_key, rotated)
 
     def _angle_bin(self, angle: float) -> int:
         normalized = angle % 360.0
@@ -143,10 +194,6 @@ class LifeformSpriteCache:
             self._module_signature(lifeform),
         )
 
-    def _rotation_key(self, lifeform, angle_bin: int) -> RotationKey:
-        base_key = self._base_key(lifeform)
-        return base_key + (angle_bin,)
-
     def _create_body_surface(self, lifeform, width: int, height: int, color: Color) -> pygame.Surface:
         graph: BodyGraph | None = getattr(lifeform, "body_graph", None)
         if graph is not None and getattr(graph, "nodes", None):
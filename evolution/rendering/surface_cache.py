@@ -0,0 +1,174 @@
+"""Memory-bounded least-recently-used store for rendered surfaces."""
+
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+import pygame
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """Pixel memory held by ``surface``."""
+
+    return surface.get_pitch() * surface.get_height()
+
+
+def shade_surface(surface: pygame.Surface, brightness: float) -> pygame.Surface:
+    """Return a darkened copy of ``surface`` (``brightness`` 0.0 = black, 1.0 = unchanged)."""
+
+    # Ensure it has SRCALPHA for proper blending
+    darkened = surface.copy()
+    if not darkened.get_flags() & pygame.SRCALPHA:
+        darkened = darkened.convert_alpha()
+
+    # Multiply RGB channels to darken while preserving the original alpha mask.
+    # Using RGBA_MULT avoids drawing over transparent regions, preventing black
+    # squares from appearing around sprites with per-pixel transparency.
+    multiplier = int(255 * brightness)
+    darkened.fill((multiplier, multiplier, multiplier, 255), special_flags=pygame.BLEND_RGBA_MULT)
+    return darkened
+
+
+def scale_surface(surface: pygame.Surface, scale: float, *, smooth: bool = True) -> pygame.Surface:
+    """Return ``surface`` resized by ``scale``; ``smooth=False`` resamples nearest-neighbour."""
+
+    size = (
+        max(1, int(math.ceil(surface.get_width() * scale))),
+        max(1, int(math.ceil(surface.get_height() * scale))),
+    )
+    if smooth and surface.get_bitsize() in (24, 32):
+        return pygame.transform.smoothscale(surface, size)
+    return pygame.transform.scale(surface, size)
+
+
+class ScaledSurfaces:
+    """Resized copies of world objects' own surfaces, one per owner, held by the renderer.
+
+    Chunks, plants and carcasses keep a single world-size surface that they
+    replace on rebuild. An owner's copy is redone when that surface or the
+    scale changes, and dropped by :meth:`sweep` once the owner goes a frame
+    without being drawn (unloaded, culled or gone).
+    """
+
+    def __init__(self) -> None:
+        # id(owner) -> (source, (scale, smooth), scaled); keeping ``source``
+        # alive means a recycled id can never match a stale entry
+        self._entries: Dict[int, Tuple[pygame.Surface, Tuple[float, bool], pygame.Surface]] = {}
+        self._drawn: Set[int] = set()
+        self.rescales = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self, owner: object, source: pygame.Surface, scale: float, *, smooth: bool = True
+    ) -> pygame.Surface:
+        key = id(owner)
+        self._drawn.add(key)
+        params = (scale, smooth)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is source and entry[1] == params:
+            return entry[2]
+        scaled = scale_surface(source, scale, smooth=smooth)
+        self._entries[key] = (source, params, scaled)
+        self.rescales += 1
+        return scaled
+
+    def discard(self, owner: object) -> None:
+        self._entries.pop(id(owner), None)
+
+    def sweep(self) -> int:
+        """Drop copies of owners not drawn since the last sweep; returns the count."""
+
+        stale = [key for key in self._entries if key not in self._drawn]
+        for key in stale:
+            del self._entries[key]
+        self._drawn.clear()
+        return len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._drawn.clear()
+
+
+class SurfaceLRU:
+    """Surfaces keyed by arbitrary hashables, evicted oldest-first over a byte budget.
+
+    Args:
+        budget_bytes: Pixel memory the cache may hold. The most recently
+            stored surface is always kept, even if it alone exceeds the budget.
+    """
+
+    def __init__(self, budget_bytes: int) -> None:
+        self.budget_bytes = max(0, int(budget_bytes))
+        self._entries: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def keys(self) -> List[Hashable]:
+        """Keys from least to most recently used."""
+
+        return list(self._entries)
+
+    def get(self, key: Hashable) -> Optional[pygame.Surface]:
+        surface = self._entries.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return surface
+
+    def put(self, key: Hashable, surface: pygame.Surface) -> pygame.Surface:
+        self.discard(key)
+        size = surface_bytes(surface)
+        self._entries[key] = surface
+        self._sizes[key] = size
+        self.bytes += size
+        while self.bytes > self.budget_bytes and len(self._entries) > 1:
+            oldest = next(iter(self._entries))
+            self.discard(oldest)
+            self.evictions += 1
+        return surface
+
+    def discard(self, key: Hashable) -> None:
+        if self._entries.pop(key, None) is not None:
+            self.bytes -= self._sizes.pop(key)
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Drop every entry whose key matches ``predicate``; returns the count."""
+
+        doomed = [key for key in self._entries if predicate(key)]
+        for key in doomed:
+            self.discard(key)
+        self.evictions += len(doomed)
+        return len(doomed)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._sizes.clear()
+        self.bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "budget_bytes": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+__all__ = ["ScaledSurfaces", "SurfaceLRU", "scale_surface", "shade_surface", "surface_bytes"]
@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 from .state import SimulationState
-from .loop import run
+from .engine import SimulationEngine
 
 __all__ = [
     "loop",
     "bootstrap",
+    "engine",
     "environment",
     "state",
 ]
+
+
+def __getattr__(name: str):
+    # The pygame loop pulls in the full rendering stack; import it lazily so
+    # headless callers can use the engine without a display.
+    if name == "run":
+        from .loop import run
+
+        return run
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,6 +13,7 @@ from ..config import settings
 from ..entities.lifeform import Lifeform
 from ..world.vegetation import MossCluster, create_initial_clusters, create_initial_strands
 from ..world.world import BiomeRegion, World
+from ..systems.spatial_hash import SpatialHashGrid
 from ..systems.telemetry import enable_telemetry
 from .state import SimulationState
 from .base_population import base_templates
@@ -59,10 +60,13 @@ def reset_simulation(
     state.plants.clear()
     state.carcasses.clear()
     state.death_ages.clear()
+    state.population_stats.reset()
     state.dna_home_biome.clear()
     state.lifeform_id_counter = 0
     state.selected_lifeform = None
     state.last_debug_log_path = None
+    # Long-lived index: entities register themselves on spawn/death
+    state.spatial_grid = SpatialHashGrid()
 
     world.regenerate()
 
@@ -98,10 +102,14 @@ def reset_simulation(
 # DNA & spawning helpers
 # ---------------------------------------------------------------------------
 
-def generate_dna_profiles(state: SimulationState, world: World) -> None:
+def generate_dna_profiles(
+    state: SimulationState,
+    world: World,
+    rng: Optional[random.Random] = None,
+) -> None:
     """Generate a small neutral DNA catalogue from base templates."""
 
-    rng = random.Random()
+    rng = rng or random.Random()
     state.dna_profiles.clear()
     state.dna_home_biome.clear()
 
@@ -124,13 +132,17 @@ def generate_dna_profiles(state: SimulationState, world: World) -> None:
         dna_id += 1
 
 
-def spawn_lifeforms(state: SimulationState, world: World) -> None:
+def spawn_lifeforms(
+    state: SimulationState,
+    world: World,
+    rng: Optional[random.Random] = None,
+) -> None:
     """Spawn the configured number of lifeforms using the DNA catalogue."""
 
     if not state.dna_profiles:
         return
 
-    rng = random.Random()
+    rng = rng or random.Random()
     anchors = _select_nutrient_anchors(world, state.plants, rng)
     occupied: List[Tuple[float, float]] = []
     max_spawns = min(settings.N_LIFEFORMS, len(state.dna_profiles))
@@ -265,23 +277,42 @@ def _attempt_anchor_spawn(
     return None
 
 
-def seed_vegetation(state: SimulationState, world: World) -> None:
+def seed_vegetation(
+    state: SimulationState,
+    world: World,
+    rng: Optional[random.Random] = None,
+    *,
+    moss_clusters: int = 32,
+    seaweed_strands: int = 18,
+) -> None:
     """Populate the world with the initial vegetation clusters."""
 
+    for plant in state.plants:
+        if state.spatial_grid is not None:
+            state.spatial_grid.remove_plant(plant)
+        occupancy = getattr(plant, "_occupancy", None)
+        if occupancy is not None:
+            occupancy.remove_plant(plant)
     state.plants.clear()
     abundance = state.environment_modifiers.get("plant_regrowth", 1.0)
     moss_growth = state.environment_modifiers.get("moss_growth_speed", 1.0)
-    clusters = create_initial_clusters(world, count=32)
+    clusters = create_initial_clusters(world, count=moss_clusters, rng=rng)
     for cluster in clusters:
         cluster.set_capacity_multiplier(abundance)
         cluster.set_growth_speed_modifier(moss_growth)
         state.plants.append(cluster)
+        world.vegetation_occupancy.add_plant(cluster)
+        if state.spatial_grid is not None:
+            state.spatial_grid.add_plant(cluster)
 
-    seaweed_strands = create_initial_strands(world, count=18)
-    for strand in seaweed_strands:
+    strands = create_initial_strands(world, count=seaweed_strands, rng=rng)
+    for strand in strands:
         strand.set_capacity_multiplier(abundance)
         strand.set_growth_speed_modifier(moss_growth * 0.9)
         state.plants.append(strand)
+        world.vegetation_occupancy.add_plant(strand)
+        if state.spatial_grid is not None:
+            state.spatial_grid.add_plant(strand)
 
 
 # ---------------------------------------------------------------------------
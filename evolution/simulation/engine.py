@@ -0,0 +1,301 @@
+"""Display-independent simulation tick shared by the pygame loop and headless runs."""
+
+from __future__ import annotations
+
+import datetime
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from pygame.math import Vector2
+
+from ..entities import ai, movement
+from ..entities.ai import sensing_radius
+from ..config import settings
+from ..entities.neural_controller import PopulationBrain
+from ..systems.timers import NULL_TIMERS, SlowestTicks, TimerAggregator
+from ..systems.spatial_hash import DEFAULT_CELL_SIZE, build_spatial_grid
+from . import environment
+from .state import SimulationState
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type hints only
+    from ..entities.lifeform import Lifeform
+    from ..rendering.effects import EffectManager
+    from ..systems.events import EventManager
+    from ..systems.notifications import NotificationManager
+    from ..systems.player import PlayerController
+
+
+class SimulationEngine:
+    """Advance the shared :class:`SimulationState` one tick at a time.
+
+    The engine owns no window, font or surface; it only drives the world,
+    vegetation, carcasses, lifeforms, events and statistics.  The pygame loop
+    calls :meth:`step` once per frame and renders afterwards, while headless
+    runs simply call it in a tight loop.
+
+    Every tick is timed per phase into :attr:`timers`; see
+    :meth:`TimerAggregator.summary` for the rolling breakdown and
+    :meth:`enable_slow_tick_capture` for cProfile captures of slow ticks.
+    The per-lifeform loops are timed as a whole; set :attr:`profile_phases`
+    to also time every lifeform's sub-phases (brain, thrust, movement,
+    feeding, ...), which costs a few microseconds per creature.
+
+    Population statistics are kept incrementally in
+    ``state.population_stats`` and published every ``stats_interval`` ticks;
+    only then are the stats listener and the event manager updated.
+    """
+
+    def __init__(
+        self,
+        state: SimulationState,
+        *,
+        event_manager: "EventManager",
+        player_controller: "PlayerController",
+        notification_manager: "NotificationManager",
+        effects_manager: "EffectManager",
+        stats_listener=None,
+        stats_interval: Optional[int] = None,
+    ) -> None:
+        self.state = state
+        self.event_manager = event_manager
+        self.player_controller = player_controller
+        self.notification_manager = notification_manager
+        self.effects_manager = effects_manager
+        self.stats_listener = stats_listener
+        self.stats_interval = max(
+            1, settings.STATS_PUBLISH_INTERVAL if stats_interval is None else int(stats_interval)
+        )
+
+        self.tick_count: int = 0
+        self.elapsed_ms: float = 0.0
+        self.latest_stats: Optional[Dict[str, object]] = None
+        self.survivors: List["Lifeform"] = []
+        self.brains = PopulationBrain()
+        self.timers = TimerAggregator()
+        self.slow_ticks: Optional[SlowestTicks] = None
+        self.profile_phases: bool = False
+
+    def enable_slow_tick_capture(self, limit: int) -> Optional[SlowestTicks]:
+        """Profile every following tick with cProfile, keeping the ``limit`` slowest."""
+
+        self.slow_ticks = SlowestTicks(limit) if limit > 0 else None
+        return self.slow_ticks
+
+    def reset_clock(self) -> None:
+        """Restart the simulated clock after a world reset."""
+
+        self.tick_count = 0
+        self.elapsed_ms = 0.0
+        self.latest_stats = None
+        self.survivors = []
+        self.state.population_stats.rebuild(self.state.lifeforms, self.state.death_ages)
+
+    def publish_stats(self, time_label: Optional[str] = None) -> Dict[str, object]:
+        """Snapshot the population statistics and hand them to the stats listener."""
+
+        state = self.state
+        if time_label is None:
+            time_label = str(datetime.timedelta(seconds=int(self.elapsed_ms / 1000)))
+        stats = state.population_stats.snapshot(state.lifeforms, time_label, state.death_ages)
+        self.latest_stats = stats
+        if self.stats_listener is not None:
+            self.stats_listener(stats)
+        return stats
+
+    # ------------------------------------------------------------------
+    # Tick
+    # ------------------------------------------------------------------
+    def step(
+        self,
+        dt: float,
+        *,
+        now_ms: Optional[int] = None,
+        time_label: Optional[str] = None,
+    ) -> Dict[str, object]:
+        """Advance the simulation by ``dt`` seconds and return population stats.
+
+        Statistics are only recomputed every :attr:`stats_interval` ticks; in
+        between the most recently published snapshot is returned.
+
+        Args:
+            dt: Tick duration in seconds.
+            now_ms: Wall-clock timestamp for world/event timers. Defaults to the
+                engine's own simulated clock so headless runs stay reproducible.
+            time_label: Pre-formatted elapsed time for the stats panel.
+
+        Returns:
+            The latest published population statistics.
+        """
+
+        capture = self.slow_ticks
+        if capture is not None:
+            capture.start()
+        started = time.perf_counter()
+        stats = self._run_tick(dt, now_ms, time_label)
+        duration_ms = (time.perf_counter() - started) * 1000.0
+        if capture is not None:
+            capture.stop(self.tick_count, duration_ms)
+        self.timers.add("tick", duration_ms)
+        self.timers.end_frame()
+        return stats
+
+    def _run_tick(
+        self, dt: float, now_ms: Optional[int], time_label: Optional[str]
+    ) -> Dict[str, object]:
+        state = self.state
+        timers = self.timers
+        world = state.world
+        self.tick_count += 1
+        self.elapsed_ms += dt * 1000.0
+        if now_ms is None:
+            now_ms = int(self.elapsed_ms)
+        if time_label is None:
+            time_label = str(datetime.timedelta(seconds=int(self.elapsed_ms / 1000.0)))
+
+        with timers.time("world_update"):
+            world.update(now_ms)
+
+        grid = state.spatial_grid
+        if grid is None:
+            # States populated outside bootstrap get their index built once;
+            # afterwards entities keep it current through spawn/death hooks.
+            with timers.time("grid_build"):
+                grid = state.spatial_grid = build_spatial_grid(
+                    state.lifeforms, state.plants, state.carcasses, cell_size=DEFAULT_CELL_SIZE
+                )
+
+        plants = state.plants
+        with timers.time("plant_regrow"):
+            for plant in plants:
+                plant.set_size()
+                plant.regrow(world, plants)
+                grid.move_plant(plant)
+
+        with timers.time("carcass_update"):
+            self._update_carcasses(dt)
+
+        lifeform_snapshot = list(state.lifeforms)
+        average_maturity = (
+            sum(l.maturity for l in lifeform_snapshot) / len(lifeform_snapshot)
+            if lifeform_snapshot
+            else None
+        )
+
+        # One batched neighbourhood lookup serves every sensing query below
+        with timers.time("grid_prefetch"):
+            grid.prefetch_neighbors(lifeform_snapshot, sensing_radius)
+        # ...and one batched forward pass drives every neural controller
+        with timers.time("brain_forward"):
+            brain_outputs = ai.evaluate_brains(lifeform_snapshot, state, self.brains)
+
+        # Per-lifeform sections only when asked for; the loops are always timed
+        phase_timers = timers if self.profile_phases else NULL_TIMERS
+
+        plans = []
+        with timers.time("lifeform_plan"):
+            for lifeform, outputs in zip(lifeform_snapshot, brain_outputs):
+                with phase_timers.time("progression"):
+                    # 1) DNA-afhankelijke eigenschappen & omgeving
+                    lifeform.set_speed(average_maturity)
+                    lifeform.calculate_attack_power()
+                    lifeform.calculate_defence_power()
+
+                    # 2) Interne levensloop
+                    lifeform.progression(dt)
+
+                # 3a) AI + stuwkracht
+                plans.append(movement.plan_movement(lifeform, state, dt, outputs, phase_timers))
+
+        # 3b) Buoyancy, drag en stroming voor alle lichamen tegelijk
+        with timers.time("integrate_body"):
+            integrated = movement.integrate_planned(lifeform_snapshot, plans, state, dt)
+
+        survivors: List["Lifeform"] = []
+        with timers.time("lifeform_finish"):
+            for lifeform, plan, result in zip(lifeform_snapshot, plans, integrated):
+                # 3c) Collision, positie & korte-afstand interacties
+                if plan is not None:
+                    movement.finish_movement(
+                        lifeform, state, dt, plan, *result, timers=phase_timers
+                    )
+
+                with phase_timers.time("growth_death"):
+                    grid.move_lifeform(lifeform)
+
+                    # 4) Oriëntatie & groei
+                    lifeform.update_angle()
+                    lifeform.grow()
+                    lifeform.set_size()
+
+                    # 5) Death-afhandeling
+                    died = lifeform.handle_death()
+                if died:
+                    continue
+
+                survivors.append(lifeform)
+
+                if lifeform.reproduced_cooldown > 0:
+                    lifeform.reproduced_cooldown -= 1
+
+        self.survivors = survivors
+
+        with timers.time("effects"):
+            self.effects_manager.update(dt)
+
+        publish = self.latest_stats is None or self.tick_count % self.stats_interval == 0
+        if publish:
+            with timers.time("stats"):
+                stats = self.publish_stats(time_label)
+        else:
+            stats = self.latest_stats
+        with timers.time("events"):
+            if publish:
+                self.event_manager.schedule_default_events()
+                self.event_manager.update(now_ms, stats, self.player_controller)
+            environment.sync_food_abundance(state)
+            environment.sync_moss_growth_speed(state)
+            self.notification_manager.update()
+        return stats
+
+    def _update_carcasses(self, dt: float) -> None:
+        carcasses = self.state.carcasses
+        world = self.state.world
+        grid = self.state.spatial_grid
+        for carcass in list(carcasses):
+            # Auto-upgrade legacy carcasses
+            if type(carcass).__name__ == "SinkingCarcass":
+                legacy = carcass
+                carcass = self._upgrade_legacy_carcass(carcass)
+                if carcass is not legacy:
+                    grid.remove_carcass(legacy)
+
+            carcass.update(world, dt)
+            if carcass.is_depleted():
+                if carcass in carcasses:
+                    carcasses.remove(carcass)
+                grid.remove_carcass(carcass)
+            else:
+                grid.move_carcass(carcass)
+
+    def _upgrade_legacy_carcass(self, carcass):
+        from ..world.advanced_carcass import DecomposingCarcass
+
+        new_carcass = DecomposingCarcass(
+            position=(carcass.x, carcass.y),
+            size=(carcass.width, carcass.height),
+            mass=carcass.mass,
+            nutrition=carcass.resource,
+            color=carcass.color,
+            body_graph=None,  # Legacy carcasses have no body graph
+        )
+        # Preserve some state
+        new_carcass.velocity = Vector2(carcass.velocity)
+
+        # Replace in the main list
+        carcasses = self.state.carcasses
+        try:
+            idx = carcasses.index(carcass)
+        except ValueError:
+            return carcass
+        carcasses[idx] = new_carcass
+        return new_carcass
@@ -33,15 +33,18 @@ from pygame.math import Vector2
 from ..body.attachment import Joint, JointType
 from ..config import settings
 from ..config.settings import SimulationSettings
-from ..entities import movement
 from ..entities.lifeform import Lifeform
 from ..rendering.camera import Camera
 from ..creator import CreatureTemplate, spawn_template
 from ..rendering.creature_creator_overlay import CreatureCreatorOverlay, PaletteEntry
-from ..rendering.draw_lifeform import draw_lifeform, draw_lifeform_vision
+from ..rendering.draw_lifeform import draw_lifeform, draw_lifeform_outline, draw_lifeform_vision
 from ..rendering.effects import EffectManager
 from ..rendering.gameplay_panel import GameplaySettingsPanel, SliderConfig
+from ..rendering.labels import LabelCache, debug_label_texts
 from ..rendering.perf_hud import PerfHUD
+from ..rendering.pose_atlas import pose_atlas
+from ..rendering.sprite_cache import lifeform_sprite_cache
+from ..rendering.surface_cache import ScaledSurfaces
 from ..rendering.lifeform_inspector import LifeformInspector
 from ..rendering.modular_palette import (
     BASE_MODULE_ALPHA,
@@ -55,21 +58,25 @@ from ..rendering.tools_panel import EditorTool, ToolsPanel
 from ..rendering.stats_window import StatsWindow
 from ..rendering.timers import TimerAggregator
 from ..physics.test_creatures import TestCreature, build_fin_swimmer_prototype
-from ..systems import stats as stats_system
 from ..systems import telemetry
 from ..systems.events import EventManager
 from ..systems.notifications import NotificationManager
 from ..systems.player import PlayerController
-from ..systems.spatial_hash import build_spatial_grid
 from ..world.types import Barrier
 from ..world.vegetation import create_cluster_from_brush
 from ..world.world import World
 from .world.chunks import ChunkManager
 from .world.chunks import ChunkManager
 from . import bootstrap, environment
-from .scenarios import setup_hexagon_scenario
+from .engine import SimulationEngine
+from .scheduler import FixedStepScheduler
 from .state import SimulationState
 
+try:  # pragma: no cover - scenario presets are optional
+    from .scenarios import setup_hexagon_scenario
+except ImportError:  # pragma: no cover - fallback when scenarios are missing
+    setup_hexagon_scenario = None
+
 
 # ---------------------------------------------------------------------------
 # Notifications & logging
@@ -130,7 +137,7 @@ if settings.TELEMETRY_ENABLED:
     telemetry.enable_telemetry("combat")
     telemetry.enable_telemetry("events")
     telemetry.enable_telemetry("reproduction")
-    logger.info("Telemetry enabled; writing JSONL samples to %s", settings.LOG_DIRECTORY / "telemetry")
+    logger.info("Telemetry enabled; writing columnar samples to %s", settings.LOG_DIRECTORY / "telemetry")
 else:
     logger.info("Telemetry disabled; set EVOLUTION_TELEMETRY=1 to capture movement/combat data")
 
@@ -611,6 +618,9 @@ def run(sim_settings: Optional[SimulationSettings] | None = None) -> None:
     font = _load_font(font1_path, 12)
     font2 = _load_font(font1_path, 18)
     font3 = _load_font(font2_path, 22)
+    # World overlay text is rasterised once per distinct string
+    overlay_labels = LabelCache(font, (0, 0, 0))
+    dna_labels = LabelCache(font2, (0, 0, 0))
 
     panel_width = 260
     panel_margin = 16
@@ -836,6 +846,9 @@ def run(sim_settings: Optional[SimulationSettings] | None = None) -> None:
         environment_modifiers=environment_modifiers,
     )
     chunk_manager = ChunkManager()
+    # Zoomed copies of chunk, plant and carcass surfaces; owned here so the
+    # world model never holds render-resolution data
+    scaled_world = ScaledSurfaces()
     perf_hud = PerfHUD()
     render_timers = TimerAggregator(logger)
     camera = Camera(
@@ -857,10 +870,27 @@ def run(sim_settings: Optional[SimulationSettings] | None = None) -> None:
     player_controller = PlayerController(notification_manager, dna_profiles, lifeforms)
     effects_manager = EffectManager()
     effects_manager.set_font(font2)
+    engine = SimulationEngine(
+        state,
+        event_manager=event_manager,
+        player_controller=player_controller,
+        notification_manager=notification_manager,
+        effects_manager=effects_manager,
+        stats_listener=stats_window.update_stats,
+    )
+    # Ticks advance with a fixed dt; rendering keeps its own clock.tick rate
+    scheduler = FixedStepScheduler(
+        1.0 / max(1, fps),
+        max_substeps=runtime.MAX_SUBSTEPS,
+        max_speed_budget=runtime.MAX_SPEED_BUDGET,
+    )
 
     render_ms: float = 0.0
     last_entity_blit_warning = -120
     last_rebuild_warning = -120
+    # Sprites of extinct DNA profiles are dropped at most this often
+    sprite_prune_interval_ms = 2000
+    last_sprite_prune_ms = 0
 
     palette_entries = [
         PaletteEntry("core", "Core", "Hoofdtorso"),
@@ -898,7 +928,21 @@ def run(sim_settings: Optional[SimulationSettings] | None = None) -> None:
             view_surface = pygame.Surface(view_rect.size).convert()
         return view_surface
 
-    def _render_world_view(render_lifeforms: List[Lifeform]) -> None:
+    def _blit_scaled(
+        target: pygame.Surface,
+        owner: object,
+        image: pygame.Surface,
+        world_pos: Tuple[int, int],
+        offset: Tuple[int, int],
+        draw_scale: float,
+        smooth: bool,
+    ) -> None:
+        target.blit(
+            scaled_world.get(owner, image, draw_scale, smooth=smooth),
+            (int((world_pos[0] - offset[0]) * draw_scale), int((world_pos[1] - offset[1]) * draw_scale)),
+        )
+
+    def _render_world_view() -> None:
         nonlocal render_ms, last_entity_blit_warning, last_rebuild_warning
 
         chunk_manager.begin_frame()
@@ -911,7 +955,14 @@ def run(sim_settings: Optional[SimulationSettings] | None = None) -> None:
             int(viewport_raw.width),
             int(viewport_raw.height),
         )
-        view = _ensure_view_surface(viewport)
+        # Screen-space path: everything is drawn straight into the window at
+        # the zoom scale from cached pre-scaled chunks and sprites, so no
+        # full-frame resample is needed. Otherwise draw the world at 1:1 into
+        # a viewport-sized surface and resample that to the window.
+        scale = camera.render_scale() if settings.RENDER_SCREEN_SPACE else None
+        draw_scale = scale if scale is not None else 1.0
+        smooth = camera.zoom >= settings.RENDER_NEAREST_BELOW_ZOOM
+        view = screen if scale is not None else _ensure_view_surface(viewport)
         view.fill(world.background_color)
 
         chunk_manager.ensure_chunks(viewport, margin=1)
@@ -924,21 +975,23 @@ def run(sim_settings: Optional[SimulationSettings] | None = None) -> None:
 
         with render_timers.time("draw_chunks"):
             for chunk in visible_chunks:
-                if chunk.surface is None:
+                chunk_surface = chunk.surface
+                if chunk_surface is None:
                     continue
-                dx = int(chunk.rect.x - viewport.x)
-                dy = int(chunk.rect.y - viewport.y)
-                view.blit(chunk.surface, (dx, dy))
+                if draw_scale != 1.0:
+                    chunk_surface = scaled_world.get(chunk, chunk_surface, draw_scale, smooth=smooth)
+                # Floor positions plus rounded-up scaled sizes leave no seams
+                dx = math.floor((chunk.rect.x - viewport.x) * draw_scale)
+                dy = math.floor((chunk.rect.y - viewport.y) * draw_scale)
+                view.blit(chunk_surface, (dx, dy))
 
         offset = (int(viewport.x), int(viewport.y))
 
         with render_timers.time("dynamic_layers"):
-            world.draw_dynamic_layers(view, viewport, offset)
+            world.draw_dynamic_layers(view, viewport, offset, draw_scale)
 
-        with render_timers.time("entities_index"):
-            chunk_manager.update_entity_index(
-                plants=plants, carcasses=carcasses, lifeforms=render_lifeforms
-            )
+        # Culling reads the simulation's own spatial index; nothing is rebuilt here
+        chunk_manager.set_entity_index(state.spatial_grid)
 
         culling_margin = chunk_manager.culling_margin
         visible_bounds = viewport.inflate(culling_margin, culling_margin)
@@ -947,22 +1000,36 @@ def run(sim_settings: Optional[SimulationSettings] | None = None) -> None:
 
         with render_timers.time("draw_entities"):
             for plant in entities_by_type["plants"]:
-                if plant.rect.colliderect(visible_bounds):
+                if not plant.rect.colliderect(visible_bounds):
+                    continue
+                if draw_scale == 1.0:
                     plant.draw(view, offset=offset)
-                    entity_blits += 1
+                else:
+                    image = plant.current_surface()
+                    if image is not None:
+                        _blit_scaled(view, plant, image, plant.rect.topleft, offset, draw_scale, smooth)
+                entity_blits += 1
 
             for carcass in entities_by_type["carcasses"]:
-                if carcass.rect.colliderect(visible_bounds):
+                if not carcass.rect.colliderect(visible_bounds):
+                    continue
+                if draw_scale == 1.0:
                     carcass.draw(view, offset=offset)
-                    entity_blits += 1
+                else:
+                    carcass.draw_snow(view, offset, draw_scale)
+                    body = carcass.body_image()
+                    if body is not None:
+                        _blit_scaled(view, carcass, body[0], body[1], offset, draw_scale, smooth)
+                entity_blits += 1
 
             bounds_cache = camera.render_bounds(padding=96) if camera is not None else None
+            drawn_lifeforms = []
             for lifeform in entities_by_type["lifeforms"]:
                 if lifeform.health_now <= 0:
                     continue
                 if not lifeform.rect.colliderect(visible_bounds):
                     continue
-                draw_lifeform(
+                if draw_lifeform(
                     view,
                     lifeform,
                     settings,
@@ -970,7 +1037,11 @@ def run(sim_settings: Optional[SimulationSettings] | None = None) -> None:
                     render_bounds=bounds_cache,
                     world_height=world.height,
                     offset=offset,
-                )
+                    outline=False,
+                    scale=draw_scale,
+                    smooth=smooth,
+                ):
+                    drawn_lifeforms.append(lifeform)
                 entity_blits += 1
                 if show_vision:
                     draw_lifeform_vision(
@@ -980,60 +1051,62 @@ def run(sim_settings: Optional[SimulationSettings] | None = None) -> None:
                         camera=camera,
                         render_bounds=bounds_cache,
                         offset=offset,
+                        scale=draw_scale,
                     )
 
+        with render_timers.time("draw_overlays"):
+            # Outlines are drawn as polygons straight onto the view and the
+            # labels come from the text caches; all labels go out in one blits()
+            labels = []
+            for lifeform in drawn_lifeforms:
+                draw_lifeform_outline(view, lifeform, offset=offset, scale=draw_scale)
+                # Labels keep their font size; only their anchor follows the zoom
+                label_x = int((int(lifeform.x) - offset[0]) * draw_scale)
+                label_y = int((lifeform.y - offset[1]) * draw_scale)
+
                 if show_debug:
-                    text = font.render(
-                        f"Health: {lifeform.health_now} ID: {lifeform.id} "
-                        f"cooldown {lifeform.reproduced_cooldown} "
-                        f"gen: {lifeform.generation} "
-                        f"dna_id {lifeform.dna_id} "
-                        f"hunger: {lifeform.hunger} "
-                        f"age: {lifeform.age} ",
-                        True,
-                        (0, 0, 0),
-                    )
-                    view.blit(
-                        text,
-                        (int(lifeform.x) - offset[0], int(lifeform.y - 30) - offset[1]),
+                    identity, vitals = debug_label_texts(lifeform)
+                    identity_label = overlay_labels.render(identity)
+                    labels.append((identity_label, (label_x, label_y - 30)))
+                    labels.append(
+                        (
+                            overlay_labels.render(vitals),
+                            (label_x + identity_label.get_width(), label_y - 30),
+                        )
                     )
 
                 if show_dna_id:
-                    text = font2.render(f"{lifeform.dna_id}", True, (0, 0, 0))
-                    view.blit(
-                        text,
-                        (int(lifeform.x) - offset[0], int(lifeform.y - 10) - offset[1]),
+                    labels.append(
+                        (dna_labels.render(f"{lifeform.dna_id}"), (label_x, label_y - 10))
                     )
 
                 if show_leader and lifeform.is_leader:
-                    text = font.render("L", True, (0, 0, 0))
-                    view.blit(
-                        text,
-                        (int(lifeform.x) - offset[0], int(lifeform.y - 30) - offset[1]),
-                    )
+                    labels.append((overlay_labels.render("L"), (label_x, label_y - 30)))
 
                 if show_action:
-                    text = font.render(
-                        f"Current target, enemy: "
-                        f"{lifeform.closest_enemy.id if lifeform.closest_enemy is not None else None}"
-                        f", prey: "
-                        f"{lifeform.closest_prey.id if lifeform.closest_prey is not None else None}, partner: "
-                        f"{lifeform.closest_partner.id if lifeform.closest_partner is not None else None}, is following: "
-                        f"{lifeform.closest_follower.id if lifeform.closest_follower is not None else None} ",
-                        True,
-                        settings.BLACK,
-                    )
-                    view.blit(
-                        text,
-                        (int(lifeform.x) - offset[0], int(lifeform.y - 20) - offset[1]),
+                    labels.append(
+                        (
+                            overlay_labels.render(
+                                f"Current target, enemy: "
+                                f"{lifeform.closest_enemy.id if lifeform.closest_enemy is not None else None}"
+                                f", prey: "
+                                f"{lifeform.closest_prey.id if lifeform.closest_prey is not None else None}, partner: "
+                                f"{lifeform.closest_partner.id if lifeform.closest_partner is not None else None}, is following: "
+                                f"{lifeform.closest_follower.id if lifeform.closest_follower is not None else None} "
+                            ),
+                            (label_x, label_y - 20),
+                        )
                     )
+            if labels:
+                view.blits(labels, doreturn=False)
 
-        effects_manager.draw(view, offset=offset)
+        effects_manager.draw(view, offset=offset, scale=draw_scale)
 
-        scaled = pygame.transform.smoothscale(
-            view, (camera.window_width, camera.window_height)
-        )
-        screen.blit(scaled, (0, 0))
+        if scale is None:
+            resample = pygame.transform.smoothscale if smooth else pygame.transform.scale
+            screen.blit(resample(view, (camera.window_width, camera.window_height)), (0, 0))
+        # Unloaded chunks, culled plants and finished carcasses lose their copies
+        scaled_world.sweep()
 
         render_ms = (time.perf_counter() - render_start) * 1000.0
 
@@ -1045,8 +1118,18 @@ def run(sim_settings: Optional[SimulationSettings] | None = None) -> None:
             "entity_blits": entity_blits,
             "chunk_rebuilds": chunk_manager.rebuilds_this_frame,
             "render_ms": render_ms,
+            "render_scale": scale,
             "streaming": chunk_manager.streaming_enabled,
             "rebuild_queue": chunk_manager.rebuild_queue_size,
+            "sim_steps": scheduler.steps_last_frame,
+            "max_speed": scheduler.max_speed,
+            "sim_phases": engine.timers.summary() if perf_hud.visible else {},
+            "sprite_caches": {
+                "sprites": lifeform_sprite_cache.stats(),
+                "poses": pose_atlas.stats(),
+            }
+            if perf_hud.visible
+            else {},
         }
 
         if entity_blits > 1500 and chunk_manager.frame_index - last_entity_blit_warning > 60:
@@ -1105,7 +1188,7 @@ def run(sim_settings: Optional[SimulationSettings] | None = None) -> None:
         brush_radius = max(8, tools_panel.brush_size // 2)
         rect = pygame.Rect(0, 0, brush_radius * 2, brush_radius * 2)
         rect.center = (int(world_pos[0]), int(world_pos[1]))
-        world.barriers.append(Barrier(rect, (90, 90, 150), "muur"))
+        world.add_barrier(Barrier(rect, (90, 90, 150), "muur"))
         chunk_manager.mark_region_dirty(rect)
 
     def _paint_biome(world_pos: Tuple[float, float]) -> None:
@@ -1309,112 +1392,20 @@ def run(sim_settings: Optional[SimulationSettings] | None = None) -> None:
             boost = keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]
             camera.move(horizontal, vertical, boost)
 
-            lifeform_snapshot = list(lifeforms)
-            render_lifeforms = list(lifeform_snapshot)
-
             if not paused:
-                world.update(pygame.time.get_ticks())
-
-                current_time = datetime.datetime.now()
-                time_passed = current_time - start_time
-                formatted_time_passed = datetime.timedelta(
-                    seconds=int(time_passed.total_seconds()),
-                )
-                formatted_time_passed = str(formatted_time_passed).split(".")[0]
-
-                if death_ages:
-                    _ = sum(death_ages) / len(death_ages)  # death_age_avg, nu niet gebruikt
-
-                for plant in plants:
-                    plant.set_size()
-                    plant.regrow(world, plants)
-
-                for i, carcass in enumerate(list(carcasses)):
-                    # Auto-upgrade legacy carcasses
-                    if type(carcass).__name__ == "SinkingCarcass":
-                        from ..world.advanced_carcass import DecomposingCarcass
-                        new_carcass = DecomposingCarcass(
-                            position=(carcass.x, carcass.y),
-                            size=(carcass.width, carcass.height),
-                            mass=carcass.mass,
-                            nutrition=carcass.resource,
-                            color=carcass.color,
-                            body_graph=None,  # Legacy carcasses have no body graph
-                        )
-                        # Preserve some state
-                        new_carcass.velocity = Vector2(carcass.velocity)
-                        
-                        # Replace in the main list
-                        # We need to find the index in the actual list, not the copy
-                        try:
-                            idx = carcasses.index(carcass)
-                            carcasses[idx] = new_carcass
-                            carcass = new_carcass
-                        except ValueError:
-                            pass
-
-                    carcass.update(world, delta_time)
-                    if carcass.is_depleted():
-                        if carcass in carcasses:
-                            carcasses.remove(carcass)
-
-                lifeform_snapshot = list(lifeforms)
-                average_maturity = (
-                    sum(l.maturity for l in lifeform_snapshot) / len(lifeform_snapshot)
-                    if lifeform_snapshot
-                    else None
-                )
-
-                # Rebuild spatial grid for efficient proximity queries
-                state.spatial_grid = build_spatial_grid(lifeform_snapshot, plants, carcasses, cell_size=200.0)
-
-                updated_lifeforms: List[Lifeform] = []
-                for lifeform in lifeform_snapshot:
-                    # 1) DNA-afhankelijke eigenschappen & omgeving
-                    lifeform.set_speed(average_maturity)
-                    lifeform.calculate_attack_power()
-                    lifeform.calculate_defence_power()
-
-                    # 2) Interne levensloop
-                    lifeform.progression(delta_time)
-
-                    # 3) AI + movement + collision
-                    movement.update_movement(lifeform, state, delta_time)
-
-                    # 4) Oriëntatie & groei
-                    lifeform.update_angle()
-                    lifeform.grow()
-                    lifeform.set_size()
-
-                    # 5) Death-afhandeling
-                    if lifeform.handle_death():
-                        continue
-
-                    updated_lifeforms.append(lifeform)
-
-                    if lifeform.reproduced_cooldown > 0:
-                        lifeform.reproduced_cooldown -= 1
-
-                render_lifeforms = updated_lifeforms
-
-                effects_manager.update(delta_time)
-
-                stats = stats_system.collect_population_stats(
-                    state, formatted_time_passed
-                )
-                latest_stats = stats
-                stats_window.update_stats(stats)
-                event_manager.schedule_default_events()
-                event_manager.update(
-                    pygame.time.get_ticks(),
-                    stats,
-                    player_controller,
-                )
-                environment.sync_food_abundance(state)
-                environment.sync_moss_growth_speed(state)
-                notification_manager.update()
+                # World/event timers and the elapsed-time label follow the
+                # engine's simulated clock, so max speed fast-forwards them too
+                if scheduler.advance(delta_time, engine.step):
+                    now_ms = pygame.time.get_ticks()
+                    latest_stats = engine.latest_stats
+                    if latest_stats and now_ms - last_sprite_prune_ms >= sprite_prune_interval_ms:
+                        lifeform_sprite_cache.retain_dna(latest_stats.get("dna_count", {}))
+                        last_sprite_prune_ms = now_ms
+            else:
+                scheduler.reset()
 
-            _render_world_view(render_lifeforms)
+            _render_world_view()
+            render_timers.end_frame()
             render_timers.maybe_log()
             if legacy_ui_visible:
                 world.draw_weather_overview(screen, font2)
@@ -1525,8 +1516,12 @@ def run(sim_settings: Optional[SimulationSettings] | None = None) -> None:
                     )
                 elif event.key == pygame.K_F3:
                     perf_hud.toggle()
+                    # Per-creature phase timings only while the HUD shows them
+                    engine.profile_phases = perf_hud.visible
                 elif event.key == pygame.K_F5:
                     chunk_manager.streaming_enabled = not chunk_manager.streaming_enabled
+                elif event.key == pygame.K_F6:
+                    scheduler.toggle_max_speed()
                 elif event.key == pygame.K_LEFTBRACKET:
                     chunk_manager.set_chunk_size(chunk_manager.chunk_size - 64)
                 elif event.key == pygame.K_RIGHTBRACKET:
@@ -1647,7 +1642,10 @@ def run(sim_settings: Optional[SimulationSettings] | None = None) -> None:
                         )
                         starting_screen = False
                         paused = False
-                    elif hexagon_scenario_button.collidepoint(event.pos):
+                    elif (
+                        setup_hexagon_scenario is not None
+                        and hexagon_scenario_button.collidepoint(event.pos)
+                    ):
                         stats_window.clear()
                         bootstrap.reset_simulation(
                             state,
@@ -1712,7 +1710,7 @@ def run(sim_settings: Optional[SimulationSettings] | None = None) -> None:
                     and tools_panel.selected_tool == EditorTool.DRAW_BARRIER
                 ):
                     if barrier_preview_rect.width > 6 and barrier_preview_rect.height > 6:
-                        world.barriers.append(
+                        world.add_barrier(
                             Barrier(barrier_preview_rect.copy(), (80, 80, 120), "muur"),
                         )
                         chunk_manager.mark_region_dirty(barrier_preview_rect)
@@ -0,0 +1,112 @@
+"""Fixed-timestep scheduling of simulation ticks independent of rendering."""
+
+from __future__ import annotations
+
+import time
+from typing import Callable, Optional
+
+from ..config import settings
+
+# Upper bound on ticks run to catch up after a slow frame
+DEFAULT_MAX_SUBSTEPS = settings.MAX_SUBSTEPS
+# Wall-clock seconds spent ticking per presented frame in max speed mode
+DEFAULT_MAX_SPEED_BUDGET = settings.MAX_SPEED_BUDGET
+# Tolerance for float drift when frame times are summed
+_EPSILON = 1e-9
+
+
+class FixedStepScheduler:
+    """Run simulation ticks with a constant ``dt`` regardless of frame time.
+
+    Frame time is added to an accumulator and drained in whole steps, so the
+    physics always integrates with the same ``dt``. A slow frame runs at most
+    ``max_substeps`` ticks; time beyond that is dropped rather than making
+    the next frames slower still. The leftover fraction of a step is exposed
+    as :attr:`alpha` for renderers that want to interpolate.
+
+    In :attr:`max_speed` mode the frame time is ignored and ticks run back to
+    back until ``max_speed_budget`` seconds of wall time have passed, which
+    fast-forwards evolution while still presenting a frame now and then.
+
+    Args:
+        step_seconds: Simulated seconds per tick.
+        max_substeps: Ticks allowed per :meth:`advance` call in normal mode.
+        max_speed_budget: Wall-clock seconds per call in max speed mode.
+        clock: Monotonic time source, replaceable in tests.
+    """
+
+    def __init__(
+        self,
+        step_seconds: float,
+        *,
+        max_substeps: int = DEFAULT_MAX_SUBSTEPS,
+        max_speed_budget: float = DEFAULT_MAX_SPEED_BUDGET,
+        clock: Optional[Callable[[], float]] = None,
+    ) -> None:
+        if step_seconds <= 0:
+            raise ValueError("step_seconds must be positive")
+        self.step_seconds = float(step_seconds)
+        self.max_substeps = max(1, int(max_substeps))
+        self.max_speed_budget = max(0.0, float(max_speed_budget))
+        self.max_speed = False
+        self._clock = clock or time.perf_counter
+        self._accumulator = 0.0
+        self.steps_last_frame = 0
+        self.total_steps = 0
+        self.dropped_seconds = 0.0
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of a step left in the accumulator (0 <= alpha < 1)."""
+
+        return self._accumulator / self.step_seconds
+
+    def reset(self) -> None:
+        """Forget accumulated time, e.g. after a pause or world reset."""
+
+        self._accumulator = 0.0
+        self.steps_last_frame = 0
+
+    def toggle_max_speed(self) -> bool:
+        self.max_speed = not self.max_speed
+        self._accumulator = 0.0
+        return self.max_speed
+
+    def advance(self, frame_seconds: float, step: Callable[[float], object]) -> int:
+        """Run the ticks owed for ``frame_seconds`` of wall time.
+
+        Args:
+            frame_seconds: Wall time since the previous call.
+            step: Callback running one tick; receives :attr:`step_seconds`.
+
+        Returns:
+            The number of ticks that ran.
+        """
+
+        dt = self.step_seconds
+        steps = 0
+        if self.max_speed:
+            deadline = self._clock() + self.max_speed_budget
+            while True:
+                step(dt)
+                steps += 1
+                if self._clock() >= deadline:
+                    break
+        else:
+            self._accumulator += max(0.0, float(frame_seconds))
+            while self._accumulator + _EPSILON >= dt and steps < self.max_substeps:
+                step(dt)
+                self._accumulator = max(0.0, self._accumulator - dt)
+                steps += 1
+            if self._accumulator + _EPSILON >= dt:
+                # Too far behind: skip the backlog instead of spiralling
+                overflow = self._accumulator - self._accumulator % dt
+                self.dropped_seconds += overflow
+                self._accumulator -= overflow
+
+        self.steps_last_frame = steps
+        self.total_steps += steps
+        return steps
+
+
+__all__ = ["DEFAULT_MAX_SPEED_BUDGET", "DEFAULT_MAX_SUBSTEPS", "FixedStepScheduler"]
@@ -0,0 +1,497 @@
+"""Run one large world as parallel strips, one worker process per strip.
+
+Every worker builds the same world from the shared seed and then keeps only
+the lifeforms, plants and carcasses whose anchor lies in its strip (see
+:class:`~evolution.simulation.sharding.StripLayout`). After each tick a
+worker reports three things to the coordinator:
+
+* halo: snapshots of its lifeforms within ``halo`` pixels of a border,
+  which the neighbour keeps as ghosts for sensing, hunting and mating;
+* migrants: lifeforms that crossed into another strip, handed over whole;
+* hits: health lost by ghosts during the tick, sent back to the owner.
+
+The coordinator routes these into the next tick's inbox of each worker and
+merges the per-shard population statistics on request. Ghosts lag their
+owner by one tick and are never simulated; besides damage, changes made to
+a ghost are overwritten by the owner's next snapshot. Plants stay with the
+strip they were seeded in, carcasses with the strip where the creature
+died, and world events run independently in every shard.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import multiprocessing
+import random
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from ..config import settings
+from ..config.settings import SimulationSettings
+from ..headless import build_engine
+from ..systems import rng as random_streams
+from .sharding import (
+    LifeformRecord,
+    StripLayout,
+    apply_record,
+    find_profile,
+    lifeform_point,
+    merge_population_stats,
+    rect_center,
+    restore_lifeform,
+    snapshot_lifeform,
+)
+
+# (neighbour shard, record) pairs and (owner shard, lifeform id, health delta)
+Routed = List[Tuple[int, LifeformRecord]]
+Hits = List[Tuple[int, str, float]]
+
+
+@dataclasses.dataclass
+class ShardExchange:
+    """What one worker hands the coordinator after a tick."""
+
+    index: int
+    halo: Routed = dataclasses.field(default_factory=list)
+    migrants: Routed = dataclasses.field(default_factory=list)
+    hits: Hits = dataclasses.field(default_factory=list)
+
+
+@dataclasses.dataclass
+class ShardInbox:
+    """What the coordinator hands one worker before its next tick."""
+
+    ghosts: Routed = dataclasses.field(default_factory=list)
+    migrants: List[LifeformRecord] = dataclasses.field(default_factory=list)
+    hits: List[Tuple[str, float]] = dataclasses.field(default_factory=list)
+
+
+def shard_seed(seed: int, index: int) -> int:
+    """Seed for the random streams of shard ``index`` once its world is built."""
+
+    return random_streams.derive_seed(seed, f"shard-{index}")
+
+
+class ShardWorker:
+    """Simulate one strip of a sharded world.
+
+    Args:
+        layout: Strip layout shared by every shard.
+        index: Strip this worker owns.
+        seed: World seed; every shard must use the same one.
+        runtime: Settings to simulate with. Defaults to the active settings.
+        halo: Halo depth in pixels. Defaults to ``settings.VISION_MAX`` so
+            every sensing query near a border sees the neighbour's ghosts.
+        stats_interval: Ticks between population-stat snapshots.
+    """
+
+    def __init__(
+        self,
+        layout: StripLayout,
+        index: int,
+        *,
+        seed: int,
+        runtime: Optional[SimulationSettings] = None,
+        halo: Optional[float] = None,
+        stats_interval: Optional[int] = None,
+    ) -> None:
+        self.layout = layout
+        self.index = index
+        self.halo = float(settings.VISION_MAX if halo is None else halo)
+        self.engine = build_engine(runtime, seed=seed, stats_interval=stats_interval)
+        # Shards share the world but not their dice
+        random_streams.seed_all(shard_seed(seed, index))
+
+        state = self.engine.state
+        state.id_namespace = f"s{index}."
+        self._ghosts: Dict[str, object] = {}
+        # Ghost health at the last snapshot; anything lower was damage done here
+        self._ghost_health: Dict[str, float] = {}
+        self._ghost_owner: Dict[str, int] = {}
+        # Every shard starts from the same catalogue, so those never travel
+        self._shipped: Set[object] = {profile["dna_id"] for profile in state.dna_profiles}
+        self._trim()
+
+    # ------------------------------------------------------------------
+    # Ownership
+    # ------------------------------------------------------------------
+    def _trim(self) -> None:
+        """Drop every entity anchored outside this strip."""
+
+        state = self.engine.state
+        grid = state.spatial_grid
+        for lifeform in list(state.lifeforms):
+            if self.layout.shard_for(lifeform_point(lifeform)) != self.index:
+                self._release(lifeform)
+        # Foreign plants stay in the occupancy bitmap: their cells are taken
+        for plant in list(state.plants):
+            if self.layout.shard_for(rect_center(plant)) != self.index:
+                state.plants.remove(plant)
+                grid.remove_plant(plant)
+        for carcass in list(state.carcasses):
+            if self.layout.shard_for(rect_center(carcass)) != self.index:
+                state.carcasses.remove(carcass)
+                grid.remove_carcass(carcass)
+
+    def _release(self, lifeform) -> None:
+        state = self.engine.state
+        state.lifeforms.remove(lifeform)
+        state.spatial_grid.remove_lifeform(lifeform)
+        state.population_stats.remove(lifeform)
+
+    def _record(self, lifeform) -> LifeformRecord:
+        profile = None
+        if lifeform.dna_id not in self._shipped:
+            self._shipped.add(lifeform.dna_id)
+            profile = find_profile(self.engine.state, lifeform.dna_id)
+        return snapshot_lifeform(lifeform, profile=profile)
+
+    # ------------------------------------------------------------------
+    # Exchange
+    # ------------------------------------------------------------------
+    def receive(self, inbox: ShardInbox) -> None:
+        """Adopt migrants, apply hits and refresh ghosts before the next tick."""
+
+        state = self.engine.state
+        grid = state.spatial_grid
+        for record in inbox.migrants:
+            self._drop_ghost(record.id)
+            if record.profile is not None:
+                self._shipped.add(record.dna_id)
+            state.lifeforms.append(restore_lifeform(state, record))
+
+        # Hits may target a migrant adopted just above
+        if inbox.hits:
+            owned = {lifeform.id: lifeform for lifeform in state.lifeforms}
+            for lifeform_id, delta in inbox.hits:
+                target = owned.get(lifeform_id)
+                if target is not None:
+                    target.health_now = max(0.0, target.health_now + delta)
+
+        seen: Set[str] = set()
+        for owner, record in inbox.ghosts:
+            seen.add(record.id)
+            if record.profile is not None:
+                self._shipped.add(record.dna_id)
+            ghost = self._ghosts.get(record.id)
+            if ghost is None:
+                ghost = self._ghosts[record.id] = restore_lifeform(state, record)
+                # Ghosts are counted by their owner
+                state.population_stats.remove(ghost)
+            else:
+                apply_record(ghost, record)
+                grid.move_lifeform(ghost)
+            self._ghost_health[record.id] = ghost.health_now
+            self._ghost_owner[record.id] = owner
+        for lifeform_id in [key for key in self._ghosts if key not in seen]:
+            self._drop_ghost(lifeform_id)
+
+    def _drop_ghost(self, lifeform_id: str) -> None:
+        ghost = self._ghosts.pop(lifeform_id, None)
+        if ghost is not None:
+            self.engine.state.spatial_grid.remove_lifeform(ghost)
+            del self._ghost_health[lifeform_id]
+            del self._ghost_owner[lifeform_id]
+
+    def step(self, dt: float) -> ShardExchange:
+        """Run one tick and collect the halo, migrants and ghost hits."""
+
+        self.engine.step(dt)
+        exchange = ShardExchange(self.index)
+
+        for lifeform_id, ghost in self._ghosts.items():
+            delta = ghost.health_now - self._ghost_health[lifeform_id]
+            if delta < 0.0:
+                exchange.hits.append((self._ghost_owner[lifeform_id], lifeform_id, delta))
+
+        layout = self.layout
+        low, high = layout.bounds(self.index)
+        axis = 0 if layout.axis == "x" else 1
+        for lifeform in list(self.engine.state.lifeforms):
+            point = lifeform_point(lifeform)
+            owner = layout.shard_for(point)
+            if owner != self.index:
+                self._release(lifeform)
+                exchange.migrants.append((owner, self._record(lifeform)))
+                continue
+            coordinate = point[axis]
+            if self.index > 0 and coordinate < low + self.halo:
+                exchange.halo.append((self.index - 1, self._record(lifeform)))
+            if self.index < layout.shards - 1 and coordinate >= high - self.halo:
+                exchange.halo.append((self.index + 1, self._record(lifeform)))
+        return exchange
+
+    def publish_stats(self, time_label: str) -> Dict[str, object]:
+        return self.engine.publish_stats(time_label)
+
+    def counts(self) -> Dict[str, int]:
+        state = self.engine.state
+        return {
+            "lifeforms": len(state.lifeforms),
+            "ghosts": len(self._ghosts),
+            "plants": len(state.plants),
+            "carcasses": len(state.carcasses),
+            "deaths": len(state.death_ages),
+        }
+
+
+def _handle(worker: ShardWorker, message: tuple):
+    command = message[0]
+    if command == "step":
+        _, dt, inbox = message
+        worker.receive(inbox)
+        return worker.step(dt)
+    if command == "stats":
+        return worker.publish_stats(message[1])
+    if command == "counts":
+        return worker.counts()
+    raise ValueError(f"unknown shard command {command!r}")
+
+
+def _serve(connection, layout: StripLayout, index: int, options: dict) -> None:
+    """Worker process entry point: answer coordinator messages until told to stop."""
+
+    runtime = options.get("runtime")
+    if runtime is not None:
+        settings.apply_runtime_settings(runtime)
+    worker = ShardWorker(layout, index, **options)
+    while True:
+        message = connection.recv()
+        if message[0] == "close":
+            break
+        connection.send(_handle(worker, message))
+    connection.close()
+
+
+class _InlineShard:
+    """Runs a worker in the calling process; used by tests and for debugging."""
+
+    def __init__(self, layout: StripLayout, index: int, options: dict) -> None:
+        self.worker = ShardWorker(layout, index, **options)
+        self._reply = None
+
+    def send(self, message: tuple) -> None:
+        self._reply = _handle(self.worker, message)
+
+    def recv(self):
+        return self._reply
+
+    def close(self) -> None:
+        self._reply = None
+
+
+class _ProcessShard:
+    def __init__(self, context, layout: StripLayout, index: int, options: dict) -> None:
+        self._connection, child = context.Pipe()
+        self._process = context.Process(
+            target=_serve,
+            args=(child, layout, index, options),
+            name=f"evolution-shard-{index}",
+            daemon=True,
+        )
+        self._process.start()
+        child.close()
+
+    def send(self, message: tuple) -> None:
+        self._connection.send(message)
+
+    def recv(self):
+        return self._connection.recv()
+
+    def close(self) -> None:
+        try:
+            self._connection.send(("close",))
+        except (BrokenPipeError, OSError):
+            pass
+        self._process.join(timeout=10.0)
+        if self._process.is_alive():
+            self._process.terminate()
+        self._connection.close()
+
+
+class ShardedSimulation:
+    """Coordinator of a sharded run.
+
+    Args:
+        shards: Number of strips and worker processes.
+        seed: World seed shared by every shard; drawn at random when ``None``.
+        runtime: Settings to simulate with. Defaults to the active settings.
+        axis: ``"x"`` for vertical strips, ``"y"`` for horizontal ones.
+        halo: Halo depth in pixels; see :class:`ShardWorker`.
+        stats_interval: Ticks between population-stat snapshots per shard.
+        processes: Run workers in child processes. ``False`` runs them one
+            after another in this process, which is only useful for tests.
+    """
+
+    def __init__(
+        self,
+        shards: int,
+        *,
+        seed: Optional[int] = None,
+        runtime: Optional[SimulationSettings] = None,
+        axis: str = "x",
+        halo: Optional[float] = None,
+        stats_interval: Optional[int] = None,
+        processes: bool = True,
+    ) -> None:
+        runtime = runtime or settings.current_settings()
+        self.seed = seed if seed is not None else random.SystemRandom().randrange(2**31)
+        self.layout = StripLayout(runtime.WORLD_WIDTH, runtime.WORLD_HEIGHT, shards, axis=axis)
+        self.tick_count = 0
+        self.elapsed_ms = 0.0
+        self.migrations = 0
+        options = {"seed": self.seed, "runtime": runtime, "halo": halo, "stats_interval": stats_interval}
+
+        self._inboxes = [ShardInbox() for _ in range(shards)]
+        # DNA profiles seen in transit and the shards that already have them
+        self._profiles: Dict[object, dict] = {}
+        self._known: List[Set[object]] = [set() for _ in range(shards)]
+        if processes:
+            context = multiprocessing.get_context("spawn")
+            self._shards = [
+                _ProcessShard(context, self.layout, index, self._worker_options(options, index))
+                for index in range(shards)
+            ]
+        else:
+            self._shards = [_InlineShard(self.layout, index, options) for index in range(shards)]
+
+    @staticmethod
+    def _worker_options(options: dict, index: int) -> dict:
+        runtime = options["runtime"]
+        # Telemetry files are named by kind and second; keep shards apart
+        log_directory = runtime.LOG_DIRECTORY / f"shard-{index}"
+        return {**options, "runtime": dataclasses.replace(runtime, LOG_DIRECTORY=log_directory)}
+
+    def __enter__(self) -> "ShardedSimulation":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def shards(self) -> int:
+        return self.layout.shards
+
+    def _broadcast(self, message_for) -> list:
+        # Send everything first so the workers run concurrently
+        for index, shard in enumerate(self._shards):
+            shard.send(message_for(index))
+        return [shard.recv() for shard in self._shards]
+
+    def step(self, dt: float) -> None:
+        """Advance every shard by one tick and route the exchange."""
+
+        inboxes = self._inboxes
+        self._collect(self._broadcast(lambda index: ("step", dt, inboxes[index])))
+        self.tick_count += 1
+        self.elapsed_ms += dt * 1000.0
+
+    def _collect(self, exchanges: List[ShardExchange]) -> None:
+        """Route one tick's exchanges into fresh inboxes for the next tick."""
+
+        self._inboxes = [ShardInbox() for _ in range(self.shards)]
+        # Hits follow a lifeform that changed hands in the same tick
+        new_owner = {
+            record.id: target for exchange in exchanges for target, record in exchange.migrants
+        }
+        for exchange in exchanges:
+            origin = exchange.index
+            for target, record in exchange.halo:
+                self._inboxes[target].ghosts.append((origin, self._route(origin, target, record)))
+            for target, record in exchange.migrants:
+                self._inboxes[target].migrants.append(self._route(origin, target, record))
+            for owner, lifeform_id, delta in exchange.hits:
+                owner = new_owner.get(lifeform_id, owner)
+                self._inboxes[owner].hits.append((lifeform_id, delta))
+            self.migrations += len(exchange.migrants)
+
+    def _route(self, origin: int, target: int, record: LifeformRecord) -> LifeformRecord:
+        """Attach the DNA profile exactly when ``target`` has not seen it yet."""
+
+        dna_id = record.dna_id
+        if record.profile is not None:
+            self._profiles[dna_id] = record.profile
+            self._known[origin].add(dna_id)
+        profile = self._profiles.get(dna_id)
+        if profile is None or dna_id in self._known[target]:
+            # Unknown here means it is part of the shared starting catalogue
+            return dataclasses.replace(record, profile=None) if record.profile is not None else record
+        self._known[target].add(dna_id)
+        return dataclasses.replace(record, profile=profile)
+
+    def publish_stats(self, time_label: Optional[str] = None) -> Dict[str, object]:
+        """Population statistics over all shards, as one world would report them."""
+
+        if time_label is None:
+            time_label = str(datetime.timedelta(seconds=int(self.elapsed_ms / 1000)))
+        parts = self._broadcast(lambda index: ("stats", time_label))
+        return merge_population_stats(parts, time_label)
+
+    def counts(self) -> List[Dict[str, int]]:
+        """Owned entities, ghosts and deaths per shard."""
+
+        return self._broadcast(lambda index: ("counts",))
+
+    def close(self) -> None:
+        for shard in self._shards:
+            shard.close()
+        self._shards = []
+
+
+def run_sharded(
+    ticks: int,
+    shards: int,
+    *,
+    seed: Optional[int] = None,
+    dt: Optional[float] = None,
+    runtime: Optional[SimulationSettings] = None,
+    axis: str = "x",
+    halo: Optional[float] = None,
+    stats_interval: Optional[int] = None,
+) -> Dict[str, object]:
+    """Sharded counterpart of :func:`evolution.headless.run_headless`."""
+
+    runtime = runtime or settings.current_settings()
+    step_dt = dt if dt is not None else 1.0 / max(1, runtime.FPS)
+    with ShardedSimulation(
+        shards,
+        seed=seed,
+        runtime=runtime,
+        axis=axis,
+        halo=halo,
+        stats_interval=stats_interval,
+    ) as simulation:
+        started = time.perf_counter()
+        for _ in range(max(0, ticks)):
+            simulation.step(step_dt)
+        elapsed = time.perf_counter() - started
+
+        stats = simulation.publish_stats()
+        per_shard = simulation.counts()
+
+    return {
+        "ticks": simulation.tick_count,
+        "seed": simulation.seed,
+        "dt": step_dt,
+        "shards": shards,
+        "axis": axis,
+        "wall_seconds": round(elapsed, 4),
+        "ticks_per_second": round(simulation.tick_count / elapsed, 2) if elapsed > 0 else None,
+        "lifeforms": stats.get("lifeform_count", 0),
+        "plants": sum(counts["plants"] for counts in per_shard),
+        "carcasses": sum(counts["carcasses"] for counts in per_shard),
+        "deaths": sum(counts["deaths"] for counts in per_shard),
+        "migrations": simulation.migrations,
+        "per_shard": per_shard,
+    }
+
+
+__all__ = [
+    "ShardExchange",
+    "ShardInbox",
+    "ShardWorker",
+    "ShardedSimulation",
+    "run_sharded",
+    "shard_seed",
+]
@@ -0,0 +1,310 @@
+"""Strip partitioning of the ocean for sharded simulation runs.
+
+A sharded run splits the world into parallel strips, one per worker. Each
+worker owns the entities whose anchor point lies in its strip, sees the
+entities of its neighbours that lie within a halo margin of the shared
+border, and hands entities over when they cross into another strip. The
+coordinator then folds the per-shard statistics back into one report with
+:func:`merge_population_stats`.
+
+Lifeforms cross process boundaries as :class:`LifeformRecord` snapshots;
+:mod:`evolution.simulation.sharded` runs the workers and the coordinator.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from pygame.math import Vector2
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type hints only
+    from ..entities.lifeform import Lifeform
+    from .state import SimulationState
+
+Point = Tuple[float, float]
+
+# Lifeform attributes a record carries, in ``LifeformRecord.values`` order.
+# Everything else is re-derived from the DNA profile on the receiving shard.
+RECORD_FIELDS = (
+    "x",
+    "y",
+    "angle",
+    "angular_velocity",
+    "age",
+    "hunger",
+    "wounded",
+    "health_now",
+    "energy_now",
+    "reproduced",
+    "reproduced_cooldown",
+    "scar_tissue",
+    "size",
+    "width",
+    "height",
+    "mass",
+    "speed",
+    "attack_power_now",
+    "defence_power_now",
+)
+
+
+def lifeform_point(entity) -> Point:
+    return (float(entity.x), float(entity.y))
+
+
+def rect_center(entity) -> Point:
+    return (float(entity.rect.centerx), float(entity.rect.centery))
+
+
+class StripLayout:
+    """Split a ``width`` x ``height`` world into equal strips.
+
+    Args:
+        width: World width in pixels.
+        height: World height in pixels.
+        shards: Number of strips.
+        axis: ``"x"`` for vertical strips side by side, ``"y"`` for
+            horizontal strips stacked by depth.
+    """
+
+    def __init__(self, width: float, height: float, shards: int, *, axis: str = "x") -> None:
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        if axis not in ("x", "y"):
+            raise ValueError("axis must be 'x' or 'y'")
+        self.width = float(width)
+        self.height = float(height)
+        self.shards = int(shards)
+        self.axis = axis
+        extent = self.width if axis == "x" else self.height
+        # Inner borders between consecutive strips
+        self._borders = [extent * index / self.shards for index in range(1, self.shards)]
+
+    def _coordinate(self, point: Point) -> float:
+        return point[0] if self.axis == "x" else point[1]
+
+    def bounds(self, index: int) -> Tuple[float, float]:
+        """Return the ``[low, high)`` span of strip ``index`` along the axis."""
+
+        extent = self.width if self.axis == "x" else self.height
+        low = self._borders[index - 1] if index > 0 else 0.0
+        high = self._borders[index] if index < self.shards - 1 else extent
+        return low, high
+
+    def shard_for(self, point: Point) -> int:
+        """Strip owning ``point``; points off the world clamp to the edge strips."""
+
+        return bisect_right(self._borders, self._coordinate(point))
+
+    def partition(
+        self, entities: Iterable[object], point: Callable[[object], Point] = lifeform_point
+    ) -> List[List[object]]:
+        """Group ``entities`` by owning strip."""
+
+        owned: List[List[object]] = [[] for _ in range(self.shards)]
+        for entity in entities:
+            owned[self.shard_for(point(entity))].append(entity)
+        return owned
+
+    def halo(
+        self,
+        owned: Sequence[Sequence[object]],
+        index: int,
+        margin: float,
+        point: Callable[[object], Point] = lifeform_point,
+    ) -> List[object]:
+        """Entities of neighbouring strips within ``margin`` of strip ``index``.
+
+        Args:
+            owned: Output of :meth:`partition`.
+            index: Strip that needs the halo.
+            margin: Halo depth, typically the largest sensing or bite radius.
+            point: Anchor used for ownership.
+        """
+
+        low, high = self.bounds(index)
+        ghosts: List[object] = []
+        if index > 0:
+            for entity in owned[index - 1]:
+                if self._coordinate(point(entity)) >= low - margin:
+                    ghosts.append(entity)
+        if index < self.shards - 1:
+            for entity in owned[index + 1]:
+                if self._coordinate(point(entity)) < high + margin:
+                    ghosts.append(entity)
+        return ghosts
+
+    def migrations(
+        self,
+        owners: Mapping[int, int],
+        entities: Iterable[object],
+        point: Callable[[object], Point] = lifeform_point,
+    ) -> List[Tuple[object, int, int]]:
+        """Return ``(entity, old_shard, new_shard)`` for entities that moved strips.
+
+        Args:
+            owners: ``id(entity) -> shard`` from the previous assignment.
+                Entities missing from it are new and do not migrate.
+            entities: Current entities.
+            point: Anchor used for ownership.
+        """
+
+        moved: List[Tuple[object, int, int]] = []
+        for entity in entities:
+            previous = owners.get(id(entity))
+            if previous is None:
+                continue
+            current = self.shard_for(point(entity))
+            if current != previous:
+                moved.append((entity, previous, current))
+        return moved
+
+
+@dataclass
+class LifeformRecord:
+    """Picklable snapshot of one lifeform, sent as a halo ghost or a migrant.
+
+    ``profile`` is only attached the first time a DNA id travels to a shard;
+    the receiver keeps it in ``state.dna_profiles`` from then on.
+    """
+
+    id: str
+    dna_id: object
+    generation: int
+    parents: Tuple[str, ...]
+    velocity: Tuple[float, float]
+    values: Tuple[float, ...]
+    profile: Optional[dict] = None
+
+
+def snapshot_lifeform(lifeform: "Lifeform", *, profile: Optional[dict] = None) -> LifeformRecord:
+    """Capture ``lifeform`` as a :class:`LifeformRecord`."""
+
+    return LifeformRecord(
+        id=lifeform.id,
+        dna_id=lifeform.dna_id,
+        generation=int(lifeform.generation),
+        parents=tuple(lifeform.parent_ids),
+        velocity=(float(lifeform.velocity.x), float(lifeform.velocity.y)),
+        values=tuple(float(getattr(lifeform, name)) for name in RECORD_FIELDS),
+        profile=profile,
+    )
+
+
+def find_profile(state: "SimulationState", dna_id: object) -> Optional[dict]:
+    """The DNA profile registered under ``dna_id`` in ``state``, if any."""
+
+    for profile in state.dna_profiles:
+        if profile["dna_id"] == dna_id:
+            return profile
+    return None
+
+
+def apply_record(lifeform: "Lifeform", record: LifeformRecord) -> None:
+    """Overwrite the dynamic state of ``lifeform`` with ``record``."""
+
+    for name, value in zip(RECORD_FIELDS, record.values):
+        setattr(lifeform, name, value)
+    lifeform.reproduced = int(lifeform.reproduced)
+    lifeform.reproduced_cooldown = int(lifeform.reproduced_cooldown)
+    lifeform.velocity = Vector2(record.velocity)
+    lifeform.rect.update(
+        int(lifeform.x),
+        int(lifeform.y),
+        max(1, int(lifeform.width)),
+        max(1, int(lifeform.height)),
+    )
+
+
+def restore_lifeform(state: "SimulationState", record: LifeformRecord) -> "Lifeform":
+    """Rebuild the lifeform described by ``record`` inside ``state``.
+
+    The new lifeform registers with the spatial grid and the population
+    statistics like any spawn; the caller decides whether it joins
+    ``state.lifeforms``.
+
+    Raises:
+        KeyError: If the record's DNA profile was never shipped to ``state``.
+    """
+
+    from ..entities.lifeform import Lifeform
+
+    profile = find_profile(state, record.dna_id)
+    if profile is None:
+        if record.profile is None:
+            raise KeyError(f"DNA profile {record.dna_id!r} is unknown to this shard")
+        profile = dict(record.profile)
+        state.dna_profiles.append(profile)
+    x, y = record.values[0], record.values[1]
+    lifeform = Lifeform(state, x, y, profile, record.generation, record.parents)
+    lifeform.id = record.id
+    apply_record(lifeform, record)
+    population_stats = getattr(state, "population_stats", None)
+    if population_stats is not None:
+        population_stats.refresh(lifeform)
+    return lifeform
+
+
+def _weighted(parts: Sequence[Mapping[str, object]], key: str, weight_key: str) -> float:
+    total_weight = 0.0
+    total = 0.0
+    for part in parts:
+        weight = float(part.get(weight_key, 0) or 0)
+        total_weight += weight
+        total += float(part.get(key, 0.0)) * weight
+    return total / total_weight if total_weight else 0.0
+
+
+def merge_population_stats(
+    parts: Sequence[Mapping[str, object]], formatted_time_passed: str
+) -> Dict[str, object]:
+    """Combine per-shard :func:`collect_population_stats` results.
+
+    Averages are weighted by each shard's ``lifeform_count`` (``death_count``
+    for ``death_age_avg``), so the result matches collecting stats over the
+    union of all shards.
+    """
+
+    merged: Dict[str, object] = {
+        "lifeform_count": sum(int(part.get("lifeform_count", 0)) for part in parts),
+        "formatted_time": formatted_time_passed,
+        "death_count": sum(int(part.get("death_count", 0)) for part in parts),
+        "death_age_avg": _weighted(parts, "death_age_avg", "death_count"),
+    }
+    averages = {key for part in parts for key in part if key.startswith("average_")}
+    for key in sorted(averages):
+        merged[key] = _weighted(parts, key, "lifeform_count")
+
+    dna_count: Dict[object, int] = {}
+    dna_sums: Dict[object, Dict[str, float]] = {}
+    for part in parts:
+        counts = part.get("dna_count", {}) or {}
+        attribute_averages = part.get("dna_attribute_averages", {}) or {}
+        for dna_id, count in counts.items():
+            dna_count[dna_id] = dna_count.get(dna_id, 0) + int(count)
+            sums = dna_sums.setdefault(dna_id, {})
+            for attribute, value in attribute_averages.get(dna_id, {}).items():
+                sums[attribute] = sums.get(attribute, 0.0) + float(value) * int(count)
+    merged["dna_count"] = dna_count
+    merged["dna_attribute_averages"] = {
+        dna_id: {attribute: total / dna_count[dna_id] for attribute, total in sums.items()}
+        for dna_id, sums in dna_sums.items()
+        if dna_count[dna_id]
+    }
+    return merged
+
+
+__all__ = [
+    "LifeformRecord",
+    "RECORD_FIELDS",
+    "StripLayout",
+    "apply_record",
+    "find_profile",
+    "lifeform_point",
+    "merge_population_stats",
+    "rect_center",
+    "restore_lifeform",
+    "snapshot_lifeform",
+]
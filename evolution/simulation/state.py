@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, TYPE_CHECKING
 
+from ..systems.stats import PopulationStats
+
 if TYPE_CHECKING:  # pragma: no cover - imported for type hints only
     from ..rendering.effects import EffectManager
     from ..entities.lifeform import Lifeform
@@ -31,12 +33,16 @@ class SimulationState:
     last_plant_regrowth: float = 1.0
     last_moss_growth_speed: float = 1.0
     death_ages: List[int] = field(default_factory=list)
+    # Running aggregates, kept in step with lifeforms and death_ages
+    population_stats: PopulationStats = field(default_factory=PopulationStats)
     dna_profiles: List[dict] = field(default_factory=list)
     dna_home_biome: dict = field(default_factory=dict)
     dna_id_counts: Dict[str, int] = field(default_factory=dict)
     dna_lineage: Dict[str, dict] = field(default_factory=dict)
     lifeform_genetics: Dict[str, dict] = field(default_factory=dict)
     lifeform_id_counter: int = 0
+    # Prefix for new lifeform and DNA ids so sharded runs never hand out the same id twice
+    id_namespace: str = ""
     selected_lifeform: Optional['Lifeform'] = None
     last_debug_log_path: Optional[str] = None
     spatial_grid: Optional['SpatialHashGrid'] = None  # Spatial hash for performance
@@ -6,7 +6,7 @@ import math
 import os
 from collections import deque
 from dataclasses import dataclass
-from typing import Deque, Dict, Iterable, List, Mapping, Tuple
+from typing import Deque, Dict, Iterable, List, Protocol, Tuple
 
 import pygame
 
@@ -27,42 +27,11 @@ class Chunk:
     last_used: int = 0
 
 
-class _EntityIndex:
-    """Simple chunk-based lookup for entities with ``rect`` attributes."""
+class EntityIndex(Protocol):
+    """Entity lookup shared with the simulation (see ``SpatialHashGrid``)."""
 
-    def __init__(self, chunk_size: int) -> None:
-        self.chunk_size = chunk_size
-        self._by_type: Dict[str, Dict[Tuple[int, int], List[object]]] = {}
-
-    def rebuild(self, entities: Mapping[str, Iterable[object]], *, coords_for_rect) -> None:
-        self._by_type = {key: {} for key in entities.keys()}
-        for entity_type, items in entities.items():
-            bucket = self._by_type[entity_type]
-            for obj in items:
-                rect = getattr(obj, "rect", None)
-                if rect is None:
-                    continue
-                for coords in coords_for_rect(rect):
-                    bucket.setdefault(coords, []).append(obj)
-
-    def entities_in_rect(
-        self, rect: pygame.Rect, *, coords_for_rect, margin: int = 0
-    ) -> Dict[str, List[object]]:
-        results: Dict[str, List[object]] = {key: [] for key in self._by_type.keys()}
-        seen: set[int] = set()
-        for coords in coords_for_rect(rect, margin=margin):
-            for entity_type, by_chunk in self._by_type.items():
-                candidates = by_chunk.get(coords)
-                if not candidates:
-                    continue
-                target = results[entity_type]
-                for obj in candidates:
-                    marker = id(obj)
-                    if marker in seen:
-                        continue
-                    seen.add(marker)
-                    target.append(obj)
-        return results
+    def entities_in_rect(self, rect: pygame.Rect, margin: float = 0.0) -> Dict[str, List[object]]:
+        ...
 
 
 class ChunkManager:
@@ -87,7 +56,7 @@ class ChunkManager:
         self._frame_index: int = 0
         self.rebuilds_this_frame: int = 0
 
-        self._entity_index = _EntityIndex(self.chunk_size)
+        self._entity_index: EntityIndex | None = None
 
     # ------------------------------------------------------------------
     # Build & streaming
@@ -122,7 +91,6 @@ class ChunkManager:
         if new_size == self.chunk_size:
             return
         self.chunk_size = new_size
-        self._entity_index = _EntityIndex(new_size)
         if self._world is not None:
             self.build_static_chunks(self._world)
 
@@ -206,28 +174,19 @@ class ChunkManager:
     def frame_index(self) -> int:
         return self._frame_index
 
-    def update_entity_index(
-        self,
-        *,
-        plants: Iterable[object],
-        carcasses: Iterable[object],
-        lifeforms: Iterable[object],
-    ) -> None:
-        entities = {
-            "plants": plants,
-            "carcasses": carcasses,
-            "lifeforms": lifeforms,
-        }
-        self._entity_index.rebuild(
-            entities, coords_for_rect=lambda r, margin=0: self._chunk_coords_for_rect(r, margin=margin)
-        )
+    def set_entity_index(self, index: EntityIndex | None) -> None:
+        """Read entity visibility from ``index`` (normally ``state.spatial_grid``).
+
+        The index is kept current by the simulation, so binding it is cheap
+        and can be repeated every frame in case the state swapped grids.
+        """
+        self._entity_index = index
 
     def entities_in_rect(self, rect: pygame.Rect, margin: int = 0) -> Dict[str, List[object]]:
-        return self._entity_index.entities_in_rect(
-            rect,
-            coords_for_rect=self._chunk_coords_for_rect,
-            margin=margin,
-        )
+        """Entities near ``rect``; ``margin`` is measured in chunks."""
+        if self._entity_index is None:
+            return {"plants": [], "carcasses": [], "lifeforms": []}
+        return self._entity_index.entities_in_rect(rect, margin * self.chunk_size)
 
     def mark_region_dirty(self, rect: pygame.Rect) -> None:
         for coords in self._chunk_coords_for_rect(rect):
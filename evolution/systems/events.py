@@ -36,6 +36,8 @@ class EventManager:
         self.environment_modifiers = environment_modifiers
         self.events: List[Event] = []
         self.active_event: Optional[Event] = None
+        # Timestamp of the last update; the simulation clock, not wall time
+        self.current_time = 0
 
     def schedule_default_events(self) -> None:
         if self.events:
@@ -86,6 +88,7 @@ class EventManager:
         event.applied_effects.clear()
 
     def update(self, current_time: int, stats: Dict[str, float], player_controller) -> None:
+        self.current_time = current_time
         if not self.active_event:
             self.start_next_event(current_time)
             return
@@ -129,8 +132,7 @@ class EventManager:
         if not self.active_event:
             return
         event = self.active_event
-        current_time = pygame.time.get_ticks()
-        remaining_seconds = int(event.time_left(current_time) / 1000)
+        remaining_seconds = int(event.time_left(self.current_time) / 1000)
         lines = [
             event.name,
             event.description,
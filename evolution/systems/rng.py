@@ -0,0 +1,125 @@
+"""Named random streams derived from a single run seed.
+
+Every stochastic subsystem draws from its own :class:`random.Random` (or
+NumPy ``Generator``) obtained through :func:`stream` / :func:`numpy_stream`.
+Each stream is seeded from the run seed and its name, so adding draws in one
+subsystem does not shift the sequence seen by another. Calling
+:func:`seed_all` reseeds the existing stream objects in place, which lets
+modules keep a reference obtained at import time.
+
+NumPy is optional; :func:`numpy_stream` returns ``None`` without it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+from typing import Dict, Optional
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - fallback when numpy is missing
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+def derive_seed(seed: int, name: str) -> int:
+    """Return a 64-bit seed for stream ``name`` under run seed ``seed``."""
+
+    digest = hashlib.sha256(f"{int(seed)}:{name}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+class RandomStreams:
+    """Registry of per-subsystem random streams.
+
+    Args:
+        seed: Run seed. ``None`` seeds every stream from OS entropy.
+    """
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        self.seed: Optional[int] = seed
+        self._streams: Dict[str, random.Random] = {}
+        self._numpy: Dict[str, object] = {}
+        self._spawned: Dict[str, int] = {}
+
+    def _seed_for(self, name: str) -> Optional[int]:
+        return None if self.seed is None else derive_seed(self.seed, name)
+
+    def stream(self, name: str) -> random.Random:
+        """Return the shared stream for ``name``; the object is stable."""
+
+        rng = self._streams.get(name)
+        if rng is None:
+            rng = self._streams[name] = random.Random(self._seed_for(name))
+        return rng
+
+    def numpy_stream(self, name: str):
+        """Return the NumPy ``Generator`` for ``name``, or ``None`` without NumPy."""
+
+        if not NUMPY_AVAILABLE:
+            return None
+        generator = self._numpy.get(name)
+        if generator is None:
+            generator = self._numpy[name] = np.random.default_rng(self._seed_for(name))
+        return generator
+
+    def spawn(self, name: str) -> random.Random:
+        """Create a new private stream, e.g. for one plant.
+
+        Children are numbered per ``name`` so the n-th child of a seeded run
+        always receives the same seed.
+        """
+
+        index = self._spawned.get(name, 0)
+        self._spawned[name] = index + 1
+        if self.seed is None:
+            return random.Random()
+        return random.Random(derive_seed(self.seed, f"{name}#{index}"))
+
+    def reseed(self, seed: Optional[int]) -> None:
+        """Reseed every existing stream in place and restart child numbering."""
+
+        self.seed = seed
+        self._spawned.clear()
+        for name, rng in self._streams.items():
+            rng.seed(self._seed_for(name))
+        for name, generator in self._numpy.items():
+            fresh = np.random.default_rng(self._seed_for(name))
+            generator.bit_generator.state = fresh.bit_generator.state
+
+
+streams = RandomStreams()
+
+
+def stream(name: str) -> random.Random:
+    return streams.stream(name)
+
+
+def numpy_stream(name: str):
+    return streams.numpy_stream(name)
+
+
+def spawn(name: str) -> random.Random:
+    return streams.spawn(name)
+
+
+def seed_all(seed: Optional[int]) -> None:
+    """Seed all named streams and the shared :mod:`random` module."""
+
+    streams.reseed(seed)
+    random.seed(seed)
+
+
+__all__ = [
+    "NUMPY_AVAILABLE",
+    "RandomStreams",
+    "derive_seed",
+    "numpy_stream",
+    "seed_all",
+    "spawn",
+    "stream",
+    "streams",
+]
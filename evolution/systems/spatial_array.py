@@ -0,0 +1,200 @@
+"""Array-backed spatial index with vectorised radius queries.
+
+Entity coordinates are stored in contiguous NumPy arrays sorted by grid cell.
+Counting-sort offsets give the index range of every cell, so the candidates
+for one grid row of a query are a single contiguous slice and the distance
+test becomes one masked vector operation. :meth:`ArraySpatialIndex.query_batch`
+answers the queries of every lifeform in a single call.
+
+NumPy is optional; :data:`NUMPY_AVAILABLE` tells callers whether this module
+can be used or whether they should stay on :class:`SpatialHashGrid` queries.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Sequence
+from typing import Any
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - fallback when numpy is missing
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+class ArraySpatialIndex:
+    """Immutable snapshot of entity positions bucketed into a uniform grid.
+
+    Args:
+        entities: Entities to index. The snapshot keeps a reference to the
+            sequence order after sorting in :attr:`entities`.
+        positions: Callable returning the ``(x, y)`` query point of an entity.
+        cell_size: Size of each grid cell.
+    """
+
+    def __init__(
+        self,
+        entities: Sequence[Any],
+        positions: Callable[[Any], tuple[float, float]],
+        cell_size: float = 200.0,
+    ) -> None:
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("ArraySpatialIndex requires numpy")
+
+        self.cell_size = max(1.0, float(cell_size))
+        count = len(entities)
+        coords = np.fromiter(
+            (value for entity in entities for value in positions(entity)),
+            dtype=np.float64,
+            count=count * 2,
+        ).reshape(count, 2)
+
+        if count:
+            self.origin_x = float(coords[:, 0].min())
+            self.origin_y = float(coords[:, 1].min())
+            span_x = float(coords[:, 0].max()) - self.origin_x
+            span_y = float(coords[:, 1].max()) - self.origin_y
+        else:
+            self.origin_x = self.origin_y = 0.0
+            span_x = span_y = 0.0
+        self.cols = int(span_x // self.cell_size) + 1
+        self.rows = int(span_y // self.cell_size) + 1
+
+        cell_x = ((coords[:, 0] - self.origin_x) // self.cell_size).astype(np.int64)
+        cell_y = ((coords[:, 1] - self.origin_y) // self.cell_size).astype(np.int64)
+        keys = cell_y * self.cols + cell_x
+
+        # Counting sort by cell key: ``starts[k]:starts[k + 1]`` is cell k.
+        counts = np.bincount(keys, minlength=self.rows * self.cols)
+        self.starts = np.zeros(counts.size + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.starts[1:])
+        order = np.argsort(keys, kind="stable")
+
+        self.xs = np.ascontiguousarray(coords[order, 0])
+        self.ys = np.ascontiguousarray(coords[order, 1])
+        self.entities: list[Any] = [entities[i] for i in order.tolist()]
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def _cell_span(self, lo: float, hi: float, origin: float, limit: int) -> tuple[int, int]:
+        first = max(0, int(math.floor((lo - origin) / self.cell_size)))
+        last = min(limit - 1, int(math.floor((hi - origin) / self.cell_size)))
+        return first, last
+
+    def query_indices(self, x: float, y: float, radius: float) -> "np.ndarray":
+        """Return sorted-array indices of entities within ``radius`` of ``(x, y)``."""
+
+        if not self.entities or radius < 0:
+            return np.empty(0, dtype=np.int64)
+        col0, col1 = self._cell_span(x - radius, x + radius, self.origin_x, self.cols)
+        row0, row1 = self._cell_span(y - radius, y + radius, self.origin_y, self.rows)
+        if col0 > col1 or row0 > row1:
+            return np.empty(0, dtype=np.int64)
+
+        starts = self.starts
+        slices = [
+            np.arange(starts[row * self.cols + col0], starts[row * self.cols + col1 + 1])
+            for row in range(row0, row1 + 1)
+        ]
+        candidates = slices[0] if len(slices) == 1 else np.concatenate(slices)
+        dx = self.xs[candidates] - x
+        dy = self.ys[candidates] - y
+        return candidates[dx * dx + dy * dy <= radius * radius]
+
+    def query(self, x: float, y: float, radius: float) -> list[Any]:
+        """Return entities within ``radius`` of ``(x, y)``."""
+
+        entities = self.entities
+        return [entities[i] for i in self.query_indices(x, y, radius).tolist()]
+
+    def query_batch(
+        self,
+        xs: Sequence[float],
+        ys: Sequence[float],
+        radii: Sequence[float] | float,
+    ) -> tuple["np.ndarray", "np.ndarray"]:
+        """Answer many radius queries at once.
+
+        Args:
+            xs, ys: Query centres.
+            radii: One radius per query or a single shared radius.
+
+        Returns:
+            ``(offsets, indices)`` in CSR layout: the hits of query ``q`` are
+            ``indices[offsets[q]:offsets[q + 1]]``.
+        """
+
+        qx = np.asarray(xs, dtype=np.float64)
+        qy = np.asarray(ys, dtype=np.float64)
+        radius = np.broadcast_to(np.asarray(radii, dtype=np.float64), qx.shape)
+        n_queries = qx.size
+        if n_queries == 0 or not self.entities:
+            return np.zeros(n_queries + 1, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        size = self.cell_size
+        col0 = np.clip(np.floor((qx - radius - self.origin_x) / size), 0, self.cols - 1).astype(np.int64)
+        col1 = np.clip(np.floor((qx + radius - self.origin_x) / size), -1, self.cols - 1).astype(np.int64)
+        row0 = np.clip(np.floor((qy - radius - self.origin_y) / size), 0, self.rows - 1).astype(np.int64)
+        row1 = np.clip(np.floor((qy + radius - self.origin_y) / size), -1, self.rows - 1).astype(np.int64)
+        # Queries entirely left of/above the data clip ``col1``/``row1`` to -1,
+        # leaving an empty span.
+
+        # One (query, row) pair per grid row each query touches; each pair is a
+        # contiguous slice of the cell-sorted arrays.
+        n_rows = np.maximum(row1 - row0 + 1, 0) * (col1 >= col0)
+        pair_query = np.repeat(np.arange(n_queries), n_rows)
+        row_offsets = np.arange(pair_query.size) - np.repeat(np.cumsum(n_rows) - n_rows, n_rows)
+        pair_row = row0[pair_query] + row_offsets
+        base = pair_row * self.cols
+        lo = self.starts[base + col0[pair_query]]
+        hi = self.starts[base + col1[pair_query] + 1]
+        lengths = hi - lo
+
+        total = int(lengths.sum())
+        cand_query = np.repeat(pair_query, lengths)
+        cand_index = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths - lo, lengths)
+
+        dx = self.xs[cand_index] - qx[cand_query]
+        dy = self.ys[cand_index] - qy[cand_query]
+        r = radius[cand_query]
+        hit = dx * dx + dy * dy <= r * r
+
+        hit_query = cand_query[hit]
+        offsets = np.zeros(n_queries + 1, dtype=np.int64)
+        np.cumsum(np.bincount(hit_query, minlength=n_queries), out=offsets[1:])
+        return offsets, cand_index[hit]
+
+    def query_batch_entities(
+        self,
+        xs: Sequence[float],
+        ys: Sequence[float],
+        radii: Sequence[float] | float,
+    ) -> list[list[Any]]:
+        """Like :meth:`query_batch` but resolves indices to entity lists."""
+
+        offsets, indices = self.query_batch(xs, ys, radii)
+        entities = self.entities
+        flat = [entities[i] for i in indices.tolist()]
+        bounds = offsets.tolist()
+        return [flat[bounds[q] : bounds[q + 1]] for q in range(len(bounds) - 1)]
+
+    def count_batch(
+        self,
+        xs: Sequence[float],
+        ys: Sequence[float],
+        radii: Sequence[float] | float,
+    ) -> "np.ndarray":
+        """Return the number of entities within each query radius."""
+
+        offsets, _ = self.query_batch(xs, ys, radii)
+        return np.diff(offsets)
+
+
+__all__ = ["ArraySpatialIndex", "NUMPY_AVAILABLE"]
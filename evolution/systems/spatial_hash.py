@@ -2,25 +2,53 @@
 
 This module provides a spatial partitioning data structure to optimize
 entity lookups and proximity queries, reducing O(n²) to approximately O(n).
+
+The grid is a long-lived index: entities are inserted once, relocated only
+when their cell key changes and removed when they die or are depleted.
 """
 
 from __future__ import annotations
 
+import math
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+from .spatial_array import NUMPY_AVAILABLE, ArraySpatialIndex
+
 if TYPE_CHECKING:
     from ..entities.lifeform import Lifeform
     from ..world.vegetation import Plant
 
 
+DEFAULT_CELL_SIZE = 200.0
+# Extra radius fetched per lifeform so neighbours that move during the tick
+# are still found by the exact per-call filter.
+DEFAULT_PREFETCH_MARGIN = 32.0
+
+
+@dataclass(slots=True)
+class _Neighborhood:
+    """Candidates fetched for one lifeform at the start of a tick."""
+
+    owner: Any
+    x: float
+    y: float
+    radius: float
+    lifeforms: list[Any]
+    plants: list[Any]
+    carcasses: list[Any]
+
+
 class SpatialHashGrid:
     """Spatial hash grid for fast proximity queries.
 
-    Divides the world into a grid of cells. Each entity is stored in the cell(s)
-    it overlaps with, allowing fast queries for nearby entities without checking
-    all entities in the world.
+    Divides the world into a grid of cells. Each entity is stored in exactly
+    one cell, allowing fast queries for nearby entities without checking all
+    entities in the world. The grid remembers which cell every entity lives in
+    so that ``move_*`` calls are a no-op unless the entity crossed a cell
+    boundary.
 
     Args:
         cell_size: Size of each grid cell. Larger cells = fewer cells but more
@@ -28,17 +56,64 @@ class SpatialHashGrid:
                    query radius.
     """
 
-    def __init__(self, cell_size: float = 200.0) -> None:
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE) -> None:
         self.cell_size = max(1.0, cell_size)
         self._lifeforms: dict[tuple[int, int], list[Lifeform]] = defaultdict(list)
         self._plants: dict[tuple[int, int], list[Plant]] = defaultdict(list)
         self._carcasses: dict[tuple[int, int], list[Any]] = defaultdict(list)
+        # id(entity) -> cell the entity is currently stored in
+        self._lifeform_cells: dict[int, tuple[int, int]] = {}
+        self._plant_cells: dict[int, tuple[int, int]] = {}
+        self._carcass_cells: dict[int, tuple[int, int]] = {}
+        self._prefetched: dict[int, _Neighborhood] = {}
+        # Entities inserted (or plants/carcasses relocated) since the last
+        # prefetch, and the furthest any prefetched lifeform has moved since.
+        self._late_lifeforms: dict[int, Any] = {}
+        self._late_plants: dict[int, Any] = {}
+        self._late_carcasses: dict[int, Any] = {}
+        self._prefetch_drift = 0.0
+        # Largest distance between an entity's grid point and its rect centre
+        # or edge seen so far; reach queries pad their radius with these.
+        self.max_lifeform_extent = 0.0
+        self.max_plant_extent = 0.0
+        self.max_carcass_extent = 0.0
 
     def clear(self) -> None:
         """Clear all entities from the grid."""
         self._lifeforms.clear()
         self._plants.clear()
         self._carcasses.clear()
+        self._lifeform_cells.clear()
+        self._plant_cells.clear()
+        self._carcass_cells.clear()
+        self._reset_prefetch()
+        self.max_lifeform_extent = 0.0
+        self.max_plant_extent = 0.0
+        self.max_carcass_extent = 0.0
+
+    def __len__(self) -> int:
+        return len(self._lifeform_cells) + len(self._plant_cells) + len(self._carcass_cells)
+
+    @property
+    def lifeform_count(self) -> int:
+        return len(self._lifeform_cells)
+
+    @property
+    def plant_count(self) -> int:
+        return len(self._plant_cells)
+
+    @property
+    def carcass_count(self) -> int:
+        return len(self._carcass_cells)
+
+    def contains(self, entity: Any) -> bool:
+        """Return ``True`` when the entity is stored in any bucket."""
+        key = id(entity)
+        return (
+            key in self._lifeform_cells
+            or key in self._plant_cells
+            or key in self._carcass_cells
+        )
 
     def _get_cell(self, x: float, y: float) -> tuple[int, int]:
         """Get the grid cell coordinates for a world position."""
@@ -62,18 +137,132 @@ class SpatialHashGrid:
                 cells.add((cell_x, cell_y))
         return cells
 
+    @staticmethod
+    def _place(
+        buckets: dict[tuple[int, int], list[Any]],
+        cells: dict[int, tuple[int, int]],
+        entity: Any,
+        cell: tuple[int, int],
+    ) -> bool:
+        """Store ``entity`` in ``cell``, relocating it if it lives elsewhere.
+
+        Returns ``True`` when the bucket membership changed.
+        """
+        key = id(entity)
+        previous = cells.get(key)
+        if previous == cell:
+            return False
+        if previous is not None:
+            SpatialHashGrid._unlink(buckets, previous, entity)
+        buckets[cell].append(entity)
+        cells[key] = cell
+        return True
+
+    @staticmethod
+    def _discard(
+        buckets: dict[tuple[int, int], list[Any]],
+        cells: dict[int, tuple[int, int]],
+        entity: Any,
+    ) -> bool:
+        cell = cells.pop(id(entity), None)
+        if cell is None:
+            return False
+        SpatialHashGrid._unlink(buckets, cell, entity)
+        return True
+
+    @staticmethod
+    def _unlink(
+        buckets: dict[tuple[int, int], list[Any]],
+        cell: tuple[int, int],
+        entity: Any,
+    ) -> None:
+        # Compare by identity: entities may define value equality
+        bucket = buckets.get(cell)
+        if bucket is None:
+            return
+        for index, candidate in enumerate(bucket):
+            if candidate is entity:
+                del bucket[index]
+                break
+        if not bucket:
+            del buckets[cell]
+
+    @staticmethod
+    def _lifeform_point(lifeform: Lifeform) -> tuple[float, float]:
+        return (lifeform.x, lifeform.y)
+
+    @staticmethod
+    def _plant_point(plant: Plant) -> tuple[float, float]:
+        # Use center of plant
+        return (plant.x + plant.width / 2, plant.y + plant.height / 2)
+
+    @staticmethod
+    def _carcass_point(carcass: Any) -> tuple[float, float]:
+        # Use center of carcass
+        if hasattr(carcass, "rect"):
+            return (carcass.rect.centerx, carcass.rect.centery)
+        return (getattr(carcass, "x", 0), getattr(carcass, "y", 0))
+
+    def _plant_cell(self, plant: Plant) -> tuple[int, int]:
+        extent = max(plant.width, plant.height) * 0.5
+        if extent > self.max_plant_extent:
+            self.max_plant_extent = float(extent)
+        return self._get_cell(*self._plant_point(plant))
+
+    def _lifeform_cell(self, lifeform: Lifeform) -> tuple[int, int]:
+        extent = math.hypot(getattr(lifeform, "width", 0.0), getattr(lifeform, "height", 0.0)) * 0.5 + 1.0
+        if extent > self.max_lifeform_extent:
+            self.max_lifeform_extent = extent
+        return self._get_cell(lifeform.x, lifeform.y)
+
+    def _carcass_cell(self, carcass: Any) -> tuple[int, int]:
+        rect = getattr(carcass, "rect", None)
+        if rect is not None:
+            extent = max(rect.width, rect.height) * 0.5 + 1.0
+            if extent > self.max_carcass_extent:
+                self.max_carcass_extent = extent
+        return self._get_cell(*self._carcass_point(carcass))
+
     def add_lifeform(self, lifeform: Lifeform) -> None:
-        """Add a lifeform to the grid based on its position."""
-        cell = self._get_cell(lifeform.x, lifeform.y)
-        self._lifeforms[cell].append(lifeform)
+        """Add a lifeform to the grid based on its position.
+
+        Adding a lifeform that is already indexed relocates it instead of
+        storing a duplicate.
+        """
+        self._place(self._lifeforms, self._lifeform_cells, lifeform, self._lifeform_cell(lifeform))
+        if self._prefetched:
+            self._late_lifeforms[id(lifeform)] = lifeform
+
+    def move_lifeform(self, lifeform: Lifeform) -> bool:
+        """Relocate a lifeform if it crossed into another cell.
+
+        Returns:
+            ``True`` when the lifeform changed buckets.
+        """
+        if self._prefetched:
+            self._track_drift(lifeform)
+        return self._place(self._lifeforms, self._lifeform_cells, lifeform, self._lifeform_cell(lifeform))
+
+    def remove_lifeform(self, lifeform: Lifeform) -> bool:
+        """Remove a lifeform from the grid. Returns ``False`` if it was absent."""
+        self._prefetched.pop(id(lifeform), None)
+        return self._discard(self._lifeforms, self._lifeform_cells, lifeform)
 
     def add_plant(self, plant: Plant) -> None:
         """Add a plant to the grid based on its position."""
-        # Use center of plant
-        center_x = plant.x + plant.width / 2
-        center_y = plant.y + plant.height / 2
-        cell = self._get_cell(center_x, center_y)
-        self._plants[cell].append(plant)
+        self._place(self._plants, self._plant_cells, plant, self._plant_cell(plant))
+        if self._prefetched:
+            self._late_plants[id(plant)] = plant
+
+    def move_plant(self, plant: Plant) -> bool:
+        """Relocate a plant whose centre moved (e.g. after a cluster grew)."""
+        if self._prefetched:
+            self._late_plants[id(plant)] = plant
+        return self._place(self._plants, self._plant_cells, plant, self._plant_cell(plant))
+
+    def remove_plant(self, plant: Plant) -> bool:
+        """Remove a plant from the grid. Returns ``False`` if it was absent."""
+        return self._discard(self._plants, self._plant_cells, plant)
 
     def query_lifeforms(self, x: float, y: float, radius: float) -> list[Lifeform]:
         """Query all lifeforms within radius of the given point.
@@ -89,20 +278,16 @@ class SpatialHashGrid:
         """
         cells = self._get_cells_in_radius(x, y, radius)
 
-        # Collect unique lifeforms from all relevant cells
-        seen = set()
+        # Every lifeform lives in exactly one cell, so no deduplication needed
         results = []
         radius_sq = radius * radius
+        buckets = self._lifeforms
 
         for cell in cells:
-            for lifeform in self._lifeforms.get(cell, []):
-                # Use lifeform.id if available, fallback to id() for deduplication
-                # Note: Grid is rebuilt each frame so object identity is stable
-                entity_key = getattr(lifeform, 'id', id(lifeform))
-                if entity_key in seen:
-                    continue
-                seen.add(entity_key)
-
+            bucket = buckets.get(cell)
+            if not bucket:
+                continue
+            for lifeform in bucket:
                 # Check actual distance (optional but recommended for accuracy)
                 dx = lifeform.x - x
                 dy = lifeform.y - y
@@ -123,19 +308,15 @@ class SpatialHashGrid:
         """
         cells = self._get_cells_in_radius(x, y, radius)
 
-        # Collect unique plants from all relevant cells
-        seen = set()
         results = []
         radius_sq = radius * radius
+        buckets = self._plants
 
         for cell in cells:
-            for plant in self._plants.get(cell, []):
-                # Plants don't have IDs, use object identity for deduplication
-                # Note: Grid is rebuilt each frame so object identity is stable
-                if id(plant) in seen:
-                    continue
-                seen.add(id(plant))
-
+            bucket = buckets.get(cell)
+            if not bucket:
+                continue
+            for plant in bucket:
                 # Check actual distance using plant center
                 center_x = plant.x + plant.width / 2
                 center_y = plant.y + plant.height / 2
@@ -148,37 +329,74 @@ class SpatialHashGrid:
 
     def add_carcass(self, carcass: Any) -> None:
         """Add a carcass to the grid based on its position."""
-        # Use center of carcass
-        if hasattr(carcass, "rect"):
-            center_x = carcass.rect.centerx
-            center_y = carcass.rect.centery
-        else:
-            center_x = getattr(carcass, "x", 0)
-            center_y = getattr(carcass, "y", 0)
-            
-        cell = self._get_cell(center_x, center_y)
-        self._carcasses[cell].append(carcass)
+        self._place(self._carcasses, self._carcass_cells, carcass, self._carcass_cell(carcass))
+        if self._prefetched:
+            self._late_carcasses[id(carcass)] = carcass
+
+    def move_carcass(self, carcass: Any) -> bool:
+        """Relocate a sinking carcass if it crossed into another cell."""
+        if self._prefetched:
+            self._late_carcasses[id(carcass)] = carcass
+        return self._place(self._carcasses, self._carcass_cells, carcass, self._carcass_cell(carcass))
+
+    def remove_carcass(self, carcass: Any) -> bool:
+        """Remove a carcass from the grid. Returns ``False`` if it was absent."""
+        return self._discard(self._carcasses, self._carcass_cells, carcass)
+
+    def sync(
+        self,
+        lifeforms: Iterable[Lifeform],
+        plants: Iterable[Plant],
+        carcasses: Iterable[Any] = (),
+    ) -> None:
+        """Reconcile the index with authoritative entity collections.
+
+        Entities missing from the grid are inserted, moved ones relocated and
+        entities no longer present in the collections are dropped. This is a
+        safety net for code paths that bypass the insert/remove hooks; the
+        per-tick path only calls the ``move_*`` helpers.
+        """
+        for entities, buckets, cells, locate in (
+            (lifeforms, self._lifeforms, self._lifeform_cells, self._lifeform_cell),
+            (plants, self._plants, self._plant_cells, self._plant_cell),
+            (carcasses, self._carcasses, self._carcass_cells, self._carcass_cell),
+        ):
+            present: dict[int, Any] = {}
+            for entity in entities:
+                present[id(entity)] = entity
+                self._place(buckets, cells, entity, locate(entity))
+            if len(cells) == len(present):
+                continue
+            for cell, bucket in list(buckets.items()):
+                kept = [entity for entity in bucket if id(entity) in present]
+                if len(kept) == len(bucket):
+                    continue
+                if kept:
+                    buckets[cell] = kept
+                else:
+                    del buckets[cell]
+            for key in [key for key in cells if key not in present]:
+                del cells[key]
 
     def query_carcasses(self, x: float, y: float, radius: float) -> list[Any]:
         """Query all carcasses within radius of the given point."""
         cells = self._get_cells_in_radius(x, y, radius)
-        seen = set()
         results = []
         radius_sq = radius * radius
+        buckets = self._carcasses
 
         for cell in cells:
-            for carcass in self._carcasses.get(cell, []):
-                if id(carcass) in seen:
-                    continue
-                seen.add(id(carcass))
-
+            bucket = buckets.get(cell)
+            if not bucket:
+                continue
+            for carcass in bucket:
                 if hasattr(carcass, "rect"):
                     dx = carcass.rect.centerx - x
                     dy = carcass.rect.centery - y
                 else:
                     dx = getattr(carcass, "x", 0) - x
                     dy = getattr(carcass, "y", 0) - y
-                    
+
                 if dx * dx + dy * dy <= radius_sq:
                     results.append(carcass)
 
@@ -201,28 +419,246 @@ class SpatialHashGrid:
         min_cell_y = int(min_y // self.cell_size)
         max_cell_y = int(max_y // self.cell_size)
 
-        seen = set()
         results = []
 
         for cell_x in range(min_cell_x, max_cell_x + 1):
             for cell_y in range(min_cell_y, max_cell_y + 1):
-                for lifeform in self._lifeforms.get((cell_x, cell_y), []):
-                    if id(lifeform) in seen:
-                        continue
-                    seen.add(id(lifeform))
-
+                for lifeform in self._lifeforms.get((cell_x, cell_y), ()):
                     # Check if actually in bounds
                     if min_x <= lifeform.x <= max_x and min_y <= lifeform.y <= max_y:
                         results.append(lifeform)
 
         return results
 
+    @staticmethod
+    def _collect_rect(
+        buckets: dict[tuple[int, int], list[Any]],
+        point: Callable[[Any], tuple[float, float]],
+        cell_size: float,
+        min_x: float,
+        min_y: float,
+        max_x: float,
+        max_y: float,
+    ) -> list[Any]:
+        results = []
+        for cell_y in range(int(min_y // cell_size), int(max_y // cell_size) + 1):
+            for cell_x in range(int(min_x // cell_size), int(max_x // cell_size) + 1):
+                bucket = buckets.get((cell_x, cell_y))
+                if not bucket:
+                    continue
+                for entity in bucket:
+                    ex, ey = point(entity)
+                    if min_x <= ex <= max_x and min_y <= ey <= max_y:
+                        results.append(entity)
+        return results
+
+    def entities_in_rect(self, rect: Any, margin: float = 0.0) -> dict[str, list[Any]]:
+        """Plants, carcasses and lifeforms whose bounds may touch ``rect``.
+
+        Reads the live buckets, so the renderer can cull against the same
+        index the simulation keeps current instead of building its own every
+        frame. Each kind's query box is widened by the largest extent seen for
+        that kind; callers still do the exact ``colliderect`` test.
+
+        Args:
+            rect: Query rectangle in world coordinates (``pygame.Rect``-like).
+            margin: Extra padding on every side, in world units.
+        """
+        left = rect.left - margin
+        top = rect.top - margin
+        right = rect.right + margin
+        bottom = rect.bottom + margin
+        size = self.cell_size
+        # Lifeforms are stored by their top-left corner, so pad on both sides
+        pad = self.max_lifeform_extent * 2.0
+        lifeforms = self._collect_rect(
+            self._lifeforms, self._lifeform_point, size, left - pad, top - pad, right + pad, bottom + pad
+        )
+        pad = self.max_plant_extent + 1.0
+        plants = self._collect_rect(
+            self._plants, self._plant_point, size, left - pad, top - pad, right + pad, bottom + pad
+        )
+        pad = self.max_carcass_extent
+        carcasses = self._collect_rect(
+            self._carcasses, self._carcass_point, size, left - pad, top - pad, right + pad, bottom + pad
+        )
+        return {"plants": plants, "carcasses": carcasses, "lifeforms": lifeforms}
+
+    # ------------------------------------------------------------------
+    # Per-tick neighbourhood prefetch
+    # ------------------------------------------------------------------
+    def prefetch_neighbors(
+        self,
+        lifeforms: Sequence[Lifeform],
+        radius_for: Callable[[Lifeform], float],
+        *,
+        margin: float = DEFAULT_PREFETCH_MARGIN,
+    ) -> None:
+        """Fetch the surroundings of every lifeform in one batched pass.
+
+        Each lifeform gets the lifeforms, plants and carcasses within
+        ``radius_for(lifeform) + margin``. With NumPy available the candidates
+        come from one vectorised :meth:`ArraySpatialIndex.query_batch` per
+        entity kind; otherwise they fall back to regular grid queries. The
+        ``nearby_*`` helpers then answer every sensing query of the tick from
+        this cache. Entities added after the prefetch are tracked separately
+        and merged into every answer, and the cache is bypassed once querier
+        drift plus the largest neighbour drift exceeds ``margin``.
+
+        Args:
+            lifeforms: Lifeforms that will sense this tick.
+            radius_for: Largest sensing radius a lifeform will ask for.
+            margin: Slack for movement between the prefetch and the query.
+        """
+        self._reset_prefetch()
+        if not lifeforms:
+            return
+
+        xs = [lifeform.x for lifeform in lifeforms]
+        ys = [lifeform.y for lifeform in lifeforms]
+        radii = [max(0.0, float(radius_for(lifeform))) + margin for lifeform in lifeforms]
+
+        if NUMPY_AVAILABLE:
+            per_kind = []
+            for buckets, point in (
+                (self._lifeforms, self._lifeform_point),
+                (self._plants, self._plant_point),
+                (self._carcasses, self._carcass_point),
+            ):
+                members = [entity for bucket in buckets.values() for entity in bucket]
+                index = ArraySpatialIndex(members, point, self.cell_size)
+                per_kind.append(index.query_batch_entities(xs, ys, radii))
+            near_lifeforms, near_plants, near_carcasses = per_kind
+        else:
+            near_lifeforms = [self.query_lifeforms(x, y, r) for x, y, r in zip(xs, ys, radii)]
+            near_plants = [self.query_plants(x, y, r) for x, y, r in zip(xs, ys, radii)]
+            near_carcasses = [self.query_carcasses(x, y, r) for x, y, r in zip(xs, ys, radii)]
+
+        prefetched = self._prefetched
+        for idx, lifeform in enumerate(lifeforms):
+            prefetched[id(lifeform)] = _Neighborhood(
+                lifeform,
+                xs[idx],
+                ys[idx],
+                radii[idx],
+                near_lifeforms[idx],
+                near_plants[idx],
+                near_carcasses[idx],
+            )
+
+    def _reset_prefetch(self) -> None:
+        self._prefetched = {}
+        self._late_lifeforms = {}
+        self._late_plants = {}
+        self._late_carcasses = {}
+        self._prefetch_drift = 0.0
+
+    def _track_drift(self, lifeform: Lifeform) -> None:
+        entry = self._prefetched.get(id(lifeform))
+        if entry is None or entry.owner is not lifeform:
+            self._late_lifeforms[id(lifeform)] = lifeform
+            return
+        drift = math.hypot(lifeform.x - entry.x, lifeform.y - entry.y)
+        if drift > self._prefetch_drift:
+            self._prefetch_drift = drift
+
+    def _neighborhood(self, lifeform: Lifeform, radius: float) -> _Neighborhood | None:
+        entry = self._prefetched.get(id(lifeform))
+        if entry is None or entry.owner is not lifeform:
+            return None
+        # A neighbour now within ``radius`` was at most this far away when
+        # the candidates were fetched.
+        drift = math.hypot(lifeform.x - entry.x, lifeform.y - entry.y)
+        if drift + self._prefetch_drift + radius > entry.radius:
+            return None
+        return entry
+
+    @staticmethod
+    def _filter(
+        candidates: list[Any],
+        late: dict[int, Any],
+        cells: dict[int, tuple[int, int]],
+        point: Callable[[Any], tuple[float, float]],
+        x: float,
+        y: float,
+        radius: float,
+    ) -> list[Any]:
+        radius_sq = radius * radius
+        results = []
+        for entity in candidates:
+            key = id(entity)
+            if key not in cells or key in late:
+                continue  # removed since the prefetch, or re-checked below
+            ex, ey = point(entity)
+            dx = ex - x
+            dy = ey - y
+            if dx * dx + dy * dy <= radius_sq:
+                results.append(entity)
+        for key, entity in late.items():
+            if key not in cells:
+                continue
+            ex, ey = point(entity)
+            dx = ex - x
+            dy = ey - y
+            if dx * dx + dy * dy <= radius_sq:
+                results.append(entity)
+        return results
+
+    def nearby_lifeforms(self, lifeform: Lifeform, radius: float) -> list[Lifeform]:
+        """Lifeforms within ``radius`` of ``lifeform`` (itself included).
+
+        Served from :meth:`prefetch_neighbors` when possible, otherwise
+        equivalent to :meth:`query_lifeforms` at the lifeform's position.
+        """
+        entry = self._neighborhood(lifeform, radius)
+        if entry is None:
+            return self.query_lifeforms(lifeform.x, lifeform.y, radius)
+        return self._filter(
+            entry.lifeforms,
+            self._late_lifeforms,
+            self._lifeform_cells,
+            self._lifeform_point,
+            lifeform.x,
+            lifeform.y,
+            radius,
+        )
+
+    def nearby_plants(self, lifeform: Lifeform, radius: float) -> list[Plant]:
+        """Plants whose centre lies within ``radius`` of ``lifeform``."""
+        entry = self._neighborhood(lifeform, radius)
+        if entry is None:
+            return self.query_plants(lifeform.x, lifeform.y, radius)
+        return self._filter(
+            entry.plants,
+            self._late_plants,
+            self._plant_cells,
+            self._plant_point,
+            lifeform.x,
+            lifeform.y,
+            radius,
+        )
+
+    def nearby_carcasses(self, lifeform: Lifeform, radius: float) -> list[Any]:
+        """Carcasses whose centre lies within ``radius`` of ``lifeform``."""
+        entry = self._neighborhood(lifeform, radius)
+        if entry is None:
+            return self.query_carcasses(lifeform.x, lifeform.y, radius)
+        return self._filter(
+            entry.carcasses,
+            self._late_carcasses,
+            self._carcass_cells,
+            self._carcass_point,
+            lifeform.x,
+            lifeform.y,
+            radius,
+        )
+
 
 def build_spatial_grid(
     lifeforms: Iterable[Lifeform],
     plants: Iterable[Plant],
     carcasses: Iterable[Any] = (),
-    cell_size: float = 200.0
+    cell_size: float = DEFAULT_CELL_SIZE
 ) -> SpatialHashGrid:
     """Build a spatial hash grid from collections of entities.
 
@@ -249,4 +685,4 @@ def build_spatial_grid(
     return grid
 
 
-__all__ = ["SpatialHashGrid", "build_spatial_grid"]
+__all__ = ["DEFAULT_CELL_SIZE", "DEFAULT_PREFETCH_MARGIN", "SpatialHashGrid", "build_spatial_grid"]
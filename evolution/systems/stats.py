@@ -1,14 +1,22 @@
-"""Simulation statistics aggregation helpers."""
+"""Simulation statistics aggregation helpers.
+
+:func:`collect_population_stats` recomputes everything from scratch.  The
+engine instead keeps a :class:`PopulationStats` on the state that is updated
+as lifeforms spawn, grow and die, and only walks the population for the
+attributes that change every tick when it publishes a snapshot.
+"""
 
 from __future__ import annotations
 
-from typing import Dict
+from operator import attrgetter
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
-from ..simulation.state import SimulationState
+if TYPE_CHECKING:  # pragma: no cover - imported for type hints only
+    from ..simulation.state import SimulationState
 
 
 def collect_population_stats(
-    state: SimulationState, formatted_time_passed: str
+    state: "SimulationState", formatted_time_passed: str
 ) -> Dict[str, object]:
     """Return aggregated statistics for the current lifeform population."""
 
@@ -41,6 +49,7 @@ def collect_population_stats(
         "average_body_density": 0.0,
         "average_body_power_output": 0.0,
         "average_body_grip_strength": 0.0,
+        "death_count": len(death_ages),
         "death_age_avg": sum(death_ages) / len(death_ages) if death_ages else 0.0,
         "dna_count": {},
         "dna_attribute_averages": {},
@@ -173,3 +182,278 @@ def _normalize_dna_id(dna_id: object) -> object:
         return int(dna_id)  # type: ignore[arg-type]
     except (TypeError, ValueError):
         return str(dna_id)
+
+
+# ----------------------------------------------------------------------
+# Incremental aggregation
+# ----------------------------------------------------------------------
+Getter = Callable[[object], float]
+
+# Attributes that only change when a body is (re)derived: kept as running
+# sums, updated on spawn, growth and death.
+_BODY_TOTALS: Tuple[Tuple[str, Getter], ...] = (
+    ("average_vision", lambda lf: lf.vision),
+    ("average_gen", lambda lf: lf.generation),
+    ("average_mass", lambda lf: getattr(lf, "mass", 1.0)),
+    ("average_reach", lambda lf: getattr(lf, "reach", 4.0)),
+    ("average_maintenance_cost", lambda lf: getattr(lf, "maintenance_cost", 0.0)),
+    ("average_perception_rays", lambda lf: getattr(lf, "perception_rays", 0.0)),
+    ("average_hearing_range", lambda lf: getattr(lf, "hearing_range", 0.0)),
+    ("average_module_count", lambda lf: float(getattr(lf, "body_module_count", 0.0))),
+    ("average_max_thrust", lambda lf: float(getattr(lf, "max_thrust", 0.0))),
+    (
+        "average_body_mass",
+        lambda lf: float(getattr(lf, "body_mass", getattr(lf, "mass", 0.0))),
+    ),
+    (
+        "average_body_energy_cost",
+        lambda lf: float(getattr(lf, "body_energy_cost", getattr(lf, "maintenance_cost", 0.0))),
+    ),
+    ("average_body_volume", lambda lf: float(getattr(lf, "body_volume", 0.0))),
+    ("average_body_power_output", lambda lf: float(getattr(lf, "body_power_output", 0.0))),
+    ("average_body_grip_strength", lambda lf: float(getattr(lf, "body_grip_strength", 0.0))),
+)
+_BODY_DNA_ATTRIBUTES: Tuple[str, ...] = (
+    "health",
+    "vision",
+    "longevity",
+    "energy",
+    "mass",
+    "reach",
+    "perception_rays",
+    "maintenance_cost",
+    "hearing_range",
+)
+
+# Attributes that move every tick: summed when a snapshot is taken.
+_TICK_TOTALS: Tuple[str, ...] = (
+    "average_health",
+    "average_hunger",
+    "average_size",
+    "average_age",
+    "average_maturity",
+    "average_speed",
+    "average_cooldown",
+)
+_tick_values = attrgetter("health_now", "hunger", "size", "age", "maturity", "speed", "reproduced_cooldown")
+_TICK_DNA_ATTRIBUTES: Tuple[str, ...] = (
+    "attack_power_now",
+    "defence_power_now",
+    "speed",
+    "maturity",
+    "size",
+)
+_tick_dna_values = attrgetter(*_TICK_DNA_ATTRIBUTES)
+
+# Key order of collect_population_stats, so both produce identical dicts
+_DNA_ATTRIBUTE_ORDER: Tuple[str, ...] = (
+    "health",
+    "vision",
+    "attack_power_now",
+    "defence_power_now",
+    "speed",
+    "maturity",
+    "size",
+    "longevity",
+    "energy",
+    "mass",
+    "reach",
+    "perception_rays",
+    "maintenance_cost",
+    "hearing_range",
+)
+
+
+class PopulationStats:
+    """Running population aggregates maintained as lifeforms come and go.
+
+    Body-derived attributes are added on :meth:`add`, re-counted on
+    :meth:`refresh` (after growth re-derives a body) and subtracted on
+    :meth:`remove` using the exact contribution recorded for that lifeform,
+    so sums never drift.  Deaths keep a running count and age total, which
+    makes the average death age O(1).
+
+    :meth:`snapshot` walks the population once for the per-tick attributes
+    (health, hunger, age, speed, ...) and heals itself if lifeforms were
+    added to or removed from the population without going through the hooks.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[int, Tuple[object, Tuple[float, ...], Tuple[float, ...]]] = {}
+        self._totals: List[float] = [0.0] * len(_BODY_TOTALS)
+        # dna_id -> [count, *body attribute sums]
+        self._dna: Dict[object, List[float]] = {}
+        self.death_count = 0
+        self.death_age_total = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Membership
+    # ------------------------------------------------------------------
+    def add(self, lifeform) -> None:
+        """Start counting ``lifeform`` (no-op when it is already tracked)."""
+
+        key = id(lifeform)
+        if key in self._entries:
+            return
+        values = tuple(getter(lifeform) for _, getter in _BODY_TOTALS)
+        dna_values = tuple(getattr(lifeform, name) for name in _BODY_DNA_ATTRIBUTES)
+        dna_id = lifeform.dna_id
+        self._entries[key] = (dna_id, values, dna_values)
+        totals = self._totals
+        for index, value in enumerate(values):
+            totals[index] += value
+        bucket = self._dna.get(dna_id)
+        if bucket is None:
+            bucket = self._dna[dna_id] = [0.0] * (len(_BODY_DNA_ATTRIBUTES) + 1)
+        bucket[0] += 1.0
+        for index, value in enumerate(dna_values, start=1):
+            bucket[index] += value
+
+    def remove(self, lifeform) -> None:
+        """Stop counting ``lifeform`` (no-op when it is not tracked)."""
+
+        entry = self._entries.pop(id(lifeform), None)
+        if entry is None:
+            return
+        dna_id, values, dna_values = entry
+        totals = self._totals
+        for index, value in enumerate(values):
+            totals[index] -= value
+        bucket = self._dna[dna_id]
+        bucket[0] -= 1.0
+        if bucket[0] <= 0.0:
+            del self._dna[dna_id]
+            return
+        for index, value in enumerate(dna_values, start=1):
+            bucket[index] -= value
+
+    def refresh(self, lifeform) -> None:
+        """Re-count a tracked lifeform whose body stats were re-derived."""
+
+        if id(lifeform) in self._entries:
+            self.remove(lifeform)
+            self.add(lifeform)
+
+    def record_death(self, age: float) -> None:
+        self.death_count += 1
+        self.death_age_total += age
+
+    def rebuild(self, lifeforms: Iterable[object], death_ages: Sequence[float] = ()) -> None:
+        """Recount everything from scratch."""
+
+        self.reset()
+        for lifeform in lifeforms:
+            self.add(lifeform)
+        self.death_count = len(death_ages)
+        self.death_age_total = float(sum(death_ages))
+
+    def reset(self) -> None:
+        self._entries.clear()
+        self._totals = [0.0] * len(_BODY_TOTALS)
+        self._dna.clear()
+        self.death_count = 0
+        self.death_age_total = 0.0
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+    def snapshot(
+        self,
+        lifeforms: Sequence[object],
+        formatted_time_passed: str,
+        death_ages: Optional[Sequence[float]] = None,
+    ) -> Dict[str, object]:
+        """Return the same dictionary as :func:`collect_population_stats`."""
+
+        if death_ages is not None and len(death_ages) != self.death_count:
+            self.death_count = len(death_ages)
+            self.death_age_total = float(sum(death_ages))
+
+        entries = self._entries
+        tick_totals = [0.0] * len(_TICK_TOTALS)
+        drag_total = 0.0
+        density_total = 0.0
+        tick_dna: Dict[object, List[float]] = {}
+        dna_width = len(_TICK_DNA_ATTRIBUTES)
+        for lifeform in lifeforms:
+            if id(lifeform) not in entries:
+                self.add(lifeform)
+            for index, value in enumerate(_tick_values(lifeform)):
+                tick_totals[index] += value
+            drag_total += float(getattr(lifeform, "drag_coefficient", 0.0))
+            density_total += float(getattr(lifeform, "body_density", 0.0))
+            bucket = tick_dna.get(lifeform.dna_id)
+            if bucket is None:
+                bucket = tick_dna[lifeform.dna_id] = [0.0] * dna_width
+            for index, value in enumerate(_tick_dna_values(lifeform)):
+                bucket[index] += value
+        if len(entries) != len(lifeforms):
+            # Lifeforms left the population without remove(): recount
+            self.rebuild(lifeforms, death_ages if death_ages is not None else ())
+
+        count = len(lifeforms)
+        stats: Dict[str, object] = {
+            "lifeform_count": count,
+            "formatted_time": formatted_time_passed,
+        }
+        averages: Dict[str, float] = {}
+        for key, total in zip(_TICK_TOTALS, tick_totals):
+            averages[key] = total / count if count else 0.0
+        averages["average_drag"] = drag_total / count if count else 0.0
+        averages["average_body_density"] = density_total / count if count else 0.0
+        for (key, _), total in zip(_BODY_TOTALS, self._totals):
+            averages[key] = total / count if count else 0.0
+        for key in _AVERAGE_KEYS:
+            stats[key] = averages[key]
+        stats["death_count"] = self.death_count
+        stats["death_age_avg"] = (
+            self.death_age_total / self.death_count if self.death_count else 0.0
+        )
+
+        dna_count: Dict[object, int] = {}
+        dna_averages: Dict[object, Dict[str, float]] = {}
+        for dna_id, tick_values in tick_dna.items():
+            bucket = self._dna[dna_id]
+            members = bucket[0]
+            values = dict(zip(_TICK_DNA_ATTRIBUTES, tick_values))
+            values.update(zip(_BODY_DNA_ATTRIBUTES, bucket[1:]))
+            normalized = _normalize_dna_id(dna_id)
+            dna_count[normalized] = int(members)
+            dna_averages[normalized] = {name: values[name] / members for name in _DNA_ATTRIBUTE_ORDER}
+        stats["dna_count"] = dna_count
+        stats["dna_attribute_averages"] = dna_averages
+        return stats
+
+
+# Key order of collect_population_stats
+_AVERAGE_KEYS: Tuple[str, ...] = (
+    "average_health",
+    "average_vision",
+    "average_gen",
+    "average_hunger",
+    "average_size",
+    "average_age",
+    "average_maturity",
+    "average_speed",
+    "average_cooldown",
+    "average_mass",
+    "average_body_mass",
+    "average_reach",
+    "average_maintenance_cost",
+    "average_perception_rays",
+    "average_hearing_range",
+    "average_module_count",
+    "average_drag",
+    "average_max_thrust",
+    "average_body_energy_cost",
+    "average_body_volume",
+    "average_body_density",
+    "average_body_power_output",
+    "average_body_grip_strength",
+)
+
+
+__all__ = ["PopulationStats", "collect_population_stats"]
@@ -1,18 +1,30 @@
-"""Runtime telemetry helpers for movement/combat diagnostics."""
+"""Runtime telemetry helpers for movement/combat diagnostics.
+
+Samples are written off the simulation thread in the columnar format of
+:mod:`telemetry_format`; ``tools/telemetry_export.py`` converts a file
+back to JSON lines.
+"""
 
 from __future__ import annotations
 
-import json
-import os
+import atexit
+import logging
 import threading
 import time
-from dataclasses import dataclass, asdict
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Deque, Optional
 
 from pygame.math import Vector2
 
 from ..config import settings
+from . import telemetry_format
+
+logger = logging.getLogger("evolution.telemetry")
+
+# Raised by telemetry_format.encode_chunk for rows that do not fit their columns
+_ENCODE_ERRORS = (TypeError, ValueError, OverflowError, IndexError)
 
 
 @dataclass(slots=True)
@@ -83,40 +95,166 @@ class ReproductionSample:
     offspring_color: tuple[int, int, int]
 
 
-class TelemetrySink:
-    """Buffered JSONL telemetry writer with background flushing."""
+_SAMPLE_TYPES = {
+    "movement": MovementSample,
+    "combat": CombatSample,
+    "events": EventSample,
+    "reproduction": ReproductionSample,
+}
 
-    def __init__(self, kind: str, *, directory: Optional[Path] = None, flush_interval: int = 32) -> None:
+# Rows buffered before the writer thread emits a chunk
+DEFAULT_CHUNK_ROWS = 2048
+# Rows allowed in the queue before new samples are dropped
+DEFAULT_QUEUE_LIMIT = 65536
+# Seconds between writer wake-ups when the queue fills slowly
+DEFAULT_WRITE_INTERVAL = 1.0
+
+
+class TelemetrySink:
+    """Columnar telemetry writer fed through a bounded queue.
+
+    The simulation thread only appends pre-packed row tuples (in the column
+    order of the sample dataclass) to a :class:`collections.deque`, whose
+    ``append``/``popleft`` are atomic, so no lock is taken per sample. A
+    daemon thread drains the queue and writes chunks in the format from
+    :mod:`telemetry_format`. When the writer falls ``queue_limit`` rows
+    behind, new samples are dropped and counted in :attr:`dropped`; rows
+    that cannot be encoded (``None`` in a numeric column, non-JSON details)
+    are logged, discarded and counted there as well.
+
+    Args:
+        kind: ``movement``, ``combat``, ``events`` or ``reproduction``.
+        directory: Output directory; defaults to ``LOG_DIRECTORY/telemetry``.
+        chunk_rows: Rows per written chunk.
+        queue_limit: Maximum number of queued rows.
+        compress: zlib-compress every chunk.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        *,
+        directory: Optional[Path] = None,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        queue_limit: int = DEFAULT_QUEUE_LIMIT,
+        compress: bool = True,
+    ) -> None:
         base = directory or Path(settings.LOG_DIRECTORY) / "telemetry"
         base.mkdir(parents=True, exist_ok=True)
         # Use timestamp in filename to avoid overwriting
         timestamp = int(time.time())
-        self.path = base / f"{kind}_{timestamp}.jsonl"
-        self._buffer: list[dict] = []
-        self._lock = threading.Lock()
-        self._flush_interval = max(1, flush_interval)
-        self._counter = 0
-
-    def write(self, payload: MovementSample | CombatSample | EventSample | ReproductionSample) -> None:
-        with self._lock:
-            self._buffer.append(asdict(payload))
-            self._counter += 1
-            if self._counter >= self._flush_interval:
-                self._flush_locked()
+        self.kind = kind
+        self.path = base / f"{kind}_{timestamp}.tcol"
+        self.sample_type = _SAMPLE_TYPES[kind]
+        self.columns = telemetry_format.columns_for(self.sample_type)
+        self._field_names = tuple(name for name, _ in self.columns)
+        self._chunk_rows = max(1, chunk_rows)
+        self._queue_limit = max(self._chunk_rows, queue_limit)
+        self._compress = compress
+        self._queue: Deque[tuple] = deque()
+        self._pending: list[tuple] = []
+        self._io_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._header_written = False
+        self.dropped = 0
+        self.rows_written = 0
+
+    def write(self, payload: MovementSample | CombatSample | EventSample | ReproductionSample | tuple) -> None:
+        """Queue one sample; tuples must follow the dataclass field order."""
+
+        queue = self._queue
+        if len(queue) >= self._queue_limit or self._closed:
+            self.dropped += 1
+            return
+        if not isinstance(payload, tuple):
+            payload = tuple(getattr(payload, name) for name in self._field_names)
+        queue.append(payload)
+        if self._thread is None:
+            self._start()
+        elif len(queue) == self._chunk_rows:
+            self._wake.set()
 
     def flush(self) -> None:
-        with self._lock:
-            self._flush_locked()
+        """Write everything queued so far, including a partial chunk."""
+
+        self._drain(final=True)
+
+    def close(self) -> None:
+        self._closed = True
+        thread = self._thread
+        if thread is not None:
+            self._wake.set()
+            thread.join(timeout=5.0)
+        self._drain(final=True)
+
+    def _start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name=f"telemetry-{self.kind}", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(DEFAULT_WRITE_INTERVAL)
+            self._wake.clear()
+            try:
+                self._drain(final=False)
+            except OSError:
+                # The failed rows are counted in ``dropped``; keep writing
+                logger.exception("Telemetry writer for %s failed", self.path)
+
+    def _encode(self, rows: list[tuple]) -> tuple[bytes, int]:
+        """Encode one chunk, discarding rows that do not fit the columns."""
 
-    def _flush_locked(self) -> None:
-        if not self._buffer:
-            self._counter = 0
-            return
-        with self.path.open("a", encoding="utf-8") as handle:
-            for row in self._buffer:
-                handle.write(json.dumps(row, ensure_ascii=False) + os.linesep)
-        self._buffer.clear()
-        self._counter = 0
+        try:
+            return telemetry_format.encode_chunk(self.columns, rows, compress=self._compress), len(rows)
+        except _ENCODE_ERRORS:
+            pass
+        good = []
+        for row in rows:
+            try:
+                telemetry_format.encode_chunk(self.columns, (row,), compress=False)
+            except _ENCODE_ERRORS as exc:
+                self.dropped += 1
+                logger.warning("Dropping unencodable %s telemetry row %r: %s", self.kind, row, exc)
+            else:
+                good.append(row)
+        if not good:
+            return b"", 0
+        return telemetry_format.encode_chunk(self.columns, good, compress=self._compress), len(good)
+
+    def _drain(self, *, final: bool) -> None:
+        with self._io_lock:
+            queue = self._queue
+            pending = self._pending
+            while queue:
+                pending.append(queue.popleft())
+            size = self._chunk_rows
+            ready = len(pending) - len(pending) % size if not final else len(pending)
+            if not ready:
+                return
+            chunks = []
+            written = 0
+            for start in range(0, ready, size):
+                blob, count = self._encode(pending[start : min(ready, start + size)])
+                if count:
+                    chunks.append(blob)
+                    written += count
+            del pending[:ready]
+            if not chunks:
+                return
+            try:
+                with self.path.open("ab") as handle:
+                    if not self._header_written:
+                        telemetry_format.write_header(handle, self.kind, self.columns)
+                        self._header_written = True
+                    for blob in chunks:
+                        handle.write(blob)
+            except OSError:
+                self.dropped += written
+                raise
+            self.rows_written += written
 
 
 _movement_sink: Optional[TelemetrySink] = None
@@ -165,37 +303,45 @@ def movement_sample(
         
     _last_movement_log[lid] = tick
 
-    sample = MovementSample(
-        tick=tick,
-        lifeform_id=lid,
-        dna_id=str(getattr(lifeform, "dna_id", "")),
-        position=(lifeform.x, lifeform.y),
-        velocity=(lifeform.velocity.x, lifeform.velocity.y),
-        desired=(desired.x, desired.y),
-        thrust=thrust,
-        effort=effort,
-        hunger=lifeform.hunger,
-        energy=lifeform.energy_now,
-        attack=getattr(lifeform, "attack_power_now", 0.0),
-        defence=getattr(lifeform, "defence_power_now", 0.0),
-        size=getattr(lifeform, "size", 0.0),
-        mass=getattr(lifeform, "mass", 0.0),
-        behavior=mode,
-        has_food_target=bool(lifeform.closest_plant or lifeform.closest_prey),
-        depth=lifeform.y,
-        closest_enemy_id=getattr(getattr(lifeform, "closest_enemy", None), "id", None),
-        closest_prey_id=getattr(getattr(lifeform, "closest_prey", None), "id", None),
-        threat_distance=_entity_distance(lifeform, getattr(lifeform, "closest_enemy", None)),
-        prey_distance=_entity_distance(lifeform, getattr(lifeform, "closest_prey", None)),
-        energy_ratio=lifeform.energy_now / max(1.0, float(getattr(lifeform, "energy", 1.0))),
-        adrenaline=float(getattr(lifeform, "adrenaline_factor", getattr(lifeform, "adrenaline", 0.0))),
-        is_fleeing=bool(getattr(lifeform, "is_fleeing", False)),
-        is_hunting=bool(getattr(lifeform, "is_hunting", False)),
-        move_away=_compute_move_away(lifeform, getattr(lifeform, "closest_enemy", None)),
-        search_pattern=getattr(lifeform, "search_pattern", None),
-        predator_count=int(getattr(lifeform, "nearby_predators_count", 0)),
+    enemy = getattr(lifeform, "closest_enemy", None)
+    prey = getattr(lifeform, "closest_prey", None)
+    center = _entity_center(lifeform)
+    enemy_center = _entity_center(enemy)
+    velocity = lifeform.velocity
+    energy_now = lifeform.energy_now
+    # Packed in MovementSample field order; the writer thread does the rest
+    _movement_sink.write(
+        (
+            tick,
+            lid,
+            str(getattr(lifeform, "dna_id", "")),
+            (lifeform.x, lifeform.y),
+            (velocity.x, velocity.y),
+            (desired.x, desired.y),
+            thrust,
+            effort,
+            lifeform.hunger,
+            energy_now,
+            getattr(lifeform, "attack_power_now", 0.0),
+            getattr(lifeform, "defence_power_now", 0.0),
+            getattr(lifeform, "size", 0.0),
+            getattr(lifeform, "mass", 0.0),
+            mode,
+            bool(lifeform.closest_plant or prey),
+            lifeform.y,
+            getattr(enemy, "id", None),
+            getattr(prey, "id", None),
+            _center_distance(center, enemy_center),
+            _center_distance(center, _entity_center(prey)),
+            energy_now / max(1.0, float(getattr(lifeform, "energy", 1.0))),
+            float(getattr(lifeform, "adrenaline_factor", getattr(lifeform, "adrenaline", 0.0))),
+            bool(getattr(lifeform, "is_fleeing", False)),
+            bool(getattr(lifeform, "is_hunting", False)),
+            _move_away(center, enemy_center),
+            getattr(lifeform, "search_pattern", None),
+            int(getattr(lifeform, "nearby_predators_count", 0)),
+        )
     )
-    _movement_sink.write(sample)
 
 
 def combat_sample(
@@ -305,19 +451,19 @@ def _entity_center(entity) -> Optional[tuple[float, float]]:
     return float(x), float(y)
 
 
-def _entity_distance(source, target) -> Optional[float]:
-    source_center = _entity_center(source)
-    target_center = _entity_center(target)
-    if source_center is None or target_center is None:
+def _center_distance(
+    source: Optional[tuple[float, float]], target: Optional[tuple[float, float]]
+) -> Optional[float]:
+    if source is None or target is None:
         return None
-    dx = target_center[0] - source_center[0]
-    dy = target_center[1] - source_center[1]
+    dx = target[0] - source[0]
+    dy = target[1] - source[1]
     return (dx * dx + dy * dy) ** 0.5
 
 
-def _compute_move_away(lifeform, closest_enemy) -> Optional[tuple[float, float]]:
-    self_center = _entity_center(lifeform)
-    enemy_center = _entity_center(closest_enemy)
+def _move_away(
+    self_center: Optional[tuple[float, float]], enemy_center: Optional[tuple[float, float]]
+) -> Optional[tuple[float, float]]:
     if self_center is None or enemy_center is None:
         return None
     dx = self_center[0] - enemy_center[0]
@@ -326,4 +472,3 @@ def _compute_move_away(lifeform, closest_enemy) -> Optional[tuple[float, float]]
     if distance <= 0:
         return 0.0, 0.0
     return dx / distance, dy / distance
-
@@ -0,0 +1,292 @@
+"""Chunked columnar file format for telemetry samples.
+
+A file starts with a magic line and a JSON header naming the sample kind and
+its columns. Rows follow in chunks; every chunk stores each column as one
+contiguous blob (a little-endian typed array for numeric columns, a JSON
+list for strings and free-form values) and is optionally zlib-compressed.
+A small uncompressed index in front of each chunk records its row count and
+tick range, so readers can skip chunks without decompressing them.
+
+Column types:
+
+``q``
+    64-bit integers.
+``d``
+    Doubles; ``d?`` additionally allows ``None`` (stored as NaN).
+``d2``
+    Pairs of doubles such as positions; ``d2?`` allows ``None``.
+``b``
+    Booleans, one byte each.
+``s``
+    Strings (``None`` allowed).
+``json``
+    Anything JSON-serialisable.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import struct
+import sys
+import zlib
+from array import array
+from dataclasses import fields
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - fallback when numpy is missing
+    np = None
+    NUMPY_AVAILABLE = False
+
+MAGIC = b"EVOTEL1\n"
+CHUNK_MAGIC = b"TCHK"
+FLAG_ZLIB = 0x01
+
+Column = Tuple[str, str]
+
+_ANNOTATION_TYPES = {
+    "int": "q",
+    "float": "d",
+    "bool": "b",
+    "str": "s",
+    "Optional[str]": "s",
+    "Optional[float]": "d?",
+    "tuple[float, float]": "d2",
+    "Optional[tuple[float, float]]": "d2?",
+}
+_NAN = float("nan")
+_SWAP = sys.byteorder != "little"
+
+
+def columns_for(sample_type) -> Tuple[Column, ...]:
+    """Derive the column layout from a telemetry sample dataclass."""
+
+    return tuple(
+        (field.name, _ANNOTATION_TYPES.get(str(field.type), "json")) for field in fields(sample_type)
+    )
+
+
+def _typed_bytes(typecode: str, values) -> bytes:
+    packed = array(typecode, values)
+    if _SWAP:
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _typed_values(typecode: str, blob: bytes) -> array:
+    packed = array(typecode)
+    packed.frombytes(blob)
+    if _SWAP:
+        packed.byteswap()
+    return packed
+
+
+_NUMPY_DTYPES = {"q": "<i8", "d": "<f8", "d?": "<f8", "d2": "<f8", "d2?": "<f8"}
+
+
+def _decode_array(kind: str, blob: bytes):
+    """Decode a numeric column straight into a NumPy array (no copy)."""
+
+    if kind == "b":
+        return np.frombuffer(blob, dtype=np.uint8).astype(bool)
+    values = np.frombuffer(blob, dtype=_NUMPY_DTYPES[kind])
+    if kind in ("d2", "d2?"):
+        return values.reshape(-1, 2)
+    return values
+
+
+def _encode_column(kind: str, values: Sequence[object]) -> bytes:
+    if kind == "q":
+        return _typed_bytes("q", values)
+    if kind == "d":
+        return _typed_bytes("d", values)
+    if kind == "d?":
+        return _typed_bytes("d", [_NAN if value is None else value for value in values])
+    if kind in ("d2", "d2?"):
+        flat: List[float] = []
+        for value in values:
+            if value is None:
+                flat.extend((_NAN, _NAN))
+            else:
+                flat.extend((value[0], value[1]))
+        return _typed_bytes("d", flat)
+    if kind == "b":
+        return bytes(1 if value else 0 for value in values)
+    return json.dumps(list(values), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _decode_column(kind: str, blob: bytes) -> List[object]:
+    if kind == "q":
+        return list(_typed_values("q", blob))
+    if kind == "d":
+        return list(_typed_values("d", blob))
+    if kind == "d?":
+        return [None if math.isnan(value) else value for value in _typed_values("d", blob)]
+    if kind in ("d2", "d2?"):
+        flat = _typed_values("d", blob)
+        pairs = [(flat[index], flat[index + 1]) for index in range(0, len(flat), 2)]
+        if kind == "d2?":
+            return [None if math.isnan(pair[0]) else pair for pair in pairs]
+        return pairs
+    if kind == "b":
+        return [bool(value) for value in blob]
+    return json.loads(blob.decode("utf-8"))
+
+
+def to_column(kind: str, values: Sequence[object], *, arrays: bool = False):
+    """Convert plain row values to what :func:`iter_chunks` yields for ``kind``."""
+
+    blob = _encode_column(kind, values)
+    if arrays and NUMPY_AVAILABLE and (kind in _NUMPY_DTYPES or kind == "b"):
+        return _decode_array(kind, blob)
+    return _decode_column(kind, blob)
+
+
+def write_header(handle: BinaryIO, kind: str, columns: Sequence[Column]) -> None:
+    header = json.dumps({"kind": kind, "columns": [list(column) for column in columns]}).encode("utf-8")
+    handle.write(MAGIC)
+    handle.write(struct.pack("<I", len(header)))
+    handle.write(header)
+
+
+def write_chunk(
+    handle: BinaryIO, columns: Sequence[Column], rows: Sequence[Sequence[object]], *, compress: bool = True
+) -> None:
+    """Append ``rows`` (tuples in column order) as one chunk."""
+
+    handle.write(encode_chunk(columns, rows, compress=compress))
+
+
+def encode_chunk(
+    columns: Sequence[Column], rows: Sequence[Sequence[object]], *, compress: bool = True
+) -> bytes:
+    """Encode ``rows`` as one chunk without writing anything.
+
+    Raises ``TypeError``, ``ValueError``, ``OverflowError`` or ``IndexError``
+    when a row does not fit its columns.
+    """
+
+    blobs = [
+        _encode_column(kind, [row[index] for row in rows]) for index, (_, kind) in enumerate(columns)
+    ]
+    index: Dict[str, object] = {"rows": len(rows), "sizes": [len(blob) for blob in blobs]}
+    for position, (name, _) in enumerate(columns):
+        if name == "tick" and rows:
+            ticks = [row[position] for row in rows]
+            index["ticks"] = [min(ticks), max(ticks)]
+    meta = json.dumps(index).encode("utf-8")
+    payload = b"".join(blobs)
+    flags = 0
+    if compress:
+        payload = zlib.compress(payload, 1)
+        flags |= FLAG_ZLIB
+    return CHUNK_MAGIC + struct.pack("<BII", flags, len(meta), len(payload)) + meta + payload
+
+
+def read_header(handle: BinaryIO) -> Tuple[str, Tuple[Column, ...]]:
+    if handle.read(len(MAGIC)) != MAGIC:
+        raise ValueError("not a columnar telemetry file")
+    (size,) = struct.unpack("<I", handle.read(4))
+    header = json.loads(handle.read(size).decode("utf-8"))
+    return header["kind"], tuple((name, kind) for name, kind in header["columns"])
+
+
+_CHUNK_PREFIX = struct.calcsize("<BII")
+
+
+def iter_chunks(
+    path: Path | str,
+    names: Optional[Sequence[str]] = None,
+    *,
+    ticks: Optional[Tuple[Optional[int], Optional[int]]] = None,
+    arrays: bool = False,
+) -> Iterator[Dict[str, object]]:
+    """Yield every chunk of ``path`` as ``{column: values}``.
+
+    Args:
+        path: Columnar telemetry file.
+        names: Only decode these columns.
+        ticks: Inclusive ``(low, high)`` tick range; chunks entirely outside
+            it are skipped unread. Rows are not filtered individually.
+        arrays: Return numeric columns as NumPy arrays when NumPy is
+            installed (lists otherwise).
+    """
+
+    low, high = ticks if ticks is not None else (None, None)
+    use_arrays = arrays and NUMPY_AVAILABLE
+    with open(path, "rb") as handle:
+        _, columns = read_header(handle)
+        wanted = set(names) if names is not None else None
+        while True:
+            prefix = handle.read(len(CHUNK_MAGIC) + _CHUNK_PREFIX)
+            if len(prefix) < len(CHUNK_MAGIC) + _CHUNK_PREFIX:
+                return
+            if prefix[: len(CHUNK_MAGIC)] != CHUNK_MAGIC:
+                raise ValueError("corrupt telemetry chunk")
+            flags, meta_size, size = struct.unpack("<BII", prefix[len(CHUNK_MAGIC) :])
+            meta = json.loads(handle.read(meta_size).decode("utf-8"))
+            chunk_ticks = meta.get("ticks")
+            if chunk_ticks is not None and (
+                (low is not None and chunk_ticks[1] < low) or (high is not None and chunk_ticks[0] > high)
+            ):
+                handle.seek(size, 1)
+                continue
+            payload = handle.read(size)
+            if len(payload) < size:
+                # Truncated final chunk from an interrupted run
+                return
+            if flags & FLAG_ZLIB:
+                payload = zlib.decompress(payload)
+            offset = 0
+            chunk: Dict[str, object] = {}
+            for (name, kind), blob_size in zip(columns, meta["sizes"]):
+                if wanted is None or name in wanted:
+                    blob = payload[offset : offset + blob_size]
+                    if use_arrays and (kind in _NUMPY_DTYPES or kind == "b"):
+                        chunk[name] = _decode_array(kind, blob)
+                    else:
+                        chunk[name] = _decode_column(kind, blob)
+                offset += blob_size
+            yield chunk
+
+
+def iter_rows(path: Path | str) -> Iterator[Dict[str, object]]:
+    """Yield the rows of ``path`` as dictionaries, in write order."""
+
+    with open(path, "rb") as handle:
+        _, columns = read_header(handle)
+    names = [name for name, _ in columns]
+    for chunk in iter_chunks(path):
+        for values in zip(*(chunk[name] for name in names)):
+            yield dict(zip(names, values))
+
+
+def export_jsonl(source: Path | str, target: Path | str) -> int:
+    """Convert a columnar file to JSON lines; returns the number of rows."""
+
+    count = 0
+    with open(target, "w", encoding="utf-8") as handle:
+        for row in iter_rows(source):
+            handle.write(json.dumps(row, ensure_ascii=False) + "\n")
+            count += 1
+    return count
+
+
+__all__ = [
+    "NUMPY_AVAILABLE",
+    "Column",
+    "columns_for",
+    "encode_chunk",
+    "export_jsonl",
+    "iter_chunks",
+    "iter_rows",
+    "read_header",
+    "to_column",
+    "write_chunk",
+    "write_header",
+]
@@ -0,0 +1,367 @@
+"""Streaming queries and reports over telemetry files.
+
+Files are read one chunk at a time, so memory stays bounded by the chunk
+size rather than the length of the run. Columnar files (``*.tcol``) only
+decode the columns a query asks for and skip whole chunks outside the tick
+range; legacy JSON lines files (``*.jsonl``) are parsed line by line and
+grouped into chunks of the same shape. With NumPy installed, numeric
+columns arrive as arrays and the aggregates are computed per chunk with
+vector operations.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from . import telemetry_format
+from .telemetry_format import NUMPY_AVAILABLE, Column, np
+
+TELEMETRY_DIR = Path("logs/telemetry")
+# Rows per chunk when reading JSON lines
+DEFAULT_CHUNK_ROWS = 8192
+TickRange = Tuple[Optional[int], Optional[int]]
+
+
+def latest_file(kind: str, directory: Path = TELEMETRY_DIR) -> Path:
+    """Newest ``{kind}_*.tcol`` or ``{kind}_*.jsonl`` file in ``directory``."""
+
+    candidates = list(directory.glob(f"{kind}_*.tcol")) + list(directory.glob(f"{kind}_*.jsonl"))
+    if not candidates:
+        raise FileNotFoundError(f"No {kind} telemetry files found under {directory}")
+    return max(candidates, key=lambda path: (path.stem, path.suffix == ".tcol"))
+
+
+def parse_tick_range(text: Optional[str]) -> Optional[TickRange]:
+    """Parse ``LOW:HIGH`` (either side may be empty) into a tick range."""
+
+    if not text:
+        return None
+    low, _, high = text.partition(":")
+    return (int(low) if low else None, int(high) if high else None)
+
+
+def _jsonl_columns(path: Path) -> Tuple[Column, ...]:
+    from .telemetry import _SAMPLE_TYPES
+
+    kind = path.stem.split("_", 1)[0]
+    if kind not in _SAMPLE_TYPES:
+        raise ValueError(f"cannot tell the sample kind of {path.name}")
+    return telemetry_format.columns_for(_SAMPLE_TYPES[kind])
+
+
+class TelemetryQuery:
+    """Filtered, column-projected scan of one telemetry file.
+
+    Args:
+        path: ``.tcol`` or ``.jsonl`` telemetry file.
+        ticks: Inclusive ``(low, high)`` tick range; either end may be ``None``.
+        where: Column equality filters, e.g. ``{"behavior": {"flee", "hunt"}}``
+            or ``{"dna_id": "7"}``.
+        chunk_rows: Rows per chunk when reading JSON lines.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        *,
+        ticks: Optional[TickRange] = None,
+        where: Optional[Mapping[str, object]] = None,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    ) -> None:
+        self.path = Path(path)
+        self.ticks = ticks
+        self.where: Dict[str, frozenset] = {}
+        for name, allowed in (where or {}).items():
+            if isinstance(allowed, (set, frozenset, list, tuple)):
+                self.where[name] = frozenset(allowed)
+            else:
+                self.where[name] = frozenset((allowed,))
+        self.chunk_rows = max(1, chunk_rows)
+        if self.path.suffix == ".jsonl":
+            self.columns = _jsonl_columns(self.path)
+        else:
+            with self.path.open("rb") as handle:
+                _, self.columns = telemetry_format.read_header(handle)
+
+    # ------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------
+    def chunks(self, names: Sequence[str]) -> Iterator[Dict[str, object]]:
+        """Yield chunks holding the filtered rows of the ``names`` columns."""
+
+        needed = list(dict.fromkeys([*names, *self.where, *(["tick"] if self.ticks else [])]))
+        for chunk in self._raw_chunks(needed):
+            mask = self._mask(chunk)
+            if mask is None:
+                yield {name: chunk[name] for name in names}
+            elif _any(mask):
+                yield {name: _select(chunk[name], mask) for name in names}
+
+    def count(self) -> int:
+        return sum(len(chunk["tick"]) for chunk in self.chunks(["tick"]))
+
+    def _raw_chunks(self, names: Sequence[str]) -> Iterator[Dict[str, object]]:
+        if self.path.suffix != ".jsonl":
+            yield from telemetry_format.iter_chunks(self.path, names, ticks=self.ticks, arrays=True)
+            return
+        kinds = dict(self.columns)
+        rows: List[dict] = []
+        with self.path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    rows.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+                if len(rows) >= self.chunk_rows:
+                    yield self._columnise(rows, names, kinds)
+                    rows = []
+        if rows:
+            yield self._columnise(rows, names, kinds)
+
+    @staticmethod
+    def _columnise(rows: List[dict], names: Sequence[str], kinds: Mapping[str, str]) -> Dict[str, object]:
+        # Round-trip through the column codec so JSON lines and columnar
+        # files produce identical chunk values
+        chunk: Dict[str, object] = {}
+        for name in names:
+            kind = kinds.get(name, "json")
+            values = [row.get(name) for row in rows]
+            if kind in ("q", "d", "b"):
+                values = [0 if value is None else value for value in values]
+            chunk[name] = telemetry_format.to_column(kind, values, arrays=True)
+        return chunk
+
+    def _mask(self, chunk: Mapping[str, object]):
+        if not self.where and not self.ticks:
+            return None
+        size = len(next(iter(chunk.values())))
+        if NUMPY_AVAILABLE:
+            mask = np.ones(size, dtype=bool)
+            if self.ticks:
+                ticks = np.asarray(chunk["tick"])
+                low, high = self.ticks
+                if low is not None:
+                    mask &= ticks >= low
+                if high is not None:
+                    mask &= ticks <= high
+            for name, allowed in self.where.items():
+                mask &= np.fromiter((value in allowed for value in chunk[name]), dtype=bool, count=size)
+            return mask
+        mask = [True] * size
+        if self.ticks:
+            low, high = self.ticks
+            for index, tick in enumerate(chunk["tick"]):
+                if (low is not None and tick < low) or (high is not None and tick > high):
+                    mask[index] = False
+        for name, allowed in self.where.items():
+            for index, value in enumerate(chunk[name]):
+                if value not in allowed:
+                    mask[index] = False
+        return mask
+
+
+def _any(mask) -> bool:
+    return bool(mask.any()) if NUMPY_AVAILABLE and hasattr(mask, "any") else any(mask)
+
+
+def _select(values, mask):
+    if NUMPY_AVAILABLE and hasattr(values, "dtype"):
+        return values[mask]
+    return [value for value, keep in zip(values, mask) if keep]
+
+
+# ----------------------------------------------------------------------
+# Reports
+# ----------------------------------------------------------------------
+@dataclass
+class RunningSummary:
+    """Count, mean and range of a stream of numbers."""
+
+    count: int = 0
+    total: float = 0.0
+    minimum: float = float("inf")
+    maximum: float = float("-inf")
+
+    def add_many(self, values: Iterable[float]) -> None:
+        if NUMPY_AVAILABLE and hasattr(values, "dtype"):
+            values = values[~np.isnan(values)]
+            if values.size:
+                self.count += int(values.size)
+                self.total += float(values.sum())
+                self.minimum = min(self.minimum, float(values.min()))
+                self.maximum = max(self.maximum, float(values.max()))
+            return
+        for value in values:
+            if value is None:
+                continue
+            self.count += 1
+            self.total += value
+            self.minimum = min(self.minimum, value)
+            self.maximum = max(self.maximum, value)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+@dataclass
+class EventReport:
+    total: int = 0
+    first_tick: Optional[int] = None
+    last_tick: Optional[int] = None
+    categories: Counter = field(default_factory=Counter)
+    threats: Counter = field(default_factory=Counter)
+    threat_distance: RunningSummary = field(default_factory=RunningSummary)
+    prey: Counter = field(default_factory=Counter)
+    prey_distance: RunningSummary = field(default_factory=RunningSummary)
+    activities: Counter = field(default_factory=Counter)
+    carcass_transitions: Counter = field(default_factory=Counter)
+
+
+def event_report(query: TelemetryQuery) -> EventReport:
+    """Aggregate an ``events`` file into the classic analysis report."""
+
+    report = EventReport()
+    for chunk in query.chunks(["tick", "category", "entity_id", "event_type", "details"]):
+        ticks = chunk["tick"]
+        if not len(ticks):
+            continue
+        if report.first_tick is None:
+            report.first_tick = int(ticks[0])
+        report.last_tick = int(ticks[-1])
+        report.total += len(ticks)
+        report.categories.update(chunk["category"])
+        threat_distances: List[float] = []
+        prey_distances: List[float] = []
+        for category, entity_id, event_type, details in zip(
+            chunk["category"], chunk["entity_id"], chunk["event_type"], chunk["details"]
+        ):
+            details = details or {}
+            if category == "AI":
+                if event_type == "THREAT_DETECTED":
+                    report.threats[entity_id] += 1
+                    if "dist" in details:
+                        threat_distances.append(details["dist"])
+                elif event_type == "PREY_ACQUIRED":
+                    report.prey[entity_id] += 1
+                    if "dist" in details:
+                        prey_distances.append(details["dist"])
+            elif category == "BEHAVIOR":
+                report.activities[details.get("name")] += 1
+            elif category == "CARCASS":
+                report.carcass_transitions[(details.get("from"), details.get("to"))] += 1
+        report.threat_distance.add_many(threat_distances)
+        report.prey_distance.add_many(prey_distances)
+    return report
+
+
+@dataclass
+class BehaviorStats:
+    count: int = 0
+    speed: float = 0.0
+    effort: float = 0.0
+    high_effort: int = 0
+    thrust: float = 0.0
+    energy_ratio: float = 0.0
+    food_target: int = 0
+    empty_search: int = 0
+    threat_distance: RunningSummary = field(default_factory=RunningSummary)
+    prey_distance: RunningSummary = field(default_factory=RunningSummary)
+
+
+_BEHAVIOR_COLUMNS = (
+    "behavior",
+    "velocity",
+    "effort",
+    "thrust",
+    "energy_ratio",
+    "has_food_target",
+    "threat_distance",
+    "prey_distance",
+)
+
+
+def behavior_report(query: TelemetryQuery) -> Dict[str, BehaviorStats]:
+    """Per-behaviour movement aggregates from a ``movement`` file."""
+
+    report: Dict[str, BehaviorStats] = {}
+    for chunk in query.chunks(_BEHAVIOR_COLUMNS):
+        behaviors = [str(value or "unknown").lower() for value in chunk["behavior"]]
+        if NUMPY_AVAILABLE and hasattr(chunk["effort"], "dtype"):
+            _accumulate_vectorised(report, behaviors, chunk)
+        else:
+            _accumulate_rows(report, behaviors, chunk)
+    return report
+
+
+def _accumulate_vectorised(report: Dict[str, BehaviorStats], behaviors: List[str], chunk) -> None:
+    labels = np.asarray(behaviors, dtype=object)
+    velocity = chunk["velocity"]
+    speed = np.hypot(velocity[:, 0], velocity[:, 1])
+    effort = chunk["effort"]
+    food = chunk["has_food_target"]
+    for behavior in set(behaviors):
+        mask = labels == behavior
+        stats = report.setdefault(behavior, BehaviorStats())
+        stats.count += int(mask.sum())
+        stats.speed += float(speed[mask].sum())
+        stats.effort += float(effort[mask].sum())
+        stats.high_effort += int((effort[mask] > 1.0).sum())
+        stats.thrust += float(chunk["thrust"][mask].sum())
+        stats.energy_ratio += float(chunk["energy_ratio"][mask].sum())
+        stats.food_target += int(food[mask].sum())
+        if behavior == "flee":
+            stats.threat_distance.add_many(chunk["threat_distance"][mask])
+        elif behavior == "hunt":
+            stats.prey_distance.add_many(chunk["prey_distance"][mask])
+        elif behavior == "search":
+            stats.empty_search += int((~food[mask]).sum())
+
+
+def _accumulate_rows(report: Dict[str, BehaviorStats], behaviors: List[str], chunk) -> None:
+    rows = zip(
+        behaviors,
+        chunk["velocity"],
+        chunk["effort"],
+        chunk["thrust"],
+        chunk["energy_ratio"],
+        chunk["has_food_target"],
+        chunk["threat_distance"],
+        chunk["prey_distance"],
+    )
+    for behavior, velocity, effort, thrust, energy_ratio, food, threat, prey in rows:
+        stats = report.setdefault(behavior, BehaviorStats())
+        stats.count += 1
+        stats.speed += (velocity[0] ** 2 + velocity[1] ** 2) ** 0.5
+        stats.effort += effort
+        stats.high_effort += effort > 1.0
+        stats.thrust += thrust
+        stats.energy_ratio += energy_ratio
+        stats.food_target += bool(food)
+        if behavior == "flee":
+            stats.threat_distance.add_many((threat,))
+        elif behavior == "hunt":
+            stats.prey_distance.add_many((prey,))
+        elif behavior == "search" and not food:
+            stats.empty_search += 1
+
+
+__all__ = [
+    "BehaviorStats",
+    "DEFAULT_CHUNK_ROWS",
+    "EventReport",
+    "RunningSummary",
+    "TELEMETRY_DIR",
+    "TelemetryQuery",
+    "behavior_report",
+    "event_report",
+    "latest_file",
+    "parse_tick_range",
+]
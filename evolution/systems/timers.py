@@ -0,0 +1,217 @@
+"""Lightweight timing helpers for render and simulation instrumentation."""
+
+from __future__ import annotations
+
+import cProfile
+import heapq
+import io
+import pstats
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Tuple
+
+# Frames kept for the rolling percentiles
+DEFAULT_WINDOW = 300
+
+
+@dataclass
+class _TimerStats:
+    total_ms: float = 0.0
+    count: int = 0
+
+
+@dataclass
+class _Window:
+    samples: Deque[float] = field(default_factory=lambda: deque(maxlen=DEFAULT_WINDOW))
+    calls: int = 0
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+class _Section:
+    """Context manager charging its wall time to one timer name."""
+
+    __slots__ = ("_owner", "_name", "_start")
+
+    def __init__(self, owner: "TimerAggregator", name: str) -> None:
+        self._owner = owner
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        self._owner.add(self._name, (time.perf_counter() - self._start) * 1000.0)
+
+
+class _NullSection:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+_NULL_SECTION = _NullSection()
+
+
+class NullTimers:
+    """Drop-in for :class:`TimerAggregator` that records nothing."""
+
+    def time(self, name: str) -> _NullSection:
+        return _NULL_SECTION
+
+    def add(self, name: str, duration_ms: float, calls: int = 1) -> None:
+        return None
+
+
+NULL_TIMERS = NullTimers()
+
+
+class TimerAggregator:
+    """Collects timing samples and emits rolling averages.
+
+    Time charged to a name between two :meth:`end_frame` calls is summed into
+    one per-frame sample, so a phase that runs once per lifeform reports its
+    total cost for the frame (or tick). :meth:`summary` gives p50/p95/max over
+    the last ``window`` frames together with the number of calls.
+
+    Args:
+        logger: Optional logger for :meth:`maybe_log`.
+        log_interval: Seconds between log lines.
+        window: Number of frames kept for the percentiles.
+    """
+
+    def __init__(self, logger=None, *, log_interval: float = 2.0, window: int = DEFAULT_WINDOW) -> None:
+        self._stats: Dict[str, _TimerStats] = {}
+        self._last_log = time.perf_counter()
+        self._log_interval = log_interval
+        self._logger = logger
+        self._window = max(1, int(window))
+        self._windows: Dict[str, _Window] = {}
+        self._frame: Dict[str, List[float]] = {}
+
+    def time(self, name: str) -> _Section:
+        return _Section(self, name)
+
+    def add(self, name: str, duration_ms: float, calls: int = 1) -> None:
+        """Charge an externally measured duration to ``name``."""
+
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = _TimerStats()
+        stats.total_ms += duration_ms
+        stats.count += calls
+        pending = self._frame.get(name)
+        if pending is None:
+            self._frame[name] = [duration_ms, calls]
+        else:
+            pending[0] += duration_ms
+            pending[1] += calls
+
+    def end_frame(self) -> None:
+        """Close the current frame and push its totals into the rolling windows."""
+
+        windows = self._windows
+        for name, (total_ms, calls) in self._frame.items():
+            window = windows.get(name)
+            if window is None:
+                window = windows[name] = _Window(deque(maxlen=self._window))
+            window.samples.append(total_ms)
+            window.calls += int(calls)
+        self._frame = {}
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Return rolling per-frame statistics for every timer name."""
+
+        result: Dict[str, Dict[str, float]] = {}
+        for name, window in self._windows.items():
+            ordered = sorted(window.samples)
+            result[name] = {
+                "calls": window.calls,
+                "frames": len(ordered),
+                "p50_ms": _percentile(ordered, 0.50),
+                "p95_ms": _percentile(ordered, 0.95),
+                "max_ms": ordered[-1] if ordered else 0.0,
+                "mean_ms": sum(ordered) / len(ordered) if ordered else 0.0,
+            }
+        return result
+
+    def maybe_log(self) -> None:
+        if self._logger is None:
+            return
+        now = time.perf_counter()
+        if now - self._last_log < self._log_interval:
+            return
+        lines = []
+        for name, stats in self._stats.items():
+            if stats.count == 0:
+                continue
+            avg_ms = stats.total_ms / max(1, stats.count)
+            lines.append(f"{name}: {avg_ms:.2f} ms ({stats.count} samples)")
+        if lines:
+            self._logger.info("Perf timers | %s", "; ".join(lines))
+        self._stats.clear()
+        self._last_log = now
+
+    def reset(self) -> None:
+        self._stats.clear()
+        self._windows.clear()
+        self._frame = {}
+        self._last_log = time.perf_counter()
+
+
+class SlowestTicks:
+    """Run ticks under :mod:`cProfile` and keep the ``limit`` slowest profiles.
+
+    Profiling every tick costs time, so this is meant for diagnostic runs
+    rather than the default loop.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = max(0, int(limit))
+        # Min-heap on duration so the fastest kept tick is evicted first
+        self._heap: List[Tuple[float, int, pstats.Stats]] = []
+        self._profiler: Optional[cProfile.Profile] = None
+
+    def start(self) -> None:
+        if self.limit:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def stop(self, tick: int, duration_ms: float) -> None:
+        profiler = self._profiler
+        if profiler is None:
+            return
+        profiler.disable()
+        self._profiler = None
+        heap = self._heap
+        if len(heap) < self.limit:
+            heapq.heappush(heap, (duration_ms, tick, pstats.Stats(profiler)))
+        elif duration_ms > heap[0][0]:
+            heapq.heapreplace(heap, (duration_ms, tick, pstats.Stats(profiler)))
+
+    def slowest(self) -> List[Tuple[float, int, pstats.Stats]]:
+        """Return ``(duration_ms, tick, stats)`` tuples, slowest first."""
+
+        return sorted(self._heap, key=lambda item: item[0], reverse=True)
+
+    def report(self, tick_stats: pstats.Stats, lines: int = 15) -> str:
+        """Format the top cumulative entries of one captured profile."""
+
+        buffer = io.StringIO()
+        tick_stats.stream = buffer
+        tick_stats.sort_stats("cumulative").print_stats(lines)
+        return buffer.getvalue()
+
+
+__all__ = ["DEFAULT_WINDOW", "NULL_TIMERS", "NullTimers", "SlowestTicks", "TimerAggregator"]
@@ -13,6 +13,7 @@ from pygame.math import Vector2
 
 from ..config import settings
 from ..rendering.modular_renderer import BodyGraphRenderer, ModularRendererState
+from ..systems import rng as random_streams
 from ..systems.telemetry import log_event
 
 if TYPE_CHECKING:
@@ -21,6 +22,12 @@ if TYPE_CHECKING:
 
 Color = Tuple[int, int, int]
 
+# Drift and ocean snow; texture speckles stay on the shared random module
+_RNG = random_streams.stream("carcass")
+
+# Decay steps between body redraws; colour and opacity follow decay progress
+_APPEARANCE_STEPS = 32
+
 
 class DecompositionStage(Enum):
     """Stages of decomposition affecting physics and visuals."""
@@ -65,19 +72,20 @@ class OceanSnowParticle:
         
         return self.opacity > 5
 
-    def draw(self, surface: pygame.Surface, offset: Tuple[int, int]) -> None:
+    def draw(self, surface: pygame.Surface, offset: Tuple[int, int], scale: float = 1.0) -> None:
         """Draw the particle."""
         if self.opacity <= 0:
             return
             
-        pos = (int(self.position.x - offset[0]), int(self.position.y - offset[1]))
+        pos = (int((self.position.x - offset[0]) * scale), int((self.position.y - offset[1]) * scale))
+        size = self.size * scale
         
         # Create surface for transparency
-        s = pygame.Surface((int(self.size * 2) + 1, int(self.size * 2) + 1), pygame.SRCALPHA)
+        s = pygame.Surface((int(size * 2) + 1, int(size * 2) + 1), pygame.SRCALPHA)
         color_with_alpha = (*self.color, self.opacity)
-        pygame.draw.circle(s, color_with_alpha, (int(self.size), int(self.size)), int(self.size))
+        pygame.draw.circle(s, color_with_alpha, (int(size), int(size)), int(size))
         
-        surface.blit(s, (pos[0] - int(self.size), pos[1] - int(self.size)))
+        surface.blit(s, (pos[0] - int(size), pos[1] - int(size)))
 
 
 class DecomposingCarcass:
@@ -103,13 +111,13 @@ class DecomposingCarcass:
         # Store original body for rendering
         self.body_graph = body_graph
         self.body_geometry = body_geometry or {}
-        self.angle = random.uniform(-15.0, 15.0)
-        self.angular_velocity = random.uniform(-3.0, 3.0)  # degrees per second
+        self.angle = _RNG.uniform(-15.0, 15.0)
+        self.angular_velocity = _RNG.uniform(-3.0, 3.0)  # degrees per second
         
         # Physical properties
         self.initial_mass = max(0.5, mass)
         self.mass = self.initial_mass
-        self.velocity = Vector2(random.uniform(-3.0, 3.0), 0.0)
+        self.velocity = Vector2(_RNG.uniform(-3.0, 3.0), 0.0)
         
         # Nutrition and decay
         self.initial_nutrition = float(max(5.0, nutrition))
@@ -141,6 +149,9 @@ class DecomposingCarcass:
         # Module consumption tracking
         self.consumed_modules = set()  # Set of module keys (node_ids) that have been eaten
 
+        # (appearance key, composed body, offset) from the last body_image()
+        self._appearance: Optional[Tuple[tuple, pygame.Surface, Tuple[int, int]]] = None
+
     def _update_decomposition_stage(self) -> None:
         """Update stage based on progress."""
         old_stage = self.stage
@@ -195,13 +206,13 @@ class DecomposingCarcass:
             emission_rate = 0.5
         
         num_particles = int(emission_rate)
-        if random.random() < (emission_rate - num_particles):
+        if _RNG.random() < (emission_rate - num_particles):
             num_particles += 1
         
         for _ in range(num_particles):
             # Spawn particle near carcass
-            offset_x = random.uniform(-self.width / 2, self.width / 2)
-            offset_y = random.uniform(-self.height / 2, self.height / 2)
+            offset_x = _RNG.uniform(-self.width / 2, self.width / 2)
+            offset_y = _RNG.uniform(-self.height / 2, self.height / 2)
             
             position = Vector2(
                 self.rect.centerx + offset_x,
@@ -210,21 +221,21 @@ class DecomposingCarcass:
             
             # Initial velocity (slight upward if bloated/gas release)
             if self.stage == DecompositionStage.BLOATED:
-                vy = random.uniform(-5.0, -1.0)  # Float up
+                vy = _RNG.uniform(-5.0, -1.0)  # Float up
             else:
-                vy = random.uniform(-0.5, 0.5)
+                vy = _RNG.uniform(-0.5, 0.5)
             
             velocity = Vector2(
-                random.uniform(-2.0, 2.0),
+                _RNG.uniform(-2.0, 2.0),
                 vy
             )
             
             # Particle properties
-            size = random.uniform(0.5, 2.0)
+            size = _RNG.uniform(0.5, 2.0)
             nutrition_per_particle = self.base_decay_rate * 0.1
             
             # Gray color for decomposition
-            gray_val = random.randint(60, 120)
+            gray_val = _RNG.randint(60, 120)
             particle_color = (gray_val, gray_val, gray_val)
             
             particle = OceanSnowParticle(
@@ -232,9 +243,9 @@ class DecomposingCarcass:
                 velocity=velocity,
                 size=size,
                 nutrition=nutrition_per_particle,
-                opacity=random.randint(100, 200),
+                opacity=_RNG.randint(100, 200),
                 color=particle_color,
-                max_age=random.uniform(20.0, 40.0)
+                max_age=_RNG.uniform(20.0, 40.0)
             )
             
             self.snow_particles.append(particle)
@@ -358,24 +369,39 @@ class DecomposingCarcass:
         if len(self.snow_particles) > 200:
             self.snow_particles = self.snow_particles[-200:]
 
-    def draw(self, surface: pygame.Surface, offset: Tuple[int, int] = (0, 0)) -> None:
-        """Draw carcass with decomposition effects."""
-        if self.stage == DecompositionStage.DISINTEGRATED:
-            return
-        
-        # Draw ocean snow particles first (behind carcass)
+    def draw_snow(
+        self, surface: pygame.Surface, offset: Tuple[int, int] = (0, 0), scale: float = 1.0
+    ) -> None:
+        """Draw the ocean snow shed by the carcass."""
         for particle in self.snow_particles:
-            particle.draw(surface, offset)
-        
-        # Calculate screen position
-        x = int(self.x) - offset[0]
-        y = int(self.y) - offset[1]
-        
+            particle.draw(surface, offset, scale)
+
+    def body_image(self) -> Optional[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Composed body at world size and the world position of its top-left corner.
+
+        The image is rebuilt only when the stage, the decay step, the eaten
+        modules or the whole-degree angle change, so callers may cache resized
+        copies per returned surface.
+        """
+        if self.stage == DecompositionStage.DISINTEGRATED:
+            return None
+        key = (
+            self.stage,
+            int(self.decomposition_progress * _APPEARANCE_STEPS),
+            len(self.consumed_modules),
+            round(self.angle),
+        )
+        if self._appearance is None or self._appearance[0] != key:
+            self._appearance = (key, *self._compose_body(float(key[3])))
+        _, image, (dx, dy) = self._appearance
+        return image, (int(self.x) + dx, int(self.y) + dy)
+
+    def _compose_body(self, angle: float) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Render the body and its decay spots; returns the image and its offset from ``(x, y)``."""
         # Opacity decreases as it decomposes
         base_opacity = int(255 * (1.0 - self.decomposition_progress * 0.3))
         
         # Try to use modular renderer for realistic body
-        rendered_modular = False
         if self.body_graph is not None:
             try:
                 # Create state
@@ -401,15 +427,13 @@ class DecomposingCarcass:
                     body_surf.set_alpha(base_opacity)
                 
                 # Rotate the body (dead creatures tumble)
-                if abs(self.angle) > 0.1:
-                    body_surf = pygame.transform.rotate(body_surf, -self.angle)
+                if abs(angle) > 0.1:
+                    body_surf = pygame.transform.rotate(body_surf, -angle)
                 
-                # Center the rotated surface
+                # Center the rotated surface on the carcass rect
                 body_rect = body_surf.get_rect()
-                blit_x = x + self.width // 2 - body_rect.width // 2
-                blit_y = y + self.height // 2 - body_rect.height // 2
-                
-                surface.blit(body_surf, (blit_x, blit_y))
+                dx = self.width // 2 - body_rect.width // 2
+                dy = self.height // 2 - body_rect.height // 2
                 
                 # Add decay spots overlay
                 if self.stage in (DecompositionStage.ACTIVE_DECAY, DecompositionStage.ADVANCED_DECAY):
@@ -422,37 +446,49 @@ class DecomposingCarcass:
                         spot_color = (30, 30, 30, spot_opacity)
                         pygame.draw.circle(spot_surface, spot_color, (spot_x, spot_y), spot_size)
                     
-                    surface.blit(spot_surface, (x, y))
+                    body_surf.blit(spot_surface, (-dx, -dy))
                 
-                rendered_modular = True
+                return body_surf, (dx, dy)
                 
             except Exception:
                 # Fall back to ellipse if modular rendering fails
                 pass
         
-        if not rendered_modular:
-            # Fallback: Simple ellipse rendering
-            ellipse = pygame.Rect(0, 0, self.width, self.height)
-            body_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            
-            pygame.draw.ellipse(body_surface, (*self.color, base_opacity), ellipse)
-            pygame.draw.ellipse(body_surface, self.outline_color, ellipse, 2)
-            
-            # Add texture/spots for decay
-            if self.stage in (DecompositionStage.ACTIVE_DECAY, DecompositionStage.ADVANCED_DECAY):
-                for _ in range(random.randint(2, 5)):
-                    spot_x = random.randint(0, self.width)
-                    spot_y = random.randint(0, self.height)
-                    spot_size = random.randint(1, 3)
-                    spot_color = (
-                        max(0, self.color[0] - 30),
-                        max(0, self.color[1] - 30),
-                        max(0, self.color[2] - 30),
-                        base_opacity // 2
-                    )
-                    pygame.draw.circle(body_surface, spot_color, (spot_x, spot_y), spot_size)
-            
-            surface.blit(body_surface, (x, y))
+        # Fallback: Simple ellipse rendering
+        ellipse = pygame.Rect(0, 0, self.width, self.height)
+        body_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        
+        pygame.draw.ellipse(body_surface, (*self.color, base_opacity), ellipse)
+        pygame.draw.ellipse(body_surface, self.outline_color, ellipse, 2)
+        
+        # Add texture/spots for decay
+        if self.stage in (DecompositionStage.ACTIVE_DECAY, DecompositionStage.ADVANCED_DECAY):
+            for _ in range(random.randint(2, 5)):
+                spot_x = random.randint(0, self.width)
+                spot_y = random.randint(0, self.height)
+                spot_size = random.randint(1, 3)
+                spot_color = (
+                    max(0, self.color[0] - 30),
+                    max(0, self.color[1] - 30),
+                    max(0, self.color[2] - 30),
+                    base_opacity // 2
+                )
+                pygame.draw.circle(body_surface, spot_color, (spot_x, spot_y), spot_size)
+        
+        return body_surface, (0, 0)
+
+    def draw(self, surface: pygame.Surface, offset: Tuple[int, int] = (0, 0)) -> None:
+        """Draw carcass with decomposition effects."""
+        if self.stage == DecompositionStage.DISINTEGRATED:
+            return
+        
+        # Draw ocean snow particles first (behind carcass)
+        self.draw_snow(surface, offset)
+        
+        body = self.body_image()
+        if body is not None:
+            image, (x, y) = body
+            surface.blit(image, (x - offset[0], y - offset[1]))
 
     def is_depleted(self) -> bool:
         """Check if carcass is depleted."""
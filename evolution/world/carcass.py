@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import math
-import random
 from typing import Tuple
 
 import pygame
 from pygame.math import Vector2
 
 from ..config import settings
+from ..systems import rng as random_streams
 
 Color = Tuple[int, int, int]
 
@@ -32,7 +32,7 @@ class SinkingCarcass:
         self.height = max(4, int(height * 0.6))
         self.rect = pygame.Rect(int(self.x), int(self.y), self.width, self.height)
         self.mass = max(0.5, mass)
-        self.velocity = Vector2(random.uniform(-3.0, 3.0), 0.0)
+        self.velocity = Vector2(random_streams.stream("carcass").uniform(-3.0, 3.0), 0.0)
         self.resource = float(max(5.0, nutrition))
         self.decay_rate = max(0.05, self.resource * 0.0005)
         self.color = color
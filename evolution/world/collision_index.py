@@ -0,0 +1,85 @@
+"""Uniform-grid broad-phase for static collision rectangles."""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Tuple
+
+import pygame
+
+DEFAULT_COLLISION_CELL = 256
+
+
+class RectGridIndex:
+    """Bucket static rectangles into square cells for fast overlap tests.
+
+    Every rectangle is stored in each cell it touches, so a query only looks
+    at the cells covered by the probe rect. The cost of :meth:`collides`
+    depends on how many rectangles are nearby, not on the total count.
+
+    Args:
+        rects: Initial rectangles.
+        cell_size: Edge length of each grid cell in world units.
+    """
+
+    def __init__(
+        self,
+        rects: Iterable[pygame.Rect] = (),
+        cell_size: int = DEFAULT_COLLISION_CELL,
+    ) -> None:
+        self.cell_size = max(1, int(cell_size))
+        self._cells: Dict[Tuple[int, int], List[pygame.Rect]] = {}
+        self._count = 0
+        for rect in rects:
+            self.add(rect)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _span(self, rect: pygame.Rect) -> Tuple[int, int, int, int]:
+        size = self.cell_size
+        return (
+            rect.left // size,
+            rect.top // size,
+            max(rect.left, rect.right - 1) // size,
+            max(rect.top, rect.bottom - 1) // size,
+        )
+
+    def add(self, rect: pygame.Rect) -> None:
+        """Index ``rect``; it is referenced, not copied."""
+
+        col0, row0, col1, row1 = self._span(rect)
+        cells = self._cells
+        for row in range(row0, row1 + 1):
+            for col in range(col0, col1 + 1):
+                cells.setdefault((col, row), []).append(rect)
+        self._count += 1
+
+    def collides(self, rect: pygame.Rect) -> bool:
+        """Return ``True`` if ``rect`` overlaps any indexed rectangle."""
+
+        if not self._cells:
+            return False
+        col0, row0, col1, row1 = self._span(rect)
+        cells = self._cells
+        for row in range(row0, row1 + 1):
+            for col in range(col0, col1 + 1):
+                bucket = cells.get((col, row))
+                if bucket and rect.collidelist(bucket) != -1:
+                    return True
+        return False
+
+    def query(self, rect: pygame.Rect) -> List[pygame.Rect]:
+        """Return the distinct indexed rectangles overlapping ``rect``."""
+
+        col0, row0, col1, row1 = self._span(rect)
+        found: Dict[int, pygame.Rect] = {}
+        cells = self._cells
+        for row in range(row0, row1 + 1):
+            for col in range(col0, col1 + 1):
+                for candidate in cells.get((col, row), ()):
+                    if rect.colliderect(candidate):
+                        found[id(candidate)] = candidate
+        return list(found.values())
+
+
+__all__ = ["DEFAULT_COLLISION_CELL", "RectGridIndex"]
@@ -0,0 +1,169 @@
+"""World-level occupancy bitmap shared by moss clusters and seaweed strands."""
+
+from __future__ import annotations
+
+from typing import Iterable, List, Optional, Tuple
+
+import pygame
+
+GridCell = Tuple[int, int]
+
+# Moss clusters and seaweed strands share this grid resolution
+VEGETATION_CELL_SIZE = 8
+
+# Claimed/released cells kept for incremental consumers before trimming
+JOURNAL_LIMIT = 4096
+
+
+class VegetationOccupancy:
+    """Flat per-cell occupancy for vegetation growth checks.
+
+    Two byte arrays cover the world on the vegetation grid: one marks cells
+    touched by barriers or water, the other counts how many plants claim a
+    cell. Cells outside the world count as occupied. Plants write their
+    cells through :meth:`add_plant`, :meth:`claim` and :meth:`release`, so a
+    growth check is a bounds test and two array reads.
+
+    Every claim and release is also appended to a change journal. Consumers
+    remember :attr:`journal_end` and later ask :meth:`changes_since` which
+    cells changed in between; :attr:`blocked_epoch` moves whenever the
+    blocked layer is edited.
+
+    Args:
+        width: World width in pixels.
+        height: World height in pixels.
+        cell_size: Vegetation cell size in pixels.
+    """
+
+    def __init__(self, width: int, height: int, cell_size: int = VEGETATION_CELL_SIZE) -> None:
+        self.cell_size = max(1, int(cell_size))
+        # Only cells that lie completely inside the world are usable
+        self.cols = max(0, int(width) // self.cell_size)
+        self.rows = max(0, int(height) // self.cell_size)
+        self._blocked = bytearray(self.cols * self.rows)
+        self._plants = bytearray(self.cols * self.rows)
+        self._journal: List[GridCell] = []
+        self._journal_base = 0
+        self.blocked_epoch = 0
+
+    # ------------------------------------------------------------------
+    # Static obstacles
+    # ------------------------------------------------------------------
+    def mark_blocked(self, rect: pygame.Rect) -> None:
+        """Mark every cell overlapping ``rect`` as blocked."""
+
+        if rect.width <= 0 or rect.height <= 0:
+            return
+        size = self.cell_size
+        col0 = max(0, rect.left // size)
+        col1 = min(self.cols - 1, (rect.right - 1) // size)
+        row0 = max(0, rect.top // size)
+        row1 = min(self.rows - 1, (rect.bottom - 1) // size)
+        if col0 > col1:
+            return
+        span = col1 - col0 + 1
+        fill = b"\x01" * span
+        for row in range(row0, row1 + 1):
+            start = row * self.cols + col0
+            self._blocked[start : start + span] = fill
+        self.blocked_epoch += 1
+
+    def reset_blocked(self, rects: Iterable[pygame.Rect]) -> None:
+        """Replace all blocked cells with the cells covered by ``rects``."""
+
+        self._blocked = bytearray(self.cols * self.rows)
+        for rect in rects:
+            self.mark_blocked(rect)
+        self.blocked_epoch += 1
+
+    # ------------------------------------------------------------------
+    # Plants
+    # ------------------------------------------------------------------
+    def _index(self, cell: GridCell) -> Optional[int]:
+        gx, gy = cell
+        if 0 <= gx < self.cols and 0 <= gy < self.rows:
+            return gy * self.cols + gx
+        return None
+
+    def claim(self, cell: GridCell) -> None:
+        index = self._index(cell)
+        if index is not None and self._plants[index] < 255:
+            self._plants[index] += 1
+            self._log(cell)
+
+    def release(self, cell: GridCell) -> None:
+        index = self._index(cell)
+        if index is not None and self._plants[index] > 0:
+            self._plants[index] -= 1
+            self._log(cell)
+
+    def add_plant(self, plant) -> None:
+        """Write all cells of ``plant`` and keep it updating this bitmap."""
+
+        if getattr(plant, "_occupancy", None) is self:
+            return
+        previous = getattr(plant, "_occupancy", None)
+        if previous is not None:
+            previous.remove_plant(plant)
+        for cell in plant.cells:
+            self.claim(cell)
+        plant._occupancy = self
+
+    def remove_plant(self, plant) -> None:
+        """Erase the cells of ``plant`` and detach it from this bitmap."""
+
+        if getattr(plant, "_occupancy", None) is not self:
+            return
+        for cell in plant.cells:
+            self.release(cell)
+        plant._occupancy = None
+
+    # ------------------------------------------------------------------
+    # Change journal
+    # ------------------------------------------------------------------
+    def _log(self, cell: GridCell) -> None:
+        journal = self._journal
+        journal.append(cell)
+        if len(journal) > JOURNAL_LIMIT * 2:
+            del journal[:JOURNAL_LIMIT]
+            self._journal_base += JOURNAL_LIMIT
+
+    @property
+    def journal_end(self) -> int:
+        """Sequence number one past the newest journal entry."""
+
+        return self._journal_base + len(self._journal)
+
+    def changes_since(self, cursor: int) -> Optional[List[GridCell]]:
+        """Return cells claimed or released since ``cursor``.
+
+        Returns ``None`` when those entries were already trimmed, in which
+        case the caller has to re-evaluate everything it derived.
+        """
+
+        if cursor < self._journal_base:
+            return None
+        return self._journal[cursor - self._journal_base :]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def is_occupied(self, cell: GridCell) -> bool:
+        """Return ``True`` for cells that are blocked, planted or off-world."""
+
+        gx, gy = cell
+        if gx < 0 or gy < 0 or gx >= self.cols or gy >= self.rows:
+            return True
+        index = gy * self.cols + gx
+        return bool(self._blocked[index] or self._plants[index])
+
+    def is_blocked(self, cell: GridCell) -> bool:
+        index = self._index(cell)
+        return index is None or bool(self._blocked[index])
+
+    def plant_count(self, cell: GridCell) -> int:
+        index = self._index(cell)
+        return 0 if index is None else self._plants[index]
+
+
+__all__ = ["JOURNAL_LIMIT", "VEGETATION_CELL_SIZE", "VegetationOccupancy"]
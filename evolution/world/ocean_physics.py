@@ -4,10 +4,18 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 from pygame.math import Vector2
 
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - fallback when numpy is missing
+    np = None
+    NUMPY_AVAILABLE = False
+
 
 @dataclass(frozen=True)
 class OceanLayer:
@@ -36,10 +44,133 @@ class FluidProperties:
     current: Vector2
 
 
+@dataclass(slots=True)
+class BodyConstants:
+    """Per-body hydrodynamic constants derived once from the body graph.
+
+    Everything :meth:`OceanPhysics.integrate_body` needs that does not change
+    from tick to tick. Rows are cached on the lifeform and rebuilt only when
+    its :class:`~evolution.physics.physics_body.PhysicsBody` is replaced.
+    """
+
+    source: object
+    mass: float
+    buoyancy_volume: float
+    buoyant_bias: float
+    base_drag: float
+    grip_multiplier: float
+    ballast_grip: float
+    buoyant_slip: float
+    fin_lift: float
+    hover_preference: float
+
+    def row(self) -> Tuple[float, ...]:
+        return (
+            self.mass,
+            self.buoyancy_volume,
+            self.buoyant_bias,
+            self.base_drag,
+            self.grip_multiplier,
+            self.ballast_grip,
+            self.buoyant_slip,
+            self.fin_lift,
+            self.hover_preference,
+        )
+
+
+def derive_body_constants(lifeform) -> BodyConstants:
+    """Collect the static integration inputs of ``lifeform``."""
+
+    physics_body = getattr(lifeform, "physics_body", None)
+    base_mass = float(getattr(physics_body, "mass", getattr(lifeform, "mass", 1.0)))
+    mass = max(0.4, base_mass)
+    volume = max(
+        1.0,
+        float(getattr(physics_body, "volume", getattr(lifeform, "volume", 1.0))),
+    )
+    buoyancy_volume = max(
+        1.0,
+        float(
+            getattr(
+                physics_body,
+                "buoyancy_volume",
+                getattr(lifeform, "buoyancy_volume", volume),
+            )
+        ),
+    )
+    lift_per_fin = 0.0
+    buoyancy_offsets = (0.0, 0.0)
+    if physics_body is not None:
+        lift_per_fin = float(getattr(physics_body, "lift_per_fin", 0.0))
+        buoyancy_offsets = getattr(physics_body, "buoyancy_offsets", (0.0, 0.0))
+    positive_buoyancy, negative_buoyancy = buoyancy_offsets
+    locomotion_drag = getattr(lifeform, "_locomotion_drag_multiplier", 1.0)
+    base_drag = float(
+        getattr(
+            physics_body,
+            "drag_coefficient",
+            getattr(lifeform, "drag_coefficient", 0.2),
+        )
+    )
+    grip_strength = max(0.3, float(getattr(lifeform, "grip_strength", 1.0)))
+    if physics_body is not None:
+        grip_strength = max(grip_strength, physics_body.grip_strength / 6.0)
+    ballast_grip = negative_buoyancy / max(1.0, volume)
+    morphology = getattr(lifeform, "morphology", None)
+    fallback_fins = getattr(morphology, "fins", 0) if morphology is not None else 0
+    fin_count = float(getattr(lifeform, "fin_count", fallback_fins))
+    fin_lift = lift_per_fin * fin_count if lift_per_fin > 0.0 and fin_count > 0.0 else 0.0
+    return BodyConstants(
+        source=physics_body,
+        mass=mass,
+        buoyancy_volume=buoyancy_volume,
+        buoyant_bias=(positive_buoyancy - negative_buoyancy) / max(1.0, volume),
+        base_drag=base_drag * locomotion_drag,
+        grip_multiplier=0.12 / max(0.5, grip_strength * (1.0 + ballast_grip * 0.6)),
+        ballast_grip=ballast_grip,
+        buoyant_slip=positive_buoyancy / max(1.0, volume),
+        fin_lift=fin_lift,
+        hover_preference=float(getattr(lifeform, "hover_lift_preference", 1.0)),
+    )
+
+
+def body_constants(lifeform) -> BodyConstants:
+    """Return the cached :class:`BodyConstants` of ``lifeform``.
+
+    The row is derived on first use after spawning and again whenever the
+    lifeform's ``physics_body`` is swapped (e.g. when a new body is built).
+    """
+
+    cached: Optional[BodyConstants] = getattr(lifeform, "_body_constants", None)
+    if cached is None or cached.source is not getattr(lifeform, "physics_body", None):
+        cached = derive_body_constants(lifeform)
+        lifeform._body_constants = cached
+    return cached
+
+
+DEFAULT_TABLE_RESOLUTION = 4.0
+DEFAULT_TIME_TOLERANCE = 0.25
+
+
 class OceanPhysics:
-    """Layered 2D Newtonian fluid approximating an alien ocean."""
+    """Layered 2D Newtonian fluid approximating an alien ocean.
 
-    def __init__(self, width: float, depth: float, surface_y: float = 0.0) -> None:
+    Fluid properties are served from a depth table with one row every
+    ``table_resolution`` units. Density, pressure, light and temperature are
+    fixed per row; the swaying currents are refreshed by :meth:`update` once
+    the clock has moved more than ``time_tolerance`` seconds past the last
+    refresh, or immediately when the global wind flips direction.
+    """
+
+    def __init__(
+        self,
+        width: float,
+        depth: float,
+        surface_y: float = 0.0,
+        *,
+        table_resolution: float = DEFAULT_TABLE_RESOLUTION,
+        time_tolerance: float = DEFAULT_TIME_TOLERANCE,
+    ) -> None:
         self.width = float(width)
         self.depth = max(1.0, float(depth))
         self.surface_y = float(surface_y)
@@ -47,6 +178,12 @@ class OceanPhysics:
         self.surface_pressure = 1.0
         self.layers: List[OceanLayer] = self._build_default_layers()
         self._time: float = 0.0
+        self.table_resolution = max(0.5, float(table_resolution))
+        self.time_tolerance = max(0.0, float(time_tolerance))
+        # Bumped whenever the currents are refreshed so callers caching
+        # derived values know when to drop them.
+        self.table_version = 0
+        self._build_table()
 
     def _build_default_layers(self) -> List[OceanLayer]:
         depth = self.depth
@@ -95,6 +232,77 @@ class OceanPhysics:
 
     def update(self, now_ms: int) -> None:
         self._time = now_ms / 1000.0
+        if (
+            abs(self._time - self._table_time) > self.time_tolerance
+            or self._wind_direction(self._time) != self._table_wind
+        ):
+            self._refresh_currents()
+
+    # ------------------------------------------------------------------
+    # Depth table
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _wind_direction(time: float) -> float:
+        # Global wind oscillation (period ~ 120 seconds)
+        return 1.0 if math.sin(time * 0.05) > 0 else -1.0
+
+    def _build_table(self) -> None:
+        """Precompute the time-independent columns of the depth table."""
+
+        rows = int(math.ceil(self.depth / self.table_resolution)) + 1
+        self._row_depths = [min(self.depth, i * self.table_resolution) for i in range(rows)]
+        self._row_layers: List[OceanLayer] = []
+        self._row_fraction: List[float] = []
+        self._row_density: List[float] = []
+        self._row_pressure: List[float] = []
+        self._row_light: List[float] = []
+        for clamped_depth in self._row_depths:
+            layer = self.layer_at(clamped_depth)
+            local_depth = max(layer.depth_start, min(layer.depth_end, clamped_depth))
+            layer_fraction = (local_depth - layer.depth_start) / max(
+                1.0, layer.depth_end - layer.depth_start
+            )
+            density = layer.density * (1.0 + layer_fraction * 0.08)
+            light = math.exp(-clamped_depth * layer.light_absorption)
+            self._row_layers.append(layer)
+            self._row_fraction.append(layer_fraction)
+            self._row_density.append(density)
+            self._row_pressure.append(
+                self.surface_pressure + density * self.gravity * (clamped_depth / self.depth)
+            )
+            self._row_light.append(max(0.0, min(1.0, light)))
+
+        if NUMPY_AVAILABLE:
+            self._table_density = np.array(self._row_density)
+            self._table_drag = np.array([layer.drag for layer in self._row_layers])
+        self._refresh_currents()
+
+    def _refresh_currents(self) -> None:
+        """Recompute the swaying current of every row for the current time."""
+
+        time = self._time
+        wind_direction = self._wind_direction(time)
+        currents: List[Vector2] = []
+        for layer, layer_fraction in zip(self._row_layers, self._row_fraction):
+            sway = math.sin(time * 0.12 + layer_fraction) * 14.0
+            # Apply wind direction to the base current
+            current = Vector2(layer.current.x * wind_direction, layer.current.y).rotate(sway)
+            current *= 0.4 + 0.6 * (1.0 - layer_fraction)
+            currents.append(current)
+        self._row_currents = currents
+        self._row_properties: List[Optional[FluidProperties]] = [None] * len(currents)
+        self._table_time = time
+        self._table_wind = wind_direction
+        self.table_version += 1
+        if NUMPY_AVAILABLE:
+            self._table_current_x = np.array([c.x for c in currents])
+            self._table_current_y = np.array([c.y for c in currents])
+
+    def row_index(self, depth: float) -> int:
+        """Return the depth-table row that serves absolute ``depth``."""
+
+        clamped_depth = max(0.0, min(self.depth, depth - self.surface_y))
+        return int(clamped_depth / self.table_resolution + 0.5)
 
     def layer_at(self, depth: float) -> OceanLayer:
         clamped_depth = max(0.0, min(self.depth, depth))
@@ -108,42 +316,25 @@ class OceanPhysics:
 
         Depth values outside the simulated column are clamped to ensure
         physically plausible outputs (e.g., no negative pressure or light
-        gain above the surface).
+        gain above the surface). The result is shared per table row and
+        must be treated as read-only.
         """
 
-        # Convert absolute Y to relative depth
-        relative_depth = depth - self.surface_y
-        clamped_depth = max(0.0, min(self.depth, relative_depth))
-        layer = self.layer_at(clamped_depth)
-        local_depth = max(layer.depth_start, min(layer.depth_end, clamped_depth))
-        layer_fraction = (local_depth - layer.depth_start) / max(
-            1.0, layer.depth_end - layer.depth_start
-        )
-        density = layer.density * (1.0 + layer_fraction * 0.08)
-        pressure = self.surface_pressure + density * self.gravity * (
-            clamped_depth / self.depth
-        )
-        light = math.exp(-clamped_depth * layer.light_absorption)
-        sway = math.sin(self._time * 0.12 + layer_fraction) * 14.0
-        
-        # Global wind oscillation (period ~ 120 seconds)
-        wind_cycle = math.sin(self._time * 0.05) 
-        wind_direction = 1.0 if wind_cycle > 0 else -1.0
-        
-        # Apply wind direction to the base current
-        base_current = Vector2(layer.current.x * wind_direction, layer.current.y)
-        
-        current = base_current.rotate(sway)
-        current *= 0.4 + 0.6 * (1.0 - layer_fraction)
-        return FluidProperties(
-            layer=layer,
-            density=density,
-            drag=layer.drag,
-            light=max(0.0, min(1.0, light)),
-            pressure=pressure,
-            temperature=layer.temperature,
-            current=current,
-        )
+        row = self.row_index(depth)
+        fluid = self._row_properties[row]
+        if fluid is None:
+            layer = self._row_layers[row]
+            fluid = FluidProperties(
+                layer=layer,
+                density=self._row_density[row],
+                drag=layer.drag,
+                light=self._row_light[row],
+                pressure=self._row_pressure[row],
+                temperature=layer.temperature,
+                current=self._row_currents[row],
+            )
+            self._row_properties[row] = fluid
+        return fluid
 
     def enrich_effects(self, effects: dict, depth: float) -> None:
         fluid = self.properties_at(depth)
@@ -162,79 +353,156 @@ class OceanPhysics:
         max_speed: float,
     ) -> Tuple[Vector2, FluidProperties]:
         fluid = self.properties_at(lifeform.rect.centery)
-        physics_body = getattr(lifeform, "physics_body", None)
-        base_mass = float(getattr(physics_body, "mass", getattr(lifeform, "mass", 1.0)))
-        mass = max(0.4, base_mass)
-        body_density = max(
-            0.2,
-            float(getattr(physics_body, "density", getattr(lifeform, "body_density", 1.0))),
-        )
-        volume = max(
-            1.0,
-            float(getattr(physics_body, "volume", getattr(lifeform, "volume", 1.0))),
-        )
-        buoyancy_volume = max(
-            1.0,
-            float(
-                getattr(
-                    physics_body,
-                    "buoyancy_volume",
-                    getattr(lifeform, "buoyancy_volume", volume),
-                )
-            ),
-        )
-        lift_per_fin = 0.0
-        buoyancy_offsets = (0.0, 0.0)
-        if physics_body is not None:
-            lift_per_fin = float(getattr(physics_body, "lift_per_fin", 0.0))
-            buoyancy_offsets = getattr(physics_body, "buoyancy_offsets", (0.0, 0.0))
-        positive_buoyancy, negative_buoyancy = buoyancy_offsets
-        propulsion = thrust
-        buoyant_bias = (positive_buoyancy - negative_buoyancy) / max(1.0, volume)
+        body = body_constants(lifeform)
+        mass = body.mass
+        velocity = lifeform.velocity
         # upward buoyant acceleration: (fluid_density * buoyancy_volume * g) / mass
-        buoyancy_acc = (fluid.density * buoyancy_volume * self.gravity) / mass
+        buoyancy_acc = (fluid.density * body.buoyancy_volume * self.gravity) / mass
         # apply small bias from buoyancy offsets (positive reduces net gravity)
-        buoyancy_acc += buoyant_bias * self.gravity * 0.25
-        locomotion_drag = getattr(lifeform, "_locomotion_drag_multiplier", 1.0)
-        base_drag = float(
-            getattr(
-                physics_body,
-                "drag_coefficient",
-                getattr(lifeform, "drag_coefficient", 0.2),
+        buoyancy_acc += body.buoyant_bias * self.gravity * 0.25
+        drag_coefficient = fluid.drag + body.base_drag
+        drag_scale = drag_coefficient / max(1.0, mass)
+        grip_multiplier = body.grip_multiplier
+        # net downward acceleration: gravity minus upward buoyant acceleration
+        vertical = self.gravity - buoyancy_acc
+        if body.ballast_grip > 0.0:
+            vertical -= velocity.y * min(0.6, body.ballast_grip)
+        if body.buoyant_slip > 0.0:
+            vertical += velocity.y * min(0.4, body.buoyant_slip * 0.5)
+        if body.fin_lift > 0.0:
+            lift_signal = max(
+                -1.0,
+                min(1.0, float(getattr(lifeform, "y_direction", 0.0)) * body.hover_preference),
             )
+            vertical += body.fin_lift * lift_signal / mass
+        ax = thrust.x - velocity.x * drag_scale + (fluid.current.x - velocity.x) * grip_multiplier
+        ay = (
+            thrust.y
+            - velocity.y * drag_scale
+            + (fluid.current.y - velocity.y) * grip_multiplier
+            + vertical
         )
-        drag_coefficient = fluid.drag + base_drag * locomotion_drag
-        drag = -lifeform.velocity * (drag_coefficient / max(1.0, mass))
-        grip_strength = max(0.3, float(getattr(lifeform, "grip_strength", 1.0)))
-        if physics_body is not None:
-            grip_strength = max(grip_strength, physics_body.grip_strength / 6.0)
-        ballast_grip = negative_buoyancy / max(1.0, volume)
-        buoyant_slip = positive_buoyancy / max(1.0, volume)
-        grip_multiplier = 0.12 / max(0.5, grip_strength * (1.0 + ballast_grip * 0.6))
-        current_adjust = (fluid.current - lifeform.velocity) * grip_multiplier
-        # net downward acceleration: gravity minus upward buoyant acceleration
-        net_gravity = self.gravity - buoyancy_acc
-        vertical = Vector2(0.0, net_gravity)
-        if ballast_grip > 0.0:
-            vertical += Vector2(0.0, -lifeform.velocity.y * min(0.6, ballast_grip))
-        if buoyant_slip > 0.0:
-            vertical += Vector2(0.0, lifeform.velocity.y * min(0.4, buoyant_slip * 0.5))
-        morphology = getattr(lifeform, "morphology", None)
-        fallback_fins = getattr(morphology, "fins", 0) if morphology is not None else 0
-        fin_count = float(getattr(lifeform, "fin_count", fallback_fins))
-        hover_preference = float(getattr(lifeform, "hover_lift_preference", 1.0))
-        if lift_per_fin > 0.0 and fin_count > 0.0:
-            lift_signal = max(-1.0, min(1.0, float(getattr(lifeform, "y_direction", 0.0)) * hover_preference))
-            if abs(lift_signal) > 0.0:
-                lift_force = lift_per_fin * fin_count * lift_signal
-                lift_acc = lift_force / max(0.4, mass)
-                vertical += Vector2(0.0, lift_acc)
-        acceleration = propulsion + drag + current_adjust + vertical
-        lifeform.velocity += acceleration * dt
-        speed = lifeform.velocity.length()
+        velocity.x += ax * dt
+        velocity.y += ay * dt
+        speed = velocity.length()
         if speed > max_speed:
-            lifeform.velocity.scale_to_length(max_speed)
-        displacement = lifeform.velocity * dt
-        next_position = Vector2(lifeform.x, lifeform.y) + displacement
+            velocity.scale_to_length(max_speed)
+        next_position = Vector2(lifeform.x + velocity.x * dt, lifeform.y + velocity.y * dt)
         lifeform.last_fluid_properties = fluid
         return next_position, fluid
+
+    # ------------------------------------------------------------------
+    # Batched integration
+    # ------------------------------------------------------------------
+    def currents_at(self, depths: "np.ndarray") -> Tuple["np.ndarray", ...]:
+        """Vectorised :meth:`properties_at` for the fields integration needs.
+
+        Returns:
+            ``(density, drag, current_x, current_y)`` arrays matching ``depths``.
+        """
+
+        clamped = np.clip(np.asarray(depths, dtype=np.float64) - self.surface_y, 0.0, self.depth)
+        rows = (clamped / self.table_resolution + 0.5).astype(np.int64)
+        return (
+            self._table_density[rows],
+            self._table_drag[rows],
+            self._table_current_x[rows],
+            self._table_current_y[rows],
+        )
+
+    def integrate_bodies(
+        self,
+        lifeforms: Sequence[object],
+        dt: float,
+        *,
+        max_speeds: Sequence[float],
+        thrusts: Optional[Sequence[Tuple[float, float]]] = None,
+    ) -> Tuple[List[Tuple[float, float]], List[Tuple[float, float]]]:
+        """Integrate buoyancy, drag, currents and speed limits for many bodies.
+
+        Positions, velocities and the cached :class:`BodyConstants` rows are
+        packed into arrays so every body advances in a handful of vector
+        operations. Velocities are written back in place; positions are
+        returned for collision resolution just like :meth:`integrate_body`.
+        Without NumPy each body falls back to :meth:`integrate_body`.
+
+        Returns:
+            ``(next_positions, currents)`` as lists of ``(x, y)`` tuples.
+        """
+
+        if not lifeforms:
+            return [], []
+        if not NUMPY_AVAILABLE:
+            positions: List[Tuple[float, float]] = []
+            currents: List[Tuple[float, float]] = []
+            for index, lifeform in enumerate(lifeforms):
+                thrust = Vector2(thrusts[index]) if thrusts is not None else Vector2()
+                position, fluid = self.integrate_body(
+                    lifeform, thrust, dt, max_speed=max_speeds[index]
+                )
+                positions.append((position.x, position.y))
+                currents.append((fluid.current.x, fluid.current.y))
+            return positions, currents
+
+        count = len(lifeforms)
+        state = np.fromiter(
+            (
+                value
+                for lifeform in lifeforms
+                for value in (
+                    lifeform.x,
+                    lifeform.y,
+                    lifeform.rect.centery,
+                    lifeform.velocity.x,
+                    lifeform.velocity.y,
+                    float(getattr(lifeform, "y_direction", 0.0)),
+                )
+            ),
+            dtype=np.float64,
+            count=count * 6,
+        ).reshape(count, 6)
+        constants = np.array([body_constants(lifeform).row() for lifeform in lifeforms])
+        (
+            mass,
+            buoyancy_volume,
+            buoyant_bias,
+            base_drag,
+            grip_multiplier,
+            ballast_grip,
+            buoyant_slip,
+            fin_lift,
+            hover,
+        ) = constants.T
+        x, y, depth, vx, vy, y_direction = state.T
+
+        density, fluid_drag, current_x, current_y = self.currents_at(depth)
+        gravity = self.gravity
+        buoyancy_acc = density * buoyancy_volume * gravity / mass + buoyant_bias * gravity * 0.25
+        drag_scale = (fluid_drag + base_drag) / np.maximum(1.0, mass)
+        vertical = (
+            gravity
+            - buoyancy_acc
+            - vy * np.clip(ballast_grip, 0.0, 0.6)
+            + vy * np.clip(buoyant_slip * 0.5, 0.0, 0.4)
+            + fin_lift * np.clip(y_direction * hover, -1.0, 1.0) / mass
+        )
+        ax = -vx * drag_scale + (current_x - vx) * grip_multiplier
+        ay = -vy * drag_scale + (current_y - vy) * grip_multiplier + vertical
+        if thrusts is not None:
+            thrust = np.asarray(thrusts, dtype=np.float64).reshape(count, 2)
+            ax = ax + thrust[:, 0]
+            ay = ay + thrust[:, 1]
+        vx = vx + ax * dt
+        vy = vy + ay * dt
+
+        limit = np.asarray(max_speeds, dtype=np.float64)
+        speed = np.hypot(vx, vy)
+        scale = np.where(speed > limit, limit / np.where(speed > 0.0, speed, 1.0), 1.0)
+        vx *= scale
+        vy *= scale
+
+        for lifeform, new_vx, new_vy in zip(lifeforms, vx.tolist(), vy.tolist()):
+            lifeform.velocity.update(new_vx, new_vy)
+        next_x = (x + vx * dt).tolist()
+        next_y = (y + vy * dt).tolist()
+        return list(zip(next_x, next_y)), list(zip(current_x.tolist(), current_y.tolist()))
@@ -9,6 +9,7 @@ from typing import List, Sequence, Tuple
 import pygame
 from pygame.math import Vector2
 
+from ..systems import rng as random_streams
 from .types import Barrier, BiomeRegion, WaterBody, WeatherPattern
 
 Color = Tuple[int, int, int]
@@ -36,7 +37,7 @@ class RadVentField:
     pulse_speed: float
     mutation_bonus: float
     color: Color = (255, 229, 128)
-    phase: float = field(default_factory=lambda: random.random() * math.tau)
+    phase: float = field(default_factory=lambda: random_streams.stream("world").random() * math.tau)
     intensity: float = 0.0
 
     def update(self, time_seconds: float) -> None:
@@ -90,7 +91,9 @@ class BubbleColumn:
                 alive.append((position, velocity, radius))
         self.bubbles = alive[-80:]
 
-    def draw(self, surface: pygame.Surface, *, offset: Tuple[int, int] = (0, 0)) -> None:
+    def draw(
+        self, surface: pygame.Surface, *, offset: Tuple[int, int] = (0, 0), scale: float = 1.0
+    ) -> None:
         if not self.bubbles:
             return
         for position, _, radius in self.bubbles:
@@ -98,10 +101,10 @@ class BubbleColumn:
                 surface,
                 self.color,
                 (
-                    int(position.x) - offset[0],
-                    int(position.y) - offset[1],
+                    int((int(position.x) - offset[0]) * scale),
+                    int((int(position.y) - offset[1]) * scale),
                 ),
-                max(1, int(radius)),
+                max(1, int(radius * scale)),
                 width=1,
             )
 
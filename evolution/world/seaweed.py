@@ -11,7 +11,9 @@ import pygame
 from pygame.math import Vector2
 
 from ..config import settings
+from ..systems import rng as random_streams
 from .moss_dna import MossDNA, ensure_dna_for_cells, random_moss_dna
+from .occupancy import VegetationOccupancy
 
 GridCell = Tuple[int, int]
 
@@ -92,10 +94,11 @@ class SeaweedStrand:
     _offset: Vector2 = field(init=False, repr=False)
     _base_rect: pygame.Rect = field(init=False, repr=False)
     _sway_phase: float = field(init=False, repr=False)
+    _occupancy: Optional[VegetationOccupancy] = field(init=False, repr=False, default=None)
 
     def __post_init__(self) -> None:
         raw_cells = self.cells
-        self._rng = random.Random()
+        self._rng = random_streams.spawn("seaweed")
         if isinstance(raw_cells, Mapping):
             cell_map: Dict[GridCell, SeaweedCellState] = {}
             for cell, dna in raw_cells.items():
@@ -201,13 +204,21 @@ class SeaweedStrand:
         self.x = float(self.rect.x)
         self.y = float(self.rect.y)
 
-    def draw(self, surface: pygame.Surface, *, offset: Tuple[int, int] = (0, 0)) -> None:
+    def current_surface(self) -> Optional[pygame.Surface]:
+        """The strand image at world size, redrawn first if cells changed."""
+
         if not self.cells:
-            return
+            return None
         if self._dirty:
             self._rebuild_surface()
+        return self.surface
+
+    def draw(self, surface: pygame.Surface, *, offset: Tuple[int, int] = (0, 0)) -> None:
+        image = self.current_surface()
+        if image is None:
+            return
         surface.blit(
-            self.surface,
+            image,
             (self.rect.x - int(offset[0]), self.rect.y - int(offset[1])),
         )
 
@@ -294,6 +305,8 @@ class SeaweedStrand:
             state = self.cells.pop(cell, None)
             if state is None:
                 continue
+            if self._occupancy is not None:
+                self._occupancy.release(cell)
             consumed += state.nutrition
             removed += 1
             samples.append(ConsumptionSample(state.dna, state.nutrition, state.alive))
@@ -365,7 +378,7 @@ def create_initial_strands(
     max_cells: int = STRAND_MAX_LENGTH,
     rng: Optional[random.Random] = None,
 ) -> List[SeaweedStrand]:
-    rng = rng or random.Random()
+    rng = rng or random_streams.stream("seaweed")
     strands: List[SeaweedStrand] = []
     occupied: Set[GridCell] = set()
     for _ in range(count):
@@ -393,7 +406,7 @@ def create_strand_from_brush(
     density: float = 0.85,
     rng: Optional[random.Random] = None,
 ) -> Optional[SeaweedStrand]:
-    rng = rng or random.Random()
+    rng = rng or random_streams.stream("seaweed")
     radius_px = max(SeaweedStrand.CELL_SIZE, int(radius_px))
     cx = max(0, min(int(center[0]), world.width - 1))
     cy = max(0, min(int(center[1]), world.height - 1))
@@ -433,7 +446,7 @@ def _generate_seed_cells(
     rng: Optional[random.Random] = None,
     allowed_biomes: Optional[Set[str]] = None,
 ) -> Optional[Set[GridCell]]:
-    rng = rng or random.Random()
+    rng = rng or random_streams.stream("seaweed")
     cell_size = SeaweedStrand.CELL_SIZE
     attempts = 0
     seed_mask: Optional[pygame.Rect] = None
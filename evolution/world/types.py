@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import random
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
 import pygame
 
+from ..systems import rng as random_streams
+
 
 Color = Tuple[int, int, int]
 
@@ -25,7 +26,7 @@ class WeatherPattern:
     duration_range: Tuple[int, int] = (15000, 30000)
 
     def random_duration(self) -> int:
-        return random.randint(*self.duration_range)
+        return random_streams.stream("weather").randint(*self.duration_range)
 
 
 @dataclass
@@ -63,7 +64,7 @@ class BiomeRegion:
 
     def update_weather(self, now_ms: int) -> None:
         if self.active_weather is None or now_ms >= self.weather_expires_at:
-            self.active_weather = random.choice(self.weather_patterns)
+            self.active_weather = random_streams.stream("weather").choice(self.weather_patterns)
             self.weather_expires_at = now_ms + self.active_weather.random_duration()
 
     def contains(self, x: float, y: float) -> bool:
@@ -13,6 +13,8 @@ GridCell = Tuple[int, int]
 
 from .moss_dna import MossDNA, average_dna, ensure_dna_for_cells, random_moss_dna
 from ..config import settings
+from ..systems import rng as random_streams
+from .occupancy import VegetationOccupancy
 from .seaweed import SeaweedCellState, SeaweedStrand, create_initial_strands, create_strand_from_brush
 
 
@@ -116,10 +118,18 @@ class MossCluster:
     _growth_timer: int = field(init=False, repr=False)
     _global_growth_modifier: float = field(init=False, repr=False)
     _rng: random.Random = field(init=False, repr=False)
+    _occupancy: Optional[VegetationOccupancy] = field(init=False, repr=False, default=None)
+    # Incremental oxygen tracking against ``_occupancy`` (see
+    # ``_update_cell_life_state``)
+    _oxygen_dirty: Set[GridCell] = field(init=False, repr=False, default_factory=set)
+    _suffocating: Set[GridCell] = field(init=False, repr=False, default_factory=set)
+    _oxygen_source: Optional[VegetationOccupancy] = field(init=False, repr=False, default=None)
+    _oxygen_cursor: int = field(init=False, repr=False, default=0)
+    _oxygen_epoch: int = field(init=False, repr=False, default=-1)
 
     def __post_init__(self) -> None:
         raw_cells = self.cells
-        self._rng = random.Random()
+        self._rng = random_streams.spawn("vegetation")
         if isinstance(raw_cells, Mapping):
             cell_map: Dict[GridCell, MossCellState] = {}
             for cell, dna in raw_cells.items():
@@ -251,12 +261,20 @@ class MossCluster:
 
         self._dirty = False
 
-    def draw(self, surface: pygame.Surface, *, offset: Tuple[int, int] = (0, 0)) -> None:
+    def current_surface(self) -> Optional[pygame.Surface]:
+        """The cluster image at world size, redrawn first if cells changed."""
+
         if not self.cells:
-            return
+            return None
         if self._dirty:
             self._rebuild_surface()
-        surface.blit(self.surface, (self.rect.x - offset[0], self.rect.y - offset[1]))
+        return self.surface
+
+    def draw(self, surface: pygame.Surface, *, offset: Tuple[int, int] = (0, 0)) -> None:
+        image = self.current_surface()
+        if image is None:
+            return
+        surface.blit(image, (self.rect.x - offset[0], self.rect.y - offset[1]))
 
     # ------------------------------------------------------------------
     # Resource & regrowth
@@ -319,6 +337,8 @@ class MossCluster:
             state = self.cells.pop(cell, None)
             if state is None:
                 continue
+            if self._occupancy is not None:
+                self._occupancy.release(cell)
             nutrition = state.nutrition
             consumed += nutrition
             removed += 1
@@ -365,6 +385,8 @@ class MossCluster:
         if new_cell in self.cells:
             return
         self.cells[new_cell] = MossCellState(self._create_offspring_dna(new_cell))
+        if self._occupancy is not None:
+            self._occupancy.claim(new_cell)
         self._recalculate_aggregates()
         self.set_size()
 
@@ -397,6 +419,11 @@ class MossCluster:
     def _is_occupied(
         self, cell: GridCell, world: "World", others: Sequence["MossCluster"]
     ) -> bool:
+        occupancy = self._occupancy
+        if occupancy is not None and occupancy is getattr(world, "vegetation_occupancy", None):
+            # Registered plants share the world bitmap (barriers pre-marked)
+            return occupancy.is_occupied(cell)
+
         if cell in self.cells:
             return True
 
@@ -420,13 +447,76 @@ class MossCluster:
     def _update_cell_life_state(
         self, world: "World", others: Sequence["MossCluster"]
     ) -> bool:
+        occupancy = self._occupancy
+        if occupancy is None or occupancy is not getattr(world, "vegetation_occupancy", None):
+            changed = False
+            for cell, state in self.cells.items():
+                has_oxygen = self._cell_has_oxygen(cell, world, others)
+                if state.apply_oxygen_state(has_oxygen):
+                    changed = True
+            return changed
+
+        self._collect_oxygen_frontier(occupancy)
         changed = False
-        for cell, state in self.cells.items():
-            has_oxygen = self._cell_has_oxygen(cell, world, others)
-            if state.apply_oxygen_state(has_oxygen):
+        cells = self.cells
+        suffocating = self._suffocating
+
+        # Only cells whose neighbourhood changed can gain or lose oxygen
+        for cell in self._oxygen_dirty:
+            state = cells.get(cell)
+            if state is None:
+                suffocating.discard(cell)
+                continue
+            if self._cell_has_oxygen(cell, world, others):
+                suffocating.discard(cell)
+                if state.apply_oxygen_state(True):
+                    changed = True
+            else:
+                suffocating.add(cell)
+        self._oxygen_dirty.clear()
+
+        # Living cells without oxygen keep counting deprivation frames; once
+        # dead they stay dead until their neighbourhood changes again.
+        for cell in list(suffocating):
+            state = cells.get(cell)
+            if state is None or not state.alive:
+                suffocating.discard(cell)
+                continue
+            if state.apply_oxygen_state(False):
                 changed = True
         return changed
 
+    def _collect_oxygen_frontier(self, occupancy: VegetationOccupancy) -> None:
+        """Mark cells next to occupancy changes since the last evaluation."""
+
+        if self._oxygen_source is not occupancy or self._oxygen_epoch != occupancy.blocked_epoch:
+            changes = None
+        else:
+            changes = occupancy.changes_since(self._oxygen_cursor)
+        self._oxygen_source = occupancy
+        self._oxygen_epoch = occupancy.blocked_epoch
+        self._oxygen_cursor = occupancy.journal_end
+
+        if changes is None:
+            self._oxygen_dirty.update(self.cells)
+            return
+
+        cells = self.cells
+        dirty = self._oxygen_dirty
+        size = self.CELL_SIZE
+        min_gx = self.rect.left // size - 1
+        max_gx = self.rect.right // size
+        min_gy = self.rect.top // size - 1
+        max_gy = self.rect.bottom // size
+        for gx, gy in changes:
+            if gx < min_gx or gx > max_gx or gy < min_gy or gy > max_gy:
+                continue
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    neighbor = (gx + dx, gy + dy)
+                    if neighbor in cells:
+                        dirty.add(neighbor)
+
     def _cell_has_oxygen(
         self, cell: GridCell, world: "World", others: Sequence["MossCluster"]
     ) -> bool:
@@ -559,7 +649,7 @@ def _generate_seed_cells(
     rng: Optional[random.Random] = None,
     allowed_biomes: Optional[Set[str]] = None,
 ) -> Optional[Set[GridCell]]:
-    rng = rng or random.Random()
+    rng = rng or random_streams.stream("vegetation")
     cell_size = MossCluster.CELL_SIZE
     max_attempts = 240
     attempts = 0
@@ -653,7 +743,7 @@ def create_cluster_from_brush(
 ) -> Optional[MossCluster]:
     """Build a moss cluster constrained to a circular brush on the grid."""
 
-    rng = rng or random.Random()
+    rng = rng or random_streams.stream("vegetation")
     radius_px = max(MossCluster.CELL_SIZE, int(radius_px))
     cx = max(0, min(int(center[0]), world.width - 1))
     cy = max(0, min(int(center[1]), world.height - 1))
@@ -700,7 +790,7 @@ def create_initial_clusters(
     max_cells: int = 48,
     rng: Optional[random.Random] = None,
 ) -> List[MossCluster]:
-    rng = rng or random.Random()
+    rng = rng or random_streams.stream("vegetation")
     clusters: List[MossCluster] = []
     occupied: Set[GridCell] = set()
 
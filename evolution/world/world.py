@@ -3,18 +3,23 @@ from __future__ import annotations
 
 import math
 import random
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import pygame
 from pygame.math import Vector2
 
 from ..config import settings
 from ..rendering.ocean_renderer import OceanRenderer  # ⬅️ NIEUW
+from ..systems import rng as random_streams
 
+from .collision_index import RectGridIndex
+from .occupancy import VegetationOccupancy
 from .ocean_physics import OceanPhysics
 from .ocean_world import BubbleColumn, DepthLayer, OceanBlueprint, RadVentField, build_ocean_blueprint
 from .types import Barrier, BiomeRegion, WaterBody, WeatherPattern
 
+_SPAWN_RNG = random_streams.stream("world")
+
 
 class World:
     def __init__(
@@ -42,14 +47,32 @@ class World:
         self._label_font: Optional[pygame.font.Font] = None
         self._time_seconds: float = 0.0
         self._layer_lookup: List[Tuple[int, int, DepthLayer]] = []
-
-        # 🌊 Nieuwe renderer voor de volledige oceaanachtergrond
-        self._renderer = OceanRenderer(self.width, self.height)
+        self._barrier_index = RectGridIndex()
+        self._water_index = RectGridIndex()
+        self.vegetation_occupancy = VegetationOccupancy(self.width, self.height)
+        # Scaled + ocean-enriched effects per (biome, ocean depth row). Cleared
+        # when weather, weather intensity, the ocean table or the layout change.
+        self._environment_cache: Dict[
+            Tuple[int, int], Tuple[Optional[BiomeRegion], Dict[str, float | int | str]]
+        ] = {}
+        self._environment_intensity: float = 1.0
+        self._environment_ocean_version: int = -1
+        self._environment_weather: List[Optional[WeatherPattern]] = []
+
+        # 🌊 Nieuwe renderer voor de volledige oceaanachtergrond (lazy, zodat
+        # headless runs nooit een display of surfaces nodig hebben)
+        self._ocean_renderer: Optional[OceanRenderer] = None
 
         self._last_update_ms: Optional[int] = None
         self._bubble_rng = random.Random(4242)
         self._generate()
 
+    @property
+    def _renderer(self) -> OceanRenderer:
+        if self._ocean_renderer is None:
+            self._ocean_renderer = OceanRenderer(self.width, self.height)
+        return self._ocean_renderer
+
     @property
     def static_background(self) -> Optional[pygame.Surface]:
         """Return the cached static background surface."""
@@ -58,6 +81,12 @@ class World:
 
     def set_environment_modifiers(self, modifiers: Dict[str, float]) -> None:
         self.environment_modifiers = modifiers
+        self.invalidate_environment_cache()
+
+    def invalidate_environment_cache(self) -> None:
+        """Drop cached environment effects, e.g. after repainting biomes."""
+
+        self._environment_cache.clear()
 
     def set_world_type(self, world_type: Optional[str]) -> None:
         # De oceaanwereld is de enige beschikbare kaart en fungeert als
@@ -77,8 +106,12 @@ class World:
         self.rad_vents = list(blueprint.vents)
         self.bubble_columns = list(blueprint.bubble_columns)
         self.ocean = OceanPhysics(self.width, self.height - settings.OCEAN_SURFACE_Y, surface_y=settings.OCEAN_SURFACE_Y)
-        self._background_surface = self._render_background()
+        self._background_surface = None
         self._rebuild_layer_lookup()
+        # Plants re-register through bootstrap.seed_vegetation after a rebuild
+        self.vegetation_occupancy = VegetationOccupancy(self.width, self.height)
+        self._rebuild_collision_index()
+        self.invalidate_environment_cache()
         self._last_update_ms = None
 
     def regenerate(self) -> None:
@@ -152,6 +185,7 @@ class World:
         *,
         offset: Tuple[int, int] = (0, 0),
         viewport: Optional[pygame.Rect] = None,
+        scale: float = 1.0,
     ) -> None:
         if not self.layers:
             return
@@ -164,8 +198,8 @@ class World:
             label = f"{layer.biome.name} – {weather}"
             text = self._label_font.render(label, True, (220, 235, 255))
             position = (
-                24 - offset[0],
-                layer.biome.rect.centery - text.get_height() // 2 - offset[1],
+                int((24 - offset[0]) * scale),
+                int((layer.biome.rect.centery - offset[1]) * scale) - text.get_height() // 2,
             )
             surface.blit(text, position)
 
@@ -201,6 +235,16 @@ class World:
         for biome in self.biomes:
             biome.update_weather(now_ms)
 
+        weather = [biome.active_weather for biome in self.biomes]
+        if (
+            self.ocean.table_version != self._environment_ocean_version
+            or len(weather) != len(self._environment_weather)
+            or any(a is not b for a, b in zip(weather, self._environment_weather))
+        ):
+            self._environment_weather = weather
+            self._environment_ocean_version = self.ocean.table_version
+            self.invalidate_environment_cache()
+
     def draw_static_region(self, surface: pygame.Surface, region: pygame.Rect) -> None:
         """Render static layers for a region into ``surface``."""
 
@@ -224,11 +268,19 @@ class World:
             pygame.draw.rect(surface, barrier.color, local_rect)
 
     def draw_dynamic_layers(
-        self, surface: pygame.Surface, viewport: pygame.Rect, offset: Tuple[int, int]
+        self,
+        surface: pygame.Surface,
+        viewport: pygame.Rect,
+        offset: Tuple[int, int],
+        scale: float = 1.0,
     ) -> None:
-        """Draw dynamic overlays that should be re-rendered each frame."""
+        """Draw dynamic overlays that should be re-rendered each frame.
+
+        ``scale`` maps world pixels to ``surface`` pixels; layer labels keep
+        their font size.
+        """
 
-        self._renderer.draw_waves_region(surface, self._time_seconds, viewport, offset)
+        self._renderer.draw_waves_region(surface, self._time_seconds, viewport, offset, scale)
 
         for vent in self.rad_vents:
             radius = max(20, vent.radius)
@@ -247,6 +299,7 @@ class World:
                 color=vent.color,
                 intensity=vent.intensity,
                 offset=offset,
+                scale=scale,
             )
 
         for column in self.bubble_columns:
@@ -257,9 +310,9 @@ class World:
                 column.height,
             )
             if col_rect.colliderect(viewport):
-                column.draw(surface, offset=offset)
+                column.draw(surface, offset=offset, scale=scale)
 
-        self._draw_layer_labels(surface, offset=offset, viewport=viewport)
+        self._draw_layer_labels(surface, offset=offset, viewport=viewport, scale=scale)
 
     def _rebuild_layer_lookup(self) -> None:
         """Cache y-ranges for each layer for fast biome queries."""
@@ -339,7 +392,26 @@ class World:
         return self._layer_lookup[-1][2]
 
     def get_environment_context(self, x: float, y: float) -> Tuple[Optional[BiomeRegion], Dict[str, float | int | str]]:
+        """Return the biome at ``(x, y)`` and its scaled environment effects.
+
+        Effects are cached per biome and ocean depth row, so the returned
+        dictionary is shared between callers and must not be modified.
+        """
+
+        intensity = 1.0
+        if self.environment_modifiers is not None:
+            intensity = float(self.environment_modifiers.get("weather_intensity", 1.0))
+        if intensity != self._environment_intensity:
+            # Events and the settings slider edit the modifier dict in place
+            self._environment_intensity = intensity
+            self._environment_cache.clear()
+
         biome = self.get_biome_at(x, y)
+        key = (id(biome), self.ocean.row_index(y))
+        cached = self._environment_cache.get(key)
+        if cached is not None:
+            return cached
+
         effects: Dict[str, float | int | str]
         if biome:
             effects = biome.get_effects()
@@ -354,9 +426,6 @@ class World:
                 "precipitation": "helder",
                 "weather_name": "Stabiel",
             }
-        intensity = 1.0
-        if self.environment_modifiers is not None:
-            intensity = float(self.environment_modifiers.get("weather_intensity", 1.0))
         if intensity != 1.0:
             movement = float(effects.get("movement", 1.0))
             hunger = float(effects.get("hunger", 1.0))
@@ -369,7 +438,9 @@ class World:
             effects["energy"] = 1.0 + (energy - 1.0) * intensity
             effects["health"] = 0.0 + health * intensity
         self.ocean.enrich_effects(effects, y)
-        return biome, effects
+        cached = (biome, effects)
+        self._environment_cache[key] = cached
+        return cached
 
     def get_mutation_multiplier(self, x: float, y: float) -> float:
         """Return a distance-weighted mutation multiplier based on nearby vents."""
@@ -425,6 +496,19 @@ class World:
         position = Vector2(lifeform.x, lifeform.y) + thrust * dt
         return position, None
 
+    def apply_fluid_dynamics_batch(
+        self, lifeforms: Sequence[object], dt: float, *, max_speeds: Sequence[float]
+    ) -> Tuple[List[Tuple[float, float]], Optional[List[Tuple[float, float]]]]:
+        """Batched :meth:`apply_fluid_dynamics` without extra thrust.
+
+        Returns the attempted positions and, when an ocean is present, the
+        sampled current at every body.
+        """
+
+        if self.ocean:
+            return self.ocean.integrate_bodies(lifeforms, dt, max_speeds=max_speeds)
+        return [(lifeform.x, lifeform.y) for lifeform in lifeforms], None
+
     def get_regrowth_modifier(self, x: float, y: float) -> float:
         _, effects = self.get_environment_context(x, y)
         return float(effects["regrowth"])
@@ -441,14 +525,33 @@ class World:
         _, effects = self.get_environment_context(x, y)
         return float(effects["health"])
 
+    def _rebuild_collision_index(self) -> None:
+        """Bucket barrier and water rects into the static broad-phase grids."""
+
+        self._barrier_index = RectGridIndex(barrier.rect for barrier in self.barriers)
+        self._water_index = RectGridIndex(
+            segment for water in self.water_bodies for segment in water.segments
+        )
+        self.vegetation_occupancy.reset_blocked(
+            [barrier.rect for barrier in self.barriers]
+            + [segment for water in self.water_bodies for segment in water.segments]
+        )
+
+    def add_barrier(self, barrier: Barrier) -> None:
+        """Add a barrier (e.g. from the editor) and index it immediately."""
+
+        self.barriers.append(barrier)
+        self._barrier_index.add(barrier.rect)
+        self.vegetation_occupancy.mark_blocked(barrier.rect)
+
     def is_blocked(self, rect: pygame.Rect, include_water: bool = True) -> bool:
-        for barrier in self.barriers:
-            if rect.colliderect(barrier.rect):
-                return True
+        if len(self._barrier_index) != len(self.barriers):
+            # Barriers were edited directly on the list; reindex once
+            self._rebuild_collision_index()
+        if self._barrier_index.collides(rect):
+            return True
         if include_water:
-            for water in self.water_bodies:
-                if water.collides(rect):
-                    return True
+            return self._water_index.collides(rect)
         return False
 
     def resolve_entity_movement(
@@ -486,15 +589,15 @@ class World:
         biome_padding: int = 0,
     ) -> Tuple[float, float, Optional[BiomeRegion]]:
         attempts = 0
-        x = random.randint(0, max(1, self.width - width))
-        y = random.randint(0, max(1, self.height - height))
+        x = _SPAWN_RNG.randint(0, max(1, self.width - width))
+        y = _SPAWN_RNG.randint(0, max(1, self.height - height))
         avoid_positions = avoid_positions or []
 
         while attempts < 260:
             if preferred_biome is None and not self.biomes:
                 biome = None
             else:
-                biome = preferred_biome or random.choice(self.biomes)
+                biome = preferred_biome or _SPAWN_RNG.choice(self.biomes)
             if biome:
                 spawn_rect = biome.rect.inflate(-biome_padding, -biome_padding)
                 if spawn_rect.width <= 0 or spawn_rect.height <= 0:
@@ -502,8 +605,8 @@ class World:
             else:
                 spawn_rect = pygame.Rect(0, 0, self.width, self.height)
 
-            x = random.randint(spawn_rect.left, max(spawn_rect.left, spawn_rect.right - width))
-            y = random.randint(spawn_rect.top, max(spawn_rect.top, spawn_rect.bottom - height))
+            x = _SPAWN_RNG.randint(spawn_rect.left, max(spawn_rect.left, spawn_rect.right - width))
+            y = _SPAWN_RNG.randint(spawn_rect.top, max(spawn_rect.top, spawn_rect.bottom - height))
             candidate = pygame.Rect(x, y, width, height)
 
             if candidate.right > self.width or candidate.bottom > self.height:
@@ -0,0 +1,55 @@
+"""Tests for the benchmark scenarios and baseline comparison."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("pygame")
+
+from benchmarks.run import compare, run_scenario
+from benchmarks.scenarios import scenario_engine
+
+
+def test_compare_flags_only_regressions_beyond_tolerance():
+    baseline = {
+        "sparse_ocean": {"ticks_per_second": 100.0, "tick_p95_ms": 10.0, "peak_rss_mb": 200.0},
+        "dense_reef": {"ticks_per_second": 5.0},
+    }
+    results = {
+        "sparse_ocean": {"ticks_per_second": 80.0, "tick_p95_ms": 10.5, "peak_rss_mb": 260.0},
+        "dense_reef": {"ticks_per_second": 4.5},
+        "moss_saturated": {"ticks_per_second": 1.0},
+    }
+
+    regressions = compare(results, baseline, tolerance=0.15)
+
+    assert len(regressions) == 2
+    assert regressions[0].startswith("sparse_ocean.ticks_per_second")
+    assert regressions[1].startswith("sparse_ocean.peak_rss_mb")
+
+
+def _snapshot(name):
+    with scenario_engine(name, seed=11, lifeforms=9) as engine:
+        engine.step(1.0 / 30.0)
+        return (
+            [(round(l.x, 6), round(l.y, 6)) for l in engine.state.lifeforms],
+            len(engine.state.carcasses),
+            len(engine.state.plants),
+        )
+
+
+@pytest.mark.parametrize("name", ["carcass_die_off", "creator_swarm"])
+def test_scenarios_are_reproducible(name):
+    assert _snapshot(name) == _snapshot(name)
+
+
+def test_run_scenario_reports_metrics():
+    result = run_scenario(
+        "carcass_die_off", ticks=2, warmup=0, alloc_ticks=1, phase_ticks=2, lifeforms=9
+    )
+
+    assert result["ticks"] == 2
+    assert result["ticks_per_second"] > 0
+    assert result["alloc_kb_per_tick"] > 0
+    assert "carcass_update" in result["phases_ms"]
+    assert "thrust_mixer" in result["phases_ms"]
@@ -0,0 +1,94 @@
+"""Tests for reach-bounded biomass targeting in :mod:`evolution.entities.feeding`."""
+
+from __future__ import annotations
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from evolution.entities import feeding
+from evolution.entities.lifeform import Lifeform
+from evolution.systems.spatial_hash import SpatialHashGrid
+
+
+def _body(x, y, width, height, **extra):
+    return SimpleNamespace(
+        x=x, y=y, width=width, height=height, rect=pygame.Rect(int(x), int(y), width, height), **extra
+    )
+
+
+def _creature(state, x, y, width=12, height=8, reach=10.0, vision=200.0):
+    creature = _body(x, y, width, height, state=state, reach=reach, vision=vision, health_now=50.0)
+    creature._plant_feeding_radius = lambda plant: Lifeform._plant_feeding_radius(creature, plant)
+    return creature
+
+
+def _populate(seed=3, count=120, extent=400):
+    rng = random.Random(seed)
+    state = SimpleNamespace(plants=[], carcasses=[], lifeforms=[], spatial_grid=None)
+    for _ in range(count):
+        state.lifeforms.append(
+            _creature(state, rng.uniform(0, extent), rng.uniform(0, extent), rng.randint(4, 30), rng.randint(4, 20))
+        )
+    for _ in range(count // 3):
+        size = rng.randint(8, 64)
+        state.plants.append(
+            _body(rng.randint(0, extent), rng.randint(0, extent), size, size // 2, resource=rng.choice([0, 5]))
+        )
+        state.carcasses.append(_body(rng.randint(0, extent), rng.randint(0, extent), 10, 6, resource=3))
+    return state
+
+
+def _signature(targets):
+    return [(id(t.target), t.tag, round(t.distance, 6)) for t in targets]
+
+
+def _brute_force(lifeform):
+    """Every target within vision and bite reach, nearest K per category."""
+
+    state = lifeform.state
+    _, carcass_reach, creature_reach = feeding._bite_reach(lifeform)
+    per_kind = []
+    for entities, tag, reach_of, keep in (
+        (state.plants, "plant", lifeform._plant_feeding_radius, lambda e: e.resource > 0),
+        (state.carcasses, "meat", lambda _: carcass_reach, lambda e: e.resource > 0),
+        (state.lifeforms, "meat", lambda _: creature_reach, lambda e: e is not lifeform and e.health_now > 0),
+    ):
+        found = []
+        for entity in entities:
+            if not keep(entity):
+                continue
+            cx, cy = entity.rect.center
+            distance = ((cx - lifeform.x) ** 2 + (cy - lifeform.y) ** 2) ** 0.5
+            if distance <= min(lifeform.vision, reach_of(entity)):
+                found.append((distance, id(entity), tag))
+        found.sort()
+        per_kind.extend(found[: feeding.BITE_TARGETS_PER_KIND])
+    return sorted((ident, tag, round(distance, 6)) for distance, ident, tag in per_kind)
+
+
+def test_grid_query_matches_full_scan():
+    state = _populate()
+    expected = {id(lf): _brute_force(lf) for lf in state.lifeforms}
+
+    grid = SpatialHashGrid(cell_size=64.0)
+    grid.sync(state.lifeforms, state.plants, state.carcasses)
+    state.spatial_grid = grid
+
+    for lifeform in state.lifeforms:
+        assert sorted(_signature(feeding._reachable_targets(lifeform))) == expected[id(lifeform)]
+
+
+def test_keeps_nearest_targets_per_kind():
+    state = SimpleNamespace(plants=[], carcasses=[], lifeforms=[], spatial_grid=None)
+    seeker = _creature(state, 100.0, 100.0, reach=40.0)
+    crowd = [_creature(state, 100.0 + offset, 100.0) for offset in (30.0, 6.0, 18.0, 12.0, 24.0)]
+    state.lifeforms = [seeker, *crowd]
+
+    targets = feeding._reachable_targets(seeker)
+
+    assert [t.target for t in targets] == [crowd[1], crowd[3], crowd[2]]
+    assert [t.distance for t in targets] == sorted(t.distance for t in targets)
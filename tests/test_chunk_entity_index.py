@@ -0,0 +1,60 @@
+"""Tests for renderer culling through the shared spatial index."""
+
+from __future__ import annotations
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from evolution.simulation.world.chunks import ChunkManager
+from evolution.systems.spatial_hash import SpatialHashGrid
+
+
+def _entity(rng, extent, max_size):
+    width = rng.randint(2, max_size)
+    height = rng.randint(2, max_size)
+    x = rng.uniform(0, extent)
+    y = rng.uniform(0, extent)
+    return SimpleNamespace(x=x, y=y, width=width, height=height, rect=pygame.Rect(int(x), int(y), width, height))
+
+
+def _populated_grid(seed=4, extent=3000):
+    rng = random.Random(seed)
+    lifeforms = [_entity(rng, extent, 60) for _ in range(300)]
+    plants = [_entity(rng, extent, 160) for _ in range(80)]
+    carcasses = [_entity(rng, extent, 30) for _ in range(40)]
+    grid = SpatialHashGrid(cell_size=200.0)
+    grid.sync(lifeforms, plants, carcasses)
+    return grid, {"plants": plants, "carcasses": carcasses, "lifeforms": lifeforms}
+
+
+def test_entities_in_rect_covers_every_overlap():
+    grid, entities = _populated_grid()
+    rng = random.Random(9)
+
+    for _ in range(50):
+        view = pygame.Rect(rng.randint(-200, 2800), rng.randint(-200, 2800), 640, 360)
+        found = grid.entities_in_rect(view)
+        for kind, items in entities.items():
+            ids = {id(item) for item in found[kind]}
+            assert all(id(item) in ids for item in items if item.rect.colliderect(view))
+
+
+def test_chunk_manager_reads_live_grid():
+    grid, entities = _populated_grid()
+    manager = ChunkManager(chunk_size=256)
+    view = pygame.Rect(1000, 1000, 400, 300)
+
+    assert manager.entities_in_rect(view) == {"plants": [], "carcasses": [], "lifeforms": []}
+
+    manager.set_entity_index(grid)
+    newcomer = SimpleNamespace(x=1100.0, y=1100.0, width=8, height=8, rect=pygame.Rect(1100, 1100, 8, 8))
+    grid.add_lifeform(newcomer)
+    assert newcomer in manager.entities_in_rect(view)["lifeforms"]
+
+    victim = next(item for item in entities["lifeforms"] if item.rect.colliderect(view))
+    grid.remove_lifeform(victim)
+    assert victim not in manager.entities_in_rect(view)["lifeforms"]
@@ -0,0 +1,60 @@
+"""Tests for the static barrier broad-phase."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from evolution.world.collision_index import RectGridIndex
+from evolution.world.types import Barrier
+from evolution.world.world import World
+
+
+def _random_rect(rng, extent=3000, size=300):
+    return pygame.Rect(
+        rng.randint(-100, extent),
+        rng.randint(-100, extent),
+        rng.randint(0, size),
+        rng.randint(0, size),
+    )
+
+
+def test_collides_matches_linear_scan():
+    rng = random.Random(12)
+    rects = [_random_rect(rng) for _ in range(80)]
+    index = RectGridIndex(rects, cell_size=128)
+
+    for _ in range(500):
+        probe = _random_rect(rng, size=60)
+        expected = probe.collidelist(rects) != -1
+        assert index.collides(probe) is expected
+        assert {id(r) for r in index.query(probe)} == {
+            id(r) for r in rects if probe.colliderect(r)
+        }
+
+
+def test_world_is_blocked_matches_barriers():
+    world = World(2000, 3000)
+    rng = random.Random(5)
+
+    for _ in range(300):
+        probe = _random_rect(rng, extent=2000, size=40)
+        expected = any(probe.colliderect(barrier.rect) for barrier in world.barriers)
+        assert world.is_blocked(probe) is expected
+
+
+def test_new_barriers_are_indexed():
+    world = World(2000, 3000)
+    probe = pygame.Rect(1000, 20, 4, 4)
+    world.barriers.clear()
+
+    assert not world.is_blocked(probe)
+
+    world.add_barrier(Barrier(pygame.Rect(995, 15, 20, 20)))
+    assert world.is_blocked(probe)
+
+    world.barriers.append(Barrier(pygame.Rect(10, 10, 5, 5)))
+    assert world.is_blocked(pygame.Rect(12, 12, 1, 1))
@@ -34,6 +34,13 @@ def test_config_file_used_when_provided(tmp_path):
     assert conf.FPS == 15
 
 
+def test_scheduler_limits_from_config(tmp_path):
+    config = _write_tmp_config(tmp_path, "max_substeps: 8\nmax_speed_budget: 0.05\n")
+    conf = settings.load_runtime_settings(args=["--config", str(config)])
+    assert conf.MAX_SUBSTEPS == 8
+    assert conf.MAX_SPEED_BUDGET == pytest.approx(0.05)
+
+
 def test_env_overrides_config(monkeypatch, tmp_path):
     config = _write_tmp_config(tmp_path, "world_width: 4000\n")
     monkeypatch.setenv("EVOLUTION_WORLD_WIDTH", "4500")
@@ -1,9 +1,14 @@
 """Tests for depth-based darkening of lifeforms."""
 
+from types import SimpleNamespace
+
 import pygame
 import pytest
 
-from evolution.rendering.draw_lifeform import _apply_depth_shading, _calculate_depth_darkness
+from evolution.config import settings
+from evolution.rendering.draw_lifeform import _calculate_depth_darkness, _depth_band
+from evolution.rendering.sprite_cache import LifeformSpriteCache
+from evolution.rendering.surface_cache import shade_surface
 
 
 class TestDepthDarkness:
@@ -54,57 +59,77 @@ class TestDepthDarkness:
 
 
 class TestDepthShading:
-    """Test the depth shading application to sprites."""
+    """Test the shading applied to cached depth variants."""
 
     def setup_method(self):
         """Initialize pygame for surface operations."""
         pygame.init()
 
-    def test_no_darkening_at_full_brightness(self):
-        """Sprite should be unchanged at full brightness."""
+    def test_full_brightness_keeps_colours(self):
+        """A full-brightness copy matches the original pixels."""
         sprite = pygame.Surface((10, 10), pygame.SRCALPHA)
         sprite.fill((255, 0, 0))  # Red
 
-        result = _apply_depth_shading(sprite, 1.0)
+        result = shade_surface(sprite, 1.0)
 
-        # Should return the original sprite without modification
-        assert result is sprite
+        # Cached variants must never alias the source sprite
+        assert result is not sprite
+        assert result.get_at((0, 0)) == sprite.get_at((0, 0))
 
     def test_complete_darkening(self):
-        """Sprite should be completely dark at 0.0 brightness."""
+        """Sprite should be black at 0.0 brightness but keep its alpha."""
         sprite = pygame.Surface((10, 10), pygame.SRCALPHA)
-        sprite.fill((255, 0, 0))  # Red
+        sprite.fill((255, 0, 0, 200))
 
-        result = _apply_depth_shading(sprite, 0.0)
+        result = shade_surface(sprite, 0.0)
 
-        # Result should be a new surface
-        assert result is not sprite
-
-        # Check that the result is significantly darker
-        # (We can't easily check exact pixel values due to blending)
         assert result.get_size() == sprite.get_size()
+        assert tuple(result.get_at((0, 0))) == (0, 0, 0, 200)
 
     def test_partial_darkening(self):
         """Sprite should be partially darkened at intermediate brightness."""
         sprite = pygame.Surface((10, 10), pygame.SRCALPHA)
-        sprite.fill((255, 0, 0))  # Red
+        sprite.fill((200, 100, 50))
 
-        result = _apply_depth_shading(sprite, 0.5)
+        result = shade_surface(sprite, 0.5)
 
-        # Result should be a new surface
-        assert result is not sprite
-        assert result.get_size() == sprite.get_size()
+        assert result.get_at((0, 0))[:3] == (100, 50, 25)
+        # The source sprite is left untouched
+        assert sprite.get_at((0, 0))[:3] == (200, 100, 50)
 
-    def test_brightness_range(self):
-        """Test various brightness levels produce different results."""
+    def test_transparent_pixels_stay_transparent(self):
+        """Shading must not paint over transparent regions."""
         sprite = pygame.Surface((10, 10), pygame.SRCALPHA)
-        sprite.fill((255, 255, 255))  # White
+        sprite.fill((0, 0, 0, 0))
+        sprite.fill((255, 255, 255), pygame.Rect(2, 2, 4, 4))
+
+        result = shade_surface(sprite, 0.25)
+
+        assert result.get_at((0, 0))[3] == 0
+        assert result.get_at((3, 3))[3] == 255
 
-        results = []
-        for brightness in [1.0, 0.75, 0.5, 0.25, 0.0]:
-            result = _apply_depth_shading(sprite, brightness)
-            results.append(result)
 
-        # All results should have the correct size
-        for result in results:
-            assert result.get_size() == (10, 10)
+class TestDepthBands:
+    """Shaded sprites are cached per quantised brightness band."""
+
+    def test_band_levels_are_shared(self):
+        assert _depth_band(0.51) == _depth_band(0.52)
+        assert _depth_band(1.0) == 1.0
+        assert _depth_band(0.995) == 1.0
+        assert _depth_band(0.0) == 0.0
+
+    def test_shaded_variant_is_cached(self, monkeypatch):
+        pygame.init()
+        monkeypatch.setattr(settings, "USE_BODYGRAPH_SIZE", True)
+        lifeform_cache = LifeformSpriteCache(budget_bytes=1024 * 1024)
+        sprite = pygame.Surface((8, 8), pygame.SRCALPHA)
+        sprite.fill((200, 100, 50, 255))
+        lifeform_cache.sprites.put(("dna", "7"), sprite)
+        lifeform = SimpleNamespace(dna_id=7)
+
+        first = lifeform_cache.get_body(lifeform, brightness=0.5)
+        second = lifeform_cache.get_body(lifeform, brightness=0.5)
+
+        assert first is second
+        assert first is not sprite
+        assert first.get_at((0, 0))[:3] == (100, 50, 25)
@@ -0,0 +1,84 @@
+"""Tests for the display-free simulation engine."""
+
+from __future__ import annotations
+
+import pytest
+
+from evolution import headless
+from evolution.config import settings
+from evolution.simulation.engine import SimulationEngine
+
+
+@pytest.fixture
+def small_runtime(monkeypatch):
+    monkeypatch.setattr(settings, "N_LIFEFORMS", 6)
+    monkeypatch.setattr(settings, "INITIAL_BASEFORM_COUNT", 1)
+    return settings.current_settings().with_updates(
+        {
+            "WORLD_WIDTH": 1600,
+            "WORLD_HEIGHT": 2000,
+            "WINDOW_WIDTH": 800,
+            "WINDOW_HEIGHT": 600,
+            "N_LIFEFORMS": 6,
+            "MAX_LIFEFORMS": 50,
+        }
+    )
+
+
+def test_build_engine_populates_state(small_runtime):
+    engine = headless.build_engine(small_runtime, seed=7)
+
+    assert isinstance(engine, SimulationEngine)
+    assert engine.state.world is not None
+    assert len(engine.state.lifeforms) == 6
+    assert engine.state.plants
+
+
+def test_step_advances_without_display(small_runtime):
+    engine = headless.build_engine(small_runtime, seed=7)
+
+    for _ in range(5):
+        stats = engine.step(1.0 / 30.0)
+
+    assert engine.tick_count == 5
+    assert engine.elapsed_ms == pytest.approx(5000.0 / 30.0)
+    assert engine.latest_stats is stats
+    assert stats["lifeform_count"] == len(engine.state.lifeforms)
+    assert engine.state.spatial_grid is not None
+
+
+def test_step_notifies_stats_listener(small_runtime):
+    engine = headless.build_engine(small_runtime, seed=1)
+    received = []
+    engine.stats_listener = received.append
+
+    engine.step(0.05)
+
+    assert received == [engine.latest_stats]
+
+
+def test_run_headless_summary(small_runtime):
+    summary = headless.run_headless(3, seed=11, dt=0.05, runtime=small_runtime)
+
+    assert summary["ticks"] == 3
+    assert summary["seed"] == 11
+    assert summary["dt"] == pytest.approx(0.05)
+    assert summary["lifeforms"] >= 0
+
+
+def _trajectory(runtime, seed, ticks=40):
+    engine = headless.build_engine(runtime, seed=seed)
+    samples = []
+    for _ in range(ticks):
+        engine.step(1.0 / 30.0)
+        samples.append(
+            [(lifeform.x, lifeform.y, lifeform.energy_now) for lifeform in engine.state.lifeforms]
+        )
+    return samples
+
+
+def test_seeded_runs_are_reproducible(small_runtime):
+    first = _trajectory(small_runtime, seed=21)
+
+    assert _trajectory(small_runtime, seed=21) == first
+    assert _trajectory(small_runtime, seed=22) != first
@@ -0,0 +1,77 @@
+"""Tests for population-level neural controller inference."""
+
+from __future__ import annotations
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from evolution.entities import ai
+from evolution.entities.neural_controller import (
+    INPUT_KEYS,
+    NeuralController,
+    PopulationBrain,
+    initialize_brain_weights,
+)
+
+np = pytest.importorskip("numpy")
+
+
+def _population(count, seed=4):
+    rng = random.Random(seed)
+    controllers = [NeuralController(initialize_brain_weights(rng)) for _ in range(count)]
+    inputs = [[rng.uniform(-1.0, 1.0) for _ in INPUT_KEYS] for _ in range(count)]
+    return controllers, inputs
+
+
+def test_batched_forward_matches_scalar_forward():
+    controllers, inputs = _population(25)
+
+    batched = PopulationBrain().forward(controllers, inputs)
+
+    for controller, x, row in zip(controllers, inputs, batched):
+        assert row == pytest.approx(controller.forward(x), abs=1e-12)
+
+
+def test_stacks_are_reused_until_members_change():
+    controllers, inputs = _population(6)
+    brain = PopulationBrain()
+
+    brain.forward(controllers, inputs)
+    stacks = brain._stacks[controllers[0].topology]
+    brain.forward(controllers, inputs)
+    assert brain._stacks[controllers[0].topology] is stacks
+
+    brain.forward(controllers[:-1], inputs[:-1])
+    assert brain._stacks[controllers[0].topology][0].shape[0] == 5
+
+
+def test_weight_change_invalidates_stack():
+    controllers, inputs = _population(3)
+    brain = PopulationBrain()
+    brain.forward(controllers, inputs)
+
+    controllers[1].set_weights(initialize_brain_weights(random.Random(99)))
+    batched = brain.forward(controllers, inputs)
+
+    assert batched[1] == pytest.approx(controllers[1].forward(inputs[1]), abs=1e-12)
+
+
+def test_empty_population():
+    assert PopulationBrain().forward([], []) == []
+
+
+def test_ensure_controller_reuses_weights_list():
+    weights = initialize_brain_weights(random.Random(1))
+    lifeform = SimpleNamespace(brain_weights=weights, _neural_controller=None)
+
+    controller = ai._ensure_controller(lifeform)
+    layers = controller.layer_matrices()
+
+    assert ai._ensure_controller(lifeform) is controller
+    assert controller.layer_matrices() is layers
+
+    lifeform.brain_weights = list(weights)
+    ai._ensure_controller(lifeform)
+    assert controller.layer_matrices() is not layers
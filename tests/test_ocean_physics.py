@@ -140,3 +140,94 @@ def test_properties_at_clamps_below_ocean_floor() -> None:
     expected_light = math.exp(-ocean.depth * fluid.layer.light_absorption)
     assert fluid.pressure == pytest.approx(expected_pressure)
     assert fluid.light == pytest.approx(expected_light)
+
+
+def _varied_body(index: int) -> PhysicsBody:
+    volume = 40.0 + index * 7.0
+    return PhysicsBody(
+        mass=volume * (0.9 + 0.03 * index),
+        center_of_mass=(0.0, 0.0),
+        moment_of_inertia=10.0,
+        volume=volume,
+        density=1.0,
+        frontal_area=30.0,
+        lateral_area=30.0,
+        dorsal_area=30.0,
+        drag_coefficient=0.2 + 0.05 * index,
+        buoyancy_volume=volume * 0.95,
+        max_thrust=50.0,
+        grip_strength=float(index * 3),
+        power_output=10.0,
+        energy_cost=5.0,
+        lift_per_fin=1.5 if index % 2 else 0.0,
+        buoyancy_offsets=(index * 2.0, (5 - index) * 1.5),
+    )
+
+
+def test_integrate_bodies_matches_per_body_integration() -> None:
+    pytest.importorskip("numpy")
+    ocean = OceanPhysics(400, 1000)
+    ocean.update(83_000)
+    depths = (-20.0, 60.0, 210.0, 480.0, 820.0, 1100.0)
+
+    def make():
+        bodies = []
+        for i, depth in enumerate(depths):
+            creature = DummyLifeform(_varied_body(i), depth)
+            creature.velocity = Vector2(10.0 - i * 4.0, 3.0 * i - 6.0)
+            creature.fin_count = 2
+            creature.y_direction = -0.5 + 0.2 * i
+            bodies.append(creature)
+        return bodies
+
+    scalar = make()
+    batched = make()
+    max_speeds = [12.0, 200.0, 200.0, 5.0, 200.0, 200.0]
+
+    expected = [
+        ocean.integrate_body(body, Vector2(), 0.05, max_speed=limit)
+        for body, limit in zip(scalar, max_speeds)
+    ]
+    positions, currents = ocean.integrate_bodies(batched, 0.05, max_speeds=max_speeds)
+
+    for (position, fluid), got, current, a, b in zip(expected, positions, currents, scalar, batched):
+        assert got == pytest.approx((position.x, position.y), abs=1e-9)
+        assert current == pytest.approx((fluid.current.x, fluid.current.y), abs=1e-9)
+        assert (b.velocity.x, b.velocity.y) == pytest.approx((a.velocity.x, a.velocity.y), abs=1e-9)
+
+
+def test_body_constants_are_cached_until_body_changes() -> None:
+    from evolution.world.ocean_physics import body_constants
+
+    creature = DummyLifeform(_varied_body(2), 100.0)
+    first = body_constants(creature)
+
+    assert body_constants(creature) is first
+
+    creature.physics_body = _varied_body(3)
+    assert body_constants(creature) is not first
+
+
+def test_properties_at_reuses_table_rows() -> None:
+    ocean = OceanPhysics(400, 1000, table_resolution=5.0)
+
+    first = ocean.properties_at(301.0)
+
+    assert ocean.properties_at(299.0) is first
+    assert ocean.properties_at(310.0) is not first
+    assert first.light == pytest.approx(math.exp(-300.0 * first.layer.light_absorption))
+
+
+def test_update_refreshes_currents_past_tolerance() -> None:
+    ocean = OceanPhysics(400, 1000, time_tolerance=0.5)
+    ocean.update(10_000)
+    before = ocean.properties_at(100.0)
+
+    ocean.update(10_200)
+    assert ocean.properties_at(100.0) is before
+
+    ocean.update(11_000)
+    refreshed = ocean.properties_at(100.0)
+    assert refreshed is not before
+    assert refreshed.current != before.current
+    assert refreshed.density == before.density
@@ -0,0 +1,100 @@
+"""Tests for the batched world overlays: polygon outlines and cached labels."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from evolution.rendering.draw_lifeform import draw_lifeform_outline, outline_corners
+from evolution.rendering.labels import LabelCache, debug_label_texts
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _pygame():
+    pygame.display.init()
+    pygame.font.init()
+    yield
+    pygame.display.quit()
+
+
+def _lifeform(angle: float = 0.0, attack: float = 100.0, defence: float = 0.0):
+    return SimpleNamespace(
+        x=40.0,
+        y=30.0,
+        width=20,
+        height=10,
+        angle=angle,
+        attack_power_now=attack,
+        defence_power_now=defence,
+    )
+
+
+def test_outline_corners_follow_the_lifeform_angle():
+    upright = outline_corners(_lifeform(), (20, 10), offset=(10, 5))
+    assert upright == [
+        pytest.approx((30.0, 25.0)),
+        pytest.approx((50.0, 25.0)),
+        pytest.approx((50.0, 35.0)),
+        pytest.approx((30.0, 35.0)),
+    ]
+
+    # pygame rotates counter-clockwise: the right-hand edge ends up on top
+    turned = outline_corners(_lifeform(angle=90.0), (20, 10), offset=(10, 5))
+    assert turned[1] == pytest.approx((35.0, 20.0))
+    xs = [x for x, _ in turned]
+    ys = [y for _, y in turned]
+    assert max(xs) - min(xs) == pytest.approx(10.0)
+    assert max(ys) - min(ys) == pytest.approx(20.0)
+
+
+def test_outline_is_drawn_directly_on_the_target():
+    surface = pygame.Surface((100, 80))
+    surface.fill((255, 255, 255))
+
+    draw_lifeform_outline(surface, _lifeform(), size=(20, 10))
+
+    red, green, blue = surface.get_at((50, 30))[:3]
+    assert red > 200 and green == 0 and blue == 0
+    assert surface.get_at((50, 35))[:3] == (255, 255, 255)
+
+
+def test_black_outline_stays_invisible():
+    surface = pygame.Surface((100, 80))
+    surface.fill((255, 255, 255))
+
+    draw_lifeform_outline(surface, _lifeform(attack=0.0), size=(20, 10))
+
+    assert surface.get_at((50, 30))[:3] == (255, 255, 255)
+
+
+def test_labels_are_rendered_once_per_distinct_text():
+    labels = LabelCache(pygame.font.Font(None, 12))
+
+    first = labels.render("42")
+    assert labels.render("42") is first
+    changed = labels.render("43")
+
+    assert changed is not first
+    stats = labels.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["entries"] == 2
+
+
+def test_debug_label_text_is_stable_between_ticks():
+    lifeform = SimpleNamespace(
+        id=7, generation=3, dna_id=12, health_now=143.6, hunger=251.2, age=88.0, reproduced_cooldown=14
+    )
+    identity, vitals = debug_label_texts(lifeform)
+
+    lifeform.health_now -= 0.4
+    lifeform.hunger += 1.5
+    lifeform.age += 0.2
+    lifeform.reproduced_cooldown -= 1
+
+    assert debug_label_texts(lifeform) == (identity, vitals)
+    assert identity == "ID: 7 gen: 3 dna_id 12 "
+    assert vitals == "health: 140 hunger: 250 age: 80 cooldown 10"
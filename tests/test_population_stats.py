@@ -0,0 +1,78 @@
+"""Tests for the incrementally maintained population statistics."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("pygame")
+
+from evolution.headless import build_engine
+from evolution.systems.stats import PopulationStats, collect_population_stats
+
+
+def _assert_same_stats(actual, expected):
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        if key == "dna_attribute_averages":
+            assert actual[key].keys() == value.keys()
+            for dna_id, averages in value.items():
+                assert actual[key][dna_id] == pytest.approx(averages)
+        elif isinstance(value, float):
+            assert actual[key] == pytest.approx(value)
+        else:
+            assert actual[key] == value
+
+
+def test_incremental_stats_match_full_recompute_through_births_and_deaths():
+    engine = build_engine(seed=11, stats_interval=1)
+    state = engine.state
+    for _ in range(40):
+        engine.step(1.0 / 30.0)
+    for lifeform in list(state.lifeforms[::3]):
+        lifeform.health_now = 0
+        lifeform.handle_death()
+    for _ in range(5):
+        engine.step(1.0 / 30.0)
+
+    assert state.death_ages
+    _assert_same_stats(engine.publish_stats("0:00:02"), collect_population_stats(state, "0:00:02"))
+
+
+def test_snapshot_heals_lifeforms_that_bypassed_the_hooks():
+    engine = build_engine(seed=5, stats_interval=1)
+    state = engine.state
+    removed = state.lifeforms.pop()
+
+    stats = state.population_stats.snapshot(state.lifeforms, "0:00:00", state.death_ages)
+
+    assert len(state.population_stats) == len(state.lifeforms)
+    _assert_same_stats(stats, collect_population_stats(state, "0:00:00"))
+
+    state.lifeforms.append(removed)
+    stats = state.population_stats.snapshot(state.lifeforms, "0:00:00", state.death_ages)
+    assert stats["lifeform_count"] == len(state.lifeforms)
+
+
+def test_death_average_is_a_running_mean():
+    tracker = PopulationStats()
+    for age in (10.0, 20.0, 60.0):
+        tracker.record_death(age)
+
+    stats = tracker.snapshot([], "0:00:00")
+
+    assert stats["death_count"] == 3
+    assert stats["death_age_avg"] == pytest.approx(30.0)
+    assert stats["lifeform_count"] == 0
+
+
+def test_engine_publishes_on_the_configured_interval():
+    published = []
+    engine = build_engine(seed=2, stats_interval=4)
+    engine.stats_listener = published.append
+
+    for _ in range(9):
+        engine.step(1.0 / 30.0)
+
+    # The first tick publishes, then every fourth
+    assert len(published) == 3
+    assert engine.latest_stats is published[-1]
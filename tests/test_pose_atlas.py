@@ -0,0 +1,108 @@
+"""Tests for the modular creature pose atlas and its surface LRU."""
+
+from __future__ import annotations
+
+import gc
+import math
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from evolution.headless import build_engine
+from evolution.rendering.modular_lifeform_renderer import modular_lifeform_renderer
+from evolution.rendering import pose_atlas
+from evolution.rendering.pose_atlas import BodyPlan, PoseAtlas
+from evolution.rendering.surface_cache import SurfaceLRU
+
+
+@pytest.fixture(scope="module")
+def lifeforms():
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+    engine = build_engine(seed=4)
+    engine.step(1.0 / 30.0)
+    modular = [lifeform for lifeform in engine.state.lifeforms if getattr(lifeform, "body_graph", None)]
+    if not modular:
+        pytest.skip("no modular lifeforms spawned")
+    yield modular
+    pygame.display.quit()
+
+
+def _atlas(**overrides):
+    options = {"budget_bytes": 64 * 1024 * 1024, "phases": 8, "angle_bin_deg": 5.0}
+    options.update(overrides)
+    return PoseAtlas(modular_lifeform_renderer, **options)
+
+
+def test_repeated_pose_is_served_from_the_atlas(lifeforms):
+    atlas = _atlas()
+    lifeform = lifeforms[0]
+
+    first = atlas.frame(lifeform)
+    second = atlas.frame(lifeform)
+
+    assert second is first
+    assert atlas.frames.hits == 1
+    # One upright pose plus its rotation
+    assert len(atlas.frames) == 2
+
+
+def test_swim_phase_and_angle_select_different_frames(lifeforms):
+    atlas = _atlas(phases=4)
+    lifeform = lifeforms[0]
+    lifeform.thrust_phase = 0.1
+    lifeform.angle = 0.0
+    base = atlas.frame(lifeform)
+
+    lifeform.thrust_phase = 0.1 + math.pi
+    assert atlas.frame(lifeform) is not base
+
+    lifeform.thrust_phase = 0.1
+    lifeform.angle = 2.0  # same 5 degree bin
+    assert atlas.frame(lifeform) is base
+    lifeform.angle = 90.0
+    assert atlas.frame(lifeform) is not base
+
+
+def test_lifeforms_sharing_a_body_plan_share_frames(lifeforms):
+    atlas = _atlas()
+    lifeform = lifeforms[0]
+    atlas.frame(lifeform)
+    plans = atlas.stats()["body_plans"]
+
+    atlas.frame(lifeform)
+    assert atlas.stats()["body_plans"] == plans
+    assert atlas.pose_key(lifeform)[0] == lifeform._modular_render_state.atlas_plan.id
+
+
+def test_body_plans_are_dropped_with_their_creatures():
+    class _State:
+        atlas_plan = None
+
+    state = _State()
+    signature = ("test-plan",)
+    pose_atlas._PLANS[signature] = state.atlas_plan = BodyPlan(-1, False)
+    assert signature in pose_atlas._PLANS
+
+    del state
+    gc.collect()
+    assert signature not in pose_atlas._PLANS
+
+
+def test_surface_lru_evicts_least_recently_used_over_budget():
+    surfaces = [pygame.Surface((16, 16), pygame.SRCALPHA, 32) for _ in range(3)]
+    size = surfaces[0].get_pitch() * 16
+    cache = SurfaceLRU(size * 2)
+
+    cache.put("a", surfaces[0])
+    cache.put("b", surfaces[1])
+    assert cache.get("a") is surfaces[0]
+    cache.put("c", surfaces[2])
+
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert cache.bytes == size * 2
+    assert cache.stats()["evictions"] == 1
+    assert cache.get("b") is None
+    assert cache.misses == 1
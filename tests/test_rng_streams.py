@@ -0,0 +1,45 @@
+"""Tests for the named random streams."""
+
+from __future__ import annotations
+
+import pytest
+
+from evolution.systems.rng import RandomStreams, derive_seed
+
+
+def test_streams_are_independent_and_reseed_in_place():
+    streams = RandomStreams(5)
+    ai = streams.stream("ai")
+    first = [ai.random() for _ in range(3)]
+
+    # Drawing from another subsystem does not shift the "ai" sequence
+    streams.reseed(5)
+    streams.stream("mutation").random()
+    assert streams.stream("ai") is ai
+    assert [ai.random() for _ in range(3)] == first
+
+    streams.reseed(6)
+    assert [ai.random() for _ in range(3)] != first
+
+
+def test_spawned_children_follow_creation_order():
+    streams = RandomStreams(3)
+    a = [streams.spawn("vegetation").random() for _ in range(2)]
+
+    streams.reseed(3)
+    b = [streams.spawn("vegetation").random() for _ in range(2)]
+
+    assert a == b
+    assert a[0] != a[1]
+    assert derive_seed(3, "ai") != derive_seed(3, "mutation")
+
+
+def test_numpy_stream_reseeds_in_place():
+    np = pytest.importorskip("numpy")
+    streams = RandomStreams(9)
+    generator = streams.numpy_stream("brain")
+    first = generator.random(4)
+
+    streams.reseed(9)
+    assert streams.numpy_stream("brain") is generator
+    assert np.array_equal(generator.random(4), first)
@@ -0,0 +1,41 @@
+"""Tests for the fixed-timestep simulation scheduler."""
+
+from __future__ import annotations
+
+import pytest
+
+from evolution.simulation.scheduler import FixedStepScheduler
+
+
+def test_steps_use_fixed_dt_and_carry_remainder():
+    scheduler = FixedStepScheduler(0.1)
+    seen = []
+
+    assert scheduler.advance(0.25, seen.append) == 2
+    assert scheduler.alpha == pytest.approx(0.5)
+    assert scheduler.advance(0.05, seen.append) == 1
+
+    assert seen == [0.1, 0.1, 0.1]
+    assert scheduler.alpha == pytest.approx(0.0, abs=1e-9)
+
+
+def test_catch_up_is_capped():
+    scheduler = FixedStepScheduler(0.1, max_substeps=3)
+    seen = []
+
+    assert scheduler.advance(2.05, seen.append) == 3
+    assert scheduler.dropped_seconds == pytest.approx(1.7)
+    assert scheduler.alpha == pytest.approx(0.5)
+
+
+def test_max_speed_runs_until_budget():
+    now = [0.0]
+
+    def step(_dt):
+        now[0] += 0.004
+
+    scheduler = FixedStepScheduler(0.1, max_speed_budget=0.02, clock=lambda: now[0])
+    scheduler.toggle_max_speed()
+
+    assert scheduler.advance(0.0, step) == 5
+    assert scheduler.total_steps == 5
@@ -0,0 +1,106 @@
+"""Tests for drawing the world straight at window resolution."""
+
+from __future__ import annotations
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from evolution.headless import build_engine
+from evolution.rendering.camera import Camera
+from evolution.rendering.draw_lifeform import outline_corners
+from evolution.rendering.surface_cache import ScaledSurfaces, scale_surface
+from evolution.simulation.world.chunks import ChunkManager
+from evolution.world.advanced_carcass import DecomposingCarcass
+from evolution.world.vegetation import MossCluster
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _display():
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+    yield
+    pygame.display.quit()
+
+
+def test_render_scale_follows_zoom_and_rejects_distorted_views():
+    camera = Camera(1280, 720, 6000, 4000)
+    assert camera.render_scale() == 1.0
+
+    camera.set_zoom(0.5)
+    assert camera.render_scale() == 0.5
+    camera.set_zoom(0.7)
+    assert camera.render_scale() == pytest.approx(0.7, abs=0.001)
+
+    # A window wider than the world can only be filled by stretching
+    narrow_world = Camera(1280, 720, 800, 4000)
+    narrow_world.set_zoom(1.0)
+    assert narrow_world.render_scale() is None
+
+
+def test_scaled_copy_is_reused_until_source_or_scale_changes():
+    source = pygame.Surface((40, 20), pygame.SRCALPHA, 32)
+    owner = object()
+    cache = ScaledSurfaces()
+
+    half = cache.get(owner, source, 0.5)
+    assert half.get_size() == (20, 10)
+    assert cache.get(owner, source, 0.5) is half
+    assert cache.get(owner, source, 0.5, smooth=False) is not half
+
+    rebuilt = pygame.Surface((40, 20), pygame.SRCALPHA, 32)
+    assert cache.get(owner, rebuilt, 0.5) is not half
+    assert scale_surface(source, 1.5).get_size() == (60, 30)
+
+
+def test_scaled_copies_of_undrawn_owners_are_swept():
+    world = build_engine(seed=1).state.world
+    manager = ChunkManager(chunk_size=256)
+    manager.build_static_chunks(world)
+    near, far = manager.chunks[(0, 0)], manager.chunks[(1, 0)]
+    cache = ScaledSurfaces()
+
+    scaled = cache.get(near, near.surface, 0.333)
+    assert scaled.get_size() == (86, 86)
+    cache.get(far, far.surface, 0.333)
+    assert cache.sweep() == 0
+
+    cache.get(near, near.surface, 0.333)
+    assert cache.sweep() == 1
+    assert len(cache) == 1
+    assert cache.get(near, near.surface, 0.333) is scaled
+
+
+def test_carcass_body_is_recomposed_only_when_its_look_changes():
+    carcass = DecomposingCarcass(
+        position=(40.0, 30.0), size=(20, 10), mass=2.0, nutrition=20.0, color=(120, 90, 60)
+    )
+    image, position = carcass.body_image()
+    assert position == (40, 30)
+
+    carcass.x += 5.0
+    carcass.angle += 0.2
+    moved, position = carcass.body_image()
+    assert moved is image
+    assert position == (45, 30)
+
+    carcass.angle += 5.0
+    assert carcass.body_image()[0] is not image
+
+
+def test_plants_expose_their_world_size_surface():
+    moss = MossCluster([(2, 2), (3, 2)])
+    image = moss.current_surface()
+    assert image is moss.surface
+    assert image.get_size() == moss.rect.size
+    assert MossCluster([]).current_surface() is None
+
+
+def test_outline_corners_scale_around_the_screen_position():
+    class Stub:
+        x, y, width, height, angle = 40.0, 30.0, 20, 10, 0.0
+
+    corners = outline_corners(Stub(), (20, 10), offset=(10, 5), scale=0.5)
+
+    assert corners[0] == pytest.approx((15.0, 12.5))
+    assert corners[2] == pytest.approx((25.0, 17.5))
@@ -0,0 +1,180 @@
+"""Tests for strip partitioning, shard workers and shard stat merging."""
+
+from __future__ import annotations
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from evolution.config import settings
+from evolution.headless import build_engine
+from evolution.simulation.sharded import ShardedSimulation, ShardInbox
+from evolution.simulation.sharding import (
+    RECORD_FIELDS,
+    StripLayout,
+    merge_population_stats,
+    restore_lifeform,
+    snapshot_lifeform,
+)
+from evolution.systems.stats import collect_population_stats
+
+_FIELDS = (
+    "health", "health_now", "vision", "generation", "hunger", "size", "age", "maturity",
+    "speed", "reproduced_cooldown", "attack_power_now", "defence_power_now", "longevity",
+    "energy", "mass", "reach", "perception_rays", "maintenance_cost", "hearing_range",
+)
+
+
+def _lifeform(rng, width, height):
+    values = {name: rng.uniform(1.0, 50.0) for name in _FIELDS}
+    return SimpleNamespace(
+        x=rng.uniform(0, width), y=rng.uniform(0, height), dna_id=rng.randint(1, 4), **values
+    )
+
+
+def test_partition_halo_and_migration():
+    rng = random.Random(1)
+    layout = StripLayout(1000, 600, 4)
+    entities = [_lifeform(rng, 1000, 600) for _ in range(200)]
+
+    owned = layout.partition(entities)
+    assert sum(len(strip) for strip in owned) == len(entities)
+    for index, strip in enumerate(owned):
+        low, high = layout.bounds(index)
+        assert all(low <= entity.x < high for entity in strip)
+
+    halo = layout.halo(owned, 1, 40.0)
+    expected = [e for e in entities if 210.0 <= e.x < 250.0 or 500.0 <= e.x < 540.0]
+    assert {id(e) for e in halo} == {id(e) for e in expected}
+
+    owners = {id(entity): layout.shard_for((entity.x, entity.y)) for entity in entities}
+    mover = owned[0][0]
+    mover.x = 260.0
+    assert layout.migrations(owners, entities) == [(mover, 0, 1)]
+
+
+def test_horizontal_strips_clamp_off_world_points():
+    layout = StripLayout(1000, 600, 3, axis="y")
+
+    assert layout.shard_for((5.0, -20.0)) == 0
+    assert layout.shard_for((5.0, 250.0)) == 1
+    assert layout.shard_for((5.0, 900.0)) == 2
+
+
+def test_merged_stats_match_union():
+    rng = random.Random(7)
+    lifeforms = [_lifeform(rng, 1000, 600) for _ in range(60)]
+    deaths = [rng.randint(10, 900) for _ in range(25)]
+    layout = StripLayout(1000, 600, 3)
+
+    parts = []
+    for index, strip in enumerate(layout.partition(lifeforms)):
+        shard_state = SimpleNamespace(lifeforms=strip, death_ages=deaths[index::3])
+        parts.append(collect_population_stats(shard_state, "0:01:00"))
+    merged = merge_population_stats(parts, "0:01:00")
+    full = collect_population_stats(SimpleNamespace(lifeforms=lifeforms, death_ages=deaths), "0:01:00")
+
+    assert merged["lifeform_count"] == full["lifeform_count"]
+    assert merged["dna_count"] == full["dna_count"]
+    assert merged["death_age_avg"] == pytest.approx(full["death_age_avg"])
+    for key, value in full.items():
+        if key.startswith("average_"):
+            assert merged[key] == pytest.approx(value), key
+    for dna_id, averages in full["dna_attribute_averages"].items():
+        assert merged["dna_attribute_averages"][dna_id] == pytest.approx(averages)
+
+
+def test_record_rebuilds_lifeform_in_another_state():
+    source = build_engine(seed=3).state
+    lifeform = source.lifeforms[0]
+    lifeform.x, lifeform.y, lifeform.age, lifeform.health_now = 321.5, 456.25, 42.0, 17.0
+
+    target = build_engine(seed=3).state
+    target.dna_profiles.clear()
+    with pytest.raises(KeyError):
+        restore_lifeform(target, snapshot_lifeform(lifeform))
+
+    profile = next(p for p in source.dna_profiles if p["dna_id"] == lifeform.dna_id)
+    copy = restore_lifeform(target, snapshot_lifeform(lifeform, profile=profile))
+    assert copy.id == lifeform.id
+    assert (copy.x, copy.y, copy.age, copy.health_now) == (321.5, 456.25, 42.0, 17.0)
+    assert copy.rect.topleft == (321, 456)
+    assert target.spatial_grid.contains(copy)
+    assert target.dna_profiles[0]["dna_id"] == lifeform.dna_id
+
+
+def test_workers_exchange_migrants_ghosts_and_hits():
+    simulation = ShardedSimulation(2, seed=5, halo=200.0, processes=False)
+    layout = simulation.layout
+    left, right = (shard.worker for shard in simulation._shards)
+    border = layout.bounds(1)[0]
+    left_state, right_state = left.engine.state, right.engine.state
+    assert all(l.x < border for l in left_state.lifeforms)
+    assert all(l.x >= border for l in right_state.lifeforms)
+
+    mover, watcher = left_state.lifeforms[:2]
+    mover.x = border + 600.0
+    watcher.x = border - 20.0
+    exchange = left.step(1 / 30)
+
+    assert [(target, record.id) for target, record in exchange.migrants] == [(1, mover.id)]
+    assert mover not in left_state.lifeforms
+    assert (1, watcher.id) in [(target, record.id) for target, record in exchange.halo]
+
+    ghosts = [(0, record) for target, record in exchange.halo if target == 1]
+    right.receive(ShardInbox(ghosts=ghosts, migrants=[record for _, record in exchange.migrants]))
+    owned = {l.id for l in right_state.lifeforms}
+    assert mover.id in owned
+    assert watcher.id not in owned
+    ghost = right._ghosts[watcher.id]
+    assert right_state.spatial_grid.contains(ghost)
+    assert right.publish_stats("0:00:00")["lifeform_count"] == len(right_state.lifeforms)
+
+    ghost.health_now -= 5.0
+    hits = right.step(1 / 30).hits
+    assert (0, watcher.id, pytest.approx(-5.0)) in hits
+    before = watcher.health_now
+    left.receive(ShardInbox(hits=[(lifeform_id, delta) for _, lifeform_id, delta in hits]))
+    assert watcher.health_now <= before - 5.0 + 1e-9
+
+    # Hit on the ghost while the owner hands the watcher over in the same tick
+    right.receive(ShardInbox(ghosts=[(0, snapshot_lifeform(watcher))]))
+    right._ghosts[watcher.id].health_now -= 7.0
+    watcher.x = border + 300.0
+    simulation._collect([left.step(1 / 30), right.step(1 / 30)])
+    inbox = simulation._inboxes[1]
+    assert [record.id for record in inbox.migrants] == [watcher.id]
+    assert (watcher.id, pytest.approx(-7.0)) in inbox.hits
+    assert not simulation._inboxes[0].hits
+
+    handed_over = next(record for record in inbox.migrants if record.id == watcher.id)
+    right.receive(inbox)
+    adopted = next(l for l in right_state.lifeforms if l.id == watcher.id)
+    assert adopted.health_now == pytest.approx(max(0.0, handed_over.values[RECORD_FIELDS.index("health_now")] - 7.0))
+
+
+def test_sharded_run_keeps_every_lifeform_in_exactly_one_strip():
+    with ShardedSimulation(3, seed=2, processes=False) as simulation:
+        for _ in range(10):
+            simulation.step(1 / 30)
+        stats = simulation.publish_stats()
+        shards = [shard.worker for shard in simulation._shards]
+
+    ids = [l.id for worker in shards for l in worker.engine.state.lifeforms]
+    assert len(ids) == len(set(ids))
+    assert stats["lifeform_count"] == len(ids)
+    for worker in shards:
+        low, high = simulation.layout.bounds(worker.index)
+        assert all(low <= l.x < high for l in worker.engine.state.lifeforms)
+
+
+def test_worker_processes_run_the_same_world():
+    runtime = settings.current_settings().with_updates({"N_LIFEFORMS": 20})
+    with ShardedSimulation(2, seed=9, runtime=runtime, halo=100.0) as simulation:
+        simulation.step(1 / 30)
+        counts = simulation.counts()
+        stats = simulation.publish_stats()
+
+    assert stats["lifeform_count"] == sum(shard["lifeforms"] for shard in counts)
+    assert 0 < stats["lifeform_count"] <= 20
@@ -0,0 +1,130 @@
+"""Tests for the NumPy-backed spatial index and the grid prefetch."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from evolution.systems.spatial_array import ArraySpatialIndex
+from evolution.systems.spatial_hash import SpatialHashGrid
+
+
+@dataclass(eq=False)
+class Point:
+    x: float
+    y: float
+    id: int = 0
+    health_now: float = 100.0
+
+
+def _brute_force(points, x, y, radius):
+    return {id(p) for p in points if (p.x - x) ** 2 + (p.y - y) ** 2 <= radius * radius}
+
+
+def _scatter(count, seed=3, extent=2000.0):
+    rng = random.Random(seed)
+    return [Point(rng.uniform(-50.0, extent), rng.uniform(-50.0, extent), i) for i in range(count)]
+
+
+class TestArraySpatialIndex:
+    def test_single_query_matches_brute_force(self):
+        points = _scatter(400)
+        index = ArraySpatialIndex(points, lambda p: (p.x, p.y), cell_size=150.0)
+
+        for x, y, radius in ((0.0, 0.0, 300.0), (1000.0, 900.0, 75.0), (1999.0, 5.0, 420.0)):
+            found = {id(p) for p in index.query(x, y, radius)}
+            assert found == _brute_force(points, x, y, radius)
+
+    def test_batch_matches_single_queries(self):
+        points = _scatter(300, seed=8)
+        index = ArraySpatialIndex(points, lambda p: (p.x, p.y), cell_size=120.0)
+        rng = random.Random(1)
+        xs = [rng.uniform(-400.0, 2400.0) for _ in range(60)]
+        ys = [rng.uniform(-400.0, 2400.0) for _ in range(60)]
+        radii = [rng.uniform(0.0, 350.0) for _ in range(60)]
+
+        batched = index.query_batch_entities(xs, ys, radii)
+
+        assert len(batched) == 60
+        for q, hits in enumerate(batched):
+            assert {id(p) for p in hits} == _brute_force(points, xs[q], ys[q], radii[q])
+
+    def test_count_batch_with_shared_radius(self):
+        points = [Point(0.0, 0.0), Point(10.0, 0.0), Point(500.0, 500.0)]
+        index = ArraySpatialIndex(points, lambda p: (p.x, p.y), cell_size=100.0)
+
+        counts = index.count_batch([0.0, 500.0, -900.0], [0.0, 500.0, -900.0], 20.0)
+
+        assert counts.tolist() == [2, 1, 0]
+
+    def test_empty_index(self):
+        index = ArraySpatialIndex([], lambda p: (p.x, p.y))
+
+        assert index.query(0.0, 0.0, 100.0) == []
+        offsets, indices = index.query_batch([1.0, 2.0], [1.0, 2.0], 50.0)
+        assert offsets.tolist() == [0, 0, 0]
+        assert indices.size == 0
+
+
+class TestPrefetchNeighbors:
+    def test_prefetch_matches_direct_queries(self):
+        grid = SpatialHashGrid(cell_size=100.0)
+        lifeforms = _scatter(120, seed=5, extent=800.0)
+        for lifeform in lifeforms:
+            grid.add_lifeform(lifeform)
+
+        grid.prefetch_neighbors(lifeforms, lambda _: 90.0)
+
+        for lifeform in lifeforms[:25]:
+            expected = {id(o) for o in grid.query_lifeforms(lifeform.x, lifeform.y, 60.0)}
+            assert {id(o) for o in grid.nearby_lifeforms(lifeform, 60.0)} == expected
+
+    def test_prefetch_skips_removed_entities(self):
+        grid = SpatialHashGrid(cell_size=100.0)
+        seeker = Point(50.0, 50.0, 1)
+        victim = Point(60.0, 50.0, 2)
+        grid.add_lifeform(seeker)
+        grid.add_lifeform(victim)
+        grid.prefetch_neighbors([seeker, victim], lambda _: 40.0)
+
+        grid.remove_lifeform(victim)
+
+        assert grid.nearby_lifeforms(seeker, 30.0) == [seeker]
+
+    def test_falls_back_when_query_exceeds_prefetch(self):
+        grid = SpatialHashGrid(cell_size=100.0)
+        seeker = Point(0.0, 0.0, 1)
+        distant = Point(400.0, 0.0, 2)
+        grid.add_lifeform(seeker)
+        grid.add_lifeform(distant)
+        grid.prefetch_neighbors([seeker], lambda _: 10.0, margin=0.0)
+
+        assert distant in grid.nearby_lifeforms(seeker, 500.0)
+
+    def test_entities_added_after_prefetch_are_visible(self):
+        grid = SpatialHashGrid(cell_size=100.0)
+        seeker = Point(50.0, 50.0, 1)
+        grid.add_lifeform(seeker)
+        grid.prefetch_neighbors([seeker], lambda _: 40.0)
+
+        newborn = Point(55.0, 50.0, 2)
+        grid.add_lifeform(newborn)
+
+        assert {id(o) for o in grid.nearby_lifeforms(seeker, 30.0)} == {id(seeker), id(newborn)}
+
+    def test_neighbour_drift_invalidates_prefetch(self):
+        grid = SpatialHashGrid(cell_size=100.0)
+        seeker = Point(0.0, 0.0, 1)
+        runner = Point(300.0, 0.0, 2)
+        grid.add_lifeform(seeker)
+        grid.add_lifeform(runner)
+        grid.prefetch_neighbors([seeker, runner], lambda _: 20.0, margin=10.0)
+
+        runner.x = 5.0
+        grid.move_lifeform(runner)
+
+        assert runner in grid.nearby_lifeforms(seeker, 20.0)
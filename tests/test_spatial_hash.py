@@ -153,6 +153,81 @@ class TestSpatialHashGrid:
         assert grid.cell_size >= 1.0
 
 
+class TestIncrementalUpdates:
+    """Test suite for the persistent insert/move/remove hooks."""
+
+    def test_add_twice_does_not_duplicate(self):
+        grid = SpatialHashGrid(cell_size=100.0)
+        lifeform = MockLifeform(x=50.0, y=50.0, id=1)
+
+        grid.add_lifeform(lifeform)
+        grid.add_lifeform(lifeform)
+
+        assert grid.lifeform_count == 1
+        assert grid.query_lifeforms(50.0, 50.0, radius=10.0) == [lifeform]
+
+    def test_move_within_cell_is_noop(self):
+        grid = SpatialHashGrid(cell_size=100.0)
+        lifeform = MockLifeform(x=10.0, y=10.0, id=1)
+        grid.add_lifeform(lifeform)
+
+        lifeform.x = 90.0
+        assert grid.move_lifeform(lifeform) is False
+        assert grid.query_lifeforms(90.0, 10.0, radius=5.0) == [lifeform]
+
+    def test_move_across_cells_relocates(self):
+        grid = SpatialHashGrid(cell_size=100.0)
+        lifeform = MockLifeform(x=50.0, y=50.0, id=1)
+        grid.add_lifeform(lifeform)
+
+        lifeform.x = 250.0
+        assert grid.move_lifeform(lifeform) is True
+        assert grid.query_lifeforms(50.0, 50.0, radius=40.0) == []
+        assert grid.query_lifeforms(250.0, 50.0, radius=10.0) == [lifeform]
+
+    def test_remove_uses_identity(self):
+        grid = SpatialHashGrid(cell_size=100.0)
+        first = MockLifeform(x=50.0, y=50.0, id=1)
+        twin = MockLifeform(x=50.0, y=50.0, id=1)  # equal by value, distinct object
+        grid.add_lifeform(first)
+        grid.add_lifeform(twin)
+
+        assert grid.remove_lifeform(twin) is True
+        assert grid.remove_lifeform(twin) is False
+        results = grid.query_lifeforms(50.0, 50.0, radius=10.0)
+        assert len(results) == 1
+        assert results[0] is first
+
+    def test_plant_and_carcass_hooks(self):
+        grid = SpatialHashGrid(cell_size=100.0)
+        plant = MockPlant(x=40.0, y=40.0)
+        carcass = MockLifeform(x=60.0, y=60.0, id=9)
+        grid.add_plant(plant)
+        grid.add_carcass(carcass)
+
+        carcass.y = 460.0
+        assert grid.move_carcass(carcass) is True
+        assert grid.query_carcasses(60.0, 460.0, radius=5.0) == [carcass]
+
+        grid.remove_plant(plant)
+        grid.remove_carcass(carcass)
+        assert len(grid) == 0
+
+    def test_sync_reconciles_membership(self):
+        grid = SpatialHashGrid(cell_size=100.0)
+        stale = MockLifeform(x=50.0, y=50.0, id=1)
+        kept = MockLifeform(x=60.0, y=50.0, id=2)
+        grid.add_lifeform(stale)
+        grid.add_lifeform(kept)
+
+        newcomer = MockLifeform(x=350.0, y=50.0, id=3)
+        grid.sync([kept, newcomer], [])
+
+        assert grid.lifeform_count == 2
+        assert grid.contains(kept) and grid.contains(newcomer)
+        assert not grid.contains(stale)
+
+
 class TestBuildSpatialGrid:
     """Test suite for build_spatial_grid helper function."""
 
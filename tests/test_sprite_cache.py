@@ -0,0 +1,58 @@
+"""Tests for the bounded per-DNA sprite cache."""
+
+from __future__ import annotations
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from evolution.headless import build_engine
+from evolution.rendering.sprite_cache import LifeformSpriteCache
+
+
+@pytest.fixture(scope="module")
+def lifeforms():
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+    engine = build_engine(seed=8)
+    yield engine.state.lifeforms
+    pygame.display.quit()
+
+
+def test_sprites_are_reused_and_counted(lifeforms):
+    cache = LifeformSpriteCache(budget_bytes=64 * 1024 * 1024)
+    lifeform = lifeforms[0]
+
+    first = cache.get_body(lifeform)
+    second = cache.get_body(lifeform)
+
+    assert second is first
+    stats = cache.stats()
+    assert stats["hits"] >= 1
+    assert stats["bytes"] > 0
+
+
+def test_budget_bounds_memory(lifeforms):
+    cache = LifeformSpriteCache(budget_bytes=64 * 1024)
+    for lifeform in lifeforms[:20]:
+        cache.get_body(lifeform)
+
+    stats = cache.stats()
+    assert stats["evictions"] > 0
+    # Only the newest entry may overshoot the budget on its own
+    assert stats["bytes"] <= stats["budget_bytes"] or stats["entries"] == 1
+
+
+def test_retain_dna_drops_extinct_profiles(lifeforms):
+    cache = LifeformSpriteCache(budget_bytes=64 * 1024 * 1024)
+    by_dna = {}
+    for lifeform in lifeforms:
+        by_dna.setdefault(lifeform.dna_id, lifeform)
+    survivors, extinct = list(by_dna)[:1], list(by_dna)[1:3]
+    for dna_id in survivors + extinct:
+        cache.get_body(by_dna[dna_id])
+
+    dropped = cache.retain_dna(survivors)
+
+    assert dropped >= len(extinct)
+    assert all(key[1] == str(survivors[0]) for key in cache.sprites.keys())
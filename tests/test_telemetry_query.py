@@ -0,0 +1,77 @@
+"""Tests for streaming telemetry queries and reports."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+pytest.importorskip("pygame")
+
+from evolution.systems import telemetry_format, telemetry_query
+from evolution.systems.telemetry import TelemetrySink
+from evolution.systems.telemetry_query import TelemetryQuery, behavior_report, event_report
+
+
+def _movement_row(tick, behavior, dna, *, threat=None, food=False):
+    return (
+        tick, f"L{tick}", dna, (0.0, 0.0), (3.0, 4.0), (1.0, 0.0), 2.0, 1.5 if tick % 2 else 0.5,
+        10.0, 80.0, 3.0, 2.0, 40.0, 12.0, behavior, food, 0.0, None, None, threat, None, 0.5,
+        1.0, False, False, None, None, 0,
+    )
+
+
+@pytest.fixture
+def movement_file(tmp_path):
+    sink = TelemetrySink("movement", directory=tmp_path, chunk_rows=5)
+    for tick in range(20):
+        behavior = ("flee", "hunt", "search", "idle")[tick % 4]
+        sink.write(_movement_row(tick, behavior, str(tick % 3), threat=float(tick), food=tick % 8 == 0))
+    sink.close()
+    return sink.path
+
+
+def test_predicates_push_down_to_chunks_and_rows(movement_file):
+    query = TelemetryQuery(movement_file, ticks=(6, 13), where={"behavior": "flee"})
+
+    ticks = [int(tick) for chunk in query.chunks(["tick"]) for tick in chunk["tick"]]
+    assert ticks == [8, 12]
+
+    skipped = list(telemetry_format.iter_chunks(movement_file, ["tick"], ticks=(6, 13)))
+    # Chunks of five rows: only ticks 5-9 and 10-14 overlap
+    assert len(skipped) == 2
+
+
+def test_behavior_report_matches_row_loop(movement_file, monkeypatch):
+    vectorised = behavior_report(TelemetryQuery(movement_file))
+    monkeypatch.setattr(telemetry_query, "NUMPY_AVAILABLE", False)
+    monkeypatch.setattr(telemetry_format, "NUMPY_AVAILABLE", False)
+    looped = behavior_report(TelemetryQuery(movement_file))
+
+    assert vectorised == looped
+    flee = vectorised["flee"]
+    assert flee.count == 5
+    assert flee.speed == pytest.approx(25.0)
+    assert flee.threat_distance.mean == pytest.approx(8.0)
+    assert vectorised["search"].empty_search == 5
+    assert vectorised["idle"].high_effort == 5
+
+
+def test_event_report_reads_legacy_jsonl(tmp_path):
+    path = tmp_path / "events_1.jsonl"
+    rows = [
+        {"tick": 10, "category": "AI", "entity_id": "A", "event_type": "THREAT_DETECTED", "details": {"dist": 4.0}},
+        {"tick": 11, "category": "AI", "entity_id": "A", "event_type": "THREAT_DETECTED", "details": {"dist": 8.0}},
+        {"tick": 12, "category": "BEHAVIOR", "entity_id": "B", "event_type": "X", "details": {"name": "graze"}},
+        {"tick": 13, "category": "CARCASS", "entity_id": "SYSTEM", "event_type": "S", "details": {"from": "fresh", "to": "bloated"}},
+    ]
+    path.write_text("\n".join(json.dumps(row) for row in rows) + "\nnot json\n")
+
+    report = event_report(TelemetryQuery(path, chunk_rows=2))
+
+    assert report.total == 4
+    assert (report.first_tick, report.last_tick) == (10, 13)
+    assert report.threats["A"] == 2
+    assert report.threat_distance.mean == pytest.approx(6.0)
+    assert report.activities["graze"] == 1
+    assert report.carcass_transitions[("fresh", "bloated")] == 1
@@ -0,0 +1,104 @@
+"""Tests for the background columnar telemetry writer."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+pytest.importorskip("pygame")
+
+from evolution.systems import telemetry, telemetry_format
+from evolution.systems.telemetry import EventSample, MovementSample, TelemetrySink
+
+
+def _movement_row(tick):
+    return (
+        tick, f"L{tick}", "7", (1.5, 2.0), (0.1, -0.2), (1.0, 0.0), 0.5, 0.25, 10.0, 80.0,
+        3.0, 2.0, 40.0, 12.0, "hunt", True, 2.0, None, "L9", None, 14.5, 0.8, 1.0,
+        False, True, (0.6, 0.8), None, 2,
+    )
+
+
+def test_rows_round_trip_through_chunks(tmp_path):
+    sink = TelemetrySink("movement", directory=tmp_path, chunk_rows=4)
+    for tick in range(10):
+        sink.write(_movement_row(tick))
+    sink.close()
+
+    rows = list(telemetry_format.iter_rows(sink.path))
+
+    assert sink.rows_written == 10
+    assert [row["tick"] for row in rows] == list(range(10))
+    first = rows[0]
+    assert first["position"] == (1.5, 2.0)
+    assert first["closest_enemy_id"] is None and first["threat_distance"] is None
+    assert first["move_away"] == (0.6, 0.8)
+    assert first["has_food_target"] is True
+    assert set(first) == set(MovementSample.__dataclass_fields__)
+
+
+def test_dataclass_samples_and_jsonl_export(tmp_path):
+    sink = TelemetrySink("events", directory=tmp_path, compress=False)
+    sink.write(EventSample(tick=5, category="AI", entity_id="L1", event_type="FLEE", details={"dist": 3.5}))
+    sink.flush()
+    target = tmp_path / "events.jsonl"
+
+    assert telemetry_format.export_jsonl(sink.path, target) == 1
+    row = json.loads(target.read_text().strip())
+    assert row == {"tick": 5, "category": "AI", "entity_id": "L1", "event_type": "FLEE", "details": {"dist": 3.5}}
+
+
+def test_full_queue_drops_samples(tmp_path):
+    sink = TelemetrySink("movement", directory=tmp_path, chunk_rows=2, queue_limit=2)
+    # Keep the writer thread from draining while the queue fills
+    sink._thread = object()
+    for tick in range(5):
+        sink.write(_movement_row(tick))
+
+    assert sink.dropped == 3
+    sink._thread = None
+    sink.close()
+    assert sink.rows_written == 2
+
+
+def test_unencodable_rows_are_dropped_not_fatal(tmp_path):
+    sink = TelemetrySink("events", directory=tmp_path, chunk_rows=4)
+    sink.write(EventSample(tick=1, category="AI", entity_id="L1", event_type="OK", details={}))
+    sink.write(EventSample(tick=None, category="AI", entity_id="L2", event_type="BAD", details={}))
+    sink.write(EventSample(tick=3, category="AI", entity_id="L3", event_type="BAD", details={"x": object()}))
+    sink.flush()
+    sink.write(EventSample(tick=4, category="AI", entity_id="L4", event_type="OK", details={}))
+    sink.close()
+
+    rows = list(telemetry_format.iter_rows(sink.path))
+
+    assert [row["entity_id"] for row in rows] == ["L1", "L4"]
+    assert sink.dropped == 2
+    assert sink.rows_written == 2
+
+
+def test_movement_sample_packs_lifeform_fields(tmp_path, monkeypatch):
+    pygame = pytest.importorskip("pygame")
+    sink = TelemetrySink("movement", directory=tmp_path)
+    monkeypatch.setattr(telemetry, "_movement_sink", sink)
+    monkeypatch.setattr(telemetry, "_last_movement_log", {})
+
+    class _Stub:
+        id = "L1"
+        dna_id = 4
+        x, y = 10.0, 20.0
+        velocity = pygame.math.Vector2(1.0, 0.0)
+        hunger, energy_now, energy = 5.0, 50.0, 100.0
+        closest_plant = None
+        closest_prey = None
+        rect = pygame.Rect(10, 20, 4, 4)
+
+    telemetry.movement_sample(tick=100, lifeform=_Stub(), desired=pygame.math.Vector2(0, 1), thrust=2.0, effort=0.5)
+    sink.close()
+
+    (row,) = list(telemetry_format.iter_rows(sink.path))
+    assert row["dna_id"] == "4"
+    assert row["energy_ratio"] == pytest.approx(0.5)
+    assert row["behavior"] == "idle"
+    assert row["move_away"] is None
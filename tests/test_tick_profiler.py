@@ -0,0 +1,82 @@
+"""Tests for the per-phase tick profiler."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+pytest.importorskip("pygame")
+
+from evolution.headless import build_engine, run_headless
+from evolution.systems.timers import TimerAggregator
+
+
+def test_frames_sum_repeated_calls_into_one_sample():
+    timers = TimerAggregator(window=4)
+    for frame in range(6):
+        timers.add("feeding", 1.0)
+        timers.add("feeding", float(frame))
+        timers.end_frame()
+
+    summary = timers.summary()["feeding"]
+
+    # Only the last four frames (totals 3..6 ms) remain in the window
+    assert summary["frames"] == 4
+    assert summary["calls"] == 12
+    assert summary["max_ms"] == pytest.approx(6.0)
+    assert summary["p50_ms"] in (pytest.approx(4.0), pytest.approx(5.0))
+
+
+def test_engine_times_each_phase():
+    engine = build_engine(seed=3, stats_interval=1)
+    engine.profile_phases = True
+    for _ in range(5):
+        engine.step(1.0 / 30.0)
+
+    summary = engine.timers.summary()
+
+    for phase in (
+        "tick",
+        "plant_regrow",
+        "carcass_update",
+        "brain_forward",
+        "lifeform_plan",
+        "integrate_body",
+        "lifeform_finish",
+        "stats",
+        "events",
+    ):
+        assert summary[phase]["frames"] == 5
+    if engine.state.lifeforms:
+        assert summary["update_brain"]["calls"] >= 5
+        assert summary["thrust_mixer"]["calls"] == summary["update_brain"]["calls"]
+        assert "resolve_entity_movement" in summary
+        assert "feeding" in summary and "reproduction" in summary
+    assert summary["tick"]["max_ms"] >= summary["plant_regrow"]["max_ms"]
+
+
+def test_per_lifeform_phases_are_off_by_default():
+    engine = build_engine(seed=3, stats_interval=1)
+    for _ in range(3):
+        engine.step(1.0 / 30.0)
+
+    summary = engine.timers.summary()
+
+    assert summary["lifeform_plan"]["frames"] == 3
+    assert "update_brain" not in summary
+    assert "feeding" not in summary
+
+
+def test_headless_profile_json_keeps_slowest_ticks(tmp_path):
+    path = tmp_path / "profile.json"
+
+    run_headless(6, seed=5, profile_path=str(path), profile_slowest=2)
+    report = json.loads(path.read_text())
+
+    assert report["ticks"] == 6
+    assert "tick" in report["phases"]
+    slowest = report["slowest_ticks"]
+    assert len(slowest) == 2
+    assert slowest[0]["ms"] >= slowest[1]["ms"]
+    assert "cumulative" in slowest[0]["profile"]
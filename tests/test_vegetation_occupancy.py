@@ -0,0 +1,115 @@
+"""Tests for the shared vegetation occupancy bitmap."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from evolution.world.occupancy import VegetationOccupancy
+from evolution.world.seaweed import SeaweedStrand
+from evolution.world.types import Barrier
+from evolution.world.vegetation import MossCluster
+from evolution.world.world import World
+
+
+@pytest.fixture
+def world():
+    world = World(800, 1200)
+    world.barriers.clear()
+    world.add_barrier(Barrier(pygame.Rect(203, 100, 30, 30)))
+    return world
+
+
+def _plants():
+    moss = MossCluster({(20 + dx, 14 + dy): None for dx in range(4) for dy in range(3)})
+    strand = SeaweedStrand([(24, 17), (25, 17), (26, 17)])
+    return moss, strand
+
+
+def test_bitmap_matches_scanning(world):
+    moss, strand = _plants()
+    plants = [moss, strand]
+    cells = [(gx, gy) for gx in range(14, 32) for gy in range(8, 22)] + [(-1, 3), (99, 149), (100, 3)]
+
+    scanned = {cell: moss._is_occupied(cell, world, plants) for cell in cells}
+    for plant in plants:
+        world.vegetation_occupancy.add_plant(plant)
+    mapped = {cell: moss._is_occupied(cell, world, plants) for cell in cells}
+
+    assert mapped == scanned
+    assert world.vegetation_occupancy.is_blocked((25, 12))
+
+
+def test_consumption_and_removal_release_cells(world):
+    moss, strand = _plants()
+    occupancy = world.vegetation_occupancy
+    occupancy.add_plant(moss)
+    occupancy.add_plant(strand)
+
+    eaten = moss.decrement_resource(1.0)
+    assert eaten
+    assert sum(occupancy.plant_count(cell) for cell in moss.cells) == len(moss.cells)
+
+    occupancy.remove_plant(strand)
+    assert not occupancy.is_occupied((25, 17))
+    assert strand._occupancy is None
+
+
+def test_regrowth_claims_new_cells(world):
+    moss, _ = _plants()
+    moss._rng = random.Random(2)
+    world.vegetation_occupancy.add_plant(moss)
+    before = set(moss.cells)
+
+    for _ in range(400):
+        moss.regrow(world, [moss])
+
+    grown = set(moss.cells) - before
+    assert grown
+    assert all(world.vegetation_occupancy.plant_count(cell) == 1 for cell in moss.cells)
+
+
+def test_mark_blocked_clips_to_world():
+    occupancy = VegetationOccupancy(64, 64)
+
+    occupancy.mark_blocked(pygame.Rect(-20, 50, 200, 4))
+
+    assert occupancy.is_blocked((0, 6))
+    assert occupancy.is_blocked((7, 6))
+    assert not occupancy.is_blocked((0, 5))
+
+
+def _assert_frontier_consistent(moss, world, plants):
+    for cell, state in moss.cells.items():
+        if state.alive:
+            has_oxygen = moss._cell_has_oxygen(cell, world, plants)
+            assert (cell in moss._suffocating) is (not has_oxygen)
+
+
+def test_incremental_oxygen_tracks_neighbour_changes(world, monkeypatch):
+    from evolution.world import vegetation
+
+    monkeypatch.setattr(vegetation, "OXYGEN_DEPRIVATION_LIMIT", 3)
+    moss = MossCluster({(30 + dx, 40 + dy): None for dx in range(6) for dy in range(6)})
+    neighbour = MossCluster({(36, 40 + dy): None for dy in range(6)})
+    plants = [moss, neighbour]
+    for plant in plants:
+        world.vegetation_occupancy.add_plant(plant)
+
+    for _ in range(4):
+        moss._update_cell_life_state(world, plants)
+    _assert_frontier_consistent(moss, world, plants)
+    assert not moss.cells[(32, 42)].alive
+    assert not moss._oxygen_dirty
+    # Dead interior cells are no longer ticked
+    assert not moss._suffocating
+
+    # Eating the neighbour strip exposes the right edge again
+    neighbour.decrement_resource(1e9)
+    moss._update_cell_life_state(world, plants)
+    _assert_frontier_consistent(moss, world, plants)
+    assert moss.cells[(35, 42)].alive
+    assert not moss.cells[(33, 42)].alive
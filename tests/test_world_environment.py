@@ -0,0 +1,49 @@
+"""Tests for the cached environment context of :class:`World`."""
+
+from __future__ import annotations
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from evolution.world.world import World
+
+
+@pytest.fixture
+def world():
+    return World(1200, 1600, environment_modifiers={"weather_intensity": 1.0})
+
+
+def test_repeated_lookups_share_effects(world):
+    world.update(1_000)
+    x, y = 400.0, 700.0
+
+    first = world.get_environment_context(x, y)
+
+    assert world.get_environment_context(x + 1.0, y + 1.0) is first
+    assert world.get_hunger_modifier(x, y) == first[1]["hunger"]
+
+
+def test_in_place_intensity_change_rescales(world):
+    world.update(1_000)
+    biome, effects = world.get_environment_context(400.0, 700.0)
+    raw = biome.get_effects()
+
+    world.environment_modifiers["weather_intensity"] = 2.0
+    _, scaled = world.get_environment_context(400.0, 700.0)
+
+    assert scaled is not effects
+    assert scaled["hunger"] == pytest.approx(1.0 + (raw["hunger"] - 1.0) * 2.0)
+
+
+def test_weather_change_invalidates(world):
+    world.update(1_000)
+    biome, before = world.get_environment_context(400.0, 700.0)
+
+    replacement = next(p for p in biome.weather_patterns if p is not biome.active_weather)
+    biome.active_weather = replacement
+    world.update(1_010)
+
+    _, after = world.get_environment_context(400.0, 700.0)
+    assert after is not before
+    assert after["weather_name"] == replacement.name
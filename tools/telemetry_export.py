@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Convert columnar telemetry files (``*.tcol``) to JSON lines.
+
+Usage:
+    python tools/telemetry_export.py logs/telemetry/events_1700000000.tcol
+    python tools/telemetry_export.py logs/telemetry/*.tcol --output-dir exported/
+
+Each input ``name.tcol`` is written next to it (or into ``--output-dir``) as
+``name.jsonl`` with one JSON object per sample.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import evolution package
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from evolution.systems.telemetry_format import export_jsonl
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Export columnar telemetry to JSON lines")
+    parser.add_argument("files", nargs="+", type=Path, help="Columnar telemetry files")
+    parser.add_argument("--output-dir", type=Path, help="Directory for the .jsonl files")
+    args = parser.parse_args(argv)
+
+    for source in args.files:
+        directory = args.output_dir or source.parent
+        directory.mkdir(parents=True, exist_ok=True)
+        target = directory / (source.stem + ".jsonl")
+        rows = export_jsonl(source, target)
+        print(f"{source} -> {target} ({rows} rows)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())